@@ -30,6 +30,7 @@ Module handling Bibles functions for OpenBibleData package.
 
 preloadVersions( state:State ) -> int
 preloadVersion( versionAbbreviation:str, folderOrFileLocation:str, state:State ) -> Bible
+mapOETWordTables( lvBible:ESFMBible, state:State ) -> bool
 
 loadTyndaleBookIntrosXML( abbrev:str, XML_filepath ) -> dict[str,str]
 formatTyndaleBookIntro( abbrev:str, level:int, BBB:str, segmentType:str, state:State ) -> str
@@ -77,6 +78,12 @@ CHANGELOG:
     2026-04-27 Split USE_PICKLES_FLAG into state.LOAD_RESOURCES_FROM_PICKLES_FLAG and WRITE_PICKLES_FLAG
                 (Usually it's only reading that we want to temporarily disable, e.g., if indexing code has changed)
     2026-07-04 Added OpenBibleImages and getOpenBibleImages
+    2026-10-16 Optionally load versions that have no current pickle in parallel worker processes (state.NUM_PRELOAD_JOBS)
+    2026-10-16 Check if pickles are current using a manifest of their source files (so a git checkout doesn't force a reload)
+    2026-10-16 Cache each Bible as a header plus a pickle file per book (loaded when first used) so TEST mode can use the full caches
+    2026-10-16 Save the TOSN/UBS reference data as separately loadable sections (only unpickled when they're used)
+    2026-10-16 Profile the load time, books, entries, and memory of each preloaded version (with an optional memory budget)
+    2026-10-16 Replace the OET-LV word tables with MappedWordTables (before caching the OET-LV) so they're not pickled
 """
 from datetime import datetime
 import os, os.path
@@ -87,6 +94,11 @@ from xml.etree.ElementTree import ElementTree, ParseError
 import shutil
 from collections import defaultdict
 import pickle
+import mmap
+import tempfile
+import traceback
+import multiprocessing
+from time import time
 
 import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
 from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
@@ -112,12 +124,17 @@ from settings import State
 from html import checkHtml
 from OETHandlers import findLVQuote, getBBBFromOETBookName
 from Dict import loadAndIndexUBSGreekDictJSON, loadAndIndexUBSHebrewDictJSON
+from pickleManifest import PICKLE_MANIFEST_FILENAME_END, makePickleManifest, checkPickleManifest
+from bookCache import BOOK_CACHE_HEADER_FILENAME, getBookCacheFolderPath, readBookCacheInfo, canLoadBooks, saveBookCache, loadBookCache
+from referenceBundle import REFERENCE_SECTION_NAMES, saveReferenceBundle, ReferenceBundle
+from preloadProfile import PreloadMemoryBudgetError, PreloadProfile
+from wordTable import MappedWordTable, getMappedWordTable
 
 
-LAST_MODIFIED_DATE = '2026-07-13' # by RJH
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
 SHORT_PROGRAM_NAME = "Bibles"
 PROGRAM_NAME = "OpenBibleData Bibles handler"
-PROGRAM_VERSION = '0.98'
+PROGRAM_VERSION = '1.04'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -138,13 +155,21 @@ def preloadVersions( state:State ) -> int:
         and look through all the other files in the folder to see if the serialised version is current,
         otherwise call preloadVersion to load the Bible from scratch.
 
+    If state.NUM_PRELOAD_JOBS > 1, the versions that have to be loaded from scratch
+        are loaded in forked worker processes while this process loads the serialised ones.
+
+    The load time and memory used by each version are profiled into state.preloadProfile
+        (which raises a PreloadMemoryBudgetError if any version uses more than state.PRELOAD_MEMORY_BUDGET_MB).
+
     Note this has a side-effect of removing unused entries from state.BibleVersions.
     """
     fnPrint( DEBUGGING_THIS_MODULE, f"preloadVersions( {state.BibleVersions} )" )
 
     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"{datetime.now().strftime('%H:%M')} Preloading {state.BibleVersions}{' in TEST mode' if state.TEST_MODE_FLAG else ''}…" )
 
-    for versionAbbreviation in state.BibleVersions[:]: # copy because we'll be deleting some entries as we go
+    state.preloadProfile = PreloadProfile( state.PRELOAD_MEMORY_BUDGET_MB )
+    versionsToLoad = []
+    for versionAbbreviation in state.BibleVersions:
         if state.TEST_VERSIONS_ONLY and versionAbbreviation not in state.TEST_VERSIONS_ONLY:
             continue # Skip this version not desired for this test
         if versionAbbreviation == 'SOTN': continue # We handle this one differently
@@ -153,148 +178,354 @@ def preloadVersions( state:State ) -> int:
             # This is a combination of two translations, so nothing to load here
             assert 'OET-RV' in state.BibleVersions and 'OET-LV' in state.BibleVersions
             continue
+        versionsToLoad.append( versionAbbreviation )
 
-        if ( versionAbbreviation not in state.selectedVersesOnlyVersions
-            and versionAbbreviation in state.BibleLocations
-            ):
-            # See if a pickled version is available for a MUCH faster load time
-            try: folderOrFileLocationPath = Path( state.BibleLocations[versionAbbreviation] )
-            except TypeError:
-                assert versionAbbreviation == 'MSB'
-                folderOrFileLocationPath = Path( state.BibleLocations[versionAbbreviation][0] )
-
-            if state.LOAD_RESOURCES_FROM_PICKLES_FLAG:
-                pickleFilename = f'{versionAbbreviation}{state.PICKLE_FILENAME_END}' if versionAbbreviation in ('TOSN',) \
-                                else f"{versionAbbreviation}__{'_'.join(state.TEST_BOOK_LIST)}{state.PICKLE_FILENAME_END}" \
-                                if state.TEST_MODE_FLAG or not state.ALL_PRODUCTION_BOOKS_FLAG \
-                                else f'{versionAbbreviation}{state.PICKLE_FILENAME_END}'
-                pickleFolderPath = folderOrFileLocationPath if folderOrFileLocationPath.is_dir() else folderOrFileLocationPath.parent
-                vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"\nLooking for {f"'{pickleFilename}'" if BibleOrgSysGlobals.verbosityLevel>1 else 'pickle'} file for ‘{versionAbbreviation}’{f' in {pickleFolderPath}/' if BibleOrgSysGlobals.verbosityLevel>2 else ''} …" )
-                pickleFilePath = pickleFolderPath.joinpath( pickleFilename )
-                dPrint( 'Never', DEBUGGING_THIS_MODULE, f"{folderOrFileLocationPath=} {pickleFilename=} {pickleFolderPath=} {pickleFilePath=}" )
-                if pickleFilePath.is_file():
-                    pickleIsObsolete = False
-                    pickleMTime = pickleFilePath.stat().st_mtime # A large integer
-                    dPrint( 'Info', DEBUGGING_THIS_MODULE, f"preloadVersions found {pickleFilename=}" )
-                    for somePath in pickleFolderPath.iterdir():
-                        dPrint( 'Never', DEBUGGING_THIS_MODULE, f"{pickleFolderPath=} {somePath=} {type(somePath)=}" )
-                        if somePath.is_file() and not str(somePath).endswith( state.PICKLE_FILENAME_END ):
-                            fileMTime = somePath.stat().st_mtime # A large integer
-                            if fileMTime > pickleMTime:
-                                pickleIsObsolete = True
-                                vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"{versionAbbreviation} pickle is obsolete because {somePath.name} is more recent." )
-                                break
-                        elif versionAbbreviation == 'OET-LV': # This one has the OT and the NT in separate folders
-                            if str(somePath).endswith ('derivedTexts/auto_edited_OT_ESFM') or str(somePath).endswith ('derivedTexts/auto_edited_VLT_ESFM'):
-                                for someSubPath in somePath.iterdir():
-                                    dPrint( 'Never', DEBUGGING_THIS_MODULE, f"Checking file-times in {somePath=} {someSubPath=} {type(someSubPath)=}" )
-                                    if someSubPath.is_file() and not str(someSubPath).endswith( state.PICKLE_FILENAME_END ):
-                                        fileMTime = someSubPath.stat().st_mtime # A large integer
-                                        if fileMTime > pickleMTime:
-                                            pickleIsObsolete = True
-                                            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"{versionAbbreviation} pickle is obsolete because {someSubPath.name} is more recent." )
-                                            break
-                        else:
-                            dPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"Ignoring pickle file or folder {somePath=} {somePath.name=}")
-                    if not pickleIsObsolete:
-                        try:
-                            if versionAbbreviation == 'TOSN':
-                                with open( pickleFolderPath.joinpath(pickleFilename), 'rb' ) as pickleInputFile:
-                                    state.TyndaleBookIntrosDict = pickle.load( pickleInputFile )
-                                    state.TyndaleBookIntroSummariesDict = pickle.load( pickleInputFile )
-                                    state.TOBDData = pickle.load( pickleInputFile )
-                                    # UBS Greek
-                                    state.UBS_GNT_DATA = pickle.load( pickleInputFile )
-                                    state.UBS_GNT_ID_INDEX = pickle.load( pickleInputFile )
-                                    state.UBS_GNT_LEMMA_INDEX = pickle.load( pickleInputFile )
-                                    # UBS Hebrew
-                                    state.UBS_HEB_DOMAIN_DATA = pickle.load( pickleInputFile )
-                                    state.UBS_HEB_DATA = pickle.load( pickleInputFile )
-                                    state.UBS_HEB_ID_INDEX = pickle.load( pickleInputFile )
-                                    state.UBS_HEB_LEMMA_INDEX = pickle.load( pickleInputFile )
-                                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "preloadVersions() loaded pickled TOSN and UBS reference data" )
-                                state.BibleVersions.remove( versionAbbreviation )
-                                continue
-                            else: # for Bibles
-                                newBibleObj = BibleOrgSysGlobals.unpickleObject( pickleFilename, pickleFolderPath )
-                                # dPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"newObj is {newBibleObj}" )
-                                # dPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Loaded {versionAbbreviation} {type(newBibleObj)} pickle file: {pickleFilename}." )
-                                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"preloadVersions() loaded pickled {newBibleObj if BibleOrgSysGlobals.verbosityLevel>=2 else versionAbbreviation}" )
-                                assert 'discoveryResults' in newBibleObj.__dict__ # .discover() should have been called before it was saved
-                                state.preloadedBibles[versionAbbreviation] = newBibleObj
-                                continue
-                        except pickle.UnpicklingError as e:
-                            logging.critical( f"Failed to load {versionAbbreviation} pickle file: Got UnpicklingError from {pickleFilename} in {pickleFolderPath}: {e}")
-                        except TypeError as e:
-                            logging.critical( f"Failed to load {versionAbbreviation} pickle file: Got TypeError from {pickleFilename} in {pickleFolderPath}: {e}")
-                        except ModuleNotFoundError as e:
-                            logging.critical( f"Failed to load {versionAbbreviation} pickle file: Got ModuleNotFoundError from {pickleFilename} in {pickleFolderPath}: {e}")
-                        except RuntimeError as e:
-                            logging.critical( f"Failed to load {versionAbbreviation} pickle file: Got RuntimeError from {pickleFilename} in {pickleFolderPath}: {e}")
-                        except EOFError:
-                            logging.critical( f"Failed to load {versionAbbreviation} pickle file: Ran out of input from {pickleFilename} in {pickleFolderPath}")
-                else:
-                    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  No pickle file for {versionAbbreviation}." )
-
-        if versionAbbreviation == 'OET-LV':
-            # Load the OT and NT from separate folders, and then combine them into one ESFM Bible object
-            thisBibleOT = preloadVersion( versionAbbreviation, state.BibleLocations['OET-LV-OT'], state )
-            assert isinstance( thisBibleOT, ESFMBible.ESFMBible )
-            thisBibleNT = preloadVersion( versionAbbreviation, state.BibleLocations['OET-LV-NT'], state )
-            assert isinstance( thisBibleNT, ESFMBible.ESFMBible )
-            # print( f"{len(thisBibleOT)=} {len(thisBibleNT)=}" )
-            thisBible = thisBibleOT
-            for bookObject in thisBibleNT:
-                # print( type(bookObject), bookObject.BBB )
-                assert bookObject.BBB not in thisBible.books
-                bookObject.containerBibleObject = thisBible
-                bookObject.workName = state.BibleNames[versionAbbreviation]
-                thisBible.books[bookObject.BBB] = bookObject
-            # print( f"{len(thisBibleOT)=}" )
-            # print( f"{len(thisBibleOT.ESFMWordTables)=}" )
-            for wordTableID,wordTable in thisBibleNT.ESFMWordTables.items():
-                # print( f"{wordTableID=} {type(wordTable)=}")
-                thisBible.ESFMWordTables[wordTableID] = wordTable
-            # print( f"{len(thisBible.ESFMWordTables)=}" )
-            # For now, use add custom OT and NT sourceFolder variables so that we can load the two different word files
-            thisBible.OTsourceFolder = thisBibleOT.sourceFolder
-            thisBible.NTsourceFolder = thisBibleNT.sourceFolder
-            thisBible.sourceFolder = None
-            del thisBibleNT
-            state.preloadedBibles['OET-LV'] = thisBible
-            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Doing discovery for {thisBible.abbreviation} ({thisBible.name})…" )
-            thisBible.discover()
-            thisBible.makeSectionIndex() # For OET-LV -- this isn't made automatically by BibleOrgSys
-            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"preloadVersions() loaded {thisBible}" )
-
-            if WRITE_PICKLES_FLAG:
-                pickleFilename = f"OET-LV__{'_'.join(state.TEST_BOOK_LIST)}{state.PICKLE_FILENAME_END}" \
-                                    if state.TEST_MODE_FLAG or not state.ALL_PRODUCTION_BOOKS_FLAG \
-                                    else f'{versionAbbreviation}{state.PICKLE_FILENAME_END}'
-                pickleFolderPath = state.BibleLocations['OET-LV']
-                try:
-                    thisBible.pickle( pickleFilename, pickleFolderPath )
-                    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Saved pickle file: {pickleFilename}.\n" )
-                except TypeError:
-                    logging.critical( f"Warning: Unable to pickle OET-LV Bible to {pickleFilename}" )
-                    # But we ignore it (the program will just run slower again next time when it reloads the Bible)
-
-        # Everything other than OET-LV
-        elif versionAbbreviation in state.BibleLocations:
-            thisBible = preloadVersion( versionAbbreviation, state.BibleLocations[versionAbbreviation], state )
-            if isinstance(thisBible, Bible) \
-            or versionAbbreviation in state.selectedVersesOnlyVersions:
-                state.preloadedBibles[versionAbbreviation] = thisBible
-            else:
-                assert False, "We want to stop here" # preloadVersion failed
-
+    try:
+        if state.NUM_PRELOAD_JOBS > 1 and not BibleOrgSysGlobals.alreadyMultiprocessing:
+            _preloadVersionsInParallel( versionsToLoad, state )
         else:
-            logging.critical( f"createPages preloadVersions() has no folder location to find ‘{versionAbbreviation}’" )
-            assert 'OET' not in versionAbbreviation
-            state.BibleVersions.remove( versionAbbreviation )
+            for versionAbbreviation in versionsToLoad:
+                _preloadVersionHere( versionAbbreviation, _getCurrentPickleFilePath( versionAbbreviation, state ), state )
+    finally: # Even if we went over the memory budget
+        state.preloadProfile.printTable()
+        if state.buildReport is not None:
+            state.buildReport.addSection( 'preloadVersions', state.preloadProfile.entries )
     return len(state.preloadedBibles)
 # end of Bibles.preloadVersions
 
+
+def _getCurrentPickleFilePath( versionAbbreviation:str, state:State ) -> Path|None:
+    """
+    Returns the path of the pickle file for this version
+        if there is one and none of its source files have changed since it was made
+        (according to the manifest saved beside it -- see pickleManifest.py).
+    """
+    if ( versionAbbreviation in state.selectedVersesOnlyVersions
+    or versionAbbreviation not in state.BibleLocations
+    or not state.LOAD_RESOURCES_FROM_PICKLES_FLAG ):
+        return None
+
+    # See if a pickled version is available for a MUCH faster load time
+    try: folderOrFileLocationPath = Path( state.BibleLocations[versionAbbreviation] )
+    except TypeError:
+        assert versionAbbreviation == 'MSB'
+        folderOrFileLocationPath = Path( state.BibleLocations[versionAbbreviation][0] )
+
+    pickleFolderPath = folderOrFileLocationPath if folderOrFileLocationPath.is_dir() else folderOrFileLocationPath.parent
+    if versionAbbreviation in ('TOSN',):
+        pickleFilename = f'{versionAbbreviation}{state.PICKLE_FILENAME_END}'
+        pickleFilePath = pickleFolderPath.joinpath( pickleFilename )
+    else: # Bibles have a folder with a header and a pickle file for each book
+        bookCacheFolderPath = getBookCacheFolderPath( pickleFolderPath, versionAbbreviation )
+        pickleFilename = f'{bookCacheFolderPath.name}/{BOOK_CACHE_HEADER_FILENAME}'
+        pickleFilePath = bookCacheFolderPath.joinpath( BOOK_CACHE_HEADER_FILENAME )
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"\nLooking for {f"'{pickleFilename}'" if BibleOrgSysGlobals.verbosityLevel>1 else 'pickle'} file for ‘{versionAbbreviation}’{f' in {pickleFolderPath}/' if BibleOrgSysGlobals.verbosityLevel>2 else ''} …" )
+    dPrint( 'Never', DEBUGGING_THIS_MODULE, f"{folderOrFileLocationPath=} {pickleFilename=} {pickleFolderPath=} {pickleFilePath=}" )
+    if not pickleFilePath.is_file():
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  No pickle file for {versionAbbreviation}." )
+        return None
+    if versionAbbreviation not in ('TOSN',):
+        bookCacheInfo = readBookCacheInfo( bookCacheFolderPath )
+        if bookCacheInfo is None:
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Incomplete book cache for {versionAbbreviation}." )
+            return None
+        if not canLoadBooks( bookCacheInfo, state.booksToLoad[versionAbbreviation] ):
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  {versionAbbreviation} book cache only has {bookCacheInfo['booksToLoad']}." )
+            return None
+
+    isCurrent, reason = checkPickleManifest( pickleFilePath, verifyHashes=state.VERIFY_PICKLE_HASHES_FLAG )
+    if isCurrent is None: # No (usable) manifest yet, e.g., an older pickle, so just compare the file times this once
+        dPrint( 'Info', DEBUGGING_THIS_MODULE, f"preloadVersions found {pickleFilename=} with {reason}" )
+        pickleMTimeNs = pickleFilePath.stat().st_mtime_ns
+        isCurrent = True
+        for sourceFolderPath in _getPickleSourceFolders( versionAbbreviation, pickleFolderPath, state ):
+            with os.scandir( sourceFolderPath ) as dirEntries:
+                for dirEntry in dirEntries:
+                    if dirEntry.is_file() and not dirEntry.name.endswith( state.PICKLE_FILENAME_END ) \
+                    and not dirEntry.name.endswith( PICKLE_MANIFEST_FILENAME_END ) \
+                    and dirEntry.stat().st_mtime_ns > pickleMTimeNs:
+                        isCurrent, reason = False, f"{dirEntry.name} is more recent"
+                        break
+            if not isCurrent: break
+        if isCurrent: # Save a manifest so that we don't have to rely on the file times next time
+            _savePickleManifest( versionAbbreviation, pickleFilePath, pickleFolderPath, state )
+    if not isCurrent:
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"{versionAbbreviation} pickle is obsolete because {reason}." )
+        return None
+    return pickleFilePath
+# end of Bibles._getCurrentPickleFilePath
+
+
+def _getPickleSourceFolders( versionAbbreviation:str, pickleFolderPath:Path, state:State ) -> list[Path]:
+    """
+    Returns the folders containing the source files that the pickle for this version is made from.
+    """
+    if versionAbbreviation == 'OET-LV': # This one has the OT and the NT in separate folders
+        return [Path( pickleFolderPath ), Path( state.BibleLocations['OET-LV-OT'] ), Path( state.BibleLocations['OET-LV-NT'] )]
+    return [Path( pickleFolderPath )]
+# end of Bibles._getPickleSourceFolders
+
+
+def _savePickleManifest( versionAbbreviation:str, pickleFilePath:Path, pickleFolderPath:Path, state:State ) -> None:
+    """
+    Save the list of source files (with their sizes, times, and hashes) beside the pickle file
+        so that we can quickly tell if the pickle is still current next time.
+    """
+    try: makePickleManifest( pickleFilePath, _getPickleSourceFolders( versionAbbreviation, pickleFolderPath, state ), state.PICKLE_FILENAME_END )
+    except OSError as err:
+        logging.error( f"Unable to save pickle manifest for {versionAbbreviation} beside {pickleFilePath}: {err}" )
+        # But we ignore it (the pickle will just be loaded from the source files again next time)
+# end of Bibles._savePickleManifest
+
+
+def _loadPickledVersion( versionAbbreviation:str, pickleFilePath:Path, state:State ) -> bool:
+    """
+    Load the version (or for TOSN, the other reference data) from the pickle file into the state.
+
+    Returns False if the pickle file couldn't be loaded.
+    """
+    pickleFolderPath, pickleFilename = pickleFilePath.parent, pickleFilePath.name
+    try:
+        if versionAbbreviation == 'TOSN':
+            # Each section is only unpickled when it's first used (see LazyReferenceSection in settings.State)
+            state.referenceBundle = ReferenceBundle( pickleFilePath )
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"preloadVersions() found {len(state.referenceBundle.sections)} pickled TOSN and UBS reference data sections" )
+            state.BibleVersions.remove( versionAbbreviation )
+        else: # for Bibles
+            newBibleObj = loadBookCache( pickleFolderPath, state.booksToLoad[versionAbbreviation] ) # Books are only unpickled when they're used
+            # dPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"newObj is {newBibleObj}" )
+            # dPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Loaded {versionAbbreviation} {type(newBibleObj)} pickle file: {pickleFilename}." )
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"preloadVersions() loaded pickled {newBibleObj if BibleOrgSysGlobals.verbosityLevel>=2 else versionAbbreviation}" )
+            assert 'discoveryResults' in newBibleObj.__dict__ # .discover() should have been called before it was saved
+            state.preloadedBibles[versionAbbreviation] = newBibleObj
+        return True
+    except pickle.UnpicklingError as e:
+        logging.critical( f"Failed to load {versionAbbreviation} pickle file: Got UnpicklingError from {pickleFilename} in {pickleFolderPath}: {e}")
+    except TypeError as e:
+        logging.critical( f"Failed to load {versionAbbreviation} pickle file: Got TypeError from {pickleFilename} in {pickleFolderPath}: {e}")
+    except ModuleNotFoundError as e:
+        logging.critical( f"Failed to load {versionAbbreviation} pickle file: Got ModuleNotFoundError from {pickleFilename} in {pickleFolderPath}: {e}")
+    except RuntimeError as e:
+        logging.critical( f"Failed to load {versionAbbreviation} pickle file: Got RuntimeError from {pickleFilename} in {pickleFolderPath}: {e}")
+    except EOFError:
+        logging.critical( f"Failed to load {versionAbbreviation} pickle file: Ran out of input from {pickleFilename} in {pickleFolderPath}")
+    except FileNotFoundError as e:
+        logging.critical( f"Failed to load {versionAbbreviation} pickle file: Got FileNotFoundError from {pickleFilename} in {pickleFolderPath}: {e}")
+    return False
+# end of Bibles._loadPickledVersion
+
+
+def _loadVersionFromSource( versionAbbreviation:str, state:State ) -> None:
+    """
+    Load the version from its source file(s) into state.preloadedBibles
+        (also pickling it for next time if WRITE_PICKLES_FLAG is set).
+    """
+    if versionAbbreviation == 'OET-LV':
+        # Load the OT and NT from separate folders, and then combine them into one ESFM Bible object
+        thisBibleOT = preloadVersion( versionAbbreviation, state.BibleLocations['OET-LV-OT'], state )
+        assert isinstance( thisBibleOT, ESFMBible.ESFMBible )
+        thisBibleNT = preloadVersion( versionAbbreviation, state.BibleLocations['OET-LV-NT'], state )
+        assert isinstance( thisBibleNT, ESFMBible.ESFMBible )
+        # print( f"{len(thisBibleOT)=} {len(thisBibleNT)=}" )
+        thisBible = thisBibleOT
+        for bookObject in thisBibleNT:
+            # print( type(bookObject), bookObject.BBB )
+            assert bookObject.BBB not in thisBible.books
+            bookObject.containerBibleObject = thisBible
+            bookObject.workName = state.BibleNames[versionAbbreviation]
+            thisBible.books[bookObject.BBB] = bookObject
+        # print( f"{len(thisBibleOT)=}" )
+        # print( f"{len(thisBibleOT.ESFMWordTables)=}" )
+        for wordTableID,wordTable in thisBibleNT.ESFMWordTables.items():
+            # print( f"{wordTableID=} {type(wordTable)=}")
+            thisBible.ESFMWordTables[wordTableID] = wordTable
+        # print( f"{len(thisBible.ESFMWordTables)=}" )
+        # For now, use add custom OT and NT sourceFolder variables so that we can load the two different word files
+        thisBible.OTsourceFolder = thisBibleOT.sourceFolder
+        thisBible.NTsourceFolder = thisBibleNT.sourceFolder
+        thisBible.sourceFolder = None
+        del thisBibleNT
+        state.preloadedBibles['OET-LV'] = thisBible
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Doing discovery for {thisBible.abbreviation} ({thisBible.name})…" )
+        thisBible.discover()
+        thisBible.makeSectionIndex() # For OET-LV -- this isn't made automatically by BibleOrgSys
+        mapOETWordTables( thisBible, state ) # So the cache only holds where to find them
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"preloadVersions() loaded {thisBible}" )
+
+        if WRITE_PICKLES_FLAG:
+            pickleFolderPath = state.BibleLocations['OET-LV']
+            bookCacheFolderPath = getBookCacheFolderPath( pickleFolderPath, versionAbbreviation )
+            try:
+                headerFilePath = saveBookCache( thisBible, bookCacheFolderPath, state.booksToLoad[versionAbbreviation] )
+                if headerFilePath is not None: # None if we only loaded some of the books in the cache
+                    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Saved book cache: {bookCacheFolderPath}/.\n" )
+                    _savePickleManifest( versionAbbreviation, headerFilePath, pickleFolderPath, state )
+            except TypeError:
+                logging.critical( f"Warning: Unable to pickle OET-LV Bible to {bookCacheFolderPath}/" )
+                # But we ignore it (the program will just run slower again next time when it reloads the Bible)
+
+    # Everything other than OET-LV
+    elif versionAbbreviation in state.BibleLocations:
+        thisBible = preloadVersion( versionAbbreviation, state.BibleLocations[versionAbbreviation], state )
+        if isinstance(thisBible, Bible) \
+        or versionAbbreviation in state.selectedVersesOnlyVersions:
+            state.preloadedBibles[versionAbbreviation] = thisBible
+        else:
+            assert False, "We want to stop here" # preloadVersion failed
+
+    else:
+        logging.critical( f"createPages preloadVersions() has no folder location to find ‘{versionAbbreviation}’" )
+        assert 'OET' not in versionAbbreviation
+        state.BibleVersions.remove( versionAbbreviation )
+# end of Bibles._loadVersionFromSource
+
+
+def mapOETWordTables( lvBible:ESFMBible, state:State ) -> bool:
+    """
+    Replace each of the OET-LV word tables (lists of TSV lines, or None if not loaded yet)
+        with a MappedWordTable from its binary form in state.BINARY_WORD_TABLES_FOLDER
+        (which is only remade if the TSV file has changed).
+
+    Returns False (leaving the rest of the tables as they were) if it wasn't able to.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"mapOETWordTables( {lvBible.abbreviation} )" )
+    if state.BINARY_WORD_TABLES_FOLDER is None: return False
+    for wordTableFilename, wordTable in lvBible.ESFMWordTables.items():
+        if isinstance( wordTable, MappedWordTable ): continue # Already done (e.g., it was loaded from the cache)
+        sourceFilepath = Path( lvBible.OTsourceFolder if '_OT_' in wordTableFilename else lvBible.NTsourceFolder ).joinpath( wordTableFilename )
+        try: lvBible.ESFMWordTables[wordTableFilename] = getMappedWordTable( wordTableFilename, sourceFilepath, state.BINARY_WORD_TABLES_FOLDER, wordTable )
+        except (OSError, ValueError, pickle.UnpicklingError) as err:
+            logging.error( f"Unable to map OET-LV word table {wordTableFilename} from {state.BINARY_WORD_TABLES_FOLDER}: {err}" )
+            return False # But we can still use the TSV lines
+    vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Mapped {len(lvBible.ESFMWordTables)} OET-LV word tables from {state.BINARY_WORD_TABLES_FOLDER}/." )
+    return True
+# end of Bibles.mapOETWordTables
+
+
+def _preloadVersionHere( versionAbbreviation:str, pickleFilePath:Path|None, state:State ) -> list[str]:
+    """
+    Load the version from the pickle file if we can, else from its source file(s).
+
+    Returns the list of keys that were added to state.preloadedBibles.
+    """
+    preloadedKeysBefore = set( state.preloadedBibles )
+    measurement = state.preloadProfile.startVersion()
+    cacheHit = pickleFilePath is not None and _loadPickledVersion( versionAbbreviation, pickleFilePath, state )
+    if not cacheHit:
+        _loadVersionFromSource( versionAbbreviation, state )
+    state.preloadProfile.finishVersion( versionAbbreviation, measurement, _getProfiledObject( versionAbbreviation, state ), cacheHit )
+    return [key for key in state.preloadedBibles if key not in preloadedKeysBefore]
+# end of Bibles._preloadVersionHere
+
+
+def _getProfiledObject( versionAbbreviation:str, state:State ):
+    """
+    Returns the object that was loaded for the version (for the preload profile)
+    """
+    if versionAbbreviation == 'TOSN' and versionAbbreviation not in state.preloadedBibles:
+        return state.referenceBundle # Might be None if it was loaded from the source files
+    return state.preloadedBibles.get( versionAbbreviation )
+# end of Bibles._getProfiledObject
+
+
+_preloadParameters = None # Set just before forking so that the worker processes inherit it (rather than pickling the huge state)
+VERSION_STATE_OUTPUTS = { 'TOSN':REFERENCE_SECTION_NAMES } # The state attributes (other than preloadedBibles and BibleVersions) that loading each version sets or changes
+
+
+def _loadVersionFromSourceMP( versionAbbreviation:str ) -> tuple[str,str|None,str]:
+    """
+    Runs in a forked worker process to load one version from its source file(s).
+
+    The results (the new preloadedBibles entries, the VERSION_STATE_OUTPUTS state attributes for this version, e.g., TOBDData, and the load time)
+        are pickled into a cache file (rather than being sent back through a pipe)
+        and the parent process maps that file into memory to unpickle them.
+
+    Returns the version abbreviation, the cache filepath (None if it failed), and any error traceback.
+    """
+    cacheFolderPath, state = _preloadParameters
+    try:
+        preloadedKeysBefore = set( state.preloadedBibles )
+        wasListed = versionAbbreviation in state.BibleVersions
+        startTime = time()
+        _loadVersionFromSource( versionAbbreviation, state )
+        results = { 'loadSeconds':time() - startTime, 'preloadedBibles':{key:value for key,value in state.preloadedBibles.items() if key not in preloadedKeysBefore},
+                    'attributes':{name:getattr( state, name ) for name in VERSION_STATE_OUTPUTS.get( versionAbbreviation, () )},
+                    'removedFromBibleVersions':wasListed and versionAbbreviation not in state.BibleVersions }
+        cacheFilePath = cacheFolderPath.joinpath( f'{versionAbbreviation}.pickle' )
+        with open( cacheFilePath, 'wb' ) as cacheFile:
+            pickle.dump( results, cacheFile, protocol=pickle.HIGHEST_PROTOCOL )
+        return versionAbbreviation, str(cacheFilePath), ''
+    except Exception: # Includes assert failures -- we'll try again in the parent process
+        return versionAbbreviation, None, traceback.format_exc()
+# end of Bibles._loadVersionFromSourceMP
+
+
+def _preloadVersionsInParallel( versionsToLoad:list[str], state:State ) -> None:
+    """
+    Loads the versions that don't have current pickle files in a pool of forked processes
+        while this process loads the ones that do.
+
+    state.preloadedBibles ends up in the same order as if they were loaded one after the other.
+    """
+    global _preloadParameters
+    fnPrint( DEBUGGING_THIS_MODULE, f"_preloadVersionsInParallel( {versionsToLoad} ) with {state.NUM_PRELOAD_JOBS} processes" )
+    startTime = time()
+    pickleFilePaths = {versionAbbreviation:_getCurrentPickleFilePath( versionAbbreviation, state ) for versionAbbreviation in versionsToLoad}
+    sourceVersions = [versionAbbreviation for versionAbbreviation in versionsToLoad
+                        if pickleFilePaths[versionAbbreviation] is None
+                        and versionAbbreviation not in state.selectedVersesOnlyVersions] # These are small so quicker to load here
+    numProcesses = min( state.NUM_PRELOAD_JOBS, len(sourceVersions) )
+    loadedKeys = {} # Key is the version abbreviation, value is the list of keys that it added to preloadedBibles
+
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Loading {len(versionsToLoad)-len(sourceVersions)} versions here while {numProcesses if sourceVersions else 0} processes load {sourceVersions} from their source files…" )
+    with tempfile.TemporaryDirectory( prefix='OBD_preload_' ) as cacheFolder:
+        asyncResults = None
+        if sourceVersions:
+            _preloadParameters = (Path( cacheFolder ), state)
+            BibleOrgSysGlobals.alreadyMultiprocessing = True # So the BibleOrgSys loaders don't try to start their own pools
+            pool = multiprocessing.get_context( 'fork' ).Pool( processes=numProcesses )
+            asyncResults = pool.map_async( _loadVersionFromSourceMP, sourceVersions, chunksize=1 )
+            pool.close()
+        try:
+            for versionAbbreviation in versionsToLoad: # Load the rest here while the worker processes are busy
+                if versionAbbreviation not in sourceVersions:
+                    loadedKeys[versionAbbreviation] = _preloadVersionHere( versionAbbreviation, pickleFilePaths[versionAbbreviation], state )
+            results = asyncResults.get() if asyncResults is not None else []
+        except PreloadMemoryBudgetError:
+            if asyncResults is not None: pool.terminate() # Don't wait for the other versions
+            raise
+        finally:
+            if asyncResults is not None:
+                pool.join()
+                BibleOrgSysGlobals.alreadyMultiprocessing = False
+                _preloadParameters = None
+
+        for versionAbbreviation, cacheFilePath, errorTraceback in results:
+            if cacheFilePath is None:
+                logging.critical( f"Failed to load {versionAbbreviation} in a worker process so trying again here: {errorTraceback}" )
+                loadedKeys[versionAbbreviation] = _preloadVersionHere( versionAbbreviation, None, state )
+                continue
+            measurement = state.preloadProfile.startVersion()
+            with open( cacheFilePath, 'rb' ) as cacheFile, mmap.mmap( cacheFile.fileno(), 0, access=mmap.ACCESS_READ ) as cacheBuffer:
+                versionResults = pickle.loads( cacheBuffer )
+            state.preloadedBibles.update( versionResults['preloadedBibles'] )
+            for name, value in versionResults['attributes'].items():
+                setattr( state, name, value )
+            if versionResults['removedFromBibleVersions']:
+                state.BibleVersions.remove( versionAbbreviation )
+            loadedKeys[versionAbbreviation] = list( versionResults['preloadedBibles'] )
+            state.preloadProfile.finishVersion( versionAbbreviation, measurement, _getProfiledObject( versionAbbreviation, state ),
+                                                cacheHit=False, loadSeconds=versionResults['loadSeconds'] )
+
+    # Put them back into the normal order
+    orderedKeys = [key for versionAbbreviation in versionsToLoad for key in loadedKeys.get( versionAbbreviation, () )]
+    orderedBibles = {key:value for key,value in state.preloadedBibles.items() if key not in orderedKeys} # Anything that was already there
+    orderedBibles.update( (key,state.preloadedBibles[key]) for key in orderedKeys )
+    state.preloadedBibles.clear()
+    state.preloadedBibles.update( orderedBibles )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Preloaded {len(versionsToLoad)} versions in {time()-startTime:.1f} seconds using {numProcesses if sourceVersions else 0} worker processes." )
+# end of Bibles._preloadVersionsInParallel
+
 def preloadVersion( versionAbbreviation:str, folderOrFileLocation:str, state:State ) -> Bible:
     """
     Loads the requested Bible into memory
@@ -485,19 +716,9 @@ def preloadVersion( versionAbbreviation:str, folderOrFileLocation:str, state:Sta
         if WRITE_PICKLES_FLAG:
             pickleFolderPath = Path( state.BibleLocations[versionAbbreviation] )
             pickleFilename = f'{versionAbbreviation}{state.PICKLE_FILENAME_END}'
-            with open( pickleFolderPath.joinpath( pickleFilename ), 'wb' ) as pickleOutputFile:
-                pickle.dump( state.TyndaleBookIntrosDict, pickleOutputFile )
-                pickle.dump( state.TyndaleBookIntroSummariesDict, pickleOutputFile )
-                pickle.dump( state.TOBDData, pickleOutputFile )
-                # UBS Greek
-                pickle.dump( state.UBS_GNT_DATA, pickleOutputFile )
-                pickle.dump( state.UBS_GNT_ID_INDEX, pickleOutputFile )
-                pickle.dump( state.UBS_GNT_LEMMA_INDEX, pickleOutputFile )
-                # UBS Hebrew
-                pickle.dump( state.UBS_HEB_DOMAIN_DATA, pickleOutputFile )
-                pickle.dump( state.UBS_HEB_DATA, pickleOutputFile )
-                pickle.dump( state.UBS_HEB_ID_INDEX, pickleOutputFile )
-                pickle.dump( state.UBS_HEB_LEMMA_INDEX, pickleOutputFile )
+            saveReferenceBundle( pickleFolderPath.joinpath( pickleFilename ),
+                                    { sectionName:getattr( state, sectionName ) for sectionName in REFERENCE_SECTION_NAMES } )
+            _savePickleManifest( versionAbbreviation, pickleFolderPath.joinpath( pickleFilename ), pickleFolderPath, state )
 
     elif versionAbbreviation in ('NET',) and 'eBible.org' not in folderOrFileLocation: # USX
         vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Preloading ‘{versionAbbreviation}’ USX Bible{' in TEST mode' if state.TEST_MODE_FLAG else ''}…" )
@@ -579,18 +800,18 @@ def preloadVersion( versionAbbreviation:str, folderOrFileLocation:str, state:Sta
         #     halt
 
         if WRITE_PICKLES_FLAG:
-            pickleFilename = f"{versionAbbreviation}__{'_'.join(state.TEST_BOOK_LIST)}{state.PICKLE_FILENAME_END}" \
-                                if state.TEST_MODE_FLAG or not state.ALL_PRODUCTION_BOOKS_FLAG \
-                                else f'{versionAbbreviation}{state.PICKLE_FILENAME_END}'
             try: pickleFolderPath = folderOrFileLocation if os.path.isdir( folderOrFileLocation ) else Path( folderOrFileLocation ).parent
             except TypeError:
                     assert versionAbbreviation == 'MSB'
                     pickleFolderPath = folderOrFileLocation[0]
+            bookCacheFolderPath = getBookCacheFolderPath( pickleFolderPath, versionAbbreviation )
             try:
-                thisBible.pickle( pickleFilename, pickleFolderPath )
-                vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Saved pickle file: {pickleFilename}.\n" )
+                headerFilePath = saveBookCache( thisBible, bookCacheFolderPath, state.booksToLoad[versionAbbreviation] )
+                if headerFilePath is not None: # None if we only loaded some of the books in the cache
+                    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Saved book cache: {bookCacheFolderPath}/.\n" )
+                    _savePickleManifest( versionAbbreviation, headerFilePath, pickleFolderPath, state )
             except TypeError:
-                logging.critical( f"Warning: Unable to pickle {versionAbbreviation} Bible to {pickleFilename}" )
+                logging.critical( f"Warning: Unable to pickle {versionAbbreviation} Bible to {bookCacheFolderPath}/" )
                 # But we ignore it (the program will just run slower again next time when it reloads the Bible)
 
     return thisBible
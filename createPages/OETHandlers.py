@@ -54,6 +54,8 @@ CHANGELOG:
     2026-05-30 Handle OET-RV PSA lines beginning with /zz (for background colouring)
     2026-06-11 Handle new % (changed person) \\add format
     2026-06-29 Fix bug that mishandled digit strings in OET
+    2026-10-16 Use the columnar WordTables (rather than splitting the word table lines every time)
+    2026-10-16 Look up verses in the word tables with WordTableIndex.getWordNumberRange()
 """
 import logging
 import re
@@ -73,10 +75,10 @@ from bible_transliterations import transliterate_Hebrew, transliterate_Greek
 from settings import State
 
 
-LAST_MODIFIED_DATE = '2026-06-29' # by RJH
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
 SHORT_PROGRAM_NAME = "OETHandlers"
 PROGRAM_NAME = "OpenBibleData OET handler"
-PROGRAM_VERSION = '0.76'
+PROGRAM_VERSION = '0.78'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -210,7 +212,8 @@ def getHebrewWordpageFilename( wordTableRowNum:int, state:State ) -> str:
         although notes and segment punctuation are treated differently
             like KI2c1v3n123456.htm
     """
-    ref, rowType, morphemeRowNumberOrList, _rest = state.OETRefData['word_tables']['OET-LV_OT_word_table.tsv'][wordTableRowNum].split( '\t', 3 )
+    wordRow = state.OETRefData['word_tables']['OET-LV_OT_word_table.tsv'].getRow( wordTableRowNum )
+    ref, rowType, morphemeRowNumberOrList = wordRow['Ref'], wordRow['RowType'], wordRow['MorphemeRowList']
     ref = ref.replace('_','c',1).replace(':','v',1) # Don't want underlines coz they're used for many other things, and colon might not be legal in filesystem
 
     if 'w' not in ref:
@@ -232,7 +235,7 @@ def getGreekWordpageFilename( rowNum:int, state:State ) -> str:
     """
     # print( f"getGreekWordpageFilename( {rowNum=}, state )" )
     # print( f"  {state.OETRefData['word_tables']['OET-LV_NT_word_table.tsv'][rowNum]=} ")
-    nWordRef = state.OETRefData['word_tables']['OET-LV_NT_word_table.tsv'][rowNum].split( '\t', 1 )[0]
+    nWordRef = state.OETRefData['word_tables']['OET-LV_NT_word_table.tsv'].getField( rowNum, 'Ref' )
     result = f"{nWordRef.replace('_','c',1).replace(':','v',1)}.htm" # Don't want underlines coz they're used for many other things, and colon might not be legal in filesystem
     # print( f" Returning {result=}" )
     return result
@@ -397,9 +400,8 @@ def livenOETWordLinks( level:int, bibleObject:ESFMBible, refTuple:tuple, givenEn
                 # wordnumberMatch = linkedGreekWordNumberRegex.search( original_text, titleMatch.end()+4 ) # After the following href
                 # assert wordnumberMatch, f"{BBB} {placeholderOriginalLanguageWord=} {original_text=}"
                 # wordNumber = int( wordnumberMatch.group(1) )
-                wordRow = state.OETRefData['word_tables']['OET-LV_NT_word_table.tsv'][wordNumber]
-                # SRLemma = wordRow.split( '\t' )[2]
-                _ref, greekWord, SRLemma, _GrkLemma, _VLTGlossWordsStr, _OETGlossWordsStr, _glossCaps, _probability, extendedStrongs, roleLetter, morphology, _tagsStr = wordRow.split( '\t' )
+                wordRow = state.OETRefData['word_tables']['OET-LV_NT_word_table.tsv'].getRow( wordNumber )
+                greekWord, SRLemma, extendedStrongs, roleLetter, morphology = wordRow['GreekWord'], wordRow['SRLemma'], wordRow['StrongsExt'], wordRow['Role'], wordRow['Morphology']
                 transliteratedWord = transliterate_Greek( greekWord )
 
                 # Do colourisation
@@ -445,9 +447,8 @@ def livenOETWordLinks( level:int, bibleObject:ESFMBible, refTuple:tuple, givenEn
                 # wordnumberMatch = linkedHebrewWordNumberRegex.search( original_text, titleMatch.end()+4 ) # After the following href
                 # assert wordnumberMatch, f"{BBB} {original_text=}"
                 # wordNumber = int( wordnumberMatch.group(1) )
-                wordRow = state.OETRefData['word_tables']['OET-LV_OT_word_table.tsv'][wordNumber]
-
-                refTuple, rowType, morphemeRowList, lemmaRowList, strongs, morphology, word, noCantillations, morphemeGlosses, contextualMorphemeGlosses, wordGloss, contextualWordGloss, glossCapitalisation, glossPunctuation, glossOrder, glossInsert, role, nesting, tags = wordRow.split( '\t' )
+                wordRow = state.OETRefData['word_tables']['OET-LV_OT_word_table.tsv'].getRow( wordNumber )
+                strongs, morphology, noCantillations = wordRow['Strongs'], wordRow['Morphology'], wordRow['NoCantillations']
                 transliteratedWord = ','.join( [transliterate_Hebrew(part) for part in noCantillations.split(',')] ) # Need to split at commas for correct transliteration
                 transliteratedWordForTitle = transliteratedWord.replace( 'ə', '~~SCHWA~~' ) # Protect it so not adjusted in the title field
 
@@ -672,9 +673,8 @@ def livenOETCompatibleWordLinks( level:int, bibleObject:InternalBible, BBB:str,
                 # wordnumberMatch = linkedGreekWordNumberRegex.search( original_text, titleMatch.end()+4 ) # After the following href
                 # assert wordnumberMatch, f"{BBB} {placeholderOriginalLanguageWord=} {original_text=}"
                 # wordNumber = int( wordnumberMatch.group(1) )
-                wordRow = state.OETRefData['word_tables']['OET-LV_NT_word_table.tsv'][wordNumber]
-                # SRLemma = wordRow.split( '\t' )[2]
-                _ref, greekWord, SRLemma, _GrkLemma, _VLTGlossWordsStr, _OETGlossWordsStr, _glossCaps, _probability, extendedStrongs, roleLetter, morphology, _tagsStr = wordRow.split( '\t' )
+                wordRow = state.OETRefData['word_tables']['OET-LV_NT_word_table.tsv'].getRow( wordNumber )
+                greekWord, SRLemma, extendedStrongs, roleLetter, morphology = wordRow['GreekWord'], wordRow['SRLemma'], wordRow['StrongsExt'], wordRow['Role'], wordRow['Morphology']
                 transliteratedWord = transliterate_Greek( greekWord )
 
                 # Do colourisation
@@ -719,9 +719,8 @@ def livenOETCompatibleWordLinks( level:int, bibleObject:InternalBible, BBB:str,
                 # wordnumberMatch = linkedHebrewWordNumberRegex.search( original_text, titleMatch.end()+4 ) # After the following href
                 # assert wordnumberMatch, f"{BBB} {original_text=}"
                 # wordNumber = int( wordnumberMatch.group(1) )
-                wordRow = state.OETRefData['word_tables']['OET-LV_OT_word_table.tsv'][wordNumber]
-
-                ref, rowType, morphemeRowList, lemmaRowList, strongs, morphology, word, noCantillations, morphemeGlosses, contextualMorphemeGlosses, wordGloss, contextualWordGloss, glossCapitalisation, glossPunctuation, glossOrder, glossInsert, role, nesting, tags = wordRow.split( '\t' )
+                wordRow = state.OETRefData['word_tables']['OET-LV_OT_word_table.tsv'].getRow( wordNumber )
+                strongs, morphology, noCantillations = wordRow['Strongs'], wordRow['Morphology'], wordRow['NoCantillations']
                 transliteratedWord = ','.join( [transliterate_Hebrew(part) for part in noCantillations.split(',')] ) # Need to split at commas for correct transliteration
                 transliteratedWordForTitle = transliteratedWord.replace( 'ə', '~~SCHWA~~' ) # Protect it so not adjusted in the title field
 
@@ -841,7 +840,7 @@ def findLVQuote( level:int, BBB:str, C:str, V:str, occurrenceNumber:int, origina
 
     if wordNumberStr: # Now we have a word number from the correct verse
         wordTable = state.OETRefData['word_tables'][wordFileName]
-        firstWordNumber,lastWordNumber = state.OETRefData['word_table_indexes'][wordFileName][ref]
+        firstWordNumber,lastWordNumber = state.OETRefData['word_table_indexes'][wordFileName].getWordNumberRange( BBB, C, V )
         # # Go backwards through the ESFM table until we find the first word in this B/C/V
         # firstWordNumber = getSmallLeadingInt( wordNumberStr )
         # rowStr = wordTable[firstWordNumber]
@@ -894,37 +893,35 @@ def findLVQuote( level:int, BBB:str, C:str, V:str, occurrenceNumber:int, origina
                 inGap = True
                 continue # Pass over whatever this SR row was (i.e., sort of match the ampersand)
 
-            rowStr = wordTable[wordNumber+wordNumberOffset]
-            # if not rowStr.startswith( f'{BBB}_{C}:{V}w' ): # gone into the next verse
+            row = wordTable.getRow( wordNumber+wordNumberOffset )
+            # if not row['Ref'].startswith( f'{BBB}_{C}:{V}w' ): # gone into the next verse
             #     break
-            row = rowStr.split( '\t' )
             if not NT:
-                while row[1]=='seg' or 'note' in row[1]: #('־','׃'): # maqqaf
-                    # print( f"<<< {wordNumber+wordNumberOffset}: {row[0]} Skip Hebrew {row[1]} >>>" )
+                while row['RowType']=='seg' or 'note' in row['RowType']: #('־','׃'): # maqqaf
+                    # print( f"<<< {wordNumber+wordNumberOffset}: {row['Ref']} Skip Hebrew {row['RowType']} >>>" )
                     wordNumberOffset += 1
                     if wordNumber+wordNumberOffset > lastWordNumber:
                         break
-                    rowStr = wordTable[wordNumber+wordNumberOffset]
-                    row = rowStr.split( '\t' )
+                    row = wordTable.getRow( wordNumber+wordNumberOffset )
             if wordNumber+wordNumberOffset > lastWordNumber:
                 break
-            assert rowStr.startswith( f'{ref}w' ), f"{ref} {rowStr=}"
+            assert row['Ref'].startswith( f'{ref}w' ), f"{ref} {row.getFields()=}"
 
             if NT:
                 #  0    1          2        3           4              5              6          7            8           9     10          11
                 # 'Ref\tGreekWord\tSRLemma\tGreekLemma\tVLTGlossWords\tOETGlossWords\tGlossCaps\tProbability\tStrongsExt\tRole\tMorphology\tTags'
                 # assert rowStr.startswith( f'{ref}w' ), f"{ref} {rowStr=}"
-                if row[7] != 'X': # This Greek word is not in the GNT text
+                if row['Probability'] != 'X': # This Greek word is not in the GNT text
                     continue
                 # assert int(row[7]), f"{ref} {row=}"
 
                 # NOTE: We have to replace MODIFIER LETTER APOSTROPHE with RIGHT SINGLE QUOTATION MARK to match correctly
-                if row[1].replace('ʼ','’') == olWord: # we have a Greek word match
+                if row['GreekWord'].replace('ʼ','’') == olWord: # we have a Greek word match
                     if currentOccurrenceNumber > 0:
                         assert olIndex == 0
                         currentOccurrenceNumber -= 1
                     if currentOccurrenceNumber == 0: # We can start matching up now
-                        lvEnglishWords.append( row[4].replace(' ','_') )
+                        lvEnglishWords.append( row['VLTGlossWords'].replace(' ','_') )
                         inGap = False
                         if olIndex == 0:
                             matchStart = -wordNumber # negative so don't get double match below
@@ -939,16 +936,16 @@ def findLVQuote( level:int, BBB:str, C:str, V:str, occurrenceNumber:int, origina
                 #  0    1        2             3        4           5     6                7                8                          9          10                   11                   12                13          14           15    16       17
                 # 'Ref\tRowType\tLemmaRowList\tStrongs\tMorphology\tWord\tNoCantillations\tMorphemeGlosses\tContextualMorphemeGlosses\tWordGloss\tContextualWordGloss\tGlossCapitalisation\tGlossPunctuation\tGlossOrder\tGlossInsert\tRole\tNesting\tTags'
                 # assert rowStr.startswith( ref ), f"{ref} {rowStr=}" # without the 'w' because segs and notes don't have word numbers
-                # print( f"{ref} {wordNumber=}+{wordNumberOffset}={wordNumber+wordNumberOffset}/{lastWordNumber} {row[6]=} vs {olWord=} {olIndex=}")
-                if row[6] == olWord: # we have a Hebrew word match
+                # print( f"{ref} {wordNumber=}+{wordNumberOffset}={wordNumber+wordNumberOffset}/{lastWordNumber} {row['Word']=} vs {olWord=} {olIndex=}")
+                if row['Word'] == olWord: # we have a Hebrew word match
                     # print( "  Matched" )
                     if currentOccurrenceNumber > 0:
                         assert olIndex == 0
                         currentOccurrenceNumber -= 1
                     if currentOccurrenceNumber == 0: # We can start matching up now
-                        gloss = row[10] if row[10] else row[9] if row[9] else row[8] if row[8] else row[7]
+                        gloss = row['WordGloss'] or row['ContextualMorphemeGlosses'] or row['MorphemeGlosses'] or row['NoCantillations']
                         if not gloss:
-                            logging.critical( f"No available gloss1 for Hebrew {row}" )
+                            logging.critical( f"No available gloss1 for Hebrew {row.getFields()}" )
                         # assert gloss, f"{BBB} {C}:{V} {row=}"
                         lvEnglishWords.append( gloss.replace(' ','_') )
                         inGap = False
@@ -968,23 +965,22 @@ def findLVQuote( level:int, BBB:str, C:str, V:str, occurrenceNumber:int, origina
             for wordNumber in range( firstWordNumber, firstWordNumber+999 ):
                 if wordNumber >= len(wordTable): # we must be in one of the last verses of Rev
                     break
-                rowStr = wordTable[wordNumber]
-                if not rowStr.startswith( f'{ref}' ): # gone into the next verse
+                row = wordTable.getRow( wordNumber )
+                if not row['Ref'].startswith( f'{ref}' ): # gone into the next verse
                     break
-                row = rowStr.split( '\t' )
                 if NT:
-                    if row[7] != 'X': # SR/probability: This Greek word is not in the GNT text
+                    if row['Probability'] != 'X': # SR/probability: This Greek word is not in the GNT text
                         continue
-                    # assert int(row[7]), f"{row=}"
+                    # assert int(row['Probability']), f"{row.getFields()=}"
                     if matchStart == -wordNumber:
                         matchStart = len(ourWords) # Convert to index of these words
-                    ourWords.append( row[1] )
+                    ourWords.append( row['GreekWord'] )
                 else: # OT
                     if matchStart == -wordNumber:
                         matchStart = len(ourWords) # Convert to index of these words
-                    gloss = row[10] if row[10] else row[9] if row[9] else row[8] if row[8] else row[7]
+                    gloss = row['WordGloss'] or row['ContextualMorphemeGlosses'] or row['MorphemeGlosses'] or row['NoCantillations']
                     if not gloss:
-                        logging.error( f"No available gloss2 for Hebrew {row}" )
+                        logging.error( f"No available gloss2 for Hebrew {row.getFields()}" )
                     # assert gloss, f"{BBB} {C}:{V} {row=}"
                     ourWords.append( gloss )
             lvEnglishWords.append( f'''(Some words not found in {'<a href="#SR-GNT">SR-GNT</a>' if NT else '<a href="#UHB">UHB</a>'}: {' '.join( ourWords )})''' )
@@ -0,0 +1,200 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# backgroundRemover.py
+#
+# Module handling deleting old OpenBibleData folder trees in the background
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling deleting old OpenBibleData folder trees in the background.
+
+Deleting hundreds of thousands of old pages takes minutes,
+    so instead each old folder is renamed into a trash folder (which is instant)
+    and then deleted by a pool of threads while the new pages are being made.
+
+Note: the threads only make os calls (no logging or printing)
+    so it's still safe to fork worker processes while they're running.
+
+BackgroundRemover( trashFolder:Path, numThreads:int=4 )
+    remove( folderOrFilepath:Path ) -> bool
+    join() -> dict
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version
+"""
+from pathlib import Path
+import os
+import shutil
+import logging
+from time import time
+from concurrent.futures import ThreadPoolExecutor
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "backgroundRemover"
+PROGRAM_NAME = "OpenBibleData background remover"
+PROGRAM_VERSION = '0.10'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+def _deleteTree( folderPath:str ) -> tuple[int,int]:
+    """
+    Deletes the folder and everything in it (like shutil.rmtree)
+
+    Returns the number of files and bytes deleted.
+    """
+    numFiles = numBytes = 0
+    for folderName, subfolderNames, filenames in os.walk( folderPath, topdown=False ):
+        for filename in filenames:
+            filepath = os.path.join( folderName, filename )
+            try:
+                numBytes += os.lstat( filepath ).st_size
+                os.unlink( filepath )
+                numFiles += 1
+            except FileNotFoundError: pass
+        for subfolderName in subfolderNames:
+            subfolderPath = os.path.join( folderName, subfolderName )
+            if os.path.islink( subfolderPath ): os.unlink( subfolderPath )
+            else: os.rmdir( subfolderPath )
+    os.rmdir( folderPath )
+    return numFiles, numBytes
+# end of backgroundRemover._deleteTree
+
+
+class BackgroundRemover:
+    """
+    Moves folders out of the way and deletes them using a pool of threads
+    """
+    def __init__( self, trashFolder:Path, numThreads:int=4 ) -> None:
+        """
+        Anything that's already in the trash folder (e.g., from a build that crashed) is deleted as well.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BackgroundRemover.__init__( {trashFolder}, {numThreads} )" )
+        self.trashFolder = trashFolder
+        self.executor = ThreadPoolExecutor( max_workers=numThreads, thread_name_prefix='OBD-remover' )
+        self.futures = []
+        self.startTime = time()
+        self.numTrashed = 0
+        os.makedirs( trashFolder, exist_ok=True )
+        with os.scandir( trashFolder ) as dirEntries:
+            for dirEntry in dirEntries:
+                self.futures.append( self.executor.submit( _deleteTree, dirEntry.path ) )
+    # end of BackgroundRemover.__init__
+
+    def remove( self, folderOrFilepath:Path ) -> bool:
+        """
+        Renames the folder into the trash folder and then deletes it in the background.
+        (Files are simply unlinked straight away.)
+
+        If the trash folder is on a different filesystem, the folder is deleted now instead.
+
+        Returns False if there was nothing there.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BackgroundRemover.remove( {folderOrFilepath} )" )
+        if not os.path.isdir( folderOrFilepath ) or os.path.islink( folderOrFilepath ):
+            try: os.unlink( folderOrFilepath )
+            except FileNotFoundError: return False
+            return True
+        self.numTrashed += 1
+        trashPath = self.trashFolder.joinpath( f'{self.numTrashed}_{os.getpid()}_{Path( folderOrFilepath ).name}' )
+        try: os.rename( folderOrFilepath, trashPath )
+        except FileNotFoundError: return False
+        except OSError as err: # Probably a different filesystem
+            logging.warning( f"Couldn't move {folderOrFilepath} to {trashPath} ({err}) so deleting it now" )
+            shutil.rmtree( folderOrFilepath )
+            return True
+        self.futures.append( self.executor.submit( _deleteTree, str( trashPath ) ) )
+        return True
+    # end of BackgroundRemover.remove
+
+    def join( self ) -> dict:
+        """
+        Wait for all the deletions to finish.
+
+        Returns a dict with the time taken (since we started), and the number of files and bytes deleted.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "BackgroundRemover.join()" )
+        waitStartTime = time()
+        numFiles = numBytes = 0
+        for future in self.futures:
+            try:
+                futureFiles, futureBytes = future.result()
+                numFiles += futureFiles
+                numBytes += futureBytes
+            except OSError as err:
+                logging.error( f"Background deletion failed: {err}" )
+        self.executor.shutdown()
+        results = { 'name':'backgroundDeletion', 'pid':os.getpid(), 'wallSeconds':round( time() - self.startTime, 2 ), 'cpuSeconds':None,
+                    'waitSeconds':round( time() - waitStartTime, 2 ), 'peakRssMB':None, 'filesWritten':None, 'bytesWritten':None,
+                    'numTrees':len(self.futures), 'filesDeleted':numFiles, 'bytesDeleted':numBytes }
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Background deletion of {results['numTrees']:,} trees took {results['wallSeconds']/60:.1f} minutes"
+                                                f" (waited {results['waitSeconds']:.1f} seconds at the end) and reclaimed {numFiles:,} files ({numBytes/1_000_000:,.1f} MB)." )
+        self.futures = []
+        return results
+    # end of BackgroundRemover.join
+# end of class BackgroundRemover
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the BackgroundRemover object
+    import tempfile
+    with tempfile.TemporaryDirectory() as tempFolder:
+        demoFolder = Path( tempFolder ).joinpath( 'demo/' )
+        os.makedirs( demoFolder )
+        for n in range( 100 ): demoFolder.joinpath( f'{n}.htm' ).write_text( 'Demo page\n' )
+        backgroundRemover = BackgroundRemover( Path( tempFolder ).joinpath( 'trash/' ) )
+        backgroundRemover.remove( demoFolder )
+        backgroundRemover.join()
+# end of backgroundRemover.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of backgroundRemover.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of backgroundRemover.py
@@ -0,0 +1,533 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# benchmarks.py
+#
+# Module timing parts of the OpenBibleData build
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module timing parts of the OpenBibleData build
+    so that different ways of doing them can be compared side by side.
+
+Run with, e.g., 'uv run benchmarks.py --benchmark preload'
+
+benchmarkPreload( state:State, numJobs:int, fromSource:bool=True ) -> dict[str,float]
+benchmarkEntryCodec( state:State ) -> dict[str,dict]
+benchmarkWordTables( state:State ) -> dict[str,float]
+benchmarkEncodedColumns( state:State ) -> dict[str,float]
+benchmarkLemmaPages( state:State ) -> dict[str,float]
+benchmarkMorphologyDecodes( state:State ) -> dict[str,float]
+printComparison( title:str, timings:dict[str,float] ) -> None
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version with serial and parallel preload benchmark
+    2026-10-16 Add entryCodec versus pickle benchmark
+    2026-10-16 Add word table benchmark (splitting every time versus the columnar WordTables)
+    2026-10-16 Add encoded columns benchmark (memory and grouping by strings versus codes)
+    2026-10-16 Add lemma pages benchmark (scanning all the lemmas and glosses for every page versus the LemmaIndex)
+    2026-10-16 Add morphology decodes benchmark (decoding every word row versus the MorphologyTables)
+    2026-10-16 Preload from the source files by default (--from-pickles for the cache hit case)
+"""
+from time import time
+from collections import defaultdict
+import sys
+import pickle
+import multiprocessing
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint, BOOKLIST_OT39, BOOKLIST_NT27
+
+from settings import State, state
+import Bibles
+from Bibles import preloadVersions
+from entryCodec import encodeEntryList, decodeEntryList
+from wordTable import WordTable, EncodedColumn
+from lemmaIndex import LemmaIndex
+from morphologyTable import MorphologyTable
+from wordIndexes import getWordIndexes
+import createOETReferencePages
+from createOETReferencePages import KNOWN_GREEK_PREFIXES, COMMON_ENGLISH_WORDS_LIST, SIMILAR_GLOSS_WORDS_DICT, CONTRASTIVE_GLOSS_WORDS_DICT
+from buildReport import startMeasurement, finishMeasurement
+from buildStages import getMemoryUsage
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "benchmarks"
+PROGRAM_NAME = "OpenBibleData benchmarks"
+PROGRAM_VERSION = '0.15'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+BENCHMARK_NAMES = ('preload','entries','wordTables','encodedColumns','lemmaPages','morphology')
+NUM_BENCHMARK_WORD_TABLE_FIELDS = 4 # How many of the (first) columns of each row to fetch (like a typical word page or verse function does)
+NUM_BENCHMARK_LEMMA_PAGES = 500 # The old way scans every lemma for every lemma page, so only time the lookups for this many (evenly spaced) lemmas
+
+
+def _expandBooksToLoad( state:State ) -> None:
+    """
+    Same as createSitePages does before preloading
+    """
+    for versionAbbreviation in state.BibleVersions:
+        state.booksToLoad[versionAbbreviation] = BOOKLIST_OT39 if state.booksToLoad[versionAbbreviation]==['OT'] \
+                                            else BOOKLIST_NT27 if state.booksToLoad[versionAbbreviation]==['NT'] \
+                                            else state.booksToLoad[versionAbbreviation]
+# end of benchmarks._expandBooksToLoad
+
+
+def printComparison( title:str, timings:dict[str,float] ) -> None:
+    """
+    Print the timings side by side (with the first one as the baseline)
+    """
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\n{title}:" )
+    baselineSeconds = next( iter( timings.values() ) )
+    for name, seconds in timings.items():
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {name:<32} {seconds:>8.2f}s  {baselineSeconds/seconds if seconds else 0:>5.1f}x" )
+# end of benchmarks.printComparison
+
+
+def benchmarkPreload( state:State, numJobs:int, fromSource:bool=True ) -> dict[str,float]:
+    """
+    Time preloadVersions() with one process and then with numJobs processes.
+
+    If fromSource is set (the default), the pickle files are ignored (and not rewritten)
+        so every version is loaded from its source files (which is where the worker processes help).
+    Otherwise the versions with current pickle files are loaded from those in the main process
+        (so if they're all current, the two runs do the same thing).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"benchmarkPreload( {numJobs}, {fromSource} )" )
+    _expandBooksToLoad( state )
+    originalBibleVersions = state.BibleVersions[:] # preloadVersions() can remove some
+    originalLoadFlag, originalWriteFlag = state.LOAD_RESOURCES_FROM_PICKLES_FLAG, Bibles.WRITE_PICKLES_FLAG
+    if fromSource:
+        state.LOAD_RESOURCES_FROM_PICKLES_FLAG = Bibles.WRITE_PICKLES_FLAG = False
+
+    timings = {}
+    try:
+        for runNumJobs in (1, numJobs):
+            state.preloadedBibles.clear()
+            state.BibleVersions[:] = originalBibleVersions
+            state.NUM_PRELOAD_JOBS = runNumJobs
+            startTime = time()
+            numVersions = preloadVersions( state )
+            timings[f"{'Serial' if runNumJobs==1 else 'Parallel'} ({runNumJobs} process{'' if runNumJobs==1 else 'es'})"] = time() - startTime
+    finally:
+        state.LOAD_RESOURCES_FROM_PICKLES_FLAG, Bibles.WRITE_PICKLES_FLAG = originalLoadFlag, originalWriteFlag
+    printComparison( f"preloadVersions() for {numVersions} versions from {'source files' if fromSource else 'pickles where current (cache hits are always loaded in the main process)'}", timings )
+    return timings
+# end of benchmarks.benchmarkPreload
+
+
+_entryBenchmarkData = None # Set just before forking so that the worker process inherits it
+
+def _loadEntryListsMP( methodName:str ) -> dict:
+    """
+    Runs in a forked worker process (so that its peak memory isn't affected by the other method)
+        to load all of the serialised entry lists using one method.
+
+    Returns a build report entry (see buildReport.py) with the extra RSS used.
+    """
+    serialisedLists = _entryBenchmarkData[methodName]
+    loadFunction = pickle.loads if methodName == 'pickle' else decodeEntryList
+    startMemoryUsage = getMemoryUsage()
+    measurement = startMeasurement()
+    entryLists = [loadFunction( serialisedList ) for serialisedList in serialisedLists]
+    results = finishMeasurement( methodName, measurement )
+    results['numEntries'] = sum( len(entryList) for entryList in entryLists )
+    results['extraRssMB'] = None if startMemoryUsage is None or results['peakRssMB'] is None \
+                            else results['peakRssMB'] - startMemoryUsage['rss'] // 1024
+    return results
+# end of benchmarks._loadEntryListsMP
+
+
+def benchmarkEntryCodec( state:State ) -> dict[str,dict]:
+    """
+    Compare pickle with entryCodec for the InternalBibleEntryList of every book of every preloaded Bible:
+        the time to save them, the total size, the time to load them, and the extra memory used by the loaded lists.
+    """
+    global _entryBenchmarkData
+    fnPrint( DEBUGGING_THIS_MODULE, "benchmarkEntryCodec()" )
+    if not state.preloadedBibles:
+        _expandBooksToLoad( state )
+        preloadVersions( state )
+
+    serialisedLists = { 'pickle':[], 'entryCodec':[] }
+    saveSeconds = { 'pickle':0.0, 'entryCodec':0.0 }
+    numVersions = numBooks = 0
+    for versionAbbreviation, thisBible in state.preloadedBibles.items():
+        if versionAbbreviation in state.selectedVersesOnlyVersions: continue # These are dicts, not Bible objects
+        numVersions += 1
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Serialising {versionAbbreviation} books…" )
+        for bookObject in thisBible: # Loads each book (if it's not loaded yet)
+            entryList = bookObject._processedLines
+            startTime = time()
+            serialisedLists['pickle'].append( pickle.dumps( entryList, protocol=pickle.HIGHEST_PROTOCOL ) )
+            saveSeconds['pickle'] += time() - startTime
+            startTime = time()
+            serialisedLists['entryCodec'].append( encodeEntryList( entryList ) )
+            saveSeconds['entryCodec'] += time() - startTime
+            numBooks += 1
+
+    _entryBenchmarkData = serialisedLists
+    results = {}
+    for methodName in serialisedLists:
+        with multiprocessing.get_context( 'fork' ).Pool( 1 ) as pool:
+            results[methodName] = pool.apply( _loadEntryListsMP, (methodName,) )
+        results[methodName]['saveSeconds'] = round( saveSeconds[methodName], 2 )
+        results[methodName]['numBytes'] = sum( len(serialisedList) for serialisedList in serialisedLists[methodName] )
+    _entryBenchmarkData = None
+    assert results['pickle']['numEntries'] == results['entryCodec']['numEntries']
+
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\nInternalBibleEntryLists for {numBooks:,} books in {numVersions} versions ({results['pickle']['numEntries']:,} entries):" )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {'':<12} {'Size':>10} {'Save':>9} {'Load':>9} {'Extra RSS':>10}" )
+    for methodName, methodResults in results.items():
+        extraRssString = '?' if methodResults['extraRssMB'] is None else f"{methodResults['extraRssMB']:,}"
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {methodName:<12} {methodResults['numBytes']/1_000_000:>8,.1f}MB {methodResults['saveSeconds']:>8.2f}s {methodResults['wallSeconds']:>8.2f}s {extraRssString:>8}MB" )
+    return results
+# end of benchmarks.benchmarkEntryCodec
+
+
+def benchmarkWordTables( state:State ) -> dict[str,float]:
+    """
+    Compare fetching fields from every row of the OET-LV word tables
+        by splitting the TSV line for every field (as the word table consumers used to do)
+        with the different ways of fetching them from a WordTable.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "benchmarkWordTables()" )
+    if 'OET-LV' not in state.preloadedBibles:
+        _expandBooksToLoad( state )
+        preloadVersions( state )
+    rawWordTables = state.preloadedBibles['OET-LV'].ESFMWordTables
+
+    timings = { 'split per field':0.0, 'split per row':0.0, 'WordTable construction':0.0,
+                'WordTable getColumn':0.0, 'WordTable getRow':0.0, 'WordTable iterFields':0.0 }
+    numTables = numRows = numFields = 0
+    for wordTableFilename, rawWordTable in rawWordTables.items():
+        if rawWordTable is None: continue
+        numTables += 1
+        columnNames = rawWordTable[0].split( '\t' )[:NUM_BENCHMARK_WORD_TABLE_FIELDS]
+        rowNumbers = range( 1, len(rawWordTable) )
+        numRows += len(rowNumbers)
+        numFields += len(rowNumbers) * len(columnNames)
+
+        startTime = time()
+        splitPerFieldResults = [[rawWordTable[n].split( '\t' )[columnIndex] for columnIndex in range( len(columnNames) )] for n in rowNumbers if rawWordTable[n]]
+        timings['split per field'] += time() - startTime
+
+        startTime = time()
+        splitPerRowResults = [rawWordTable[n].split( '\t' )[:len(columnNames)] for n in rowNumbers if rawWordTable[n]]
+        timings['split per row'] += time() - startTime
+
+        startTime = time()
+        wordTable = WordTable( wordTableFilename, rawWordTable )
+        timings['WordTable construction'] += time() - startTime
+
+        startTime = time()
+        columns = [wordTable.getColumn( columnName ) for columnName in columnNames]
+        getColumnResults = [[column[n] for column in columns] for n in rowNumbers if columns[0][n]]
+        timings['WordTable getColumn'] += time() - startTime
+
+        startTime = time()
+        getRowResults = []
+        for n in rowNumbers:
+            row = wordTable.getRow( n )
+            if row[0]: getRowResults.append( [row[columnName] for columnName in columnNames] )
+        timings['WordTable getRow'] += time() - startTime
+
+        startTime = time()
+        iterFieldsResults = [list( fields[:len(columnNames)] ) for fields in wordTable.iterFields() if fields[0]]
+        timings['WordTable iterFields'] += time() - startTime
+
+        assert splitPerFieldResults == splitPerRowResults == getColumnResults == getRowResults == iterFieldsResults
+
+    printComparison( f"OET-LV word tables ({numTables} tables with {numRows:,} rows, fetching {numFields:,} fields)", timings )
+    return timings
+# end of benchmarks.benchmarkWordTables
+
+
+def benchmarkEncodedColumns( state:State ) -> dict[str,float]:
+    """
+    Compare the memory used by the OET-LV OT (Hebrew) word table columns
+        as separate strings for every row versus as EncodedColumns,
+        and the time taken to group and count the rows by their form and gloss
+        (like preprocessHebrewWordsLemmasGlosses does) using the strings versus the codes.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "benchmarkEncodedColumns()" )
+    if 'OET-LV' not in state.preloadedBibles:
+        _expandBooksToLoad( state )
+        preloadVersions( state )
+    wordTableFilename = 'OET-LV_OT_word_table.tsv'
+    rawWordTable = state.preloadedBibles['OET-LV'].ESFMWordTables[wordTableFilename]
+    wordTable = rawWordTable if isinstance( rawWordTable, WordTable ) else WordTable( wordTableFilename, rawWordTable )
+    rowNumbers = range( 1, len(wordTable) )
+    columnNames = ('NoCantillations','Morphology','ContextualWordGloss','LemmaRowList','Strongs','Role','Tags','GlossCapitalisation')
+
+    stringBytes = encodedBytes = 0
+    for columnName in columnNames:
+        column = wordTable.getColumn( columnName )
+        stringBytes += sum( sys.getsizeof( column[n] ) for n in rowNumbers ) + len(rowNumbers) * 8 # Each row with its own str (like after splitting the lines) plus a pointer to it
+        encodedBytes += wordTable.getEncodedColumn( columnName ).getNumBytes()
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\n{wordTableFilename} {len(columnNames)} columns of {len(rowNumbers):,} rows: {stringBytes/1_000_000:,.1f} MB as strings,"
+                                            f" {encodedBytes/1_000_000:,.1f} MB encoded (saving {(stringBytes-encodedBytes)/1_000_000:,.1f} MB)" )
+
+    timings = { 'group split rows by strings':0.0, 'group columns by strings':0.0, 'encode columns':0.0, 'group columns by codes':0.0 }
+    formIndex, morphologyIndex, glossIndex = (wordTable.columnIndexes[columnName] for columnName in columnNames[:3])
+    startTime = time()
+    splitFormRowNumbers, splitFormGlossCounts = defaultdict(list), defaultdict(int)
+    for n in rowNumbers:
+        fields = wordTable[n].split( '\t' )
+        formKey = (fields[formIndex], fields[morphologyIndex]) if fields[0] else ('','')
+        splitFormRowNumbers[formKey].append( n )
+        splitFormGlossCounts[(formKey, fields[glossIndex] if fields[0] else '')] += 1
+    timings['group split rows by strings'] += time() - startTime
+
+    startTime = time()
+    formColumn, morphologyColumn, glossColumn = wordTable.getColumn( 'NoCantillations' ), wordTable.getColumn( 'Morphology' ), wordTable.getColumn( 'ContextualWordGloss' )
+    stringFormRowNumbers, stringFormGlossCounts = defaultdict(list), defaultdict(int)
+    for n in rowNumbers:
+        formKey = (formColumn[n], morphologyColumn[n])
+        stringFormRowNumbers[formKey].append( n )
+        stringFormGlossCounts[(formKey, glossColumn[n])] += 1
+    timings['group columns by strings'] += time() - startTime
+
+    startTime = time()
+    encodedColumns = [EncodedColumn.fromColumn( columnName, wordTable.getColumn( columnName ) ) for columnName in columnNames[:3]]
+    timings['encode columns'] += time() - startTime
+
+    startTime = time()
+    formCodes, morphologyCodes, glossCodes = (encodedColumn.codes for encodedColumn in encodedColumns)
+    codeFormRowNumbers, codeFormGlossCounts = defaultdict(list), defaultdict(int)
+    for n in rowNumbers:
+        formKey = (formCodes[n], morphologyCodes[n])
+        codeFormRowNumbers[formKey].append( n )
+        codeFormGlossCounts[(formKey, glossCodes[n])] += 1
+    timings['group columns by codes'] += time() - startTime
+
+    formValues, morphologyValues, glossValues = (encodedColumn.values for encodedColumn in encodedColumns)
+    assert splitFormRowNumbers == stringFormRowNumbers == { (formValues[formCode],morphologyValues[morphologyCode]):rowNumberList for (formCode,morphologyCode),rowNumberList in codeFormRowNumbers.items() }
+    assert splitFormGlossCounts == stringFormGlossCounts == { ((formValues[formCode],morphologyValues[morphologyCode]),glossValues[glossCode]):count for ((formCode,morphologyCode),glossCode),count in codeFormGlossCounts.items() }
+
+    printComparison( f"Grouping the {len(rowNumbers):,} {wordTableFilename} rows by form and gloss", timings )
+    return timings
+# end of benchmarks.benchmarkEncodedColumns
+
+
+def _loadOETWordIndexes( state:State ) -> None:
+    """
+    Same as createSitePages and createOETReferencePages do before making the reference pages
+    """
+    if 'OET-LV' not in state.preloadedBibles:
+        _expandBooksToLoad( state )
+        preloadVersions( state )
+    if not getattr( state, 'OETRefData', None ):
+        lvBible = state.preloadedBibles['OET-LV']
+        state.OETRefData = { 'word_tables':{} }
+        for wordTableFilename, rawWordTable in lvBible.ESFMWordTables.items():
+            if rawWordTable is None:
+                lvBible.loadESFMWordFile( wordTableFilename )
+                rawWordTable = lvBible.ESFMWordTables[wordTableFilename]
+            state.OETRefData['word_tables'][wordTableFilename] = rawWordTable if isinstance( rawWordTable, WordTable ) else WordTable( wordTableFilename, rawWordTable )
+    state.OETRefData.update( getWordIndexes( 'OET-LV_OT', createOETReferencePages.getHebrewWordIndexesKey( state ), lambda: createOETReferencePages.makeHebrewWordIndexes( state ),
+                                                state.BINARY_WORD_TABLES_FOLDER ) )
+    state.OETRefData.update( getWordIndexes( 'OET-LV_NT', createOETReferencePages.getGreekWordIndexesKey( state ), lambda: createOETReferencePages.makeGreekWordIndexes( state ),
+                                                state.BINARY_WORD_TABLES_FOLDER ) )
+# end of benchmarks._loadOETWordIndexes
+
+
+def _scanLemmaPageLookups( lemma:str, lemmaList:list[str], lemmaGlossesDict:dict[str,set[str]], refColumn:tuple[str,...], rowNumbers:list[int], searchWords:list[str] ) -> tuple[list,set,list]:
+    """
+    The lookups that each lemma page used to do by scanning all the lemmas (for prefixes)
+        and all the glosses of all the lemmas (for similar and contrastive glosses),
+        and by splitting the reference of each word row.
+    """
+    prefixedLemmas = []
+    for otherLemma in lemmaList:
+        if otherLemma and len(otherLemma)>1 and otherLemma != lemma:
+            prefix = None
+            if otherLemma.endswith( lemma ):
+                prefix = otherLemma[:len(otherLemma)-len(lemma)]
+            elif lemma.endswith( otherLemma ):
+                prefix = lemma[:len(lemma)-len(otherLemma)]
+            if prefix and len(prefix) < 6 and prefix in KNOWN_GREEK_PREFIXES:
+                prefixedLemmas.append( (otherLemma, prefix) )
+    glossLemmas = set()
+    for searchWord in searchWords:
+        for otherLemma, otherLemmaGlosses in lemmaGlossesDict.items():
+            if otherLemma != lemma and searchWord in otherLemmaGlosses:
+                glossLemmas.add( otherLemma )
+    rowVerses = []
+    for n in rowNumbers:
+        BBB, CVW = refColumn[n].split( '_', 1 )
+        C, VW = CVW.split( ':', 1 )
+        rowVerses.append( (BBB, C, VW.split( 'w', 1 )[0]) )
+    return prefixedLemmas, glossLemmas, rowVerses
+# end of benchmarks._scanLemmaPageLookups
+
+
+def benchmarkLemmaPages( state:State ) -> dict[str,float]:
+    """
+    Compare the time per Hebrew and Greek lemma page for the lookups
+        that create_Hebrew_lemma_pages and create_Greek_lemma_pages used to do by scanning
+        with making a LemmaIndex (once) and looking them up in it.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "benchmarkLemmaPages()" )
+    _loadOETWordIndexes( state )
+
+    allTimings = {}
+    for languageName, lemmaList, lemmaGlossesDict, wordTableFilename, getLemmaGlosses, getRowNumbers in (
+            ('Hebrew', list( state.OETRefData['OTLemmaGlossDict'] ), state.OETRefData['OTLemmaOETGlossesDict'], createOETReferencePages.HebrewWordFileName,
+                lambda lemmaIndex, lemma: state.OETRefData['OTLemmaGlossDict'][lemma], lambda lemmaIndex, lemma: state.OETRefData['OTWordRowNumbersDict'].get( lemmaIndex+1, [] ) ),
+            ('Greek', sorted( state.OETRefData['NTLemmaDict'] ), state.OETRefData['NTLemmaOETGlossesDict'], createOETReferencePages.GreekWordFileName,
+                lambda lemmaIndex, lemma: sorted( state.OETRefData['NTLemmaOETGlossesDict'][lemma] ), lambda lemmaIndex, lemma: state.OETRefData['NTLemmaDict'][lemma] ) ):
+        wordTable = state.OETRefData['word_tables'][wordTableFilename]
+        refColumn = wordTable.getColumn( 'Ref' )
+        sampleLemmaIndexes = range( 0, len(lemmaList), max( 1, len(lemmaList) // NUM_BENCHMARK_LEMMA_PAGES ) )
+        sampleJobs = []
+        for lemmaIndex in sampleLemmaIndexes:
+            lemma = lemmaList[lemmaIndex]
+            searchWords = []
+            for lemmaGloss in getLemmaGlosses( lemmaIndex, lemma ):
+                if lemmaGloss not in COMMON_ENGLISH_WORDS_LIST:
+                    searchWords.extend( (lemmaGloss,) + SIMILAR_GLOSS_WORDS_DICT.get( lemmaGloss, () ) + tuple( CONTRASTIVE_GLOSS_WORDS_DICT.get( lemmaGloss, () ) ) )
+            sampleJobs.append( (lemma, getRowNumbers( lemmaIndex, lemma )[:100], searchWords) ) # No page lists more than 100 rows of a lemma
+
+        timings = { 'scan every lemma and gloss':0.0, 'LemmaIndex construction':0.0, 'LemmaIndex lookups':0.0 }
+        startTime = time()
+        scanResults = [_scanLemmaPageLookups( lemma, lemmaList, lemmaGlossesDict, refColumn, rowNumbers, searchWords ) for lemma, rowNumbers, searchWords in sampleJobs]
+        timings['scan every lemma and gloss'] += time() - startTime
+
+        startTime = time()
+        lemmaIndex = LemmaIndex( lemmaList, lemmaGlossesDict, KNOWN_GREEK_PREFIXES, wordTable )
+        timings['LemmaIndex construction'] += time() - startTime
+
+        startTime = time()
+        indexResults = [( lemmaIndex.getPrefixedLemmas( lemma ),
+                          {otherLemma for searchWord in searchWords for otherLemma in lemmaIndex.getGlossLemmas( searchWord ) if otherLemma != lemma},
+                          [lemmaIndex.getRowVerse( n ) for n in rowNumbers] )
+                        for lemma, rowNumbers, searchWords in sampleJobs]
+        timings['LemmaIndex lookups'] += time() - startTime
+
+        assert scanResults == indexResults
+
+        printComparison( f"{languageName} lemma page lookups for {len(sampleJobs):,} of the {len(lemmaList):,} lemmas", timings )
+        oldMsPerPage = 1000 * timings['scan every lemma and gloss'] / len(sampleJobs)
+        newMsPerPage = 1000 * (timings['LemmaIndex construction'] / len(lemmaList) + timings['LemmaIndex lookups'] / len(sampleJobs))
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Per {languageName} lemma page: {oldMsPerPage:,.3f}ms before, {newMsPerPage:,.3f}ms after (including a share of the LemmaIndex construction)" )
+        allTimings.update( {f'{languageName} {name}':seconds for name, seconds in timings.items()} )
+    return allTimings
+# end of benchmarks.benchmarkLemmaPages
+
+
+def benchmarkMorphologyDecodes( state:State ) -> dict[str,float]:
+    """
+    Compare decoding the morphology of every row of the full Hebrew and Greek word tables
+        (as the word pages and the app json files used to do)
+        with making a MorphologyTable (once) and looking each row up in it.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "benchmarkMorphologyDecodes()" )
+    _loadOETWordIndexes( state )
+
+    allTimings = {}
+    for languageName, wordTableFilename, decodeFunction, columnNames in (
+            ('Hebrew', createOETReferencePages.HebrewWordFileName, createOETReferencePages.decode_Hebrew_morphology, ('RowType','Morphology')),
+            ('Greek', createOETReferencePages.GreekWordFileName, createOETReferencePages.decode_Greek_morphology, ('Role','Morphology','GlossCaps')) ):
+        wordTable = state.OETRefData['word_tables'][wordTableFilename]
+        columns = [wordTable.getColumn( columnName ) for columnName in columnNames]
+        rowKeys = [tuple( column[n] for column in columns ) for n in range( 1, len(wordTable) )]
+
+        timings = { 'decode every row':0.0, 'MorphologyTable construction':0.0, 'MorphologyTable lookups':0.0 }
+        startTime = time()
+        decodeResults = [decodeFunction( *rowKey ) for rowKey in rowKeys]
+        timings['decode every row'] += time() - startTime
+
+        startTime = time()
+        morphologyTable = MorphologyTable.fromWordTable( f'{languageName} morphology', decodeFunction, wordTable, columnNames )
+        timings['MorphologyTable construction'] += time() - startTime
+
+        startTime = time()
+        tableResults = [morphologyTable.getDecode( *rowKey ) for rowKey in rowKeys]
+        timings['MorphologyTable lookups'] += time() - startTime
+
+        assert decodeResults == tableResults
+
+        printComparison( f"{languageName} morphology decodes for {len(rowKeys):,} word rows ({len(morphologyTable):,} different codes)", timings )
+        allTimings.update( {f'{languageName} {name}':seconds for name, seconds in timings.items()} )
+    return allTimings
+# end of benchmarks.benchmarkMorphologyDecodes
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the benchmarks
+    benchmarkPreload( state, numJobs=state.NUM_PRELOAD_JOBS )
+# end of benchmarks.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    commandLineArguments = BibleOrgSysGlobals.commandLineArguments
+    if 'preload' in commandLineArguments.benchmark:
+        benchmarkPreload( state, numJobs=commandLineArguments.jobs, fromSource=not commandLineArguments.from_pickles )
+    if 'entries' in commandLineArguments.benchmark:
+        benchmarkEntryCodec( state )
+    if 'wordTables' in commandLineArguments.benchmark:
+        benchmarkWordTables( state )
+    if 'encodedColumns' in commandLineArguments.benchmark:
+        benchmarkEncodedColumns( state )
+    if 'lemmaPages' in commandLineArguments.benchmark:
+        benchmarkLemmaPages( state )
+    if 'morphology' in commandLineArguments.benchmark:
+        benchmarkMorphologyDecodes( state )
+# end of benchmarks.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import set_start_method, freeze_support
+    set_start_method('fork') # The default was changed on POSIX systems from 'fork' to 'forkserver' in Python3.14
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    parser.add_argument( '--benchmark', action='append', choices=BENCHMARK_NAMES, default=[],
+                        help="which benchmark(s) to run (can be given more than once) -- default is all of them" )
+    parser.add_argument( '-j', '--jobs', type=int, default=state.NUM_PRELOAD_JOBS, metavar='N',
+                        help=f"number of processes for the parallel runs (default {state.NUM_PRELOAD_JOBS})" )
+    parser.add_argument( '--from-pickles', action='store_true',
+                        help="for the preload benchmark, load the versions with current pickle files from those (rather than loading everything from the source files)" )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+    if not BibleOrgSysGlobals.commandLineArguments.benchmark:
+        BibleOrgSysGlobals.commandLineArguments.benchmark = list( BENCHMARK_NAMES )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of benchmarks.py
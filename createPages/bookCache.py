@@ -0,0 +1,420 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# bookCache.py
+#
+# Module handling OpenBibleData per-book cache files
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling OpenBibleData per-book cache files.
+
+Rather than pickling a whole Bible into one file,
+    each version gets a cache folder, e.g., 'OET-RV.OBD_BookCache/', containing:
+        header.pickle: the Bible object without its books
+        header.json: which books are in the cache (and a few checks)
+        GEN.pickle, EXO.pickle, etc.: one pickled book object each
+            (including its InternalBibleEntryList which is compactly encoded by entryCodec.py)
+
+Loading the cache only unpickles the header,
+    and each book is unpickled the first time that it's accessed, e.g., with thisBible.books['MRK'] or thisBible['MRK'].
+Before forking worker processes, call loadAllBooks() in the main process
+    so that the workers share the books (rather than each unpickling their own private copies).
+
+Objects that the books share with the header (e.g., the containing Bible object or the ESFM word tables)
+    are pickled as references to the header (using the pickle memo indexes)
+    so they're not duplicated in every book file and are still shared after unpickling.
+
+Because the cache remembers which books it holds,
+    a TEST mode build can use a cache made by a full build (and then just drop the other books).
+
+getBookCacheFolderPath( pickleFolderPath:Path, versionAbbreviation:str ) -> Path
+readBookCacheInfo( cacheFolderPath:Path ) -> dict|None
+canLoadBooks( cacheInfo:dict, booksToLoad:list[str] ) -> bool
+saveBookCache( BibleObject, cacheFolderPath:Path, booksToLoad:list[str] ) -> Path
+loadBookCache( cacheFolderPath:Path, booksToLoad:list[str] )
+loadAllBooks( BibleObject ) -> int
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version
+    2026-10-16 Encode InternalBibleEntryLists with entryCodec rather than pickling each entry
+    2026-10-16 Save the number of entries in each book (for the preload profile)
+    2026-10-16 Added loadAllBooks (to load the books before forking) and LazyBookDict.copy()
+"""
+from pathlib import Path
+import os
+import pickle
+import json
+import logging
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from bible_organisational_system import InternalBibleEntryList
+
+from entryCodec import encodeEntryList, decodeEntryList
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "bookCache"
+PROGRAM_NAME = "OpenBibleData book cache handler"
+PROGRAM_VERSION = '0.13'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+BOOK_CACHE_FOLDER_END = '.OBD_BookCache'
+BOOK_CACHE_HEADER_FILENAME = 'header.pickle'
+BOOK_CACHE_INFO_FILENAME = 'header.json' # Written last, so it's only there if the cache is complete
+BOOK_CACHE_FORMAT_VERSION = 1
+ENCODE_ENTRY_LISTS_FLAG = True # Use entryCodec (rather than pickle) for each book's InternalBibleEntryList (much smaller and faster to load)
+
+
+class BookPlaceholder:
+    """
+    Stands in for a book object that hasn't been unpickled yet.
+
+    Normally these are only seen inside a LazyBookDict (which replaces them as the books are accessed),
+        but if any other object in the header refers to a book,
+        it keeps the placeholder which passes attribute lookups through to the real book.
+    """
+    __slots__ = ('_books', 'BBB')
+
+    def __init__( self, books:'LazyBookDict', BBB:str ) -> None:
+        self._books, self.BBB = books, BBB
+    def __getattr__( self, name:str ):
+        return getattr( self._books[self.BBB], name )
+    def __repr__( self ) -> str:
+        return f"BookPlaceholder( {self.BBB} )"
+# end of class BookPlaceholder
+
+
+class LazyBookDict( dict ):
+    """
+    Replaces the books dict of a Bible object loaded from a book cache.
+
+    The keys (BBBs) are all there (in order) from the start,
+        but each book object is only unpickled when it's first fetched.
+
+    It's still a dict (because BibleOrgSys and our code expect the books to be one),
+        but the books are only loaded by the Python methods below.
+    Anything that reads the dict directly (e.g., dict.__getitem__() or C/Rust code using the dict API)
+        sees a BookPlaceholder for any book that's not loaded yet,
+        so call loadAll() (or loadAllBooks()) before passing the books to any such code.
+    """
+    def __init__( self, cacheFolderPath:Path ) -> None:
+        super().__init__()
+        self.cacheFolderPath = cacheFolderPath
+        self.sharedObjects = {} # Header objects that the book files refer to (by their pickle memo index)
+        self.placeholders = {} # For all the books in the cache (even if they're not wanted this time)
+        self.entryCounts = {} # Number of InternalBibleEntries in each book (so they can be counted without loading the books)
+        self.numLoaded = 0
+    # end of LazyBookDict.__init__
+
+    def __getitem__( self, BBB:str ):
+        bookObject = dict.__getitem__( self, BBB )
+        if type(bookObject) is BookPlaceholder:
+            bookObject = self._loadBook( BBB )
+        return bookObject
+    # end of LazyBookDict.__getitem__
+
+    def get( self, BBB:str, default=None ):
+        return self[BBB] if BBB in self else default
+    def values( self ) -> list:
+        return [self[BBB] for BBB in self]
+    def items( self ) -> list[tuple]:
+        return [(BBB,self[BBB]) for BBB in self]
+    def copy( self ) -> dict: # A normal dict (with all the books loaded)
+        return dict( self.items() )
+    def __reduce__( self ): # If it's pickled again, it becomes a normal dict
+        return dict, (self.items(),)
+
+    def isLoaded( self ) -> bool:
+        """
+        Returns True if all the books are loaded (so there are no placeholders left in the dict)
+        """
+        return not any( type(bookObject) is BookPlaceholder for bookObject in dict.values( self ) )
+    # end of LazyBookDict.isLoaded
+
+    def loadAll( self ) -> int:
+        """
+        Unpickle all the books that aren't loaded yet
+
+        Returns the number of books that were loaded.
+        """
+        numLoaded = 0
+        for BBB,bookObject in list( dict.items( self ) ):
+            if type(bookObject) is BookPlaceholder:
+                self._loadBook( BBB )
+                numLoaded += 1
+        return numLoaded
+    # end of LazyBookDict.loadAll
+
+    def getBookOrPlaceholder( self, BBB:str ):
+        """
+        Returns the book object without loading it (so might be a BookPlaceholder)
+        """
+        return dict.__getitem__( self, BBB ) if BBB in self else self.placeholders[BBB]
+    # end of LazyBookDict.getBookOrPlaceholder
+
+    def _loadBook( self, BBB:str ):
+        """
+        Unpickle the book object and put it in place of the placeholder
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"LazyBookDict._loadBook( {BBB} ) from {self.cacheFolderPath}/" )
+        bookFilepath = self.cacheFolderPath.joinpath( f'{BBB}.pickle' )
+        try:
+            with open( bookFilepath, 'rb' ) as bookFile:
+                bookObject = _BookUnpickler( bookFile, self ).load()
+        except (OSError, pickle.UnpicklingError, EOFError) as err:
+            logging.critical( f"Unable to load {BBB} from book cache {bookFilepath}: {err}" )
+            raise
+        dict.__setitem__( self, BBB, bookObject )
+        self.numLoaded += 1
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Loaded {BBB} from book cache {self.cacheFolderPath.name}/ ({self.numLoaded}/{len(self)} books now loaded)." )
+        return bookObject
+    # end of LazyBookDict._loadBook
+# end of class LazyBookDict
+
+
+class _HeaderPickler( pickle.Pickler ):
+    """
+    Pickles the Bible object with references in place of the book objects
+    """
+    def __init__( self, file, BibleObject ) -> None:
+        super().__init__( file, protocol=pickle.HIGHEST_PROTOCOL )
+        self.bookIDs = { id(bookObject):BBB for BBB,bookObject in BibleObject.books.items() }
+    def persistent_id( self, obj ):
+        BBB = self.bookIDs.get( id(obj) )
+        return None if BBB is None else ('book', BBB)
+# end of class _HeaderPickler
+
+
+class _BookPickler( pickle.Pickler ):
+    """
+    Pickles one book object with references in place of the other books and of any objects that are already in the header
+        (and with its InternalBibleEntryList(s) encoded by entryCodec)
+    """
+    def __init__( self, file, bookObject, bookIDs:dict[int,str], headerMemo:dict[int,int], sharedIndexes:set[int] ) -> None:
+        super().__init__( file, protocol=pickle.HIGHEST_PROTOCOL )
+        self.bookObject, self.bookIDs, self.headerMemo, self.sharedIndexes = bookObject, bookIDs, headerMemo, sharedIndexes
+    def reducer_override( self, obj ):
+        if ENCODE_ENTRY_LISTS_FLAG and type(obj) is InternalBibleEntryList:
+            try: return decodeEntryList, (encodeEntryList( obj ),)
+            except (ValueError, TypeError, AttributeError, OverflowError) as err:
+                logging.warning( f"Unable to encode {len(obj):,} entries compactly ({err}) so pickling them instead" )
+        return NotImplemented
+    def persistent_id( self, obj ):
+        if obj is self.bookObject: return None
+        BBB = self.bookIDs.get( id(obj) )
+        if BBB is not None: return ('book', BBB)
+        memoIndex = self.headerMemo.get( id(obj) )
+        if memoIndex is None: return None
+        self.sharedIndexes.add( memoIndex )
+        return ('header', memoIndex)
+# end of class _BookPickler
+
+
+class _HeaderUnpickler( pickle.Unpickler ):
+    def __init__( self, file, books:LazyBookDict ) -> None:
+        super().__init__( file )
+        self.books = books
+    def persistent_load( self, pid ):
+        assert pid[0] == 'book', f"Unexpected book cache header reference {pid}"
+        return BookPlaceholder( self.books, pid[1] )
+# end of class _HeaderUnpickler
+
+
+class _BookUnpickler( pickle.Unpickler ):
+    def __init__( self, file, books:LazyBookDict ) -> None:
+        super().__init__( file )
+        self.books = books
+    def persistent_load( self, pid ):
+        if pid[0] == 'book': return self.books.getBookOrPlaceholder( pid[1] )
+        try: return self.books.sharedObjects[pid[1]]
+        except KeyError: raise pickle.UnpicklingError( f"Book cache refers to unknown header object {pid}" )
+# end of class _BookUnpickler
+
+
+def getBookCacheFolderPath( pickleFolderPath:Path, versionAbbreviation:str ) -> Path:
+    return Path( pickleFolderPath ).joinpath( f'{versionAbbreviation}{BOOK_CACHE_FOLDER_END}' )
+# end of bookCache.getBookCacheFolderPath
+
+
+def readBookCacheInfo( cacheFolderPath:Path ) -> dict|None:
+    """
+    Returns the dict saved with the cache
+        or None if there's no (complete) cache in the folder.
+    """
+    try:
+        with open( cacheFolderPath.joinpath( BOOK_CACHE_INFO_FILENAME ), 'rt', encoding='utf-8' ) as infoFile:
+            cacheInfo = json.load( infoFile )
+    except (FileNotFoundError, json.JSONDecodeError): return None
+    return cacheInfo if cacheInfo.get( 'formatVersion' ) == BOOK_CACHE_FORMAT_VERSION else None
+# end of bookCache.readBookCacheInfo
+
+
+def canLoadBooks( cacheInfo:dict, booksToLoad:list[str] ) -> bool:
+    """
+    Returns True if the cache was made with all the books that we want now.
+    """
+    return cacheInfo['booksToLoad'] == ['ALL'] or set( booksToLoad ) <= set( cacheInfo['booksToLoad'] )
+# end of bookCache.canLoadBooks
+
+
+def saveBookCache( BibleObject, cacheFolderPath:Path, booksToLoad:list[str] ) -> Path|None:
+    """
+    Save the Bible object into the cache folder (replacing any previous cache there).
+
+    booksToLoad is the list of books that was requested when the Bible was loaded (so might be ['ALL']).
+    If the cache there already has books that aren't in booksToLoad (e.g., from a full build
+        and this is only a TEST or --books build), it's left as it is (and nothing is saved).
+
+    Returns the header filepath (or None if the cache wasn't saved).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"saveBookCache( {BibleObject.abbreviation}, {cacheFolderPath}, {booksToLoad} )" )
+    cacheInfo = readBookCacheInfo( cacheFolderPath )
+    if cacheInfo is not None and booksToLoad != ['ALL'] \
+    and (cacheInfo['booksToLoad'] == ['ALL'] or not set( booksToLoad ) >= set( cacheInfo['booksToLoad'] )):
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Not replacing {BibleObject.abbreviation} book cache for {cacheInfo['booksToLoad']} with only {booksToLoad}." )
+        return None
+    os.makedirs( cacheFolderPath, exist_ok=True )
+    infoFilepath = cacheFolderPath.joinpath( BOOK_CACHE_INFO_FILENAME )
+    try: os.unlink( infoFilepath ) # The cache isn't valid again until we write this at the end
+    except FileNotFoundError: pass
+
+    headerFilepath = cacheFolderPath.joinpath( BOOK_CACHE_HEADER_FILENAME )
+    with open( headerFilepath, 'wb' ) as headerFile:
+        headerPickler = _HeaderPickler( headerFile, BibleObject )
+        headerPickler.dump( BibleObject )
+    headerMemo = { objectID:memoIndex for objectID,(memoIndex,_obj) in headerPickler.memo.copy().items() }
+
+    sharedIndexes, entryCounts = set(), {}
+    for BBB,bookObject in BibleObject.books.items():
+        processedLines = getattr( bookObject, '_processedLines', None )
+        if processedLines is not None: entryCounts[BBB] = len(processedLines)
+        with open( cacheFolderPath.joinpath( f'{BBB}.pickle' ), 'wb' ) as bookFile:
+            _BookPickler( bookFile, bookObject, headerPickler.bookIDs, headerMemo, sharedIndexes ).dump( bookObject )
+    with os.scandir( cacheFolderPath ) as dirEntries: # Remove any books that we don't have this time
+        for dirEntry in dirEntries:
+            if dirEntry.name.endswith( '.pickle' ) and dirEntry.name != BOOK_CACHE_HEADER_FILENAME \
+            and dirEntry.name[:-len('.pickle')] not in BibleObject.books:
+                os.unlink( dirEntry.path )
+
+    with open( infoFilepath, 'wt', encoding='utf-8' ) as infoFile:
+        json.dump( {'formatVersion':BOOK_CACHE_FORMAT_VERSION, 'abbreviation':BibleObject.abbreviation,
+                    'booksToLoad':booksToLoad, 'BBBs':list( BibleObject.books ),
+                    'headerMemoSize':len(headerMemo), 'sharedIndexes':sorted( sharedIndexes ), 'entryCounts':entryCounts}, infoFile )
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Saved {BibleObject.abbreviation} header and {len(BibleObject.books)} books into {cacheFolderPath}/ (sharing {len(sharedIndexes):,} header objects)." )
+    return headerFilepath
+# end of bookCache.saveBookCache
+
+
+def loadBookCache( cacheFolderPath:Path, booksToLoad:list[str] ):
+    """
+    Load the Bible object (without any of its books yet) from the cache folder,
+        and then remove any books that aren't in booksToLoad (unless it's ['ALL']).
+
+    Returns the Bible object.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"loadBookCache( {cacheFolderPath}, {booksToLoad} )" )
+    cacheInfo = readBookCacheInfo( cacheFolderPath )
+    if cacheInfo is None: raise FileNotFoundError( f"No complete book cache in {cacheFolderPath}/" )
+
+    books = LazyBookDict( cacheFolderPath )
+    with open( cacheFolderPath.joinpath( BOOK_CACHE_HEADER_FILENAME ), 'rb' ) as headerFile:
+        headerUnpickler = _HeaderUnpickler( headerFile, books )
+        BibleObject = headerUnpickler.load()
+    headerMemo = headerUnpickler.memo.copy()
+    if len(headerMemo) != cacheInfo['headerMemoSize']: # The book files would refer to the wrong objects
+        raise pickle.UnpicklingError( f"Book cache header in {cacheFolderPath}/ has {len(headerMemo):,} objects (expected {cacheInfo['headerMemoSize']:,})" )
+    books.sharedObjects = { memoIndex:headerMemo[memoIndex] for memoIndex in cacheInfo['sharedIndexes'] }
+    books.placeholders = dict( BibleObject.books )
+    books.entryCounts = cacheInfo.get( 'entryCounts', {} ) # Not in older caches
+
+    for BBB,bookPlaceholder in BibleObject.books.items():
+        if booksToLoad == ['ALL'] or BBB in booksToLoad:
+            dict.__setitem__( books, BBB, bookPlaceholder )
+    BibleObject.books = books
+    vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Loaded {BibleObject.abbreviation} header from {cacheFolderPath}/ with {len(books)}/{len(cacheInfo['BBBs'])} books available." )
+    return BibleObject
+# end of bookCache.loadBookCache
+
+
+def loadAllBooks( BibleObject ) -> int:
+    """
+    Load any books of the Bible object that are still in its book cache
+        (e.g., before forking worker processes so that they all share the loaded books).
+
+    Returns the number of books that were loaded (always zero if the Bible wasn't loaded from a book cache).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"loadAllBooks( {getattr( BibleObject, 'abbreviation', BibleObject )} )" )
+    books = getattr( BibleObject, 'books', None )
+    if not isinstance( books, LazyBookDict ): return 0
+    numLoaded = books.loadAll()
+    assert books.isLoaded()
+    return numLoaded
+# end of bookCache.loadAllBooks
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the book cache
+    import tempfile
+    from types import SimpleNamespace
+    demoBible = SimpleNamespace( abbreviation='DEMO', books={}, wordTable=['word1','word2'] )
+    for BBB in ('MRK','GAL'):
+        demoBible.books[BBB] = SimpleNamespace( BBB=BBB, containerBibleObject=demoBible, wordTable=demoBible.wordTable,
+                                                _processedLines=[f'{BBB} line 1', f'{BBB} line 2'] )
+    with tempfile.TemporaryDirectory() as tempFolder:
+        cacheFolderPath = getBookCacheFolderPath( Path( tempFolder ), demoBible.abbreviation )
+        saveBookCache( demoBible, cacheFolderPath, ['ALL'] )
+        loadedBible = loadBookCache( cacheFolderPath, ['MRK'] )
+        loadedBook = loadedBible.books['MRK']
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {list(loadedBible.books)=} {loadedBook._processedLines=} {loadedBook.containerBibleObject is loadedBible=} {loadedBook.wordTable is loadedBible.wordTable=}" )
+# end of bookCache.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of bookCache.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of bookCache.py
@@ -0,0 +1,294 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# buildDaemon.py
+#
+# Module handling the OpenBibleData warm build daemon (and its client)
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling the OpenBibleData warm build daemon (and its client).
+
+While developing, every test build spends a long time preloading the Bibles and word tables
+    before it writes a single page.
+Instead, 'uv run createSitePages.py --daemon' preloads everything once
+    and then waits for build requests on a Unix domain socket (state.BUILD_DAEMON_SOCKET_PATH).
+
+Each request is built in a forked child process (so it starts with everything already in memory,
+    and anything that it changes or releases doesn't affect the daemon or the next request).
+The output of the child is sent back through the socket as it's built,
+    followed by a NUL and then a small JSON status, e.g., {"exitStatus":0}.
+
+Run the client with, e.g., 'uv run buildDaemon.py --stages par --books MRK,GAL --output-folder ../testPages/'
+    and it exits with the exit status of the child process that did the build.
+'uv run buildDaemon.py --stop' stops the daemon.
+
+The requests are handled one at a time (in the order that they're received).
+
+serveBuildRequests( socketPath:Path, buildFunction ) -> None
+sendBuildRequest( socketPath:Path, request:dict, outputFile=None ) -> int
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version
+"""
+from pathlib import Path
+import sys
+import os
+import socket
+import json
+import logging
+import traceback
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+from settings import state
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "buildDaemon"
+PROGRAM_NAME = "OpenBibleData build daemon"
+PROGRAM_VERSION = '0.10'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+STATUS_SEPARATOR = b'\x00' # Never in the build output (which is text)
+MAX_REQUEST_BYTES = 64_000
+BAD_REQUEST_EXIT_STATUS = 2
+
+
+def _removeStaleSocket( socketPath:Path ) -> None:
+    """
+    Remove the socket file left by a daemon that didn't close down properly.
+
+    Raises a RuntimeError if there's a daemon still listening on it.
+    """
+    if not os.path.exists( socketPath ): return
+    with socket.socket( socket.AF_UNIX, socket.SOCK_STREAM ) as testSocket:
+        try: testSocket.connect( str(socketPath) )
+        except ConnectionRefusedError: # No-one's listening
+            os.unlink( socketPath )
+            return
+    raise RuntimeError( f"There's already a build daemon listening on {socketPath}" )
+# end of buildDaemon._removeStaleSocket
+
+
+def _receiveRequest( connection:socket.socket ) -> dict|None:
+    """
+    Read the request (one line of JSON) from the client.
+
+    Returns None if they didn't send anything (e.g., _removeStaleSocket() checking if we're running).
+    Raises a ValueError if it's not a valid request.
+    """
+    requestBytes = b''
+    while not requestBytes.endswith( b'\n' ):
+        chunk = connection.recv( 4096 )
+        if not chunk: break
+        requestBytes += chunk
+        if len(requestBytes) > MAX_REQUEST_BYTES: raise ValueError( f"Request is longer than {MAX_REQUEST_BYTES:,} bytes" )
+    if not requestBytes: return None
+    request = json.loads( requestBytes )
+    if not isinstance( request, dict ) or request.get( 'command' ) not in ('build','stop'):
+        raise ValueError( f"Unknown request {request!r}" )
+    return request
+# end of buildDaemon._receiveRequest
+
+
+def _sendExitStatus( connection:socket.socket, exitStatus:int ) -> None:
+    try: connection.sendall( STATUS_SEPARATOR + json.dumps( {'exitStatus':exitStatus} ).encode( 'utf-8' ) )
+    except OSError as err: logging.warning( f"Couldn't send exit status {exitStatus} to build client: {err}" ) # e.g., they gave up waiting
+# end of buildDaemon._sendExitStatus
+
+
+def _runRequestInChild( serverSocket:socket.socket, connection:socket.socket, request:dict, buildFunction ) -> int:
+    """
+    Fork a child process to do the build, with its stdout and stderr going back to the client.
+
+    Returns the exit status of the child (negative if it was killed by a signal).
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    childPID = os.fork()
+    if childPID == 0: # We're the child
+        exitStatus = 1
+        try:
+            serverSocket.close()
+            # Send all our output (including from logging and any worker processes) to the client
+            os.dup2( connection.fileno(), sys.stdout.fileno() )
+            os.dup2( connection.fileno(), sys.stderr.fileno() )
+            sys.stdout.reconfigure( line_buffering=True ) # So they see the progress as it happens
+            sys.stderr.reconfigure( line_buffering=True )
+            exitStatus = buildFunction( request )
+        except BaseException: # Includes SystemExit and assert failures
+            traceback.print_exc()
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            except OSError: pass # The client has gone
+            os._exit( exitStatus ) # Don't run any of the daemon's clean-up code
+    _childPID, waitStatus = os.waitpid( childPID, 0 )
+    return os.waitstatus_to_exitcode( waitStatus )
+# end of buildDaemon._runRequestInChild
+
+
+def serveBuildRequests( socketPath:Path, buildFunction ) -> None:
+    """
+    Call this after everything is preloaded.
+
+    Waits for build requests on the socket (until a 'stop' request or a KeyboardInterrupt)
+        and calls buildFunction( request ) in a forked child process for each one.
+    buildFunction should return the exit status for the client (0 if the build succeeded).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"serveBuildRequests( {socketPath}, {buildFunction} )" )
+    _removeStaleSocket( socketPath )
+    serverSocket = socket.socket( socket.AF_UNIX, socket.SOCK_STREAM )
+    try:
+        serverSocket.bind( str(socketPath) )
+        serverSocket.listen()
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\nBuild daemon (process {os.getpid()}) waiting for requests on {socketPath}…" )
+        numRequests = 0
+        while True:
+            connection, _address = serverSocket.accept()
+            with connection:
+                try: request = _receiveRequest( connection )
+                except (OSError, ValueError) as err: # includes json.JSONDecodeError
+                    logging.error( f"Ignoring bad build request: {err}" )
+                    _sendExitStatus( connection, BAD_REQUEST_EXIT_STATUS )
+                    continue
+                if request is None: continue
+                if request['command'] == 'stop':
+                    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Build daemon stopping after {numRequests:,} build requests." )
+                    _sendExitStatus( connection, 0 )
+                    break
+                numRequests += 1
+                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Build request #{numRequests}: {request}…" )
+                exitStatus = _runRequestInChild( serverSocket, connection, request, buildFunction )
+                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Build request #{numRequests} finished with exit status {exitStatus}." )
+                _sendExitStatus( connection, exitStatus )
+    finally:
+        serverSocket.close()
+        try: os.unlink( socketPath )
+        except FileNotFoundError: pass
+# end of buildDaemon.serveBuildRequests
+
+
+def sendBuildRequest( socketPath:Path, request:dict, outputFile=None ) -> int:
+    """
+    Send the request to the build daemon and copy the build output to outputFile (default is stdout) as it arrives.
+
+    Returns the exit status to use, i.e., the exit status of the build
+        (or 128 plus the signal number if it was killed by a signal).
+
+    Raises a FileNotFoundError or a ConnectionRefusedError if there's no build daemon running.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"sendBuildRequest( {socketPath}, {request} )" )
+    if outputFile is None: outputFile = sys.stdout.buffer
+    statusBytes = None
+    with socket.socket( socket.AF_UNIX, socket.SOCK_STREAM ) as clientSocket:
+        clientSocket.connect( str(socketPath) )
+        clientSocket.sendall( json.dumps( request ).encode( 'utf-8' ) + b'\n' )
+        while chunk := clientSocket.recv( 65536 ):
+            if statusBytes is None:
+                outputBytes, separator, statusBytes = chunk.partition( STATUS_SEPARATOR )
+                outputFile.write( outputBytes )
+                outputFile.flush()
+                if not separator: statusBytes = None
+            else: statusBytes += chunk
+    if statusBytes is None:
+        logging.critical( f"Build daemon on {socketPath} closed the connection without sending a status" )
+        return 1
+    exitStatus = json.loads( statusBytes )['exitStatus']
+    return exitStatus if exitStatus >= 0 else 128 - exitStatus
+# end of buildDaemon.sendBuildRequest
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo a build daemon (in another process) with a pretend build
+    import tempfile
+    import multiprocessing
+    import time
+    def demoBuild( request:dict ) -> int:
+        print( f"  Pretending to build {request['stages']}…" )
+        logging.warning( "  Pretend warning" )
+        return 3
+    with tempfile.TemporaryDirectory() as tempFolder:
+        socketPath = Path( tempFolder ).joinpath( 'demo.socket' )
+        daemonProcess = multiprocessing.get_context( 'fork' ).Process( target=serveBuildRequests, args=(socketPath, demoBuild) )
+        daemonProcess.start()
+        while not os.path.exists( socketPath ): time.sleep( 0.1 )
+        exitStatus = sendBuildRequest( socketPath, {'command':'build', 'stages':['UBS']} )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Demo build gave {exitStatus=}" )
+        sendBuildRequest( socketPath, {'command':'stop'} )
+        daemonProcess.join()
+# end of buildDaemon.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of buildDaemon.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    parser.add_argument( '--stages', metavar='STAGES',
+                        help="comma-separated list of build stages to run -- default is those the daemon was started with (else all of them)" )
+    parser.add_argument( '--books', metavar='BOOKS',
+                        help="comma-separated list of BOS book codes to build, e.g., MRK,GAL (must have been preloaded by the daemon)" )
+    parser.add_argument( '--output-folder', metavar='FOLDER',
+                        help=f"folder to build the pages in (and not make a release from them) -- default is {state.TEMP_BUILD_FOLDER}/" )
+    parser.add_argument( '--socket', type=Path, default=state.BUILD_DAEMON_SOCKET_PATH, metavar='PATH',
+                        help=f"the build daemon socket (default {state.BUILD_DAEMON_SOCKET_PATH})" )
+    parser.add_argument( '--stop', action='store_true',
+                        help="stop the build daemon" )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+    commandLineArguments = BibleOrgSysGlobals.commandLineArguments
+
+    if commandLineArguments.stop:
+        buildRequest = { 'command':'stop' }
+    else:
+        buildRequest = { 'command':'build',
+                        'stages':commandLineArguments.stages.split( ',' ) if commandLineArguments.stages else None,
+                        'books':commandLineArguments.books.upper().split( ',' ) if commandLineArguments.books else None,
+                        'outputFolder':str( Path( commandLineArguments.output_folder ).resolve() ) if commandLineArguments.output_folder else None }
+    try: exitStatus = sendBuildRequest( commandLineArguments.socket, buildRequest )
+    except (FileNotFoundError, ConnectionRefusedError):
+        logging.critical( f"No build daemon is listening on {commandLineArguments.socket} -- start one with 'uv run createSitePages.py --daemon'" )
+        exitStatus = 1
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+    sys.exit( exitStatus )
+# end of buildDaemon.py
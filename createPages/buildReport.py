@@ -0,0 +1,268 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# buildReport.py
+#
+# Module handling OpenBibleData build timing and resource reports
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling OpenBibleData build timing and resource reports.
+
+Each step of the build (preloading, indexing, each family of pages, moving, etc.)
+    is measured for wall time, CPU time (including any child processes that it waited for),
+    peak RSS, and the number of files and bytes that it wrote.
+The results are saved as JSON so that successive builds can be compared.
+
+startMeasurement() -> dict
+finishMeasurement( name:str, measurement:dict, outputFolders:tuple[Path]=() ) -> dict
+getFolderFilesAndBytes( folderPaths:tuple[Path] ) -> tuple[int,int]
+getCurrentRssMB() -> int|None
+BuildReport()
+    measure( name:str, outputFolders:tuple[Path]=() ) context manager
+    addEntry( entry:dict ) -> None
+    addSection( name:str, data ) -> None
+    save( filepath:Path, settings:dict|None=None ) -> None
+    printSummary() -> None
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version
+    2026-10-16 Allow entries without a CPU time (e.g., for background deletion)
+    2026-10-16 Added getCurrentRssMB() and report sections (e.g., the preload profile)
+"""
+from pathlib import Path
+import os
+import json
+from contextlib import contextmanager
+from datetime import datetime
+from time import time, process_time
+try: import resource # Not available on Windows
+except ImportError: resource = None
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "buildReport"
+PROGRAM_NAME = "OpenBibleData build report"
+PROGRAM_VERSION = '0.12'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+def _readProcFile( filepath:str ) -> dict[str,int]:
+    """
+    Reads lines like 'VmHWM:\t  12345 kB' or 'wchar: 12345' from a Linux /proc file.
+
+    Returns an empty dict if the file isn't available (i.e., not on Linux).
+    """
+    fields = {}
+    try:
+        with open( filepath, 'rt', encoding='utf-8' ) as procFile:
+            for procLine in procFile:
+                key, _colon, value = procLine.partition( ':' )
+                bits = value.split()
+                if bits and bits[0].isdigit():
+                    fields[key] = int( bits[0] )
+    except OSError: pass
+    return fields
+# end of buildReport._readProcFile
+
+
+def _getChildrenCPUTime() -> float:
+    """
+    Returns the CPU seconds used by child processes that have finished and been waited for
+    """
+    if resource is None: return 0.0
+    childrenUsage = resource.getrusage( resource.RUSAGE_CHILDREN )
+    return childrenUsage.ru_utime + childrenUsage.ru_stime
+# end of buildReport._getChildrenCPUTime
+
+
+def startMeasurement() -> dict:
+    """
+    Returns the starting values for finishMeasurement()
+
+    Also resets the peak RSS of this process (on Linux) so that we get the peak for just this step.
+    """
+    try:
+        with open( '/proc/self/clear_refs', 'wt' ) as clearRefsFile:
+            clearRefsFile.write( '5' ) # Resets VmHWM to the current RSS
+    except OSError: pass
+    return { 'wallStart':time(), 'cpuStart':process_time(), 'childrenCPUStart':_getChildrenCPUTime(),
+            'wcharStart':_readProcFile( '/proc/self/io' ).get( 'wchar' ) }
+# end of buildReport.startMeasurement
+
+
+def getFolderFilesAndBytes( folderPaths:tuple[Path] ) -> tuple[int,int]:
+    """
+    Returns the number of files and their total size in the given folders (and their subfolders)
+    """
+    numFiles = numBytes = 0
+    folderPathsToScan = [str(folderPath) for folderPath in folderPaths]
+    while folderPathsToScan:
+        try:
+            with os.scandir( folderPathsToScan.pop() ) as dirEntries:
+                for dirEntry in dirEntries:
+                    if dirEntry.is_dir( follow_symlinks=False ):
+                        folderPathsToScan.append( dirEntry.path )
+                    elif dirEntry.is_file( follow_symlinks=False ):
+                        numFiles += 1
+                        numBytes += dirEntry.stat( follow_symlinks=False ).st_size
+        except FileNotFoundError: pass
+    return numFiles, numBytes
+# end of buildReport.getFolderFilesAndBytes
+
+
+def getCurrentRssMB() -> int|None:
+    """
+    Returns the current resident set size of this process
+        or None if it's not available (i.e., not on Linux).
+    """
+    return _readProcFile( '/proc/self/status' ).get( 'VmRSS', 0 ) // 1024 or None
+# end of buildReport.getCurrentRssMB
+
+
+def finishMeasurement( name:str, measurement:dict, outputFolders:tuple[Path]=() ) -> dict:
+    """
+    Returns a report entry for the step that started with the given measurement.
+
+    If outputFolders are given, the files and bytes written are counted from those folders,
+        otherwise bytesWritten is from the write() calls of this process (and filesWritten is None).
+    """
+    entry = { 'name':name, 'pid':os.getpid(),
+            'wallSeconds':round( time() - measurement['wallStart'], 2 ),
+            'cpuSeconds':round( process_time() - measurement['cpuStart'] + _getChildrenCPUTime() - measurement['childrenCPUStart'], 2 ),
+            'peakRssMB':_readProcFile( '/proc/self/status' ).get( 'VmHWM', 0 ) // 1024 or None,
+            }
+    if outputFolders:
+        entry['filesWritten'], entry['bytesWritten'] = getFolderFilesAndBytes( outputFolders )
+    else:
+        wcharEnd = _readProcFile( '/proc/self/io' ).get( 'wchar' )
+        entry['filesWritten'] = None
+        entry['bytesWritten'] = None if wcharEnd is None or measurement['wcharStart'] is None else wcharEnd - measurement['wcharStart']
+    return entry
+# end of buildReport.finishMeasurement
+
+
+class BuildReport:
+    """
+    Collects the time and resources used by each step of the build
+    """
+    def __init__( self ) -> None:
+        self.startDateTime = datetime.now()
+        self.wallStart = time()
+        self.entries = []
+        self.sections = {} # Other results to save in the report, e.g., 'preloadVersions'
+    # end of BuildReport.__init__
+
+    @contextmanager
+    def measure( self, name:str, outputFolders:tuple[Path]=() ):
+        """
+        Use as 'with state.buildReport.measure( 'preload' ):'
+
+        The entry is recorded even if the step fails.
+        """
+        measurement = startMeasurement()
+        try: yield
+        finally: self.entries.append( finishMeasurement( name, measurement, outputFolders ) )
+    # end of BuildReport.measure
+
+    def addEntry( self, entry:dict ) -> None:
+        """
+        Add an entry that was measured elsewhere, e.g., in a worker process
+        """
+        self.entries.append( entry )
+    # end of BuildReport.addEntry
+
+    def addSection( self, name:str, data ) -> None:
+        """
+        Add some other (JSON serialisable) results to be saved in the report, e.g., the preload profile
+        """
+        self.sections[name] = data
+    # end of BuildReport.addSection
+
+    def save( self, filepath:Path, settings:dict|None=None ) -> None:
+        """
+        Save the report as JSON (including any given build settings so that runs can be compared)
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BuildReport.save( {filepath} )" )
+        with open( filepath, 'wt', encoding='utf-8' ) as reportFile:
+            json.dump( { 'started':self.startDateTime.isoformat( timespec='seconds' ),
+                        'totalWallSeconds':round( time() - self.wallStart, 2 ),
+                        'settings':settings or {},
+                        'steps':self.entries } | self.sections, reportFile, indent=2 )
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Saved build report with {len(self.entries)} steps to {filepath}." )
+    # end of BuildReport.save
+
+    def printSummary( self ) -> None:
+        """
+        Print a table of the steps with the slowest first
+        """
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\nBuild steps (slowest first) for total {(time()-self.wallStart)/60:.1f} minutes:" )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {'Step':<20} {'Wall min':>8} {'CPU min':>8} {'Peak MB':>8} {'Files':>9} {'MB written':>10}" )
+        for entry in sorted( self.entries, key=lambda entry: entry['wallSeconds'], reverse=True ):
+            CPUString = '?' if entry['cpuSeconds'] is None else f"{entry['cpuSeconds']/60:.1f}" # e.g., background threads
+            filesString = '' if entry['filesWritten'] is None else f"{entry['filesWritten']:,}"
+            megabytesString = '?' if entry['bytesWritten'] is None else f"{entry['bytesWritten']/1_000_000:,.1f}"
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {entry['name']:<20} {entry['wallSeconds']/60:>8.1f} {CPUString:>8}"
+                                                    f" {entry['peakRssMB'] or '?':>8} {filesString:>9} {megabytesString:>10}" )
+    # end of BuildReport.printSummary
+# end of class BuildReport
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the BuildReport object
+    buildReport = BuildReport()
+    with buildReport.measure( 'demo' ):
+        sum( range( 1_000_000 ) )
+    buildReport.printSummary()
+# end of buildReport.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of buildReport.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of buildReport.py
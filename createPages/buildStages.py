@@ -0,0 +1,802 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# buildStages.py
+#
+# Module handling OpenBibleData build stage scheduling
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling OpenBibleData build stage scheduling.
+
+Each family of pages (parallel verse pages, interlinear pages, reference pages, etc.)
+    is declared as a BuildStage with the Bible versions and OETRefData tables that it reads,
+    the folders that it writes, and the other stages that it depends on.
+
+runBuildStages() then either runs the stages one after the other (in a fixed order)
+    or else runs independent stages at the same time in forked worker processes.
+The workers inherit the (huge) preloaded state from the main process when they're forked
+    so nothing needs to be pickled on the way in,
+    and only the declared stateOutputs are sent back to be merged into the main process state.
+
+After each stage is completed, a checkpoint (the stage fingerprint, the list of files written,
+    and the stage results) is saved in a hidden folder in TEMP_BUILD_FOLDER,
+    so that a crashed build can be resumed without rebuilding the completed stages.
+
+BuildStage( name:str, function, level:int, folder:str, ... )
+loadPreloadedBooks( state:State ) -> int
+prepareForForkedWorkers( state:State|None=None ) -> None
+    Call in the main process after preloading so that forked workers keep sharing those pages
+startForkedWorker() -> None
+    Call at the start of each forked worker
+getMemoryUsage() -> dict[str,int]|None
+    Returns this process's RSS split into shared and private kB (from /proc/self/smaps_rollup)
+formatMemoryUsage( memoryUsage:dict[str,int]|None ) -> str
+ReleasedVersion( versionAbbreviation:str, bible=None )
+    Left in state.preloadedBibles in place of a Bible that's no longer needed
+getStageOrder( stages:list[BuildStage] ) -> list[BuildStage]
+getStageFingerprint( stage:BuildStage, state:State, buildInputs:str ) -> str
+getCompletedStages( stages:list[BuildStage], state:State, buildInputs:str ) -> dict[str,dict]
+    Returns the checkpoints of the stages that don't need to be built again when resuming
+removeStageCheckpoint( stageName:str, buildFolder:Path ) -> None
+runBuildStages( stages:list[BuildStage], numJobs:int, state:State, buildInputs:str='', completedStages:dict[str,dict]|None=None, keepResources:tuple[str]=() ) -> bool
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version, so that independent page families can be built concurrently
+    2026-10-16 Freeze the preloaded objects (for copy-on-write sharing) and report worker shared/private memory
+    2026-10-16 Send page manifest entries back from worker processes
+    2026-10-16 Write a checkpoint after each stage so that builds can be resumed
+    2026-10-16 Add each stage (including those run in worker processes) to the build report
+    2026-10-16 Release Bibles, tables, and other state attributes after the last stage that uses them
+    2026-10-16 Add the reference bundle sections that each stage materialised to the build report
+    2026-10-16 Raise the garbage collection thresholds in forked workers (rather than disabling collection)
+    2026-10-16 Keep the book membership and discoveryResults of released versions (for the page headers)
+    2026-10-16 Make the page header snapshot from the real Bibles before releasing any (e.g., when resuming)
+    2026-10-16 Load all the books from the book caches before forking any workers (so they're shared)
+    2026-10-16 Include all the loaded modules from this folder and openbibledata_rust in the stage fingerprints
+    2026-10-16 Log a failed stage and return False when running the stages serially too (like when they're run in worker processes)
+"""
+from pathlib import Path
+import os
+import gc
+import sys
+import hashlib
+import json
+import pickle
+from itertools import islice
+from collections import defaultdict
+import multiprocessing
+from multiprocessing.connection import wait
+import traceback
+from time import time
+import logging
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+import bos_books_codes_py
+
+from settings import State
+from html import makePageChromeConfig
+from bookCache import loadAllBooks
+from buildReport import startMeasurement, finishMeasurement
+from pageManifest import getModuleFingerprint
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "buildStages"
+PROGRAM_NAME = "OpenBibleData build stages"
+PROGRAM_VERSION = '0.35'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+CHECKPOINT_FOLDER_NAME = '.OBD_checkpoints' # Hidden so that it doesn't get moved to the actual site with the pages
+CHECKPOINT_FORMAT_VERSION = 1
+
+WORKER_GC_THRESHOLDS = (50_000, 20, 20) # Python's defaults are (700, 10, 10)
+
+
+class BuildStage:
+    """
+    Describes one family of pages that can be built by itself.
+
+    function is called as function( level, state.TEMP_BUILD_FOLDER.joinpath(folder), state )
+        i.e., the same as our existing createXXXPages() functions.
+    inputVersions is a tuple of version abbreviations (or 'ALL') that the stage reads.
+    inputTables is a tuple of state.OETRefData keys that the stage reads.
+    inputAttributes is a tuple of other (big) state attribute names that the stage reads, e.g., 'TOBDData'.
+        (These inputs are released from the state after the last stage that uses them.)
+    outputs is a tuple of the (top-level) folders that the stage writes into.
+    dependsOn is a tuple of stage names that must be completed first.
+    stateOutputs is a tuple of state attribute names (or 'OETRefData.key' names)
+        that the stage creates and which later stages or pages need,
+        so they have to be sent back from a worker process.
+    collectFunction (optional) is called in the worker to return any other (picklable) results,
+        which are then passed to mergeFunction in the main process.
+    """
+    def __init__( self, name:str, function, level:int, folder:str, inputVersions:tuple[str]|str=(), inputTables:tuple[str]=(),
+                        inputAttributes:tuple[str]=(), outputs:tuple[str]=(), dependsOn:tuple[str]=(), stateOutputs:tuple[str]=(),
+                        collectFunction=None, mergeFunction=None ) -> None:
+        self.name, self.function, self.level, self.folder = name, function, level, folder
+        self.inputVersions, self.inputTables, self.inputAttributes, self.outputs = inputVersions, inputTables, inputAttributes, outputs
+        self.dependsOn, self.stateOutputs = dependsOn, stateOutputs
+        self.collectFunction, self.mergeFunction = collectFunction, mergeFunction
+    # end of BuildStage.__init__
+
+    def __repr__( self ) -> str:
+        return f"BuildStage( '{self.name}', folder='{self.folder}', dependsOn={self.dependsOn} )"
+    # end of BuildStage.__repr__
+
+    def run( self, state:State ) -> None:
+        """
+        Build the pages for this stage (in the current process)
+        """
+        self.function( self.level, state.TEMP_BUILD_FOLDER.joinpath( self.folder ), state )
+    # end of BuildStage.run
+
+    def collectResults( self, state:State, manifestSnapshot:tuple[int,int,int]|None=None ) -> dict:
+        """
+        Gather the stateOutputs (and anything else) that need to go back to the main process
+            (or be saved in the checkpoint).
+
+        manifestSnapshot is from _getManifestSnapshot() before the stage was run
+            so that we only collect the page manifest entries for this stage.
+        """
+        results = {}
+        for stateOutputName in self.stateOutputs:
+            if stateOutputName.startswith( 'OETRefData.' ):
+                tableName = stateOutputName[11:]
+                if 'OETRefData' in vars(state) and tableName in state.OETRefData:
+                    results[stateOutputName] = state.OETRefData[tableName]
+            elif stateOutputName in vars(state):
+                results[stateOutputName] = getattr( state, stateOutputName )
+        if self.collectFunction is not None:
+            results[''] = self.collectFunction()
+        if state.pageManifest is not None: # Pages that were made (or reused) by this stage
+            newPages, numReused, numRendered = state.pageManifest.getNewEntries()
+            if manifestSnapshot is not None:
+                numPagesBefore, numReusedBefore, numRenderedBefore = manifestSnapshot
+                newPages = dict( islice( newPages.items(), numPagesBefore, None ) ) # dicts keep their insertion order
+                numReused, numRendered = numReused - numReusedBefore, numRendered - numRenderedBefore
+            results['pageManifest'] = (newPages, numReused, numRendered)
+        return results
+    # end of BuildStage.collectResults
+
+    def mergeResults( self, results:dict, state:State ) -> None:
+        """
+        Put the results from collectResults() (in a worker process) into our state
+        """
+        for stateOutputName,value in results.items():
+            if not stateOutputName: continue # that's for the mergeFunction
+            if stateOutputName == 'pageManifest':
+                state.pageManifest.mergeNewEntries( value )
+            elif stateOutputName.startswith( 'OETRefData.' ):
+                state.OETRefData[stateOutputName[11:]] = value
+            else:
+                setattr( state, stateOutputName, value )
+        if self.mergeFunction is not None and '' in results:
+            self.mergeFunction( results[''] )
+    # end of BuildStage.mergeResults
+# end of class BuildStage
+
+
+def loadPreloadedBooks( state:State ) -> int:
+    """
+    Bibles loaded from book caches only unpickle each book when it's first used,
+        which would happen separately in each forked worker (so the books wouldn't be shared).
+    So load all the books of the (not released) preloaded Bibles here in the main process.
+
+    Returns the number of books that were loaded.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "loadPreloadedBooks()" )
+    numLoaded = sum( loadAllBooks( thisBible ) for thisBible in state.preloadedBibles.values()
+                        if not isinstance( thisBible, (ReleasedVersion, dict) ) ) # Not the selected-verses-only versions
+    if numLoaded:
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Loaded {numLoaded:,} books from the book caches for sharing with forked workers." )
+    return numLoaded
+# end of buildStages.loadPreloadedBooks
+
+
+def prepareForForkedWorkers( state:State|None=None ) -> None:
+    """
+    Call this in the main process after the Bibles and tables are preloaded (and before forking).
+
+    If the state is given, all the books of its preloaded Bibles are loaded first (see loadPreloadedBooks()).
+    (runBuildStages() also does that itself, after releasing the Bibles that only completed stages used.)
+
+    Even just reading a Python object in a forked process changes its reference count
+        which dirties the memory page that it's on and so causes the page to be copied.
+    We can't avoid that, but a cyclic garbage collection would touch EVERY tracked object,
+        so we move everything that's already loaded into the permanent generation
+        where the garbage collector will never look at it again.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "prepareForForkedWorkers()" )
+
+    if state is not None: loadPreloadedBooks( state )
+    gc.collect() # So we don't freeze any garbage
+    gc.freeze()
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Froze {gc.get_freeze_count():,} preloaded objects for sharing with forked workers ({formatMemoryUsage( getMemoryUsage() )})." )
+# end of buildStages.prepareForForkedWorkers
+
+
+def startForkedWorker() -> None:
+    """
+    Call this at the start of each forked worker process.
+
+    The (frozen) preloaded objects are never looked at by the garbage collector,
+        so collections in the worker only touch the objects that the worker itself made.
+    Some workers run for hours, so we can't just disable the garbage collector
+        (any reference cycles made while making the pages would never be freed),
+        but we raise the thresholds so that it runs much less often.
+    """
+    gc.set_threshold( *WORKER_GC_THRESHOLDS )
+# end of buildStages.startForkedWorker
+
+
+def getMemoryUsage() -> dict[str,int] | None:
+    """
+    Returns a dict with 'rss', 'pss', 'shared', and 'private' (all in kB) for this process
+        or None if /proc/self/smaps_rollup isn't available (i.e., not on Linux).
+    """
+    try:
+        with open( '/proc/self/smaps_rollup', 'rt', encoding='utf-8' ) as smapsFile:
+            smapsLines = smapsFile.readlines()
+    except OSError: return None
+    fields = {}
+    for smapsLine in smapsLines:
+        bits = smapsLine.split()
+        if len(bits) == 3 and bits[2] == 'kB': # Lines are like 'Shared_Clean:      12345 kB'
+            fields[bits[0].rstrip(':')] = int( bits[1] )
+    return { 'rss':fields.get('Rss',0), 'pss':fields.get('Pss',0),
+            'shared':fields.get('Shared_Clean',0) + fields.get('Shared_Dirty',0),
+            'private':fields.get('Private_Clean',0) + fields.get('Private_Dirty',0) }
+# end of buildStages.getMemoryUsage
+
+
+def formatMemoryUsage( memoryUsage:dict[str,int]|None ) -> str:
+    """
+    Returns a short string like 'RSS 3,456 MB = 3,000 MB shared + 456 MB private'
+    """
+    if not memoryUsage: return 'no memory information'
+    return f"RSS {memoryUsage['rss']//1024:,} MB = {memoryUsage['shared']//1024:,} MB shared + {memoryUsage['private']//1024:,} MB private"
+# end of buildStages.formatMemoryUsage
+
+
+class ReleasedVersion:
+    """
+    Left in state.preloadedBibles in place of a Bible that's no longer needed by any build stage,
+        so that checks like "if versionAbbreviation in state.preloadedBibles" still give the same answers,
+        but anything that tries to actually use the Bible gets a clear error.
+
+    The page headers (made by makeTop from the html.PageChromeConfig snapshot of the state)
+        list the versions that have each book and those with section headings,
+        and that snapshot can be made after some versions are released
+        (e.g., when resuming a build or in a worker process),
+        so we keep which books the Bible had (for "BBB in thisBible") and its (small) discoveryResults.
+    """
+    def __init__( self, versionAbbreviation:str, bible=None ) -> None:
+        self.abbreviation = versionAbbreviation
+        self.BBBs = frozenset() if bible is None else frozenset( BBB for BBB in bos_books_codes_py.get_all_bos_book_codes() if BBB in bible )
+        if bible is not None and hasattr( bible, 'discoveryResults' ):
+            self.discoveryResults = bible.discoveryResults # Otherwise getting it gives an AttributeError (like the Bible would)
+    def __repr__( self ) -> str:
+        return f"ReleasedVersion( '{self.abbreviation}' )"
+    def __getattr__( self, name:str ):
+        raise AttributeError( f"'{self.abbreviation}' Bible was released after its last build stage so has no '{name}' (add it to the inputVersions of the stage)" )
+    def __iter__( self ):
+        raise RuntimeError( f"'{self.abbreviation}' Bible was released after its last build stage (add it to the inputVersions of the stage)" )
+    def __contains__( self, BBB:str ) -> bool:
+        return BBB in self.BBBs
+# end of class ReleasedVersion
+
+
+def getStageOrder( stages:list[BuildStage] ) -> list[BuildStage]:
+    """
+    Returns the stages in a valid dependency order.
+
+    Stages are kept in their given order except where a dependency has to be moved earlier,
+        so that the serial build is deterministic (and the same as the old hard-coded order).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"getStageOrder( {[stage.name for stage in stages]} )" )
+
+    stageDict = {stage.name:stage for stage in stages}
+    assert len(stageDict) == len(stages), f"Duplicate stage names in {[stage.name for stage in stages]}"
+    orderedStages, doneNames, visitingNames = [], set(), set()
+
+    def visit( stage:BuildStage ) -> None:
+        if stage.name in doneNames: return
+        assert stage.name not in visitingNames, f"Circular stage dependency involving '{stage.name}'"
+        visitingNames.add( stage.name )
+        for dependencyName in stage.dependsOn:
+            if dependencyName in stageDict: # Otherwise the stage isn't being built this time
+                visit( stageDict[dependencyName] )
+        visitingNames.discard( stage.name )
+        doneNames.add( stage.name )
+        orderedStages.append( stage )
+
+    for stage in stages:
+        visit( stage )
+    return orderedStages
+# end of buildStages.getStageOrder
+
+
+def _getManifestSnapshot( state:State ) -> tuple[int,int,int] | None:
+    """
+    Returns the number of pages, reused pages, and rendered pages in the page manifest so far
+        (so that we can tell which ones a stage added).
+    """
+    if state.pageManifest is None: return None
+    newPages, numReused, numRendered = state.pageManifest.getNewEntries()
+    return len(newPages), numReused, numRendered
+# end of buildStages._getManifestSnapshot
+
+
+def _getLocationStats( locationPath:Path ) -> list[str]:
+    """
+    Returns the name, size, and modification time of the file
+        or of each file in the folder (not including subfolders).
+    """
+    try:
+        if not locationPath.is_dir():
+            locationStat = os.stat( locationPath )
+            return [f'{locationPath.name} {locationStat.st_size} {locationStat.st_mtime_ns}']
+        with os.scandir( locationPath ) as dirEntries:
+            return sorted( f'{dirEntry.name} {dirEntry.stat().st_size} {dirEntry.stat().st_mtime_ns}'
+                            for dirEntry in dirEntries if dirEntry.is_file() )
+    except FileNotFoundError: return [f'{locationPath} missing']
+# end of buildStages._getLocationStats
+
+
+def _getCodeFingerprint( stage:BuildStage ) -> str:
+    """
+    Returns a hash of the code that the stage might run:
+        every loaded module from this folder (e.g., html.py and createChapterPages.py, not just the module with the stage function),
+        the module with the stage function, and the openbibledata_rust extension.
+    """
+    codeFolderPath = Path( __file__ ).resolve().parent
+    modules = {moduleName:module for moduleName,module in list( sys.modules.items() )
+                if getattr( module, '__file__', None ) and Path( module.__file__ ).resolve().parent == codeFolderPath}
+    for moduleName in (getattr( stage.function, '__module__', '' ), 'openbibledata_rust'):
+        if sys.modules.get( moduleName ) is not None: modules[moduleName] = sys.modules[moduleName]
+    hasher = hashlib.sha256()
+    for moduleName in sorted( modules ):
+        hasher.update( f'{moduleName} {getModuleFingerprint( modules[moduleName] )}\n'.encode( 'utf-8' ) )
+    return hasher.hexdigest()
+# end of buildStages._getCodeFingerprint
+
+
+def getStageFingerprint( stage:BuildStage, state:State, buildInputs:str ) -> str:
+    """
+    Returns a hash of the inputs of the stage.
+
+    This includes the buildInputs (anything that affects every page, e.g., the list of versions),
+        the stage declaration, the code (see _getCodeFingerprint),
+        and the file sizes and times of the source folders for its input versions
+        (the OET word tables are in the OET-LV folder).
+    """
+    hasher = hashlib.sha256( f'{CHECKPOINT_FORMAT_VERSION}\n{buildInputs}\n{stage.name} {stage.level} {stage.folder} {stage.outputs} {stage.inputTables} {stage.dependsOn} {stage.stateOutputs}\n'.encode( 'utf-8' ) )
+    hasher.update( f'{_getCodeFingerprint( stage )}\n'.encode( 'utf-8' ) )
+    versionAbbreviations = list( state.BibleLocations ) if stage.inputVersions == 'ALL' else list( stage.inputVersions )
+    if stage.inputTables and 'OET-LV' not in versionAbbreviations:
+        versionAbbreviations.append( 'OET-LV' )
+    for versionAbbreviation in versionAbbreviations:
+        if versionAbbreviation in state.BibleLocations:
+            hasher.update( f'{versionAbbreviation} {_getLocationStats( Path( state.BibleLocations[versionAbbreviation] ) )}\n'.encode( 'utf-8' ) )
+    return hasher.hexdigest()
+# end of buildStages.getStageFingerprint
+
+
+def _getStageFilepaths( stage:BuildStage, stages:list[BuildStage], buildFolder:Path ) -> tuple[list[str],int]:
+    """
+    Returns the relative paths of all the files in the output folders of the stage,
+        but not in any output folders of other stages that are inside those,
+        along with the total size of those files.
+    """
+    otherOutputs = {output for otherStage in stages if otherStage is not stage for output in otherStage.outputs} - set( stage.outputs )
+    relativeFilepaths, numBytes = [], 0
+    for output in stage.outputs:
+        for dirpath, dirnames, filenames in os.walk( buildFolder.joinpath( output ) ):
+            relativeDirpath = Path( dirpath ).relative_to( buildFolder ).as_posix()
+            dirnames[:] = [dirname for dirname in dirnames if f'{relativeDirpath}/{dirname}/' not in otherOutputs]
+            relativeFilepaths.extend( f'{relativeDirpath}/{filename}' for filename in filenames )
+            numBytes += sum( os.path.getsize( os.path.join( dirpath, filename ) ) for filename in filenames )
+    return sorted( relativeFilepaths ), numBytes
+# end of buildStages._getStageFilepaths
+
+
+def _writeStageCheckpoint( stage:BuildStage, stages:list[BuildStage], results:dict, fingerprint:str, buildFolder:Path ) -> tuple[int,int]:
+    """
+    Save the stage results (pickled) and then the checkpoint marker itself,
+        so a checkpoint marker is only there if the stage was completed.
+
+    Returns the number of files written by the stage and their total size.
+    """
+    checkpointFolder = buildFolder.joinpath( CHECKPOINT_FOLDER_NAME )
+    os.makedirs( checkpointFolder, exist_ok=True )
+    with open( checkpointFolder.joinpath( f'{stage.name}.pickle' ), 'wb' ) as resultsFile:
+        pickle.dump( results, resultsFile, pickle.HIGHEST_PROTOCOL )
+    relativeFilepaths, numBytes = _getStageFilepaths( stage, stages, buildFolder )
+    checkpointFilepath = checkpointFolder.joinpath( f'{stage.name}.json' )
+    with open( f'{checkpointFilepath}.tmp', 'wt', encoding='utf-8' ) as checkpointFile:
+        json.dump( {'formatVersion':CHECKPOINT_FORMAT_VERSION, 'stageName':stage.name, 'fingerprint':fingerprint, 'filepaths':relativeFilepaths}, checkpointFile, indent=0 )
+    os.replace( f'{checkpointFilepath}.tmp', checkpointFilepath ) # So that we never leave a partly written checkpoint
+    vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Wrote checkpoint for build stage '{stage.name}' with {len(relativeFilepaths):,} files." )
+    return len(relativeFilepaths), numBytes
+# end of buildStages._writeStageCheckpoint
+
+
+def removeStageCheckpoint( stageName:str, buildFolder:Path ) -> None:
+    """
+    Remove the checkpoint (if any) for a stage that's going to be built again
+    """
+    for filename in (f'{stageName}.json', f'{stageName}.pickle'):
+        try: os.unlink( buildFolder.joinpath( CHECKPOINT_FOLDER_NAME, filename ) )
+        except FileNotFoundError: pass
+# end of buildStages.removeStageCheckpoint
+
+
+def getCompletedStages( stages:list[BuildStage], state:State, buildInputs:str ) -> dict[str,dict]:
+    """
+    Returns a dict of stage names to checkpoints for the stages that were completed
+        in a previous (probably crashed) build in state.TEMP_BUILD_FOLDER
+        and which don't need to be built again.
+
+    A stage needs to be built again if its fingerprint has changed, if any of its files are missing,
+        if a stage that it depends on needs to be built again,
+        or if it writes inside the output folder of a stage that needs to be built again
+        (because that whole folder gets deleted).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"getCompletedStages( {[stage.name for stage in stages]} )" )
+
+    completedStages = {}
+    for stage in stages:
+        checkpointFilepath = state.TEMP_BUILD_FOLDER.joinpath( CHECKPOINT_FOLDER_NAME, f'{stage.name}.json' )
+        try:
+            with open( checkpointFilepath, 'rt', encoding='utf-8' ) as checkpointFile:
+                checkpoint = json.load( checkpointFile )
+        except FileNotFoundError: continue
+        except json.JSONDecodeError as err:
+            logging.error( f"Ignoring unreadable checkpoint {checkpointFilepath}: {err}" ); continue
+        if checkpoint.get( 'formatVersion' ) != CHECKPOINT_FORMAT_VERSION \
+        or checkpoint.get( 'fingerprint' ) != getStageFingerprint( stage, state, buildInputs ):
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Inputs have changed for build stage '{stage.name}' so it will be built again." )
+            continue
+        if not state.TEMP_BUILD_FOLDER.joinpath( CHECKPOINT_FOLDER_NAME, f'{stage.name}.pickle' ).is_file() \
+        or not all( state.TEMP_BUILD_FOLDER.joinpath( relativeFilepath ).is_file() for relativeFilepath in checkpoint['filepaths'] ):
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Files are missing for build stage '{stage.name}' so it will be built again." )
+            continue
+        completedStages[stage.name] = checkpoint
+
+    allStageNames = {stage.name for stage in stages}
+    madeChanges = True
+    while madeChanges: # Keep going because removing one stage can affect others
+        madeChanges = False
+        incompleteOutputs = [output for stage in stages if stage.name not in completedStages for output in stage.outputs]
+        for stage in stages:
+            if stage.name not in completedStages: continue
+            if any( dependencyName not in completedStages for dependencyName in stage.dependsOn if dependencyName in allStageNames ) \
+            or any( output.startswith( incompleteOutput ) and output != incompleteOutput for output in stage.outputs for incompleteOutput in incompleteOutputs ):
+                vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Build stage '{stage.name}' will be built again because of another stage." )
+                del completedStages[stage.name]
+                madeChanges = True
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Resuming build with {len(completedStages)}/{len(stages)} build stages already completed: {list(completedStages)}" )
+    return completedStages
+# end of buildStages.getCompletedStages
+
+
+def _getStageResourceNames( stage:BuildStage, stages:list[BuildStage], state:State ) -> set[str]:
+    """
+    Returns the names of the Bibles (like 'Bible.KJB-1611'), tables (like 'OETRefData.word_tables'),
+        and other state attributes that the stage reads
+        (including any tables made by the stages that it depends on).
+    """
+    stageDict = {otherStage.name:otherStage for otherStage in stages}
+    resourceNames = {f'Bible.{versionAbbreviation}' for versionAbbreviation in (state.preloadedBibles if stage.inputVersions == 'ALL' else stage.inputVersions)}
+    resourceNames.update( f'OETRefData.{tableName}' for tableName in stage.inputTables )
+    resourceNames.update( stage.inputAttributes )
+    for dependencyName in stage.dependsOn:
+        if dependencyName in stageDict:
+            resourceNames.update( stateOutputName for stateOutputName in stageDict[dependencyName].stateOutputs if stateOutputName.startswith( 'OETRefData.' ) )
+    return resourceNames
+# end of buildStages._getStageResourceNames
+
+
+class _ResourceReleaser:
+    """
+    Keeps track of which stages still need each Bible, table, and other state attribute,
+        and drops each one from the state as soon as the last of those stages is finished.
+
+    The (frozen) objects aren't actually freed until collectGarbage() is called,
+        which shouldn't be done while worker processes are running
+        because a full garbage collection touches every object and so unshares the memory pages.
+    """
+    def __init__( self, stages:list[BuildStage], stagesToRun:list[BuildStage], state:State, keepResources:tuple[str]=() ) -> None:
+        self.stages, self.state, self.keepResources = stages, state, set( keepResources )
+        self.enabled = state.RELEASE_FINISHED_RESOURCES_FLAG
+        self.remainingUsers = defaultdict( set ) # Key is resource name, value is a set of stage names
+        for stage in stagesToRun:
+            for resourceName in _getStageResourceNames( stage, stages, state ):
+                self.remainingUsers[resourceName].add( stage.name )
+        self.releasedNames, self.memoryBefore = [], None
+
+        # Release anything that none of the stages that we're running need
+        declaredNames = {f'Bible.{versionAbbreviation}' for versionAbbreviation in state.preloadedBibles}
+        for stage in stages:
+            declaredNames.update( _getStageResourceNames( stage, stages, state ) )
+        self._release( declaredNames - set( self.remainingUsers ) )
+    # end of _ResourceReleaser.__init__
+
+    def _release( self, resourceNames:set[str] ) -> None:
+        """
+        Drop the references to these resources from the state (if they're there)
+        """
+        if not self.enabled: return
+        for resourceName in sorted( resourceNames - self.keepResources ):
+            if resourceName.startswith( 'Bible.' ):
+                versionAbbreviation = resourceName[6:]
+                if versionAbbreviation not in self.state.preloadedBibles \
+                or isinstance( self.state.preloadedBibles[versionAbbreviation], ReleasedVersion ): continue
+                if self.memoryBefore is None: self.memoryBefore = getMemoryUsage()
+                self.state.preloadedBibles[versionAbbreviation] = ReleasedVersion( versionAbbreviation, self.state.preloadedBibles[versionAbbreviation] )
+            elif resourceName.startswith( 'OETRefData.' ):
+                if 'OETRefData' not in vars(self.state) or resourceName[11:] not in self.state.OETRefData: continue
+                if self.memoryBefore is None: self.memoryBefore = getMemoryUsage()
+                del self.state.OETRefData[resourceName[11:]]
+            else:
+                if resourceName not in vars(self.state): continue
+                if self.memoryBefore is None: self.memoryBefore = getMemoryUsage()
+                delattr( self.state, resourceName )
+            self.releasedNames.append( resourceName )
+    # end of _ResourceReleaser._release
+
+    def stageFinished( self, stage:BuildStage ) -> None:
+        """
+        Release anything that this stage used (or made) that no other remaining stage needs
+        """
+        finishedNames = set()
+        for resourceName, stageNames in self.remainingUsers.items():
+            if stage.name in stageNames:
+                stageNames.discard( stage.name )
+                if not stageNames: finishedNames.add( resourceName )
+        # Tables that this stage made but which no remaining stage needs
+        finishedNames.update( stateOutputName for stateOutputName in stage.stateOutputs
+                                if stateOutputName.startswith( 'OETRefData.' ) and not self.remainingUsers.get( stateOutputName ) )
+        self._release( finishedNames )
+    # end of _ResourceReleaser.stageFinished
+
+    def collectGarbage( self ) -> None:
+        """
+        Actually free the memory of the released resources and log how much we saved
+        """
+        if not self.releasedNames: return
+        gc.unfreeze() # Otherwise the garbage collector won't look at the (frozen) preloaded objects
+        gc.collect()
+        gc.freeze() # Refreeze what's left for any future worker processes
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Released {len(self.releasedNames)} resources {self.releasedNames}: {formatMemoryUsage( self.memoryBefore )} -> {formatMemoryUsage( getMemoryUsage() )}" )
+        self.releasedNames, self.memoryBefore = [], None
+    # end of _ResourceReleaser.collectGarbage
+# end of class _ResourceReleaser
+
+
+def _getNumMaterialisedSections( state:State ) -> int:
+    return 0 if state.referenceBundle is None else len(state.referenceBundle.materialisedNames)
+# end of buildStages._getNumMaterialisedSections
+
+def _addMaterialisedSections( reportEntry:dict, state:State, numSectionsBefore:int ) -> dict:
+    """
+    Add the names of any reference bundle sections (e.g., 'TOBDData') that were unpickled since numSectionsBefore
+        to the build report entry.
+    """
+    if state.referenceBundle is not None:
+        reportEntry['materialisedSections'] = state.referenceBundle.materialisedNames[numSectionsBefore:]
+    return reportEntry
+# end of buildStages._addMaterialisedSections
+
+
+def _runStageInWorker( stage:BuildStage, state:State, resultConnection ) -> None:
+    """
+    This runs in the forked worker process
+        which has inherited all of our preloaded Bibles and tables.
+
+    Sends back ('OK',results,memoryUsage,reportEntry) or ('FAILED',tracebackString,memoryUsage,reportEntry).
+    """
+    startForkedWorker()
+    measurement = startMeasurement()
+    numSectionsBefore = _getNumMaterialisedSections( state ) # We inherited any sections that the main process already loaded
+    try:
+        manifestSnapshot = _getManifestSnapshot( state ) # We inherited any pages from the main process
+        stage.run( state )
+        resultConnection.send( ('OK', stage.collectResults( state, manifestSnapshot ), getMemoryUsage(),
+                                _addMaterialisedSections( finishMeasurement( stage.name, measurement ), state, numSectionsBefore )) )
+    except BaseException:
+        resultConnection.send( ('FAILED', traceback.format_exc(), getMemoryUsage(),
+                                _addMaterialisedSections( finishMeasurement( stage.name, measurement ), state, numSectionsBefore )) )
+    resultConnection.close()
+# end of buildStages._runStageInWorker
+
+
+def runBuildStages( stages:list[BuildStage], numJobs:int, state:State, buildInputs:str='', completedStages:dict[str,dict]|None=None, keepResources:tuple[str]=() ) -> bool:
+    """
+    Runs all the given build stages.
+
+    Bibles, tables, and other declared inputs are released from the state after the last stage that uses them,
+        except for keepResources (e.g., 'Bible.AHB') which are still needed after the build stages.
+
+    Stages in completedStages (from getCompletedStages()) are not run again,
+        but their saved results are merged into our state.
+    The page header snapshot is made first (from the real preloaded Bibles),
+        because the Bibles that only the completed stages used are released straight away.
+    Then all the books of the other Bibles are loaded (from their book caches)
+        so that any worker processes forked by (or within) the stages share them.
+    A checkpoint is written after each other stage is completed
+        and the stage is added to state.buildReport (if there is one).
+
+    If numJobs is 1 (or we're already inside a worker process),
+        the stages are run one after the other in this process in a fixed order.
+    Otherwise up to numJobs stages at a time are run in forked worker processes
+        as soon as the stages that they depend on are completed.
+
+    Returns False if any stage failed.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"runBuildStages( {[stage.name for stage in stages]}, {numJobs}, {list(completedStages) if completedStages else None} )" )
+
+    orderedStages = []
+    for stage in getStageOrder( stages ):
+        if completedStages and stage.name in completedStages:
+            with open( state.TEMP_BUILD_FOLDER.joinpath( CHECKPOINT_FOLDER_NAME, f'{stage.name}.pickle' ), 'rb' ) as resultsFile:
+                stage.mergeResults( pickle.load( resultsFile ), state )
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Skipping build stage '{stage.name}' which was already completed." )
+        else:
+            orderedStages.append( stage )
+    makePageChromeConfig( state ) # Before any Bibles are released (and so that any worker processes inherit it)
+    # Get these now in case any source files are edited while we're building
+    stageFingerprints = {stage.name:getStageFingerprint( stage, state, buildInputs ) for stage in orderedStages}
+    resourceReleaser = _ResourceReleaser( stages, orderedStages, state, keepResources )
+    resourceReleaser.collectGarbage()
+    if not orderedStages: return True
+    if loadPreloadedBooks( state ): # Before any stage forks workers
+        gc.freeze() # So the garbage collector doesn't look at the loaded books either
+
+    if numJobs <= 1 or len(orderedStages) < 2 or BibleOrgSysGlobals.alreadyMultiprocessing:
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"\nRunning {len(orderedStages)} build stages serially: {[stage.name for stage in orderedStages]}…" )
+        failedNames = set()
+        for stage in orderedStages:
+            if any( dependencyName in failedNames for dependencyName in stage.dependsOn ):
+                logging.critical( f"Not running build stage '{stage.name}' because a stage that it depends on failed." )
+                failedNames.add( stage.name )
+                resourceReleaser.stageFinished( stage )
+                continue
+            startTime = time()
+            measurement = startMeasurement()
+            numSectionsBefore = _getNumMaterialisedSections( state )
+            manifestSnapshot = _getManifestSnapshot( state )
+            try: stage.run( state )
+            except Exception: # Fail the same way as when the stage is run in a worker process
+                logging.critical( f"Build stage '{stage.name}' FAILED: {traceback.format_exc()}" )
+                failedNames.add( stage.name )
+                if state.buildReport is not None:
+                    state.buildReport.addEntry( _addMaterialisedSections( finishMeasurement( stage.name, measurement ), state, numSectionsBefore ) )
+                resourceReleaser.stageFinished( stage )
+                resourceReleaser.collectGarbage()
+                continue
+            reportEntry = _addMaterialisedSections( finishMeasurement( stage.name, measurement ), state, numSectionsBefore )
+            reportEntry['filesWritten'], reportEntry['bytesWritten'] = _writeStageCheckpoint( stage, stages, stage.collectResults( state, manifestSnapshot ), stageFingerprints[stage.name], state.TEMP_BUILD_FOLDER )
+            if state.buildReport is not None: state.buildReport.addEntry( reportEntry )
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Build stage '{stage.name}' took {(time()-startTime)/60:.1f} minutes ({formatMemoryUsage( getMemoryUsage() )})." )
+            resourceReleaser.stageFinished( stage )
+            resourceReleaser.collectGarbage()
+        if failedNames:
+            logging.critical( f"{len(failedNames)} build stage(s) failed: {sorted(failedNames)}" )
+            return False
+        return True
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"\nRunning {len(orderedStages)} build stages using up to {numJobs} worker processes: {[stage.name for stage in orderedStages]}…" )
+    forkContext = multiprocessing.get_context( 'fork' ) # So that the workers share our (copy-on-write) preloaded state
+    stageNames = {stage.name for stage in orderedStages} # Any others are already completed
+    pendingStages = list( orderedStages )
+    runningStages = {} # Key is the result connection, value is (stage, process, startTime)
+    doneNames, failedNames = set(), set()
+    while pendingStages or runningStages:
+        # Start any stages whose dependencies are all done
+        for stage in list( pendingStages ):
+            if len(runningStages) >= numJobs: break
+            ourDependencies = [dependencyName for dependencyName in stage.dependsOn if dependencyName in stageNames]
+            if any( dependencyName in failedNames for dependencyName in ourDependencies ):
+                logging.critical( f"Not running build stage '{stage.name}' because a stage that it depends on failed." )
+                pendingStages.remove( stage )
+                failedNames.add( stage.name )
+                resourceReleaser.stageFinished( stage )
+                continue
+            if all( dependencyName in doneNames for dependencyName in ourDependencies ):
+                resultReceiveConnection, resultSendConnection = forkContext.Pipe( duplex=False )
+                process = forkContext.Process( target=_runStageInWorker, args=(stage, state, resultSendConnection), name=f'OBD-{stage.name}' )
+                process.start()
+                resultSendConnection.close() # Only the worker writes to this
+                vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Started build stage '{stage.name}' in process {process.pid}…" )
+                runningStages[resultReceiveConnection] = (stage, process, time())
+                pendingStages.remove( stage )
+        if not runningStages: # Just to get any remaining failed stages dropped
+            resourceReleaser.collectGarbage()
+            continue
+
+        # Wait for any worker to finish
+        for resultConnection in wait( list( runningStages ) ):
+            stage, process, startTime = runningStages.pop( resultConnection )
+            try: resultStatus, result, memoryUsage, reportEntry = resultConnection.recv() # Must receive BEFORE joining in case the results are big
+            except EOFError: resultStatus, result, memoryUsage, reportEntry = 'FAILED', f"Worker process ended without sending any results (exit code {process.exitcode})", None, None
+            resultConnection.close()
+            process.join()
+            if resultStatus == 'OK' and process.exitcode == 0:
+                stage.mergeResults( result, state )
+                reportEntry['filesWritten'], reportEntry['bytesWritten'] = _writeStageCheckpoint( stage, stages, result, stageFingerprints[stage.name], state.TEMP_BUILD_FOLDER )
+                doneNames.add( stage.name )
+                vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Build stage '{stage.name}' took {(time()-startTime)/60:.1f} minutes (worker {formatMemoryUsage( memoryUsage )})." )
+            else:
+                logging.critical( f"Build stage '{stage.name}' FAILED (exit code {process.exitcode}): {result}" )
+                failedNames.add( stage.name )
+            if reportEntry is not None and state.buildReport is not None:
+                reportEntry['workerExitCode'] = process.exitcode
+                state.buildReport.addEntry( reportEntry )
+            resourceReleaser.stageFinished( stage )
+        if not runningStages: # Safe to collect the garbage now (before forking any more workers)
+            resourceReleaser.collectGarbage()
+
+    if failedNames:
+        logging.critical( f"{len(failedNames)} build stage(s) failed: {sorted(failedNames)}" )
+        return False
+    return True
+# end of buildStages.runBuildStages
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the stage ordering
+    stages = [BuildStage( 'app', None, 1, 'app/', dependsOn=('ref',) ), BuildStage( 'par', None, 1, 'par/' ), BuildStage( 'ref', None, 1, 'ref/' )]
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {getStageOrder( stages )}" )
+# end of buildStages.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of buildStages.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of buildStages.py
@@ -35,6 +35,8 @@ main calls fullDemo()
 
 
 CHANGELOG:
+    2026-10-16 Use the columnar WordTables (rather than splitting the word table lines every time)
+    2026-10-16 Get the Hebrew and Greek morphology from the MorphologyTables (rather than decoding it for every word)
 """
 from pathlib import Path
 import os
@@ -55,17 +57,15 @@ from bible_transliterations import transliterate_Hebrew, transliterate_Greek
 from settings import State, state, CNTR_BOOK_ID_MAP
 from OETHandlers import getOETTidyBBB, getOETBookName, getHebrewWordpageFilename, getGreekWordpageFilename, livenOETWordLinks
 from createSectionPages import findSectionNumber
-from createOETReferencePages import HebrewWordFileName, convert_Hebrew_word_gloss_spans, tidy_Hebrew_morphology, \
+from createOETReferencePages import HebrewWordFileName, convert_Hebrew_word_gloss_spans, get_Hebrew_morphology_table, \
                     GLOSS_TYPE_STRING_DICT,\
-                GreekWordFileName, formatNTContextSpansOETGlossWords, \
-                    CNTR_ROLE_NAME_DICT, CNTR_MOOD_NAME_DICT, CNTR_TENSE_NAME_DICT, CNTR_VOICE_NAME_DICT, CNTR_PERSON_NAME_DICT, \
-                    CNTR_CASE_NAME_DICT, CNTR_GENDER_NAME_DICT, CNTR_NUMBER_NAME_DICT
+                GreekWordFileName, formatNTContextSpansOETGlossWords, get_Greek_morphology_table
 
 
-LAST_MODIFIED_DATE = '2026-04-26' # by RJH
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
 SHORT_PROGRAM_NAME = "createAppJsonFiles"
 PROGRAM_NAME = "OpenBibleData createAppJsonFiles functions"
-PROGRAM_VERSION = '0.12'
+PROGRAM_VERSION = '0.14'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -122,8 +122,8 @@ def create_Hebrew_words_json( level:int, outputFolderPath:Path, state:State ) ->
     # Now make a page for each Hebrew word (including the note pages)
     numWordPagesMade = 0
     wordLinksForIndex:list[str] = [] # Used below to make an index page
-    for hh, columns_string in enumerate( state.OETRefData['word_tables'][HebrewWordFileName][1:], start=1 ):
-        if not columns_string: continue # a blank line (esp. at end)
+    for hh, wordFields in enumerate( state.OETRefData['word_tables'][HebrewWordFileName].iterFields(), start=1 ):
+        if not wordFields[0]: continue # a blank line (esp. at end)
         if numWordPagesMade>0 and hh % 50_000 == 0:
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      {numWordPagesMade+1:,} made out of {f'{hh:,} out of ' if hh!=numWordPagesMade+1 else ''}{len(state.OETRefData['word_tables'][HebrewWordFileName])-1:,}…" )
         # output_filename = getHebrewWordpageFilename( hh, state )
@@ -132,13 +132,13 @@ def create_Hebrew_words_json( level:int, outputFolderPath:Path, state:State ) ->
             # Check that we're not creating any duplicate filenames (that will then be overwritten)
             assert output_filename not in used_word_filenames, f"Hebrew {hh} {output_filename}"
             used_word_filenames.append( output_filename )
-        ref, rowType, _morphemeRowList, _lemmaRowList, _strongs, _morphology, word, noCantillations, _morphemeGlosses, _contextualMorphemeGlosses, _wordGloss, _contextualWordGloss, _glossCapitalisation, _glossPunctuation, _glossOrder, _glossInsert, _role, _nesting, _tags = columns_string.split( '\t' )
+        ref, rowType, _morphemeRowList, _lemmaRowList, _strongs, _morphology, word, noCantillations, _morphemeGlosses, _contextualMorphemeGlosses, _wordGloss, _contextualWordGloss, _glossCapitalisation, _glossPunctuation, _glossOrder, _glossInsert, _role, _nesting, _tags = wordFields
         BBB, _CVW = ref.split( '_', 1 )
         if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG and BBB not in state.TEST_BOOK_LIST:
             continue # In some test modes, we only make the relevant json files
         hebrewWord = (noCantillations.replace( ',', '' ) # Remove morpheme breaks
                         if noCantillations else word ) # Segs and notes have nothing in the noCantillations field
-        if create_Hebrew_word_json( level, hh, hebrewWord, columns_string, outputFolderPath, output_filename, state ):
+        if create_Hebrew_word_json( level, hh, hebrewWord, wordFields, outputFolderPath, output_filename, state ):
             if rowType!='seg' and 'note' not in rowType:
                 wordLinksForIndex.append( f'<a href="{output_filename}">{hebrewWord}</a>')
             numWordPagesMade += 1
@@ -200,17 +200,17 @@ def create_Hebrew_words_json( level:int, outputFolderPath:Path, state:State ) ->
 # end of createAppJsonFiles.create_Hebrew_words_json
 
 
-def create_Hebrew_word_json( level:int, hh:int, hebrewWord:str, columns_string:str, outputFolderPath:Path, word_output_filename:Path, state:State ) -> bool:
+def create_Hebrew_word_json( level:int, hh:int, hebrewWord:str, wordFields:tuple[str,...], outputFolderPath:Path, word_output_filename:Path, state:State ) -> bool:
     """
     """
     fnPrint( DEBUGGING_THIS_MODULE, f"create_Hebrew_word_json( {level}, {hh}, {hebrewWord}, ..., {word_output_filename} ... )" )
-    dPrint( 'Normal' if BibleOrgSysGlobals.alreadyMultiprocessing else 'Verbose', DEBUGGING_THIS_MODULE, f"Word {hh}: {columns_string}" )
+    dPrint( 'Normal' if BibleOrgSysGlobals.alreadyMultiprocessing else 'Verbose', DEBUGGING_THIS_MODULE, f"Word {hh}: {wordFields}" )
     assert hebrewWord
     # print( f"create_Hebrew_word_json( ..., {hh}, {hebrewWord}, ..., {word_output_filename} ... )" )
 
     usedRoleLetters, usedMorphologies = set(), set()
     # dPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Got '{columns_string}' for '{word_output_filename}'" )
-    ref, rowType, morphemeRowList, lemmaRowList, strongs, morphology, word, noCantillations, morphemeGlosses, contextualMorphemeGlosses, wordGloss, contextualWordGloss, glossCapitalisation, glossPunctuation, glossOrder, glossInsert, role, nesting, tagsStr = columns_string.split( '\t' )
+    ref, rowType, morphemeRowList, lemmaRowList, strongs, morphology, word, noCantillations, morphemeGlosses, contextualMorphemeGlosses, wordGloss, contextualWordGloss, glossCapitalisation, glossPunctuation, glossOrder, glossInsert, role, nesting, tagsStr = wordFields
 
     BBB, CVW = ref.split( '_', 1 )
     assert not state.TEST_MODE_FLAG or state.ALL_TEST_REFERENCE_PAGES_FLAG or BBB in state.TEST_BOOK_LIST
@@ -255,7 +255,7 @@ def create_Hebrew_word_json( level:int, hh:int, hebrewWord:str, columns_string:s
     if rowType!='seg' and 'note' not in rowType:
         # it's a proper Hebrew (or Aramaic) word
         assert morphemeRowList.count(',') == strongs.count(',') == morphology.count(',') == word.count(',') == noCantillations.count(',')
-        tidyMorphologyFields = tidy_Hebrew_morphology( rowType, morphology )
+        tidyMorphologyFields = get_Hebrew_morphology_table( state ).getDecode( rowType, morphology )[0]
         jsonDict['tidy_morphology_html'] = tidyMorphologyFields
         if gloss:
             translationFields = f'''{GLOSS_TYPE_STRING_DICT[chosenGlossType]}=‘<b>{gloss[0].upper() if glossCapitalisation=='S' else gloss[0]}{gloss[1:]}</b>’'''
@@ -317,7 +317,7 @@ def create_Hebrew_word_json( level:int, hh:int, hebrewWord:str, columns_string:s
             elif tagPrefix == 'R':
                 semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Refers to <a title="Go to referred word" href="{tag}.htm#Top">Word #{tag}</a>'''
             else:
-                logging.critical( f"Unknown '{tagPrefix}' word tag in {n}: {columns_string}")
+                logging.critical( f"Unknown '{tagPrefix}' word tag in {n}: {wordFields}")
                 unknownTag
     if semanticExtras:
         jsonDict['semantic_extras'] = semanticExtras
@@ -646,15 +646,15 @@ def create_Greek_words_json( level:int, outputFolderPath:Path, state:State ) ->
     numWordPagesMade = 0
     wordLinksForIndex:list[str] = [] # Used below to make an index page
     state.OETRefData['usedGrkLemmas'], state.OETRefData['usedGrkStrongs'] = set(), set() # Used in next functions to make lemma and Strongs pages
-    for gg, columns_string in enumerate( state.OETRefData['word_tables'][GreekWordFileName][1:], start=1 ):
+    for gg, wordFields in enumerate( state.OETRefData['word_tables'][GreekWordFileName].iterFields(), start=1 ):
         if gg % 40_000 == 0:
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      {numWordPagesMade+1:,} made out of {f'{gg:,} out of ' if gg!=numWordPagesMade+1 else ''}{len(state.OETRefData['word_tables'][GreekWordFileName])-1:,}…" )
-        if not columns_string: continue # a blank line (esp. at end)
+        if not wordFields[0]: continue # a blank line (esp. at end)
         # print( f"Word {gg}: {columns_string}" )
 
         usedRoleLetters, usedMorphologies = set(), set()
 
-        ref, greekWord, SRLemma, GrkLemma, VLTGlossWordsStr, OETGlossWordsStr, glossCaps, probability, extendedStrongs, roleLetter, morphology, tagsStr = columns_string.split( '\t' )
+        ref, greekWord, SRLemma, GrkLemma, VLTGlossWordsStr, OETGlossWordsStr, glossCaps, probability, extendedStrongs, roleLetter, morphology, tagsStr = wordFields
         if probability != 'X': continue # Only want words/variants that are actually used
 
         BBB, CVW = ref.split( '_', 1 )
@@ -690,7 +690,7 @@ def create_Greek_words_json( level:int, outputFolderPath:Path, state:State ) ->
                                 .split( ' ' ):
             # print( f"{someGlossWord=}" )
             if '˱' not in someGlossWord and '˓' not in someGlossWord and '‹' not in someGlossWord: # We only want the main words not gloss helpers, etc.
-                assert not mainGlossWord, f"There should only be ONE {BBB} {C}:{V}w{W} {mainGlossWord=} {someGlossWord=} from {gg} {columns_string=}"
+                assert not mainGlossWord, f"There should only be ONE {BBB} {C}:{V}w{W} {mainGlossWord=} {someGlossWord=} from {gg} {wordFields=}"
                 mainGlossWord = someGlossWord.split('/(')[0] # Throw away any Hebrew names #.replace('\\add_','\\add ')
         if mainGlossWord and ('\\' in mainGlossWord or '/' in mainGlossWord):
             if '\\' in mainGlossWord: print( f"{gg=} {mainGlossWord=} from {OETGlossWordsStr=}"); assert False, "We want to stop here"
@@ -704,11 +704,10 @@ def create_Greek_words_json( level:int, outputFolderPath:Path, state:State ) ->
         jsonDict['extended_Strongs'] = extendedStrongs
         jsonDict['Strongs_number'] = strongs
 
+        # The role and morphology fields are only decoded once for each different code (in the morphology table)
+        roleName, _roleField, morphologyFields, tidyMorphology, _tidyRoleMorphology, _morphologyText = get_Greek_morphology_table( state ).getDecode( wordFields[9], wordFields[10], glossCaps )
         roleField = ''
         if roleLetter:
-            roleName = CNTR_ROLE_NAME_DICT[roleLetter]
-            if roleName=='noun' and 'U' in glossCaps:
-                roleName = 'proper noun'
             roleField = f' Word role=<b>{roleName}</b>'
             usedRoleLetters.add( roleLetter )
             jsonDict['word_role'] = roleName
@@ -716,25 +715,8 @@ def create_Greek_words_json( level:int, outputFolderPath:Path, state:State ) ->
         nominaSacraField = 'Marked with <b>Nomina Sacra</b>' if 'N' in glossCaps else ''
         jsonDict['nomina_sacra'] = 'N' in glossCaps
 
-        # morphologyField =
-        tidyRoleMorphology = tidyMorphology = moodField = tenseField = voiceField = personField = caseField = genderField = numberField = ''
-        if morphology:
-            # morphologyField = f' Morphology=<b>{morphology}</b>:' # Not currently used since we give all the following information instead
-            tidyMorphology = morphology[4:] if morphology.startswith('····') else morphology
-            tidyRoleMorphology = f'{roleLetter}-{tidyMorphology}'
-            assert len(morphology) == 7, f"Got {ref} '{greekWord}' morphology ({len(morphology)}) = '{morphology}'"
-            mood,tense,voice,person,case,gender,number = morphology
-            if mood!='·': moodField = f' mood=<b>{CNTR_MOOD_NAME_DICT[mood]}</b>'
-            if tense!='·': tenseField = f' tense=<b>{CNTR_TENSE_NAME_DICT[tense]}</b>'
-            if voice!='·': voiceField = f' voice=<b>{CNTR_VOICE_NAME_DICT[voice]}</b>'
-            if person!='·': personField = f' person=<b>{CNTR_PERSON_NAME_DICT[person]}</b>'
-            if case!='·': caseField = f' case=<b>{CNTR_CASE_NAME_DICT[case]}</b>'
-            if gender!='·': genderField = f' gender=<b>{CNTR_GENDER_NAME_DICT[gender]}</b>'
-            if number!='·': numberField = f' number=<b>{CNTR_NUMBER_NAME_DICT[number]}</b>' # or № ???
-            if tidyMorphology != '···': usedMorphologies.add( tidyMorphology )
-        else:
-            tidyRoleMorphology = roleLetter
-        jsonDict['tidy_morphology_html'] = f'{roleField}{moodField}{tenseField}{voiceField}{personField}{caseField}{genderField}{numberField}'
+        if morphology and tidyMorphology != '···': usedMorphologies.add( tidyMorphology )
+        jsonDict['tidy_morphology_html'] = f'{roleField}{morphologyFields}'
         translation = '<small>(no English gloss here)</small>' if not OETGlossWordsStr or OETGlossWordsStr=='-' else f'''‘{tidyGlossOfGreekWord(formattedContextGlossWords)}’'''
         jsonDict['translation_html'] = translation
         # capsField = f' <small>(Caps={glossCaps})</small>' if glossCaps else ''
@@ -763,7 +745,7 @@ def create_Greek_words_json( level:int, outputFolderPath:Path, state:State ) ->
                 elif tagPrefix == 'R':
                     semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Refers to <a title="Go to referred word" href="{tag}.htm#Top">Word #{tag}</a>'''
                 else:
-                    logging.critical( f"Unknown '{tagPrefix}' word tag in {gg}: {columns_string}")
+                    logging.critical( f"Unknown '{tagPrefix}' word tag in {gg}: {wordFields}")
                     unknownTag
         jsonDict['semantic_extras'] = semanticExtras
         state.OETRefData['usedGrkLemmas'].add( GrkLemma ) # Used in next function to make lemma pages
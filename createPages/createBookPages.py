@@ -36,6 +36,7 @@ CHANGELOG:
     2025-09-25 Make all SR-GNT verse text into live links to collation pages
     2026-01-07 Added OET Logo
     2026-08-22 Import convertVerseEntryListToHtml directly from openbibledata_rust (convert.py deleted)
+    2026-10-16 Reuse unchanged book pages from the previous build if state.pageManifest is set
 """
 from pathlib import Path
 import os
@@ -51,17 +52,21 @@ from bible_organisational_system import InternalBibleEntryList
 import bos_books_codes_py
 
 from settings import State, CNTR_BOOK_ID_MAP
+import openbibledata_rust
 from openbibledata_rust import convertVerseEntryListToHtml
-from html import do_OET_RV_HTMLcustomisations, do_OET_LV_HTMLcustomisations, do_LSV_HTMLcustomisations, do_T4T_HTMLcustomisations, \
+from html import PROGRAM_NAME_VERSION as HTML_PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE as HTML_LAST_MODIFIED_DATE, \
+                    do_OET_RV_HTMLcustomisations, do_OET_LV_HTMLcustomisations, do_LSV_HTMLcustomisations, do_T4T_HTMLcustomisations, \
                     makeTop, makeBottom, makeBookNavListParagraph, removeDuplicateCVids, checkHtml
+from pageManifest import getModuleFingerprint
 from OETHandlers import livenOETWordLinks, livenOETCompatibleWordLinks, getOETTidyBBB, getHebrewWordpageFilename, getGreekWordpageFilename
 
 
-LAST_MODIFIED_DATE = '2026-06-28' # by RJH
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
 SHORT_PROGRAM_NAME = "createBookPages"
 PROGRAM_NAME = "OpenBibleData createBookPages functions"
-PROGRAM_VERSION = '0.69'
+PROGRAM_VERSION = '0.70'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+PAGE_GENERATOR_VERSION = f'{PROGRAM_NAME_VERSION} {LAST_MODIFIED_DATE} with {HTML_PROGRAM_NAME_VERSION} {HTML_LAST_MODIFIED_DATE} and openbibledata_rust {getModuleFingerprint( openbibledata_rust )}' # For incremental builds (the Rust code renders the pages and their headers)
 
 DEBUGGING_THIS_MODULE = False
 
@@ -435,6 +440,16 @@ def createBookPages( level:int, folder:Path, thisBible, state:State ) -> list[st
 
         bkHtml = f'''<p class="bkNav">{bkPrevNav}<span class="bkHead" id="Top">{thisBible.abbreviation} {ourTidyBBB}</span>{bkNextNav}</p>{f'{NEWLINE}{state.JAMES_NOTE_HTML_PARAGRAPH}' if 'OET' in thisBible.abbreviation and BBB=='JAM' else ''}{'' if bos_books_codes_py.is_single_chapter_book(BBB) else f'{NEWLINE}{state.OET_UNFINISHED_BOOK_WARNING_HTML_PARAGRAPH}' if 'OET' in thisBible.abbreviation else state.WHOLE_BOOK_WARNING_HTML_PARAGRAPH}{f'{state.BLACK_LETTER_FONT_HTML_PARAGRAPH}{NEWLINE}' if thisBible.abbreviation=='KJB-1611' else ''}'''
         verseEntryList, contextList = thisBible.getContextVerseData( (BBB,) )
+        filename = f'{BBB}.htm'
+        filepath = folder.joinpath( filename )
+        if state.pageManifest is not None: # See if this page is unchanged since the last build
+            pageFingerprint = state.pageManifest.makeFingerprint( PAGE_GENERATOR_VERSION, verseEntryLists=(verseEntryList,),
+                                extras=(thisBible.abbreviation, contextList, navBookListParagraph, bkHtml,
+                                        state.pageManifest.getDataFingerprint( 'word_tables', state.OETRefData['word_tables'] )
+                                            if isinstance( thisBible, ESFMBible.ESFMBible ) or thisBible.abbreviation in ('BSB','MSB') else '') )
+            if state.pageManifest.reuseExistingPage( filepath, pageFingerprint ):
+                processedFilenames.append( filename )
+                continue
         if isinstance( thisBible, ESFMBible.ESFMBible ):
             verseEntryList = livenOETWordLinks( level, thisBible, (BBB,), verseEntryList, state )
         elif thisBible.abbreviation in ('BSB','MSB'):
@@ -461,10 +476,8 @@ def createBookPages( level:int, folder:Path, thisBible, state:State ) -> list[st
                 textHtml = f'''{textHtml[:ix]}<a title="Go to the GreekCNTR collation page" href="https://GreekCNTR.org/collation/?v={CNTR_BOOK_ID_MAP[BBB]}{C.zfill(3)}{V.zfill(3)}">{textHtml[ix:].replace( '</span>', '</a></span>', 1 )}'''
                 startIndex = ix + 99 # Approx number of added characters
         bkHtml = f'{bkHtml}{textHtml}'
-        filename = f'{BBB}.htm'
         processedFilenames.append( filename )
         # BBBLinks.append( f'<a title="{bos_books_codes_py.get_english_name_nr(BBB)}" href="{filename}#Top">{ourTidyBBB}</a>' )
-        filepath = folder.joinpath( filename )
         top = makeTop( level, thisBible.abbreviation, 'book', f'byDoc/{filename}', state ) \
                 .replace( '__TITLE__', f"{thisBible.abbreviation} {ourTidyBBB} book{' TEST' if state.TEST_MODE_FLAG else ''}" ) \
                 .replace( '__KEYWORDS__', f'Bible, {thisBible.abbreviation}, book, document, {ourTidyBBB}' ) \
@@ -478,6 +491,8 @@ def createBookPages( level:int, folder:Path, thisBible, state:State ) -> list[st
         assert not filepath.is_file() # Check that we're not overwriting anything
         with open( filepath, 'wt', encoding='utf-8' ) as bkHtmlFile:
             bkHtmlFile.write( bkHtml )
+        if state.pageManifest is not None:
+            state.pageManifest.recordPage( filepath, pageFingerprint )
         vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"        {len(bkHtml):,} characters written to {filepath}" )
 
     # Now create an overall index page
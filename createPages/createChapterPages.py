@@ -43,6 +43,7 @@ CHANGELOG:
     2026-07-06 Added OBI images to OET-RV
     2026-08-17 Remove current chapter from chLst (chapter links)
     2026-08-22 Use Rust equivalent of convertVerseEntryListToHtml, and add bkLst to FRT chapter pages
+    2026-10-16 Reuse unchanged chapter pages from the previous build if state.pageManifest is set
 """
 from pathlib import Path
 import os
@@ -55,18 +56,22 @@ import BibleOrgSys.Formats.ESFMBible as ESFMBible
 import bos_books_codes_py
 
 from settings import State, CNTR_BOOK_ID_MAP
+import openbibledata_rust
 from openbibledata_rust import convertVerseEntryListToHtml
-from html import do_OET_RV_HTMLcustomisations, do_OET_LV_HTMLcustomisations, do_LSV_HTMLcustomisations, do_T4T_HTMLcustomisations, \
+from html import PROGRAM_NAME_VERSION as HTML_PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE as HTML_LAST_MODIFIED_DATE, \
+                    do_OET_RV_HTMLcustomisations, do_OET_LV_HTMLcustomisations, do_LSV_HTMLcustomisations, do_T4T_HTMLcustomisations, \
                     makeTop, makeBottom, makeBookNavListParagraph, removeDuplicateCVids, checkHtml
+from pageManifest import getModuleFingerprint
 from Bibles import getBibleMapperMaps, getOpenBibleImages
 from OETHandlers import livenOETWordLinks, livenOETCompatibleWordLinks, getOETTidyBBB, getHebrewWordpageFilename, getGreekWordpageFilename
 
 
-LAST_MODIFIED_DATE = '2026-08-22' # by RJH
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
 SHORT_PROGRAM_NAME = "createChapterPages"
 PROGRAM_NAME = "OpenBibleData createChapterPages functions"
-PROGRAM_VERSION = '0.84'
+PROGRAM_VERSION = '0.85'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+PAGE_GENERATOR_VERSION = f'{PROGRAM_NAME_VERSION} {LAST_MODIFIED_DATE} with {HTML_PROGRAM_NAME_VERSION} {HTML_LAST_MODIFIED_DATE} and openbibledata_rust {getModuleFingerprint( openbibledata_rust )}' # For incremental builds (the Rust code renders the pages and their headers)
 
 DEBUGGING_THIS_MODULE = False
 
@@ -550,6 +555,16 @@ def createChapterPages( level:int, folder:Path, thisBible, state:State ) -> list
                     if c == 0: continue # Usually no chapter zero
                     logging.critical( f"No chapter found for {thisBible.abbreviation} {BBB} {C=}" )
                     continue
+                filename = f'{BBB}_Intro.htm' if c==-1 else f'{BBB}_C{C}.htm'
+                filepath = folder.joinpath( filename )
+                if state.pageManifest is not None: # See if this page is unchanged since the last build
+                    pageFingerprint = state.pageManifest.makeFingerprint( PAGE_GENERATOR_VERSION, verseEntryLists=(verseEntryList,),
+                                        extras=(thisBible.abbreviation, contextList, navBookListParagraph, chapterLinksParagraph, cNav, chapterHtml,
+                                                state.pageManifest.getDataFingerprint( 'word_tables', state.OETRefData['word_tables'] )
+                                                    if isinstance( thisBible, ESFMBible.ESFMBible ) or thisBible.abbreviation in ('BSB','MSB') else '') )
+                    if state.pageManifest.reuseExistingPage( filepath, pageFingerprint ):
+                        filenames.append( filename )
+                        continue
                 if isinstance( thisBible, ESFMBible.ESFMBible ): # e.g., OET-RV and OET-LV
                     verseEntryList = livenOETWordLinks( level, thisBible, (BBB,str(c)), verseEntryList, state )
                 elif thisBible.abbreviation in ('BSB','MSB'):
@@ -575,9 +590,7 @@ def createChapterPages( level:int, folder:Path, thisBible, state:State ) -> list
                         textHtml = f'''{textHtml[:ix]}<a title="Go to the GreekCNTR collation page" href="https://GreekCNTR.org/collation/?v={CNTR_BOOK_ID_MAP[BBB]}{C.zfill(3)}{str(v).zfill(3)}">{textHtml[ix:].replace( '</span>', '</a></span>', 1 )}'''
                         startIndex = ix + 99 # Approx number of added characters
                 chapterHtml = f'{chapterHtml}{textHtml}'
-                filename = f'{BBB}_Intro.htm' if c==-1 else f'{BBB}_C{C}.htm'
                 filenames.append( filename )
-                filepath = folder.joinpath( filename )
                 top = makeTop( level, thisBible.abbreviation, 'chapter', f'byC/{filename}', state ) \
                         .replace( '__TITLE__', f"{thisBible.abbreviation} {ourTidyBBB} introduction{' TEST' if state.TEST_MODE_FLAG else ''}"
                                         if c==-1 else f"{thisBible.abbreviation} {ourTidyBBB} chapter {C}{' TEST' if state.TEST_MODE_FLAG else ''}" ) \
@@ -595,6 +608,8 @@ def createChapterPages( level:int, folder:Path, thisBible, state:State ) -> list
                 assert not filepath.is_file() # Check that we're not overwriting anything
                 with open( filepath, 'wt', encoding='utf-8' ) as cHtmlFile:
                     cHtmlFile.write( chapterHtml )
+                if state.pageManifest is not None:
+                    state.pageManifest.recordPage( filepath, pageFingerprint )
                 vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"        {len(chapterHtml):,} characters written to {filepath}" )
 
             # Now create an index page for this book
@@ -52,6 +52,8 @@ CHANGELOG:
     2026-04-09 Changed to use getPositiveLeadingInt
     2026-04-19 Added SOTN (SIL Open Translators Notes)
     2026-08-22 Import convertVerseEntryListToHtml directly from openbibledata_rust (convert.py deleted)
+    2026-10-16 Use the columnar WordTables (rather than splitting the word table lines every time)
+    2026-10-16 Look up verses in the word tables with WordTableIndex.getWordNumberRange()
 
 TODO:
     Add colour keys for LV and RV words
@@ -77,10 +79,10 @@ from OETHandlers import livenOETWordLinks, getOETBookName, getOETTidyBBB, getHeb
 from jsonResources import getFormattedSILOpenTranslationNotes
 
 
-LAST_MODIFIED_DATE = '2026-06-16' # by RJH
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
 SHORT_PROGRAM_NAME = "createOETInterlinearPages"
 PROGRAM_NAME = "OpenBibleData createOETInterlinearPages functions"
-PROGRAM_VERSION = '0.68'
+PROGRAM_VERSION = '0.70'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -443,12 +445,9 @@ def createOETInterlinearVerseInner( level:int, BBB:str, c:int, v:int, state:Stat
             rvEnglishWordDict[number].append( word )
 
     if NT: # See if we have variants
-        firstWordNumber,lastWordNumber = state.OETRefData['word_table_indexes'][wordFileName][f'{BBB}_{C}:{V}']
-        haveVariants = False
-        for wordNumber in range( firstWordNumber, lastWordNumber+1 ):
-            if wordTable[wordNumber].split('\t')[7] != 'X': # SR/probability
-                haveVariants = True
-                break # no need to look further
+        firstWordNumber,lastWordNumber = state.OETRefData['word_table_indexes'][wordFileName].getWordNumberRange( BBB, C, V )
+        probabilityColumn = wordTable.getColumn( 'Probability' ) # SR/probability
+        haveVariants = any( probabilityColumn[wordNumber] != 'X' for wordNumber in range( firstWordNumber, lastWordNumber+1 ) )
 
     # print( f"Found {BBB} {c}:{v} ({len(EnglishWordList)}) {EnglishWordList=}" )
     # Removed <li lang="en_PERCENT">{row[7]+'%' if row[7]=='X' else 'V'}</li>
@@ -474,11 +473,10 @@ def createOETInterlinearVerseInner( level:int, BBB:str, c:int, v:int, state:Stat
             for wordNumber in range( firstWordNumber, lastWordNumber+1 ):
                 # if wordNumber >= len(wordTable): # we must be in one of the last verses of Rev
                 #     break
-                rowStr = wordTable[wordNumber]
-                assert rowStr.startswith( f'{BBB}_{c}:{v}w' )
-                # if not rowStr.startswith( f'{BBB}_{c}:{v}w' ): # gone into the next verse
+                row = wordTable.getFields( wordNumber )
+                assert row[0].startswith( f'{BBB}_{c}:{v}w' )
+                # if not row[0].startswith( f'{BBB}_{c}:{v}w' ): # gone into the next verse
                 #     break
-                row = rowStr.split( '\t' )
                 assert len(row) == 12
                 #  0    1          2        3           4              5              6          7            8           9     10          11
                 # 'Ref\tGreekWord\tSRLemma\tGreekLemma\tVLTGlossWords\tOETGlossWords\tGlossCaps\tProbability\tStrongsExt\tRole\tMorphology\tTags'
@@ -519,15 +517,14 @@ def createOETInterlinearVerseInner( level:int, BBB:str, c:int, v:int, state:Stat
   <li lang="en_TAGS">OET tags</li>
   <li lang="en_WORDNUM">OET word #</li>
 </ol><!--titles--></li>''']
-            firstWordNumber,lastWordNumber = state.OETRefData['word_table_indexes'][wordFileName][f'{BBB}_{C}:{V}']
+            firstWordNumber,lastWordNumber = state.OETRefData['word_table_indexes'][wordFileName].getWordNumberRange( BBB, C, V )
             for wordNumber in range( firstWordNumber, lastWordNumber+1 ):
                 # if wordNumber >= len(wordTable): # we must be in one of the last verses of Rev
                 #     break
-                rowStr = wordTable[wordNumber]
-                assert rowStr.startswith( f'{BBB}_{c}:{v}' )
-                # if not rowStr.startswith( f'{BBB}_{c}:{v}w' ): # gone into the next verse
+                row = wordTable.getFields( wordNumber )
+                assert row[0].startswith( f'{BBB}_{c}:{v}' )
+                # if not row[0].startswith( f'{BBB}_{c}:{v}w' ): # gone into the next verse
                 #     break
-                row = rowStr.split( '\t' )
                 assert len(row) == 19, f"({len(row)}) {row=}"
                 #  0    1        2                3             4        5           6     7                8                9                          10         11                   12                   13                14          15           16    17       18
                 # 'Ref\tRowType\tMorphemeRowList\tLemmaRowList\tStrongs\tMorphology\tWord\tNoCantillations\tMorphemeGlosses\tContextualMorphemeGlosses\tWordGloss\tContextualWordGloss\tGlossCapitalisation\tGlossPunctuation\tGlossOrder\tGlossInsert\tRole\tNesting\tTags'
@@ -614,10 +611,9 @@ def createOETInterlinearVerseInner( level:int, BBB:str, c:int, v:int, state:Stat
             reverseList.append( lastEntry )
         else:
             # Display the reverse interlinear blocks
-            rowStr = wordTable[wordNumber]
+            row = wordTable.getFields( wordNumber )
             if NT:
-                assert rowStr.startswith( f'{BBB}_{c}:{v}w' )
-                row = rowStr.split( '\t' )
+                assert row[0].startswith( f'{BBB}_{c}:{v}w' )
                 assert len(row) == 12
                 #  0    1          2        3           4              5              6          7            8           9     10          11
                 # 'Ref\tGreekWord\tSRLemma\tGreekLemma\tVLTGlossWords\tOETGlossWords\tGlossCaps\tProbability\tStrongsExt\tRole\tMorphology\tTags'
@@ -645,8 +641,7 @@ def createOETInterlinearVerseInner( level:int, BBB:str, c:int, v:int, state:Stat
   <li lang="en_WORDNUM"><a title="View word details" href="{'../'*level}ref/GrkWrd/{getGreekWordpageFilename(wordNumber, state )}#Top">{wordNumber}</a></li>
 </ol><!--word--></li>''' )
             else: # OT
-                assert rowStr.startswith( f'{BBB}_{c}:{v}' )
-                row = rowStr.split( '\t' )
+                assert row[0].startswith( f'{BBB}_{c}:{v}' )
                 assert len(row) == 19, f"({len(row)}) {row=}"
                 #  0    1        2                3             4        5           6     7                8                9                          10         11                   12                   13                14          15           16    17       18
                 # 'Ref\tRowType\tMorphemeRowList\tLemmaRowList\tStrongs\tMorphology\tWord\tNoCantillations\tMorphemeGlosses\tContextualMorphemeGlosses\tWordGloss\tContextualWordGloss\tGlossCapitalisation\tGlossPunctuation\tGlossOrder\tGlossInsert\tRole\tNesting\tTags'
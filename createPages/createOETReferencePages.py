@@ -28,10 +28,18 @@
 Module handling createOETReferencePages functions.
 
 createOETReferencePages( level:int, outputFolderPath:Path, state:State ) -> bool
+makeHebrewWordIndexes( state:State ) -> dict
+getHebrewWordIndexesKey( state:State ) -> str
+makeGreekWordIndexes( state:State ) -> dict
+getGreekWordIndexesKey( state:State ) -> str
 preprocessGreekWordsLemmasGlosses( BBBSelection:str|list[str]], state ) -> bool
 preprocessHebrewWordsLemmasGlosses( BBBSelection:str|list[str]], state ) -> bool
 formatNTSpansGlossWords( glossWords:str ) -> str
 formatNTContextSpansOETGlossWords( rowNum:int, state:State ) -> str
+decode_Hebrew_morphology( dHM_rowType:str, dHM_morphology:str ) -> tuple[str,str]
+get_Hebrew_morphology_table( state:State ) -> MorphologyTable
+decode_Greek_morphology( dGM_roleLetter:str, dGM_morphology:str, dGM_glossCaps:str ) -> tuple[str|None,str,str,str,str|None,str]
+get_Greek_morphology_table( state:State ) -> MorphologyTable
 get_OET_LV_verse_HTML( level:int, ref:str, state:State ) -> str
 get_OET_RV_verse_HTML( level:int, ref:str, state:State ) -> str
 create_Hebrew_word_pages( level:int, outputFolderPath:Path, state:State ) -> None
@@ -82,23 +90,33 @@ CHANGELOG:
     2026-04-13 Added frequency counts for glosses in word pages and NT lemma pages
     2026-06-24 Don't exclude the current verse from Hebrew & Greek word & lemma page example & verse lines
     2026-08-10 Added UHG and UGG
+    2026-10-16 Use the columnar WordTables (rather than splitting the word table lines every time)
+    2026-10-16 Preprocess the Hebrew and Greek words by the encoded column codes (so each different field is only processed once)
+    2026-10-16 Save the preprocessed word, lemma, form, and Strongs indexes (and load them if the word tables haven't changed)
+    2026-10-16 Make the Hebrew and Greek word pages in chunks in forked worker processes (if PARALLEL_WORD_PAGES_FLAG)
+    2026-10-16 Make the Hebrew and Greek lemma pages from the inverted LemmaIndex (rather than scanning all lemmas and glosses for every page) and in forked worker processes (if PARALLEL_LEMMA_PAGES_FLAG)
+    2026-10-16 Decode the Hebrew and Greek morphology once for each different code (in MorphologyTables) for the word pages and the app json files
+    2026-10-16 Don't remove the single preprocessed book from the global BOOKLIST_OT39/BOOKLIST_NT27 (which wasn't done when the word indexes were loaded)
+    2026-10-16 Key the saved word indexes on the contents of the code modules that make them (not just PROGRAM_VERSION)
 """
 from pathlib import Path
 import os
+import sys
 from collections import defaultdict
 import re
 import json
 import logging
 import unicodedata
 from time import time
-import multiprocessing, copy
+import multiprocessing
 from functools import cache
+from itertools import chain
 import docutils.core
 from docutils.parsers.rst import roles
 from docutils import nodes
 
 import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
-from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint, BOOKLIST_OT39, BOOKLIST_NT27, BOOKLIST_66
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint, BOOKLIST_66
 from BibleOrgSys.Reference.BibleVersificationSystems import BibleVersificationSystem
 from BibleOrgSys.OriginalLanguages import Hebrew, BibleLexicon
 from bible_organisational_system import getPositiveLeadingInt
@@ -111,12 +129,17 @@ from html import makeTop, makeBottom, checkHtml, do_OET_LV_HTMLcustomisations, d
 from openbibledata_rust import convertVerseEntryListToHtml
 from OETHandlers import getOETTidyBBB, getOETBookName, getHebrewWordpageFilename, getGreekWordpageFilename, livenOETWordLinks
 from createSectionPages import findSectionNumber
+from wordIndexes import getWordIndexesKey, getWordIndexes
+from pageManifest import getModuleFingerprint
+from lemmaIndex import LemmaIndex
+from morphologyTable import MorphologyTable, getMorphologyText
+from buildStages import startForkedWorker
 
 
-LAST_MODIFIED_DATE = '2026-08-13' # by RJH
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
 SHORT_PROGRAM_NAME = "createOETReferencePages"
 PROGRAM_NAME = "OpenBibleData createOETReferencePages functions"
-PROGRAM_VERSION = '0.98'
+PROGRAM_VERSION = '1.05'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -814,23 +837,9 @@ def createOETReferencePages( level:int, outputFolderPath:Path, state:State ) ->
     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\nCreating {'TEST ' if state.TEST_MODE_FLAG else ''}reference pages for OET…" )
 
     vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Preprocessing OT word forms for OET…" )
-    # Here we create our Dicts and Lists that we'll make the reference pages from
-    # First make a list of each place the same Greek word (and matching morphology) is used
-    state.OETRefData['OTFormUsageDict'], state.OETRefData['OTLemmaRowNumbersDict'] = defaultdict(list), defaultdict(list)
-    state.OETRefData['OTWordRowNumbersDict'] = defaultdict(list)
-    # state.OETRefData['OTLemmaFormsDict'] = defaultdict(set)
-    state.OETRefData['OTFormOETGlossesDict'] = defaultdict(set)
-    state.OETRefData['OTFormOETGlossesCountDict'] = defaultdict(int)
-    state.OETRefData['OTLemmaOETGlossesDict'] = defaultdict(set)
-    state.OETRefData['OTLemmasForRootDict'] = defaultdict(set)
-    state.OETRefData['OETOTGlossWordDict'] = defaultdict(list)
-    state.OETRefData['OTLemmaGlossDict'] = {}
-    state.OETRefData['OTStrongsRefs'] = defaultdict(set) # Key is like '358', entry is set of ref strings, e.g., {'GEN_1:1'}
-    # startTime = time()
-    preprocessHebrewWordsLemmasGlosses( [], state ) # Ignores these books (that must be processed manually)
-    # if state.TEST_MODE_FLAG: vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      preprocessHebrewWordsLemmasGlosses() took {(time()-startTime)/60:.2f} minutes.")
-    # for ss,(sKey,refs) in enumerate( state.OETRefData['OTStrongsRefs'].items() ):
-    #     print( f"{ss} {sKey=} {refs=}")
+    # Here we create our Dicts and Lists that we'll make the reference pages from (or load them if the word tables haven't changed)
+    state.OETRefData.update( getWordIndexes( 'OET-LV_OT', getHebrewWordIndexesKey( state ), lambda: makeHebrewWordIndexes( state ),
+                                                state.BINARY_WORD_TABLES_FOLDER, verify=state.VERIFY_WORD_INDEXES_FLAG ) )
     startTime = time()
     create_Hebrew_word_pages( level+1, outputFolderPath.joinpath( 'HebWrd/' ), state )
     vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      create_Hebrew_word_pages() took {(time()-startTime)/60:.1f} minutes.")
@@ -844,22 +853,8 @@ def createOETReferencePages( level:int, outputFolderPath:Path, state:State ) ->
     del state.OETRefData['OTFormOETGlossesCountDict']
 
     vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Preprocessing NT word forms for OET…" )
-    state.OETRefData['NTFormUsageDict'], state.OETRefData['NTLemmaDict'] = defaultdict(list), defaultdict(list)
-    state.OETRefData['NTLemmaFormsDict'] = defaultdict(set)
-    state.OETRefData['NTLemmaFormsCountDict'] = defaultdict(int)
-    state.OETRefData['NTFormOETGlossesDict'], state.OETRefData['NTFormVLTGlossesDict'] = defaultdict(set), defaultdict(set)
-    state.OETRefData['NTFormOETGlossesCountDict'] = defaultdict(int)
-    state.OETRefData['NTLemmaOETGlossesDict'], state.OETRefData['NTLemmaVLTGlossesDict'] = defaultdict(set), defaultdict(set)
-    state.OETRefData['NTLemmaOETGlossesCountDict'] = defaultdict(int)
-    state.OETRefData['OETNTGlossWordDict'], state.OETRefData['VLTGlossWordDict'] = defaultdict(list), defaultdict(list)
-    state.OETRefData['NTGreekLemmaDict'] = {}
-    state.OETRefData['NTStrongsRefs'] = defaultdict(set) # Key is like '358', entry is set of ref strings, e.g., {'GEN_1:1'}
-    # NOTE: The word table has Matthew at the beginning (whereas the OET places John and Mark at the beginning) so we do them first
-    # startTime = time()
-    preprocessGreekWordsLemmasGlosses( 'JHN', state ) # Only processes this book so it goes first
-    preprocessGreekWordsLemmasGlosses( 'MRK', state )
-    preprocessGreekWordsLemmasGlosses( ['JHN','MRK'], state ) # Ignores these books (that must be processed manually)
-    # if state.TEST_MODE_FLAG: vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      preprocessGreekWordsLemmasGlosses() took {(time()-startTime)/60:.2f} minutes.")
+    state.OETRefData.update( getWordIndexes( 'OET-LV_NT', getGreekWordIndexesKey( state ), lambda: makeGreekWordIndexes( state ),
+                                                state.BINARY_WORD_TABLES_FOLDER, verify=state.VERIFY_WORD_INDEXES_FLAG ) )
     startTime = time()
     create_Greek_word_pages( level+1, outputFolderPath.joinpath( 'GrkWrd/' ), state )
     vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      create_Greek_word_pages() took {(time()-startTime)/60:.1f} minutes.")
@@ -1128,6 +1123,60 @@ def create_Greek_grammar_pages( level:int, outputFolderPath:Path, state:State )
 HebrewWordFileName = 'OET-LV_OT_word_table.tsv'
 # HebrewMorphemeFileName = 'OET-LV_OT_morpheme_table.tsv'
 HebrewLemmaFileName = 'OET-LV_OT_lemma_table.tsv'
+HEBREW_PREPROCESS_BBB_SELECTIONS = ([],) # Ignores these books (that must be processed manually)
+HEBREW_WORD_INDEX_NAMES = ('OTFormUsageDict','OTLemmaRowNumbersDict','OTWordRowNumbersDict',
+                            'OTFormOETGlossesDict','OTFormOETGlossesCountDict','OTLemmaOETGlossesDict','OTLemmasForRootDict','OETOTGlossWordDict',
+                            'OTLemmaGlossDict','OTStrongsRefs','OTLemmaFullRowTable','OTHebLemmaList','OTTransLemmaList')
+def makeHebrewWordIndexes( state:State ) -> dict:
+    """
+    Makes the OT Dicts and Lists (in state.OETRefData) that we'll make the Hebrew reference pages from.
+
+    Returns them in a dict (keyed by their state.OETRefData names) so they can be saved by getWordIndexes().
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "makeHebrewWordIndexes()" )
+    # First make a list of each place the same Greek word (and matching morphology) is used
+    state.OETRefData['OTFormUsageDict'], state.OETRefData['OTLemmaRowNumbersDict'] = defaultdict(list), defaultdict(list)
+    state.OETRefData['OTWordRowNumbersDict'] = defaultdict(list)
+    # state.OETRefData['OTLemmaFormsDict'] = defaultdict(set)
+    state.OETRefData['OTFormOETGlossesDict'] = defaultdict(set)
+    state.OETRefData['OTFormOETGlossesCountDict'] = defaultdict(int)
+    state.OETRefData['OTLemmaOETGlossesDict'] = defaultdict(set)
+    state.OETRefData['OTLemmasForRootDict'] = defaultdict(set)
+    state.OETRefData['OETOTGlossWordDict'] = defaultdict(list)
+    state.OETRefData['OTLemmaGlossDict'] = {}
+    state.OETRefData['OTStrongsRefs'] = defaultdict(set) # Key is like '358', entry is set of ref strings, e.g., {'GEN_1:1'}
+    startTime = time()
+    for BBBSelection in HEBREW_PREPROCESS_BBB_SELECTIONS:
+        preprocessHebrewWordsLemmasGlosses( BBBSelection, state )
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      preprocessHebrewWordsLemmasGlosses() took {time()-startTime:.1f} seconds.")
+    # for ss,(sKey,refs) in enumerate( state.OETRefData['OTStrongsRefs'].items() ):
+    #     print( f"{ss} {sKey=} {refs=}")
+    return { indexName:state.OETRefData[indexName] for indexName in HEBREW_WORD_INDEX_NAMES }
+# end of createOETReferencePages.makeHebrewWordIndexes
+
+WORD_INDEXES_CODE_MODULE_NAMES = (__name__, 'wordIndexes', 'wordTable', 'wordTableIndex', 'bible_transliterations', Hebrew.__name__)
+
+def _getWordIndexesCodeVersion() -> str:
+    """
+    The code part of the word indexes keys.
+
+    As well as our version, this includes the contents of this module (with the preprocessing functions and COMMON_ENGLISH_WORDS_LIST),
+        the word table modules, and the transliteration and Hebrew vowel pointing modules,
+        so the saved indexes aren't used after any of those are edited (even without a version change).
+    """
+    return ' '.join( [PROGRAM_VERSION] + [getModuleFingerprint( sys.modules[moduleName] ) for moduleName in WORD_INDEXES_CODE_MODULE_NAMES] )
+# end of createOETReferencePages._getWordIndexesCodeVersion
+
+
+def getHebrewWordIndexesKey( state:State ) -> str:
+    """
+    The key for the saved OT word indexes (which changes if the Hebrew word or lemma tables or the code changes).
+    """
+    return getWordIndexesKey( state.OETRefData['word_tables'][HebrewWordFileName], HEBREW_PREPROCESS_BBB_SELECTIONS,
+                                (Path( state.preloadedBibles['OET-LV'].OTsourceFolder ).joinpath( HebrewLemmaFileName ),), _getWordIndexesCodeVersion() )
+# end of createOETReferencePages.getHebrewWordIndexesKey
+
+
 def preprocessHebrewWordsLemmasGlosses( BBBSelection:str|list[str], state ) -> bool:
     """
     Makes all the lists and indexes of words, lemmas, and glosses
@@ -1140,7 +1189,7 @@ def preprocessHebrewWordsLemmasGlosses( BBBSelection:str|list[str], state ) -> b
     """
     if isinstance( BBBSelection, str ):
         processBBB = BBBSelection
-        ignoreBBBs = BOOKLIST_OT39.remove( processBBB )
+        ignoreBBBs = None # Not used (and don't change the global BOOKLIST_OT39 which is also used for state.booksToLoad)
         assert bos_books_codes_py.is_old_testament_nr( processBBB )
     else:
         assert isinstance( BBBSelection, list )
@@ -1178,88 +1227,170 @@ def preprocessHebrewWordsLemmasGlosses( BBBSelection:str|list[str], state ) -> b
     # state.OETRefData['OTLemmaFullRowTable'] = morphemeFileText.rstrip( '\n' ).split( '\n' ) # Remove any blank line at the end then split
     # # Uses less memory to keep the rows as single strings, rather than separating the columns at the tabs now
 
+    # Group the selected rows by the (int) codes of the encoded columns,
+    #   so that each different field value (or combination of them) is only processed once (below)
+    wordTable = state.OETRefData['word_tables'][HebrewWordFileName]
+    refColumn = wordTable.getColumn( 'Ref' )
+    lemmaRowListColumn, strongsColumn, morphologyColumn, noCantillationsColumn = wordTable.getEncodedColumns( 'LemmaRowList', 'Strongs', 'Morphology', 'NoCantillations' )
+    glossColumns = wordTable.getEncodedColumns( 'ContextualWordGloss', 'WordGloss', 'ContextualMorphemeGlosses', 'MorphemeGlosses' ) # In order of preference
+    lemmaRowListCodes, strongsCodes, morphologyCodes, noCantillationsCodes = lemmaRowListColumn.codes, strongsColumn.codes, morphologyColumn.codes, noCantillationsColumn.codes
+    contextualWordGlossCodes, wordGlossCodes, contextualMorphemeGlossesCodes, morphemeGlossesCodes = (glossColumn.codes for glossColumn in glossColumns)
+    formRowNumbers, formGlossCounts, glossRowNumbers = defaultdict(list), defaultdict(int), defaultdict(list)
+    lemmaRowListRowNumbers, lastLemmaRowListCodes, strongsVRefs = defaultdict(list), {}, defaultdict(set)
     started = False
-    for n, columns_string in enumerate( state.OETRefData['word_tables'][HebrewWordFileName][1:], start=1 ):
-        if (processBBB is not None and columns_string.startswith(processBBB)) \
-        or (processBBB is None and columns_string[:3] not in ignoreBBBs):
+    for n in range( 1, len(wordTable) ):
+        ref = refColumn[n]
+        if (processBBB is not None and ref.startswith(processBBB)) \
+        or (processBBB is None and ref[:3] not in ignoreBBBs):
             started = True
-            ref, rowType, _morphemeRowList, lemmaRowList, strongsField, morphology, _word, noCantillations, morphemeGlosses, contextualMorphemeGlosses, wordGloss, contextualWordGloss, glossCapitalisation, glossPunctuation, glossOrder, glossInsert, role, nesting, tags = columns_string.split( '\t' )
-            vRef = ref.split( 'w' )[0]
-            # if _ref == 'JOS_17:15w12' or '1214' in lemmaRowList:
-            #     print( f"{_ref} ({len(state.OETRefData['OTWordRowNumbersDict'][1214])}) {state.OETRefData['OTWordRowNumbersDict'][1214]=}" )
-            # elif _ref == 'MAL_3:24':
-            #     print( f"({len(state.OETRefData['OTWordRowNumbersDict'][1214])}) {state.OETRefData['OTWordRowNumbersDict'][1214]=}" )
-            gloss = contextualWordGloss if contextualWordGloss else wordGloss if wordGloss else contextualMorphemeGlosses if contextualMorphemeGlosses else morphemeGlosses
-            formMorph2Tuple = (noCantillations, morphology)
-            # if '1254' in strongs:
-            #     print( f"{_ref=} {rowType=} {_morphemeRowList=} {lemmaRowList=} {strongs=} {morphology=} {_word=} {noCantillations=} {morphemeGlosses=} {contextualMorphemeGlosses=} {wordGloss=} {contextualWordGloss=} {glossCapitalisation=} {glossPunctuation=} {glossOrder=} {glossInsert=} {role=} {nesting=} {tags=}\n   {gloss=} {formMorph2Tuple=}" )
-            state.OETRefData['OTFormUsageDict'][formMorph2Tuple].append( n )
-            state.OETRefData['OTLemmaRowNumbersDict'][noCantillations] = []
-            for strongsNumber in strongsField.replace( ' ', ',' ).replace( '+', '' ).split( ',' ): # e.g., 'l,m,8179+' or 'b,5788 a'
-                if strongsNumber.isdigit():
-                    state.OETRefData['OTStrongsRefs'][strongsNumber].add( vRef )
-            # print( f"{lemmaRowList=}" )
-            if lemmaRowList: # (Doesn't exist for 'seg' rows)
-                for lemmaRowNumberStr in lemmaRowList.split( ',' ):
-                    try:
-                        lemmaRowNumber = int( lemmaRowNumberStr )
-                        state.OETRefData['OTLemmaRowNumbersDict'][noCantillations].append( lemmaRowNumber )
-                        state.OETRefData['OTWordRowNumbersDict'][lemmaRowNumber].append( n )
-                    except ValueError: # '###MISSING-B3###'
-                        # print( f"preprocessHebrewWordsLemmasGlosses ignored {lemmaRowNumberStr=} from {n} {columns_string=}" ); assert False, "We want to stop here"
-                        pass
-            # print( f"{_word=} {noCantillations=} {_morphemeRowList=} {lemmaRowList=} {state.OETRefData['OTLemmaRowNumbersDict'][noCantillations]=}" )
-            # for lrn in state.OETRefData['OTLemmaRowNumbersDict'][noCantillations]: print( f"  {lrn=}: {state.OETRefData['OTWordRowNumbersDict'][lrn]=}")
-            # if noCantillations == 'נִין': assert False, "We want to stop here"
-            # else:
-            #     state.OETRefData['OTLemmaRowNumbersDict'][noCantillations].append( n )
-            #     state.OETRefData['OTLemmaFormsDict'][noCantillations].add( formMorph2Tuple )
-            if gloss:
-                state.OETRefData['OTFormOETGlossesDict'][formMorph2Tuple].add( gloss )
-                state.OETRefData['OTFormOETGlossesCountDict'][(noCantillations, morphology, gloss)] += 1
-                state.OETRefData['OTLemmaOETGlossesDict'][noCantillations].add( gloss )
-                if gloss != 'DOM':
-                    adjGloss = ( gloss.replace( '\\untr DOM\\untr*', '' ).replace( 'DOM', '' )
-                                    .replace( '\\nd ', '' ).replace( '\\nd*', '' )
-                                    .replace( '_~_', ' ' )
-                                    .replace( '(cmp)', '' )
-                                    .replace( '[s]', '' ).replace( '[es]', '' )
-                                    .replace( '(ms)', '' ).replace( '(m)', '' ).replace( '(fs)', '' )
-                                    .replace( '//', ' ' ).replace( '/', ' ' ).replace( '_', ' ' ).replace( '=', ' ' ).replace( ',', ' ' )
-                                    #.replace( '[', ' ' ).replace( ']', ' ' ) # We'll delete these below
-                                    .replace( '(', ' ' ).replace( ')', ' ' )
-                                    .replace( '   ', ' ' ).replace( '  ', ' ' ).strip() )
-                    # if '[' in gloss: print( f"{_ref} {gloss=} {adjGloss=}")
-                    if adjGloss:
-                        for someGlossWord in adjGloss.split( ' ' ):
-                            assert someGlossWord, f"{someGlossWord=} {gloss=} {adjGloss=}"
-                            if someGlossWord.startswith('[') and someGlossWord.endswith(']'):
-                                if someGlossWord[1:-1] not in COMMON_ENGLISH_WORDS_LIST \
-                                and someGlossWord[1:-1] not in ('fem','masc',
-                                                                'person','people',
-                                                                'man','men','woman','women','son','daughter',
-                                                                'cubits','times','portion',
-                                                                'belongs','belonged'):
-                                    dPrint( 'Info', DEBUGGING_THIS_MODULE, f"      preprocessHebrewWordsLemmasGlosses is ignoring {someGlossWord=} (assumed to be an added word) from {gloss=}")
-                                continue
-                            if someGlossWord not in COMMON_ENGLISH_WORDS_LIST \
-                            or someGlossWord == adjGloss: # it's the entire gloss
-                                # print( f"{n} {_ref} {someGlossWord=} from {gloss=}")
-                                # assert n not in state.OETRefData['OETOTGlossWordDict'][someGlossWord] # There are some rare instances like the=time//this_time
-                                state.OETRefData['OETOTGlossWordDict'][someGlossWord].append( n )
-            # if noCantillations in state.OETRefData['OTHebrewLemmaDict']:
-            #     # assert state.OETRefData['NTGreekLemmaDict'][noCantillations] == GrkLemma, f"{n=} {_ref} {noCantillations=} {GrkLemma=} {state.OETRefData['NTGreekLemmaDict'][SRLemma]=}"
-            #     if state.OETRefData['OTHebrewLemmaDict'][noCantillations] != GrkLemma:
-            #         dPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"    {n=} {_ref} {noCantillations=} {GrkLemma=} {state.OETRefData['OTHebrewLemmaDict'][noCantillations]=}" )
-            # state.OETRefData['OTHebrewLemmaDict'][noCantillations] = noCantillations
+            formCodes = (noCantillationsCodes[n], morphologyCodes[n])
+            glossCodes = (contextualWordGlossCodes[n], wordGlossCodes[n], contextualMorphemeGlossesCodes[n], morphemeGlossesCodes[n])
+            formRowNumbers[formCodes].append( n )
+            formGlossCounts[(formCodes,glossCodes)] += 1
+            glossRowNumbers[glossCodes].append( n )
+            lastLemmaRowListCodes[formCodes[0]] = lemmaRowListCode = lemmaRowListCodes[n] # Only the last row for each form is used
+            lemmaRowListRowNumbers[lemmaRowListCode].append( n )
+            strongsVRefs[strongsCodes[n]].add( ref.split( 'w' )[0] )
         elif processBBB and started:
             break # Must have already finished the desired book(s)
 
+    # Now update the lists and dicts in state (still adding the keys in the order of their first row)
+    noCantillationsValues, morphologyValues = noCantillationsColumn.values, morphologyColumn.values
+    for (noCantillationsCode,morphologyCode), rowNumbers in formRowNumbers.items():
+        state.OETRefData['OTFormUsageDict'][(noCantillationsValues[noCantillationsCode],morphologyValues[morphologyCode])].extend( rowNumbers )
+
+    lemmaRowNumbersLists = { lemmaRowListCode:_getHebrewLemmaRowNumbers( lemmaRowListColumn.values[lemmaRowListCode] ) for lemmaRowListCode in lemmaRowListRowNumbers }
+    for noCantillationsCode, lemmaRowListCode in lastLemmaRowListCodes.items():
+        state.OETRefData['OTLemmaRowNumbersDict'][noCantillationsValues[noCantillationsCode]] = lemmaRowNumbersLists[lemmaRowListCode].copy()
+    wordRowNumbersLists = defaultdict(list)
+    for lemmaRowListCode, rowNumbers in lemmaRowListRowNumbers.items():
+        for lemmaRowNumber in lemmaRowNumbersLists[lemmaRowListCode]:
+            wordRowNumbersLists[lemmaRowNumber].append( rowNumbers )
+    for lemmaRowNumber, rowNumbersLists in wordRowNumbersLists.items():
+        state.OETRefData['OTWordRowNumbersDict'][lemmaRowNumber].extend( _mergeRowNumbers( rowNumbersLists ) )
+
+    for strongsCode, vRefs in strongsVRefs.items():
+        for strongsNumber in strongsColumn.values[strongsCode].replace( ' ', ',' ).replace( '+', '' ).split( ',' ): # e.g., 'l,m,8179+' or 'b,5788 a'
+            if strongsNumber.isdigit():
+                state.OETRefData['OTStrongsRefs'][strongsNumber].update( vRefs )
+
+    glosses = { glossCodes:next( (glossColumn.values[glossCode] for glossColumn,glossCode in zip( glossColumns, glossCodes ) if glossColumn.values[glossCode]), '' )
+                for glossCodes in glossRowNumbers }
+    for ((noCantillationsCode,morphologyCode),glossCodes), count in formGlossCounts.items():
+        gloss = glosses[glossCodes]
+        if gloss:
+            noCantillations, morphology = noCantillationsValues[noCantillationsCode], morphologyValues[morphologyCode]
+            state.OETRefData['OTFormOETGlossesDict'][(noCantillations, morphology)].add( gloss )
+            state.OETRefData['OTFormOETGlossesCountDict'][(noCantillations, morphology, gloss)] += count
+            state.OETRefData['OTLemmaOETGlossesDict'][noCantillations].add( gloss )
+    glossWordRowNumbersLists = defaultdict(list)
+    for glossCodes, rowNumbers in glossRowNumbers.items():
+        for someGlossWord in _getHebrewGlossWords( glosses[glossCodes] ):
+            glossWordRowNumbersLists[someGlossWord].append( rowNumbers )
+    for someGlossWord, rowNumbersLists in glossWordRowNumbersLists.items():
+        # assert n not in state.OETRefData['OETOTGlossWordDict'][someGlossWord] # There are some rare instances like the=time//this_time
+        state.OETRefData['OETOTGlossWordDict'][someGlossWord].extend( _mergeRowNumbers( rowNumbersLists ) )
+
     return True
 # end of createOETReferencePages.preprocessHebrewWordsLemmasGlosses
 
 
+def _getHebrewLemmaRowNumbers( lemmaRowList:str ) -> list[int]:
+    """
+    Returns the lemma row numbers from a LemmaRowList field, e.g., '1214,33'
+    """
+    lemmaRowNumbers = []
+    if lemmaRowList: # (Doesn't exist for 'seg' rows)
+        for lemmaRowNumberStr in lemmaRowList.split( ',' ):
+            try: lemmaRowNumbers.append( int( lemmaRowNumberStr ) )
+            except ValueError: pass # '###MISSING-B3###'
+    return lemmaRowNumbers
+# end of createOETReferencePages._getHebrewLemmaRowNumbers
+
+
+def _getHebrewGlossWords( gloss:str ) -> list[str]:
+    """
+    Returns the (uncommon) English words in the Hebrew gloss to be indexed in OETOTGlossWordDict.
+    """
+    if not gloss or gloss == 'DOM': return []
+    adjGloss = ( gloss.replace( '\\untr DOM\\untr*', '' ).replace( 'DOM', '' )
+                    .replace( '\\nd ', '' ).replace( '\\nd*', '' )
+                    .replace( '_~_', ' ' )
+                    .replace( '(cmp)', '' )
+                    .replace( '[s]', '' ).replace( '[es]', '' )
+                    .replace( '(ms)', '' ).replace( '(m)', '' ).replace( '(fs)', '' )
+                    .replace( '//', ' ' ).replace( '/', ' ' ).replace( '_', ' ' ).replace( '=', ' ' ).replace( ',', ' ' )
+                    #.replace( '[', ' ' ).replace( ']', ' ' ) # We'll delete these below
+                    .replace( '(', ' ' ).replace( ')', ' ' )
+                    .replace( '   ', ' ' ).replace( '  ', ' ' ).strip() )
+    # if '[' in gloss: print( f"{gloss=} {adjGloss=}")
+    glossWords = []
+    if adjGloss:
+        for someGlossWord in adjGloss.split( ' ' ):
+            assert someGlossWord, f"{someGlossWord=} {gloss=} {adjGloss=}"
+            if someGlossWord.startswith('[') and someGlossWord.endswith(']'):
+                if someGlossWord[1:-1] not in COMMON_ENGLISH_WORDS_LIST \
+                and someGlossWord[1:-1] not in ('fem','masc',
+                                                'person','people',
+                                                'man','men','woman','women','son','daughter',
+                                                'cubits','times','portion',
+                                                'belongs','belonged'):
+                    dPrint( 'Info', DEBUGGING_THIS_MODULE, f"      preprocessHebrewWordsLemmasGlosses is ignoring {someGlossWord=} (assumed to be an added word) from {gloss=}")
+                continue
+            if someGlossWord not in COMMON_ENGLISH_WORDS_LIST \
+            or someGlossWord == adjGloss: # it's the entire gloss
+                glossWords.append( someGlossWord )
+    return glossWords
+# end of createOETReferencePages._getHebrewGlossWords
+
+
+def _mergeRowNumbers( rowNumbersLists:list[list[int]] ) -> list[int]:
+    """
+    Returns the row numbers from the lists (each already in order) merged back into order.
+    """
+    return rowNumbersLists[0] if len(rowNumbersLists) == 1 else sorted( chain.from_iterable( rowNumbersLists ) )
+# end of createOETReferencePages._mergeRowNumbers
+
+
 GreekWordFileName = 'OET-LV_NT_word_table.tsv'
+# NOTE: The word table has Matthew at the beginning (whereas the OET places John and Mark at the beginning) so we do them first
+GREEK_PREPROCESS_BBB_SELECTIONS = ('JHN', 'MRK', ['JHN','MRK']) # Then ignore these books (that have been processed manually)
+GREEK_WORD_INDEX_NAMES = ('NTFormUsageDict','NTLemmaDict','NTLemmaFormsDict','NTLemmaFormsCountDict',
+                            'NTFormOETGlossesDict','NTFormVLTGlossesDict','NTFormOETGlossesCountDict',
+                            'NTLemmaOETGlossesDict','NTLemmaVLTGlossesDict','NTLemmaOETGlossesCountDict',
+                            'OETNTGlossWordDict','VLTGlossWordDict','NTGreekLemmaDict','NTStrongsRefs')
+def makeGreekWordIndexes( state:State ) -> dict:
+    """
+    Makes the NT Dicts and Lists (in state.OETRefData) that we'll make the Greek reference pages from.
+
+    Returns them in a dict (keyed by their state.OETRefData names) so they can be saved by getWordIndexes().
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "makeGreekWordIndexes()" )
+    state.OETRefData['NTFormUsageDict'], state.OETRefData['NTLemmaDict'] = defaultdict(list), defaultdict(list)
+    state.OETRefData['NTLemmaFormsDict'] = defaultdict(set)
+    state.OETRefData['NTLemmaFormsCountDict'] = defaultdict(int)
+    state.OETRefData['NTFormOETGlossesDict'], state.OETRefData['NTFormVLTGlossesDict'] = defaultdict(set), defaultdict(set)
+    state.OETRefData['NTFormOETGlossesCountDict'] = defaultdict(int)
+    state.OETRefData['NTLemmaOETGlossesDict'], state.OETRefData['NTLemmaVLTGlossesDict'] = defaultdict(set), defaultdict(set)
+    state.OETRefData['NTLemmaOETGlossesCountDict'] = defaultdict(int)
+    state.OETRefData['OETNTGlossWordDict'], state.OETRefData['VLTGlossWordDict'] = defaultdict(list), defaultdict(list)
+    state.OETRefData['NTGreekLemmaDict'] = {}
+    state.OETRefData['NTStrongsRefs'] = defaultdict(set) # Key is like '358', entry is set of ref strings, e.g., {'GEN_1:1'}
+    startTime = time()
+    for BBBSelection in GREEK_PREPROCESS_BBB_SELECTIONS:
+        preprocessGreekWordsLemmasGlosses( BBBSelection, state )
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      preprocessGreekWordsLemmasGlosses() took {time()-startTime:.1f} seconds.")
+    return { indexName:state.OETRefData[indexName] for indexName in GREEK_WORD_INDEX_NAMES }
+# end of createOETReferencePages.makeGreekWordIndexes
+
+def getGreekWordIndexesKey( state:State ) -> str:
+    """
+    The key for the saved NT word indexes (which changes if the Greek word table or the code changes).
+    """
+    return getWordIndexesKey( state.OETRefData['word_tables'][GreekWordFileName], GREEK_PREPROCESS_BBB_SELECTIONS, (), _getWordIndexesCodeVersion() )
+# end of createOETReferencePages.getGreekWordIndexesKey
+
+
 def preprocessGreekWordsLemmasGlosses( BBBSelection:str|list[str], state ) -> bool:
     """
     Makes all the lists and indexes of words, lemmas, and glosses
@@ -1275,51 +1406,85 @@ def preprocessGreekWordsLemmasGlosses( BBBSelection:str|list[str], state ) -> bo
     """
     if isinstance( BBBSelection, str ):
         processBBB = BBBSelection
-        ignoreBBBs = BOOKLIST_NT27.remove( processBBB )
+        ignoreBBBs = None # Not used (and don't change the global BOOKLIST_NT27 which is also used for state.booksToLoad)
         assert bos_books_codes_py.is_new_testament_nr( processBBB )
     else:
         assert isinstance( BBBSelection, list )
         processBBB = None
         ignoreBBBs = BBBSelection
 
+    # Group the selected rows by the (int) codes of the encoded columns,
+    #   so that each different field value (or combination of them) is only processed once (below)
+    wordTable = state.OETRefData['word_tables'][GreekWordFileName]
+    refColumn = wordTable.getColumn( 'Ref' )
+    greekWordColumn, SRLemmaColumn, greekLemmaColumn, VLTGlossWordsColumn, OETGlossWordsColumn, probabilityColumn, extendedStrongsColumn, roleColumn, morphologyColumn \
+        = wordTable.getEncodedColumns( 'GreekWord', 'SRLemma', 'GreekLemma', 'VLTGlossWords', 'OETGlossWords', 'Probability', 'StrongsExt', 'Role', 'Morphology' )
+    greekWordCodes, SRLemmaCodes, greekLemmaCodes, VLTGlossWordsCodes, OETGlossWordsCodes, probabilityCodes, extendedStrongsCodes, roleCodes, morphologyCodes \
+        = (encodedColumn.codes for encodedColumn in (greekWordColumn, SRLemmaColumn, greekLemmaColumn, VLTGlossWordsColumn, OETGlossWordsColumn, probabilityColumn, extendedStrongsColumn, roleColumn, morphologyColumn))
+    hasProbability = tuple( bool(probability) for probability in probabilityColumn.values )
+    formRowNumbers, lemmaRowNumbers, formGlossCounts = defaultdict(list), defaultdict(list), defaultdict(int)
+    OETGlossRowNumbers, VLTGlossRowNumbers, lastGreekLemmaCodes, strongsVRefs = defaultdict(list), defaultdict(list), {}, defaultdict(set)
     started = False
-    for n, columns_string in enumerate( state.OETRefData['word_tables'][GreekWordFileName][1:], start=1 ):
-        if (processBBB is not None and columns_string.startswith(processBBB)) \
-        or (processBBB is None and columns_string[:3] not in ignoreBBBs):
+    for n in range( 1, len(wordTable) ):
+        ref = refColumn[n]
+        if (processBBB is not None and ref.startswith(processBBB)) \
+        or (processBBB is None and ref[:3] not in ignoreBBBs):
             started = True
-            ref, greekWord, SRLemma, GrkLemma, VLTGlossWordsStr, OETGlossWordsStr, _glossCaps, probability, extendedStrongs, roleLetter, morphology, _tagsStr = columns_string.split( '\t' )
-            vRef = ref.split( 'w', 1 )[0]
-            if probability:
-                OETFormattedGlossWords = formatNTSpansGlossWords( OETGlossWordsStr )
-                VLTFormattedGlossWords = formatNTSpansGlossWords( VLTGlossWordsStr )
-                formMorph3Tuple = (greekWord, roleLetter, None if morphology=='None' else morphology)
-                state.OETRefData['NTFormUsageDict'][formMorph3Tuple].append( n )
-                state.OETRefData['NTLemmaDict'][SRLemma].append( n )
-                state.OETRefData['NTLemmaFormsDict'][SRLemma].add( formMorph3Tuple )
-                state.OETRefData['NTLemmaFormsCountDict'][(SRLemma,greekWord,roleLetter,None if morphology=='None' else morphology)] += 1
-                state.OETRefData['NTFormOETGlossesDict'][formMorph3Tuple].add( OETFormattedGlossWords )
-                state.OETRefData['NTFormOETGlossesCountDict'][(greekWord, roleLetter, None if morphology=='None' else morphology, OETFormattedGlossWords)] += 1
-                state.OETRefData['NTFormVLTGlossesDict'][formMorph3Tuple].add( VLTFormattedGlossWords )
-                state.OETRefData['NTLemmaOETGlossesDict'][SRLemma].add( OETFormattedGlossWords )
-                state.OETRefData['NTLemmaOETGlossesCountDict'][(SRLemma, OETFormattedGlossWords)] += 1
-                state.OETRefData['NTLemmaVLTGlossesDict'][SRLemma].add( VLTFormattedGlossWords )
-                for someGlossWord in OETGlossWordsStr.split( ' ' ):
-                    if '˓' not in someGlossWord and '˱' not in someGlossWord and '‹' not in someGlossWord: # We only want the main words
-                        assert n not in state.OETRefData['OETNTGlossWordDict'][someGlossWord]
-                        state.OETRefData['OETNTGlossWordDict'][someGlossWord].append( n )
-                for someGlossWord in VLTGlossWordsStr.split( ' ' ):
-                    if '˓' not in someGlossWord and '˱' not in someGlossWord and '‹' not in someGlossWord: # We only want the main words
-                        assert n not in state.OETRefData['VLTGlossWordDict'][someGlossWord]
-                        state.OETRefData['VLTGlossWordDict'][someGlossWord].append( n )
-                if SRLemma in state.OETRefData['NTGreekLemmaDict']:
-                    # assert state.OETRefData['NTGreekLemmaDict'][SRLemma] == GrkLemma, f"{n=} {_ref} {SRLemma=} {GrkLemma=} {state.OETRefData['NTGreekLemmaDict'][SRLemma]=}"
-                    if state.OETRefData['NTGreekLemmaDict'][SRLemma] != GrkLemma:
-                        dPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"    {n=} {ref} {SRLemma=} {GrkLemma=} {state.OETRefData['NTGreekLemmaDict'][SRLemma]=}" )
-                state.OETRefData['NTGreekLemmaDict'][SRLemma] = GrkLemma
-            state.OETRefData['NTStrongsRefs'][extendedStrongs[:-1]].add( vRef ) # We drop the final digit
+            if hasProbability[probabilityCodes[n]]:
+                formCodes = (greekWordCodes[n], roleCodes[n], morphologyCodes[n])
+                SRLemmaCode, OETGlossWordsCode, VLTGlossWordsCode, greekLemmaCode = SRLemmaCodes[n], OETGlossWordsCodes[n], VLTGlossWordsCodes[n], greekLemmaCodes[n]
+                formRowNumbers[formCodes].append( n )
+                lemmaRowNumbers[SRLemmaCode].append( n )
+                formGlossCounts[(SRLemmaCode,formCodes,OETGlossWordsCode,VLTGlossWordsCode)] += 1
+                OETGlossRowNumbers[OETGlossWordsCode].append( n )
+                VLTGlossRowNumbers[VLTGlossWordsCode].append( n )
+                if lastGreekLemmaCodes.setdefault( SRLemmaCode, greekLemmaCode ) != greekLemmaCode:
+                    dPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"    {n=} {ref} SRLemma={SRLemmaColumn.values[SRLemmaCode]!r} GrkLemma={greekLemmaColumn.values[greekLemmaCode]!r} was {greekLemmaColumn.values[lastGreekLemmaCodes[SRLemmaCode]]!r}" )
+                    lastGreekLemmaCodes[SRLemmaCode] = greekLemmaCode # The last one wins
+            strongsVRefs[extendedStrongsCodes[n]].add( ref.split( 'w', 1 )[0] )
         elif processBBB and started:
             break # Must have already finished the desired book(s)
 
+    # Now update the lists and dicts in state (still adding the keys in the order of their first row)
+    SRLemmaValues = SRLemmaColumn.values
+    formMorph3Tuples = { formCodes:(greekWordColumn.values[greekWordCode], roleColumn.values[roleCode], None if morphologyColumn.values[morphologyCode]=='None' else morphologyColumn.values[morphologyCode])
+                            for formCodes in formRowNumbers for greekWordCode,roleCode,morphologyCode in (formCodes,) }
+    for formCodes, rowNumbers in formRowNumbers.items():
+        state.OETRefData['NTFormUsageDict'][formMorph3Tuples[formCodes]].extend( rowNumbers )
+    for SRLemmaCode, rowNumbers in lemmaRowNumbers.items():
+        state.OETRefData['NTLemmaDict'][SRLemmaValues[SRLemmaCode]].extend( rowNumbers )
+
+    OETFormattedGlossWordsStrs = { OETGlossWordsCode:formatNTSpansGlossWords( OETGlossWordsColumn.values[OETGlossWordsCode] ) for OETGlossWordsCode in OETGlossRowNumbers }
+    VLTFormattedGlossWordsStrs = { VLTGlossWordsCode:formatNTSpansGlossWords( VLTGlossWordsColumn.values[VLTGlossWordsCode] ) for VLTGlossWordsCode in VLTGlossRowNumbers }
+    for (SRLemmaCode,formCodes,OETGlossWordsCode,VLTGlossWordsCode), count in formGlossCounts.items():
+        SRLemma, formMorph3Tuple = SRLemmaValues[SRLemmaCode], formMorph3Tuples[formCodes]
+        OETFormattedGlossWords, VLTFormattedGlossWords = OETFormattedGlossWordsStrs[OETGlossWordsCode], VLTFormattedGlossWordsStrs[VLTGlossWordsCode]
+        state.OETRefData['NTLemmaFormsDict'][SRLemma].add( formMorph3Tuple )
+        state.OETRefData['NTLemmaFormsCountDict'][(SRLemma,*formMorph3Tuple)] += count
+        state.OETRefData['NTFormOETGlossesDict'][formMorph3Tuple].add( OETFormattedGlossWords )
+        state.OETRefData['NTFormOETGlossesCountDict'][(*formMorph3Tuple, OETFormattedGlossWords)] += count
+        state.OETRefData['NTFormVLTGlossesDict'][formMorph3Tuple].add( VLTFormattedGlossWords )
+        state.OETRefData['NTLemmaOETGlossesDict'][SRLemma].add( OETFormattedGlossWords )
+        state.OETRefData['NTLemmaOETGlossesCountDict'][(SRLemma, OETFormattedGlossWords)] += count
+        state.OETRefData['NTLemmaVLTGlossesDict'][SRLemma].add( VLTFormattedGlossWords )
+
+    for glossRowNumbers, glossWordsColumn, glossWordDict in ((OETGlossRowNumbers, OETGlossWordsColumn, state.OETRefData['OETNTGlossWordDict']),
+                                                              (VLTGlossRowNumbers, VLTGlossWordsColumn, state.OETRefData['VLTGlossWordDict'])):
+        glossWordRowNumbersLists = defaultdict(list)
+        for glossWordsCode, rowNumbers in glossRowNumbers.items():
+            for someGlossWord in glossWordsColumn.values[glossWordsCode].split( ' ' ):
+                if '˓' not in someGlossWord and '˱' not in someGlossWord and '‹' not in someGlossWord: # We only want the main words
+                    glossWordRowNumbersLists[someGlossWord].append( rowNumbers )
+        for someGlossWord, rowNumbersLists in glossWordRowNumbersLists.items():
+            rowNumbers, wordRowNumbers = _mergeRowNumbers( rowNumbersLists ), glossWordDict[someGlossWord]
+            assert len( set( wordRowNumbers ).union( rowNumbers ) ) == len(wordRowNumbers) + len(rowNumbers), f"{someGlossWord=}" # No row is in there twice
+            wordRowNumbers.extend( rowNumbers )
+
+    for SRLemmaCode, greekLemmaCode in lastGreekLemmaCodes.items():
+        state.OETRefData['NTGreekLemmaDict'][SRLemmaValues[SRLemmaCode]] = greekLemmaColumn.values[greekLemmaCode]
+    for extendedStrongsCode, vRefs in strongsVRefs.items():
+        state.OETRefData['NTStrongsRefs'][extendedStrongsColumn.values[extendedStrongsCode][:-1]].update( vRefs ) # We drop the final digit
+
     return True
 # end of createOETReferencePages.preprocessGreekWordsLemmasGlosses
 
@@ -1364,7 +1529,7 @@ def formatNTContextSpansOETGlossWords( rowNum:int, state:State ) -> str:
     """
     # NT = bos_books_codes_py.is_new_testament_nr( BBB )
 
-    fOriginalWordRef, _fGreekWord, _fSRLemma, _fGrkLemma, _fVLTGlossWords, fOETGlossWords, _fGlossCaps, fProbability, _fExtendedStrongs, _fRoleLetter, _fMorphology, _fTagsStr = state.OETRefData['word_tables'][GreekWordFileName][rowNum].split( '\t' )
+    fOriginalWordRef, _fGreekWord, _fSRLemma, _fGrkLemma, _fVLTGlossWords, fOETGlossWords, _fGlossCaps, fProbability, _fExtendedStrongs, _fRoleLetter, _fMorphology, _fTagsStr = state.OETRefData['word_tables'][GreekWordFileName].getFields( rowNum )
     # print( f"formatNTContextSpansOETGlossWords( {rowNum:,} ) at {fOriginalWordRef}" )
     fOriginalBCV = fOriginalWordRef.split( 'w', 1 )[0]
 
@@ -1374,7 +1539,7 @@ def formatNTContextSpansOETGlossWords( rowNum:int, state:State ) -> str:
     while rowCount < NUM_BEFORE_AND_AFTER:
         fN -= 1
         if fN < 1: break
-        fWordRef, _fGreekWord, _fSRLemma, _fGrkLemma, _fVLTGlossWords, fOETGlossWords, _fGlossCaps, fProbability, _fExtendedStrongs, _fRoleLetter, _fMorphology, _fTagsStr = state.OETRefData['word_tables'][GreekWordFileName][fN].split( '\t' )
+        fWordRef, _fGreekWord, _fSRLemma, _fGrkLemma, _fVLTGlossWords, fOETGlossWords, _fGlossCaps, fProbability, _fExtendedStrongs, _fRoleLetter, _fMorphology, _fTagsStr = state.OETRefData['word_tables'][GreekWordFileName].getFields( fN )
         if not fWordRef.startswith( fOriginalBCV ): break # Stay in this verse
         # print( f"{fWordRef} {fProbability=} {fGlossWords=}" )
         if fProbability == 'None': fProbability = None
@@ -1386,7 +1551,7 @@ def formatNTContextSpansOETGlossWords( rowNum:int, state:State ) -> str:
     while rowCount < NUM_BEFORE_AND_AFTER:
         fN += 1
         if fN >= len(state.OETRefData['word_tables'][GreekWordFileName]): break
-        fWordRef, _fGreekWord, _fSRLemma, _fGrkLemma, _fVLTGlossWords, fOETGlossWords, _fGlossCaps, fProbability, _fExtendedStrongs, _fRoleLetter, _fMorphology, _fTagsStr = state.OETRefData['word_tables'][GreekWordFileName][fN].split( '\t' )
+        fWordRef, _fGreekWord, _fSRLemma, _fGrkLemma, _fVLTGlossWords, fOETGlossWords, _fGlossCaps, fProbability, _fExtendedStrongs, _fRoleLetter, _fMorphology, _fTagsStr = state.OETRefData['word_tables'][GreekWordFileName].getFields( fN )
         if not fWordRef.startswith( fOriginalBCV ): break # Stay in this verse
         # print( f"{fWordRef} {fProbability=} {fGlossWords=}" )
         if fProbability == 'None': fProbability = None
@@ -1518,6 +1683,86 @@ def tidy_Hebrew_morphology( tHM_rowType:str, tHM_morphology:str ) -> str:
 # end of createOETReferencePages.tidy_Hebrew_morphology
 
 
+def decode_Hebrew_morphology( dHM_rowType:str, dHM_morphology:str ) -> tuple[str,str]:
+    """
+    Returns the tidied morphology HTML and its plain text form
+        (or two empty strings for segs and notes, which aren't Hebrew words).
+
+    Used to make the Hebrew MorphologyTable (so it's only run once for each different row type and morphology).
+    """
+    if dHM_rowType=='seg' or 'note' in dHM_rowType: return '', ''
+    dHM_tidyMorphologyFields = tidy_Hebrew_morphology( dHM_rowType, dHM_morphology )
+    return dHM_tidyMorphologyFields, getMorphologyText( dHM_tidyMorphologyFields )
+# end of createOETReferencePages.decode_Hebrew_morphology
+
+def get_Hebrew_morphology_table( state:State ) -> MorphologyTable:
+    """
+    Returns the decodes of each different (row type, morphology) in the Hebrew word table
+        (made the first time that it's asked for, i.e., once per build).
+    """
+    try: return state.OETRefData['OTMorphologyTable']
+    except KeyError:
+        morphologyTable = state.OETRefData['OTMorphologyTable'] = MorphologyTable.fromWordTable( 'Hebrew morphology', decode_Hebrew_morphology,
+                                                state.OETRefData['word_tables'][HebrewWordFileName], ('RowType','Morphology') )
+        return morphologyTable
+# end of createOETReferencePages.get_Hebrew_morphology_table
+
+
+def decode_Greek_morphology( dGM_roleLetter:str, dGM_morphology:str, dGM_glossCaps:str ) -> tuple[str|None,str,str,str,str|None,str]:
+    """
+    Returns a 6-tuple with
+        the role name (or None), the linked role field HTML, the mood/tense/voice/person/case/gender/number fields HTML,
+        the tidied morphology, the tidied role and morphology, and the plain text form of the fields.
+
+    The role letter and morphology can be 'None' (as in the word table).
+
+    Used to make the Greek MorphologyTable (so it's only run once for each different role, morphology, and caps).
+    """
+    if dGM_roleLetter == 'None': dGM_roleLetter = None
+    if dGM_morphology == 'None': dGM_morphology = None
+
+    roleName = None
+    roleField = ''
+    if dGM_roleLetter:
+        roleName = CNTR_ROLE_NAME_DICT[dGM_roleLetter]
+        if roleName=='noun' and 'U' in dGM_glossCaps:
+            roleName = 'proper noun'
+        try: roleNameField = GREEK_ROLE_TYPE_TABLE[roleName]
+        except KeyError: roleNameField = roleName
+        roleField = f' Word role=<b>{roleNameField}</b>'
+
+    tidyMorphology = moodField = tenseField = voiceField = personField = caseField = genderField = numberField = ''
+    if dGM_morphology:
+        tidyMorphology = dGM_morphology[4:] if dGM_morphology.startswith('····') else dGM_morphology
+        tidyRoleMorphology = f'{dGM_roleLetter}-{tidyMorphology}'
+        assert len(dGM_morphology) == 7, f"Got morphology ({len(dGM_morphology)}) = '{dGM_morphology}'"
+        mood,tense,voice,person,case,gender,number = dGM_morphology
+        if mood!='·': moodField = f' mood=<b>{CNTR_MOOD_NAME_DICT[mood]}</b>'
+        if tense!='·': tenseField = f' tense=<b>{CNTR_TENSE_NAME_DICT[tense]}</b>'
+        if voice!='·': voiceField = f' voice=<b>{CNTR_VOICE_NAME_DICT[voice]}</b>'
+        if person!='·': personField = f' person=<b>{CNTR_PERSON_NAME_DICT[person]}</b>'
+        if case!='·': caseField = f' case=<b>{CNTR_CASE_NAME_DICT[case]}</b>'
+        if gender!='·': genderField = f' gender=<b>{CNTR_GENDER_NAME_DICT[gender]}</b>'
+        if number!='·': numberField = f' number=<b>{CNTR_NUMBER_NAME_DICT[number]}</b>' # or № ???
+    else:
+        tidyRoleMorphology = dGM_roleLetter
+    morphologyFields = f'{moodField}{tenseField}{voiceField}{personField}{caseField}{genderField}{numberField}'
+    return roleName, roleField, morphologyFields, tidyMorphology, tidyRoleMorphology, getMorphologyText( f'{roleField}{morphologyFields}' )
+# end of createOETReferencePages.decode_Greek_morphology
+
+def get_Greek_morphology_table( state:State ) -> MorphologyTable:
+    """
+    Returns the decodes of each different (role, morphology, caps) in the Greek word table
+        (made the first time that it's asked for, i.e., once per build).
+    """
+    try: return state.OETRefData['NTMorphologyTable']
+    except KeyError:
+        morphologyTable = state.OETRefData['NTMorphologyTable'] = MorphologyTable.fromWordTable( 'Greek morphology', decode_Greek_morphology,
+                                                state.OETRefData['word_tables'][GreekWordFileName], ('Role','Morphology','GlossCaps') )
+        return morphologyTable
+# end of createOETReferencePages.get_Greek_morphology_table
+
+
 # NOTE: We imported state at the module level so it didn't have to be a parameter
 @cache
 def get_OET_LV_verse_HTML( level:int, BBB:str, C:str, V:str ) -> str:
@@ -1557,18 +1802,99 @@ def get_OET_RV_verse_HTML( level:int, BBB:str, C:str, V:str ) -> str:
 # end of createOETReferencePages.get_OET_RV_verse_HTML
 
 
-def _create_Hebrew_word_page_MP( parameters ):
+@cache
+def get_Hebrew_lemma_line_verse_parts( level:int, BBB:str, C:str, V:str, verseLinked:bool ) -> tuple[str,str,str,str|None,str|None]:
+    """
+    Returns the parts of a Hebrew lemma page line which only depend on the verse
+        (because many of the word rows on the lemma pages are in the same verses):
+            tidyBBBwithNotes, OSISbookCode, OETLink, OET_LV_verse_HTML, OET_RV_verse_HTML
+
+    verseLinked is False if the verse isn't on the site (i.e., when only some books are made in TEST mode).
+    """
+    tidyBBB = getOETTidyBBB( BBB )
+    tidyBBBwithNotes = getOETTidyBBB( BBB, addNotes=True )
+    OSISbookCode = bos_books_codes_py.bos_to_osis_book_code( BBB )
+    OET_LV_verse_HTML = OET_RV_verse_HTML = None
+    if verseLinked:
+        OET_LV_verse_HTML = get_OET_LV_verse_HTML( level, BBB, C, V )
+        OET_RV_verse_HTML = get_OET_RV_verse_HTML( level, BBB, C, V )
+    OETLink = f'''<a title="View OET {tidyBBB} text" href="{'../'*level}OET/byC/{BBB}_C{C}.htm#C{C}V{V}">{tidyBBBwithNotes} {C}:{V}</a>''' \
+                    if verseLinked else f'{tidyBBBwithNotes} {C}:{V}'
+    return tidyBBBwithNotes, OSISbookCode, OETLink, OET_LV_verse_HTML, OET_RV_verse_HTML
+# end of createOETReferencePages.get_Hebrew_lemma_line_verse_parts
+
+
+WORD_PAGES_CHUNK_SIZE = 2_000 # Number of consecutive word table rows for each worker process to make the word pages for at once
+LEMMA_PAGES_CHUNK_SIZE = 100 # Number of consecutive lemmas for each worker process to make the lemma pages for at once
+_wordPagesParameters = None # Set just before forking so that the worker processes inherit it (rather than pickling the huge state)
+def _create_word_pages_chunk_MP( chunkRange:tuple[int,int] ) -> tuple[int,list[bool],dict[str,set]]:
     """
     Multiprocessing version!
 
-    Parameter is a 7-tuple containing the parameters (including the small-State).
+    Makes the word pages for one chunk of the word jobs
+        and returns only the small results that need to be merged back into the parent process.
     """
-    fnPrint( DEBUGGING_THIS_MODULE, f"_create_Hebrew_word_page_MP( {parameters} )" )
-    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  _create_Hebrew_word_page_MP: Loading with {parameters}…" )
-    result = create_Hebrew_word_page( *parameters )
-    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"    Finishing _create_Hebrew_word_page_MP with {parameters} got {result=}." )
-    return result
-# end of ESFMBible._create_Hebrew_word_page_MP
+    createWordPage, wordJobs, usedSetNames, state = _wordPagesParameters
+    startIndex, endIndex = chunkRange
+    fnPrint( DEBUGGING_THIS_MODULE, f"_create_word_pages_chunk_MP( {chunkRange} ) for {createWordPage.__name__}" )
+
+    startForkedWorker()
+    # Only send back what this chunk used (this process might have done another chunk already)
+    for usedSetName in usedSetNames:
+        state.OETRefData[usedSetName] = set()
+    madeFlags = [createWordPage( *wordJob, state ) for wordJob in wordJobs[startIndex:endIndex]]
+    return startIndex, madeFlags, {usedSetName:state.OETRefData[usedSetName] for usedSetName in usedSetNames}
+# end of createOETReferencePages._create_word_pages_chunk_MP
+
+
+def _create_word_pages( pagesName:str, createWordPage, wordJobs:list[tuple], usedSetNames:tuple[str,...], state:State,
+                        chunkSize:int|None=None, progressInterval:int=50_000, parallelFlag:bool|None=None ) -> list[bool]:
+    """
+    Call createWordPage( *wordJob, state ) for each word job
+        either one after the other,
+        or by forking processes (which inherit the word tables and indexes) to make contiguous chunks of the word pages.
+
+    Also used for the lemma pages (with their own chunkSize and parallelFlag).
+
+    createWordPage must only change the state.OETRefData sets named in usedSetNames
+        (which are merged back into our state).
+
+    Returns a list of the createWordPage results (in the same order as wordJobs).
+    """
+    global _wordPagesParameters
+    fnPrint( DEBUGGING_THIS_MODULE, f"_create_word_pages( {pagesName}, {createWordPage.__name__}, {len(wordJobs):,} jobs, {usedSetNames}, {chunkSize}, {progressInterval}, {parallelFlag}, … )" )
+    if chunkSize is None: chunkSize = WORD_PAGES_CHUNK_SIZE
+    if parallelFlag is None: parallelFlag = state.PARALLEL_WORD_PAGES_FLAG
+
+    if not parallelFlag or BibleOrgSysGlobals.maxProcesses < 2 \
+    or len(wordJobs) <= chunkSize or BibleOrgSysGlobals.alreadyMultiprocessing:
+        madeFlags = []
+        for jj, wordJob in enumerate( wordJobs ):
+            if jj and jj % progressInterval == 0:
+                vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      {sum(madeFlags):,} {pagesName} pages made out of {jj:,} out of {len(wordJobs):,}…" )
+            madeFlags.append( createWordPage( *wordJob, state ) )
+        return madeFlags
+
+    chunkRanges = [(startIndex, min( startIndex+chunkSize, len(wordJobs) )) for startIndex in range( 0, len(wordJobs), chunkSize )]
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Creating {len(wordJobs):,} {pagesName} pages in {len(chunkRanges):,} chunks using {BibleOrgSysGlobals.maxProcesses} processes…" )
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, "    NOTE: Outputs (including error and warning messages) from various pages may be interspersed." )
+    madeFlags:list[bool|None] = [None] * len(wordJobs)
+    _wordPagesParameters = (createWordPage, wordJobs, usedSetNames, state)
+    BibleOrgSysGlobals.alreadyMultiprocessing = True
+    try:
+        with multiprocessing.get_context( 'fork' ).Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
+            for numChunksDone, (startIndex, chunkMadeFlags, usedSets) in enumerate( pool.imap_unordered( _create_word_pages_chunk_MP, chunkRanges ), start=1 ):
+                madeFlags[startIndex:startIndex+len(chunkMadeFlags)] = chunkMadeFlags
+                for usedSetName, usedSet in usedSets.items():
+                    state.OETRefData[usedSetName].update( usedSet )
+                if numChunksDone % 25 == 0:
+                    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      Finished {numChunksDone:,}/{len(chunkRanges):,} chunks of {pagesName} pages…" )
+    finally:
+        BibleOrgSysGlobals.alreadyMultiprocessing = False
+        _wordPagesParameters = None
+    assert None not in madeFlags
+    return madeFlags
+# end of createOETReferencePages._create_word_pages
 
 
 used_word_filenames = []
@@ -1585,107 +1911,28 @@ def create_Hebrew_word_pages( level:int, outputFolderPath:Path, state:State ) ->
     numWordPagesMade = 0
     wordLinksForIndex:list[str] = [] # Used below to make an index page
     state.OETRefData['usedHebLemmasSet'], state.OETRefData['usedHebStrongsSet'] = set(), set() # Used in next functions to make lemma and Strongs pages
-    if 0 and BibleOrgSysGlobals.maxProcesses > 1 \
-    and not BibleOrgSysGlobals.alreadyMultiprocessing: # Process all the word pages with different threads
-        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"Creating {len(state.OETRefData['word_tables'][HebrewWordFileName])-1:,} Hebrew word pages using {BibleOrgSysGlobals.maxProcesses} processes…" )
-        vPrint( 'Normal', DEBUGGING_THIS_MODULE, "  NOTE: Outputs (including error and warning messages) from various words may be interspersed." )
-        # parameters = [(level, hh, hebrewWord, columns_string, outputFolderPath, output_filename, state ) \
-        #                                     for hh,columns_string in enumerate( state.OETRefData['word_tables'][HebrewWordFileName][1:], start=1 ) if columns_string]
-
-        # print( f"\n{type(state.__dict__)=} {len(state.__dict__)=} {state.__dict__.keys()=}")
-        # print( f"\n{type(vars(state))=} {len(vars(state))=} {vars(state).keys()=}")
-        # print( f"\n{type(dir(state))=} {len(dir(state))=} {dir(state)=}")
-
-        # import pickle; size_estimate = len( pickle.dumps(state) ) # TypeError: cannot pickle 'dict_keys' object
-
-        state_keys = [k for k in dir(state) if not k.startswith('__')]
-        # state_keys = filter(lambda a: not a.startswith('__'), dir(state))
-        # print( f"\n{type(state_keys)=} {len(state_keys)=} {state_keys=}")
-
-        import inspect
-        wantedStateAttributes = [a for a in inspect.getmembers(state, lambda a:not(inspect.isroutine(a))) if not(a[0].startswith('__') and a[0].endswith('__'))]
-        # print( f"\n{type(wantedStateAttributes)=} {len(wantedStateAttributes)=}" ) # {wantedAttributes=}")
-        # print( f"{len(str(wantedStateAttributes))//1_000_000:,} MB" )
-        # print( f"\nState class is about ({len(wantedStateAttributes)}) {len(str(wantedStateAttributes))//1_000_000:,} MB" )
-
-        small_state = copy.copy( state ) # Shallow copy
-        small_state.OETRefData = copy.copy( state.OETRefData )
-        wantedSmallStateAttributes = [a for a in inspect.getmembers(small_state, lambda a:not(inspect.isroutine(a))) if not(a[0].startswith('__') and a[0].endswith('__'))]
-        # print( f"Small state copied class started at about ({len(wantedSmallStateAttributes)}) {len(str(wantedSmallStateAttributes))//1_000_000:,} MB" )
-
-        small_state.BBBLinks = small_state.BBBsToProcess = small_state.BibleLanguages = small_state.BibleLocations = None
-        small_state.BibleNames = small_state.BibleVersionDecorations = small_state.BibleVersions = small_state.wholeBibleVersions = None
-        small_state.allBBBs = small_state.allPossibleBibleVersions = small_state.auxilliaryVersions = small_state.booksToLoad = None
-        small_state.detailsHtml = small_state.numAllowedSelectedVerses = small_state.preloadedBibles = small_state.sectionsLists = None
-        small_state.selectedVersesOnlyVersions = small_state.versionLocation = small_state.versionsWithoutTheirOwnPages = None
-        # print( f"({len(small_state.OETRefData.keys())=:,}) {small_state.OETRefData.keys()=}")
-        for tableName in small_state.OETRefData:
-            small_state.OETRefData[tableName] = None
-        # small_state.OETRefData['OTFormUsageDict'] = None
-        # small_state.OETRefData['OTLemmaRowNumbersDict'] = None
-        # small_state.OETRefData['OTWordRowNumbersDict'] = None
-        # small_state.OETRefData['OTFormOETGlossesDict'] = None
-        # small_state.OETRefData['OTLemmaOETGlossesDict'] = None
-        # small_state.OETRefData['OTLemmasForRootDict'] = None
-        # small_state.OETRefData['OETOTGlossWordDict'] = None
-        # small_state.OETRefData['OTLemmaGlossDict'] = None
-        wantedSmallStateAttributes = [a for a in inspect.getmembers(small_state, lambda a:not(inspect.isroutine(a))) if not(a[0].startswith('__') and a[0].endswith('__'))]
-        # for a,b in wantedSmallStateAttributes:
-        #     print( f"  {a} is {len(str(b)):,}")
-        # print( f"Now small state copied class is about ({len(wantedSmallStateAttributes)}) {len(str(wantedSmallStateAttributes))//1_000:,} KB" )
-        wantedStateAttributes = [a for a in inspect.getmembers(state, lambda a:not(inspect.isroutine(a))) if not(a[0].startswith('__') and a[0].endswith('__'))]
-        # print( f" and original state class is still about ({len(wantedStateAttributes)}) {len(str(wantedStateAttributes))//1_000_000:,} MB" )
-        # for a,b in wantedStateAttributes:
-        #     print( f"  {a} is {len(str(b)):,}")
-        # import pickle; size_estimate = len( pickle.dumps(small_state) ) # TypeError: cannot pickle 'dict_keys' object
-
-        parameters = []
-        for hh, columns_string in enumerate( state.OETRefData['word_tables'][HebrewWordFileName][1:], start=1 ):
-            if not columns_string: continue # a blank line (esp. at end)
-            # if hh % 50_000 == 0:
-            #     vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      {numWordPagesMade:,} made out of {hh:,} out of {len(state.OETRefData['word_tables'][HebrewWordFileName])-1:,}…" )
-            output_filename = getHebrewWordpageFilename( hh, state )
-            if DEBUGGING_THIS_MODULE or BibleOrgSysGlobals.debugFlag: # NOTE: This makes the function MUCH slower
-                # Check that we're not creating any duplicate filenames (that will then be overwritten)
-                assert output_filename not in used_word_filenames, f"Hebrew {hh} {output_filename}"
-                used_word_filenames.append( output_filename )
-            ref, _rowType, _morphemeRowList, _lemmaRowList, _strongs, _morphology, word, noCantillations, _morphemeGlosses, _contextualMorphemeGlosses, _wordGloss, _contextualWordGloss, _glossCapitalisation, _glossPunctuation, _glossOrder, _glossInsert, _role, _nesting, _tags = columns_string.split( '\t' )
-            BBB, _CVW = ref.split( '_', 1 )
-            if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG and BBB not in state.TEST_BOOK_LIST:
-                continue # In some test modes, we only make the relevant word pages
-            hebrewWord = (noCantillations.replace( ',', '' ) # Remove morpheme breaks
-                            if noCantillations else word ) # Segs and notes have nothing in the noCantillations field
-            parameters.append( (level, hh, hebrewWord, columns_string, outputFolderPath, output_filename, small_state) )
-        BibleOrgSysGlobals.alreadyMultiprocessing = True
-        with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-            results = pool.map( _create_Hebrew_word_page_MP, parameters ) # have the pool do our loads
-            assert len(results) == len(parameters)
-        BibleOrgSysGlobals.alreadyMultiprocessing = False
-        for rr, result in enumerate( results ):
-            if result:
-                if rowType!='seg' and 'note' not in rowType:
-                    wordLinksForIndex.append( f'<a href="{output_filename}">{hebrewWord}</a>')
-                numWordPagesMade += 1
-    else: # no multi-processing
-        for hh, columns_string in enumerate( state.OETRefData['word_tables'][HebrewWordFileName][1:], start=1 ):
-            if not columns_string: continue # a blank line (esp. at end)
-            if numWordPagesMade>0 and hh % 50_000 == 0:
-                vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      {numWordPagesMade+1:,} made out of {f'{hh:,} out of ' if hh!=numWordPagesMade+1 else ''}{len(state.OETRefData['word_tables'][HebrewWordFileName])-1:,}…" )
-            output_filename = getHebrewWordpageFilename( hh, state )
-            if DEBUGGING_THIS_MODULE or BibleOrgSysGlobals.debugFlag: # NOTE: This makes the function MUCH slower
-                # Check that we're not creating any duplicate filenames (that will then be overwritten)
-                assert output_filename not in used_word_filenames, f"Hebrew {hh} {output_filename}"
-                used_word_filenames.append( output_filename )
-            ref, rowType, _morphemeRowList, _lemmaRowList, _strongs, _morphology, word, noCantillations, _morphemeGlosses, _contextualMorphemeGlosses, _wordGloss, _contextualWordGloss, _glossCapitalisation, _glossPunctuation, _glossOrder, _glossInsert, _role, _nesting, _tags = columns_string.split( '\t' )
-            BBB, _CVW = ref.split( '_', 1 )
-            if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG and BBB not in state.TEST_BOOK_LIST:
-                continue # In some test modes, we only make the relevant word pages
-            hebrewWord = (noCantillations.replace( ',', '' ) # Remove morpheme breaks
-                            if noCantillations else word ) # Segs and notes have nothing in the noCantillations field
-            if create_Hebrew_word_page( level, hh, hebrewWord, columns_string, outputFolderPath, output_filename, state ):
-                if rowType!='seg' and 'note' not in rowType:
-                    wordLinksForIndex.append( f'<a href="{output_filename}">{hebrewWord}</a>')
-                numWordPagesMade += 1
+    wordJobs, wordLinks = [], []
+    for hh, wordFields in enumerate( state.OETRefData['word_tables'][HebrewWordFileName].iterFields(), start=1 ):
+        if not wordFields[0]: continue # a blank line (esp. at end)
+        output_filename = getHebrewWordpageFilename( hh, state )
+        if DEBUGGING_THIS_MODULE or BibleOrgSysGlobals.debugFlag: # NOTE: This makes the function MUCH slower
+            # Check that we're not creating any duplicate filenames (that will then be overwritten)
+            assert output_filename not in used_word_filenames, f"Hebrew {hh} {output_filename}"
+            used_word_filenames.append( output_filename )
+        ref, rowType, _morphemeRowList, _lemmaRowList, _strongs, _morphology, word, noCantillations, _morphemeGlosses, _contextualMorphemeGlosses, _wordGloss, _contextualWordGloss, _glossCapitalisation, _glossPunctuation, _glossOrder, _glossInsert, _role, _nesting, _tags = wordFields
+        BBB, _CVW = ref.split( '_', 1 )
+        if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG and BBB not in state.TEST_BOOK_LIST:
+            continue # In some test modes, we only make the relevant word pages
+        hebrewWord = (noCantillations.replace( ',', '' ) # Remove morpheme breaks
+                        if noCantillations else word ) # Segs and notes have nothing in the noCantillations field
+        wordJobs.append( (level, hh, hebrewWord, wordFields, outputFolderPath, output_filename) )
+        wordLinks.append( f'<a href="{output_filename}">{hebrewWord}</a>' if rowType!='seg' and 'note' not in rowType else None )
+    get_Hebrew_morphology_table( state ) # Made before forking so that the workers all share it
+    for jj, made in enumerate( _create_word_pages( 'Hebrew word', create_Hebrew_word_page, wordJobs, ('usedHebLemmasSet','usedHebStrongsSet'), state ) ):
+        if made:
+            if wordLinks[jj] is not None:
+                wordLinksForIndex.append( wordLinks[jj] )
+            numWordPagesMade += 1
 
     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f'''    Created {numWordPagesMade:,}{f"/{len(state.OETRefData['word_tables'][HebrewWordFileName])-1:,}" if numWordPagesMade < len(state.OETRefData['word_tables'][HebrewWordFileName])-1 else ''} Hebrew word pages (using {len(state.OETRefData['usedHebLemmasSet']):,} Hebrew lemmas).''' )
 
@@ -1747,17 +1994,17 @@ GLOSS_TYPE_STRING_DICT = {'cWG':'contextual word gloss',
                     'wG':'word gloss',
                     'cMGs':'contextual morpheme glosses',
                     'mGs':'morpheme glosses'}
-def create_Hebrew_word_page( level:int, hh:int, hebrewWord:str, columns_string:str, outputFolderPath:Path, word_output_filename:Path, state:State ) -> bool:
+def create_Hebrew_word_page( level:int, hh:int, hebrewWord:str, wordFields:tuple[str,...], outputFolderPath:Path, word_output_filename:Path, state:State ) -> bool:
     """
     """
     fnPrint( DEBUGGING_THIS_MODULE, f"create_Hebrew_word_page( {level}, {hh}, {hebrewWord}, ..., {word_output_filename} ... )" )
-    dPrint( 'Normal' if BibleOrgSysGlobals.alreadyMultiprocessing else 'Verbose', DEBUGGING_THIS_MODULE, f"Word {hh}: {columns_string}" )
+    dPrint( 'Normal' if BibleOrgSysGlobals.alreadyMultiprocessing else 'Verbose', DEBUGGING_THIS_MODULE, f"Word {hh}: {wordFields}" )
     assert hebrewWord
     # print( f"create_Hebrew_word_page( ..., {hh}, {hebrewWord}, ..., {word_output_filename} ... )" )
 
     usedRoleLetters, usedMorphologies = set(), set()
     # dPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Got '{columns_string}' for '{word_output_filename}'" )
-    ref, rowType, morphemeRowList, lemmaRowList, strongs, morphology, word, noCantillations, morphemeGlosses, contextualMorphemeGlosses, wordGloss, contextualWordGloss, glossCapitalisation, glossPunctuation, glossOrder, glossInsert, role, nesting, tagsStr = columns_string.split( '\t' )
+    ref, rowType, morphemeRowList, lemmaRowList, strongs, morphology, word, noCantillations, morphemeGlosses, contextualMorphemeGlosses, wordGloss, contextualWordGloss, glossCapitalisation, glossPunctuation, glossOrder, glossInsert, role, nesting, tagsStr = wordFields
 
     BBB, CVW = ref.split( '_', 1 )
     assert not state.TEST_MODE_FLAG or state.ALL_TEST_REFERENCE_PAGES_FLAG or BBB in state.TEST_BOOK_LIST
@@ -1793,7 +2040,7 @@ def create_Hebrew_word_page( level:int, hh:int, hebrewWord:str, columns_string:s
     if rowType!='seg' and 'note' not in rowType:
         # it's a proper Hebrew (or Aramaic) word
         assert morphemeRowList.count(',') == strongs.count(',') == morphology.count(',') == word.count(',') == noCantillations.count(',')
-        tidyMorphologyFields = tidy_Hebrew_morphology( rowType, morphology )
+        tidyMorphologyFields = get_Hebrew_morphology_table( state ).getDecode( rowType, morphology )[0]
 
         if gloss:
             translationFields = f'''{GLOSS_TYPE_STRING_DICT[chosenGlossType]}=‘<b>{gloss[0].upper() if glossCapitalisation=='S' else gloss[0]}{gloss[1:]}</b>’'''
@@ -1855,7 +2102,7 @@ def create_Hebrew_word_page( level:int, hh:int, hebrewWord:str, columns_string:s
             elif tagPrefix == 'R':
                 semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Refers to <a title="Go to referred word" href="{tag}.htm#Top">Word #{tag}</a>'''
             else:
-                logging.critical( f"Unknown '{tagPrefix}' word tag in {n}: {columns_string}")
+                logging.critical( f"Unknown '{tagPrefix}' word tag in {n}: {wordFields}")
                 unknownTag
     lemmaLinksList = []
     for lemmaRowNumberStr in lemmaRowList.split( ',' ):
@@ -1882,7 +2129,7 @@ def create_Hebrew_word_page( level:int, hh:int, hebrewWord:str, columns_string:s
     if hh > 1:
         if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG:
             for nN in range( hh-1, 0, -1 ):
-                nWordRef = state.OETRefData['word_tables'][HebrewWordFileName][nN].split( '\t', 1 )[0]
+                nWordRef = state.OETRefData['word_tables'][HebrewWordFileName].getField( nN, 'Ref' )
                 nBBB = nWordRef.split( '_', 1 )[0]
                 if nBBB in state.TEST_BOOK_LIST:
                     prevN = nN
@@ -1891,7 +2138,7 @@ def create_Hebrew_word_page( level:int, hh:int, hebrewWord:str, columns_string:s
     if hh<len(state.OETRefData['word_tables'][HebrewWordFileName])-1:
         if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG:
             for nN in range( hh+1, len(state.OETRefData['word_tables'][HebrewWordFileName]) ):
-                nWordRef = state.OETRefData['word_tables'][HebrewWordFileName][nN].split( '\t', 1 )[0]
+                nWordRef = state.OETRefData['word_tables'][HebrewWordFileName].getField( nN, 'Ref' )
                 nBBB = nWordRef.split( '_', 1 )[0]
                 if nBBB in state.TEST_BOOK_LIST:
                     nextN = nN
@@ -1964,7 +2211,7 @@ This is all part of the commitment of the <em>Open English Translation</em> team
         for oN in thisWordNumberList:
             # if oN==hh: continue # don't duplicate the word we're making the page for
             # print( f"HERE: ({len(state.OETRefData['word_tables'][wordFileName][oN].split( TAB ))}) {state.OETRefData['word_tables'][wordFileName][oN]}")
-            oWordRef, oRowType, oMorphemeRowList, oLemmaRowList, oStrongs, oMorphology, oWord, oNoCantillations, oMorphemeGlosses, oContextualMorphemeGlosses, oWordGloss, oContextualWordGloss, oGlossCapitalisation, oGlossPunctuation, oGlossOrder, oGlossInsert, oRole, oNesting, oTags = state.OETRefData['word_tables'][HebrewWordFileName][oN].split( '\t' )
+            oWordRef, oRowType, oMorphemeRowList, oLemmaRowList, oStrongs, oMorphology, oWord, oNoCantillations, oMorphemeGlosses, oContextualMorphemeGlosses, oWordGloss, oContextualWordGloss, oGlossCapitalisation, oGlossPunctuation, oGlossOrder, oGlossInsert, oRole, oNesting, oTags = state.OETRefData['word_tables'][HebrewWordFileName].getFields( oN )
             oWordGloss = oWordGloss.replace( '=', '_' )
             # oHebrewWord = (oNoCantillations.replace( ',', '' ) # Remove morpheme breaks
             #                 if oNoCantillations else oWord ) # Segs and notes have nothing in the noCantillations field
@@ -2041,7 +2288,7 @@ f''' {oTranslation} <a title="Go to Open Scriptures Hebrew verse page" href=
                             dPrint( 'Info', DEBUGGING_THIS_MODULE, f"preprocessHebrewWordsLemmasGlosses has EXCESSIVE {len(nList):,} entries for {mainGlossWord=} from {similarWord=}")
                     for thisN in nList:
                         # if thisN == hh: continue # That's the current word row
-                        eWordRef, eRowType, eMorphemeRowList, eLemmaRowList, eStrongs, eMorphology, eWord, eNoCantillations, eMorphemeGlosses, eContextualMorphemeGlosses, eWordGloss, eContextualWordGloss, eGlossCapitalisation, eGlossPunctuation, eGlossOrder, eGlossInsert, eRole, eNesting, eTags = state.OETRefData['word_tables'][HebrewWordFileName][thisN].split( '\t' )
+                        eWordRef, eRowType, eMorphemeRowList, eLemmaRowList, eStrongs, eMorphology, eWord, eNoCantillations, eMorphemeGlosses, eContextualMorphemeGlosses, eWordGloss, eContextualWordGloss, eGlossCapitalisation, eGlossPunctuation, eGlossOrder, eGlossInsert, eRole, eNesting, eTags = state.OETRefData['word_tables'][HebrewWordFileName].getFields( thisN )
                         eHebrewWord = (eNoCantillations.replace( ',', '' ) # Remove morpheme breaks
                                         if eNoCantillations else eWord ) # Segs and notes have nothing in the noCantillations field
                         # eWordGloss = eWordGloss.replace( '=', '_' )
@@ -2141,7 +2388,7 @@ f''' <a title="Go to Open Scriptures Hebrew verse page" href="https://hb.OpenS
     assert not filepath.is_file() # Check that we're not overwriting anything
     with open( filepath, 'wt', encoding='utf-8' ) as html_output_file:
         html_output_file.write( wordsHtml )
-    vPrint( 'Normal' if BibleOrgSysGlobals.alreadyMultiprocessing else 'Verbose', DEBUGGING_THIS_MODULE, f"      Wrote {len(wordsHtml):,} characters to {word_output_filename}" )
+    vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"      Wrote {len(wordsHtml):,} characters to {word_output_filename}" )
     return True
 # end of createOETReferencePages.create_Hebrew_word_page
 
@@ -2167,7 +2414,6 @@ def create_Hebrew_lemma_pages( level:int, outputFolderPath:Path, state:State ) -
     """
     These end up in OBD/ref/HebLem/abc.htm
 
-    TODO: Why does this take so long to run???
     TODO: Add related lemma info (not just prefixed ones, but adding synonyms, etc.)
     """
     fnPrint( DEBUGGING_THIS_MODULE, f"create_Hebrew_lemma_pages( {outputFolderPath}, {state.BibleVersions} )" )
@@ -2182,369 +2428,33 @@ def create_Hebrew_lemma_pages( level:int, outputFolderPath:Path, state:State ) -
     # print( f"{state.OETRefData['OTTransLemmaList'][0]=} {state.OETRefData['OTTransLemmaList'][1]=} {state.OETRefData['OTTransLemmaList'][2]=}")
 
     # Now make a page for each Hebrew lemma
+    startTime = time()
     lemmaLinks:list[str] = [] # Used below to make an index page
     lemmaList = list( state.OETRefData['OTLemmaGlossDict'] )
+    OTLemmaIndex = LemmaIndex( lemmaList, state.OETRefData['OTLemmaOETGlossesDict'], KNOWN_GREEK_PREFIXES, state.OETRefData['word_tables'][HebrewWordFileName] )
     # lemmaListWithGlosses = list( state.OETRefData['OTLemmaGlossDict'].items() )
     # assert len(lemmaListWithGlosses) == len(lemmaList)
     # BEWARE: Some of these lists might be 1 out from others
+    lemmaJobs, usedFilenames = [], set()
     for lemmaIndex,hebLemma  in enumerate( lemmaList ):
-        # if hebLemma == 'בָּרָא':
-        #     print( f"create_Hebrew_lemma_pages: {lemmaIndex} {hebLemma=}")
-        # if hebLemma == 'בָּרָד':
-        #     print( f"create_Hebrew_lemma_pages: {lemmaIndex} {hebLemma=}")
-        #     assert False, "We want to stop here"
-        if (lemmaIndex+1) % 2_000 == 0:
-            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      {len(lemmaLinks)+1:,} made out of {f'{lemmaIndex+1:,} out of ' if lemmaIndex!=len(lemmaLinks) else ''}{len(lemmaList):,}…" )
         transliteratedLemma = transliterate_Hebrew( hebLemma )
-        if transliteratedLemma == 'pitgām': # One is at ll=5803 hebLemma='פִּתְגָם' ll=5804 hebLemma='פִּתְגָּם'
-            print( f"      Found pitgām at {lemmaIndex=} {hebLemma=} {transliteratedLemma=} wordRows={state.OETRefData['OTWordRowNumbersDict'][lemmaIndex]}" )
         if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG and hebLemma not in state.OETRefData['usedHebLemmasSet']:
             continue # Don't make this page
-        vowellessLemma = removeHebrewVowelPointing( hebLemma )
-        transliteratedVowellessLemma = transliterate_Hebrew( vowellessLemma )
-
-        hebLemmaWordRowsList = state.OETRefData['OTWordRowNumbersDict'][lemmaIndex+1]
-        # print( f"\n{lemmaIndex=} {len(lemmaList)=} {hebLemma=} {transliteratedLemma=} {state.OETRefData['OTWordRowNumbersDict'][lemmaIndex+1]=}\n{lemmaList[lemmaIndex]=}")
-        # if hebLemma == 'בָּרָא': print( f"\ncreate_Hebrew_lemma_pages: lemma {lemmaIndex}: {hebLemma=} {vowellessLemma=} {transliteratedLemma=} {transliteratedVowellessLemma=} ({len(hebLemmaWordRowsList)}) {hebLemmaWordRowsList=}" ); assert False, "We want to stop here"
-        # lemmaFormsList = sorted( state.OETRefData['OTLemmaFormsDict'][hebLemma] )
-        # lemmaOETGlossesList = state.OETRefData['OTLemmaGlossDict'][hebLemma].split( ';' )
-
-        # def getFirstHebrewWordNumber(grk:str,morph:str):
-        #     return state.OETRefData['OTFormUsageDict'][(grk,morph)][0]
-
-        usedMorphologies = set()
         ll_output_filename = f"{'pitggām' if hebLemma=='פִּתְגָּם' else transliteratedLemma}.htm" # Hack to keep transliterations unique
-
-        prevLemmaIndex = nextLemmaIndex = None
-        if lemmaIndex > 0:
-            if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG:
-                for LL in range( lemmaIndex-1, -1, -1 ): # Use -1 for stop, so zero will be included
-                    if lemmaList[LL] in state.OETRefData['usedHebLemmasSet']:
-                        prevLemmaIndex = LL
-                        break
-            else: prevLemmaIndex = lemmaIndex - 1
-        if lemmaIndex<len(lemmaList)-1:
-            if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG:
-                for LL in range( lemmaIndex+1, len(lemmaList) ):
-                    if lemmaList[LL] in state.OETRefData['usedHebLemmasSet']:
-                        nextLemmaIndex = LL
-                        break
-            else: nextLemmaIndex = lemmaIndex + 1
-        prevLink = f'<b><a title="Previous lemma" href="{transliterate_Hebrew(lemmaList[prevLemmaIndex])}.htm#Top">←</a></b> ' if prevLemmaIndex is not None else ''
-        nextLink = f' <b><a title="Next lemma" href="{transliterate_Hebrew(lemmaList[nextLemmaIndex])}.htm#Top">→</a></b>' if nextLemmaIndex else ''
-        lemmasHtml = f'''<h1 id="Top">Hebrew root <small>(lemma)</small> ‘{hebLemma}’ ({transliteratedLemma})</h1>
-<p class="pgNav">{prevLink}<b>{hebLemma}</b> <a title="Go to Hebrew word index" href="index.htm">⌂</a>{nextLink}</p>
-<p class="btnBar"><button type="button" id="wordsButton" title="Hide/Show word lines" onclick="hide_show_words()">Hide words</button> <button type="button" id="versesButton" title="Hide/Show verse lines" onclick="hide_show_verses()">Hide verses</button> <button type="button" id="coloursButton" title="Hide/Show verse colours" onclick="hide_show_colours()">Hide verse colours</button></p>'''
-# <p class="summary">This root form (lemma) ‘{hebLemma}’ is used in {'only one form' if len(lemmaFormsList)==1 else f'{len(lemmaFormsList):,} different forms'} in the Hebrew originals: {', '.join([f'<a title="View Hebrew word form" href="../HebWrd/{getFirstHebrewWordNumber(heb,morph)}.htm#Top">{heb}</a> <small>({morph[4:] if morph.startswith("....") else morph})</small>' for heb,morph in lemmaFormsList])}.</p>
-# <p class="summary">It is glossed in {'only one way' if len(lemmaOETGlossesList)==1 else f'{len(lemmaOETGlossesList):,} different ways'}: ‘<b>{"</b>’, ‘<b>".join(lemmaOETGlossesList)}</b>’.</p>
-
-        def makeHebrewLemmaHTML( thisLemmaStr:str, thisLemmaRowsList ) -> str:
-            """
-            The guts of making the lemma page
-                put into a function so that we can also re-use it for related words
-
-            Side-effects: updates usedRoleLetters and usedMorphologies
-            """
-            # for oN in thisLemmaRowsList:
-            #     _oref, orowType, oMorphemeRowList, olemmaRowList, ostrongs, ocantillationHierarchy, omorphology, oword, _oNoCantillations, oMorphemeGlosses, oContextualMorphemeGlosses, oWordGloss, oContextualWordGloss, oglossCapitalisation, oglossPunctuation, oglossOrder, oglossInsert, oRole, oNesting, oTags = state.OETRefData['word_tables'][wordFileName][oN].split( '\t' )
-            #     # usedRoleLetters.add( oRoleLetter )
-            # # oRoleLetter remains set to the last value added to the set (which is the only value if len(oRoleSet)==1)
-
-            if len(thisLemmaRowsList) > 100: # too many to list
-                maxWordsToShow = 50
-                lemmaHTML = f"<h2>Showing the first {maxWordsToShow} out of {len(thisLemmaRowsList)-1:,} uses of Hebrew root <small>(lemma)</small> ‘{thisLemmaStr}’ ({transliterate_Hebrew(thisLemmaStr)}) in the Hebrew originals</h2>"
-            else: # we can list all uses of the word
-                maxWordsToShow = 100
-                lemmaHTML = f"<h2>Have {len(thisLemmaRowsList):,} {'use' if len(thisLemmaRowsList)==1 else 'uses'} of Hebrew root <small>(lemma)</small> ‘{thisLemmaStr}’ ({transliterate_Hebrew(thisLemmaStr)}) in the Hebrew originals</h2>"
-            for displayCounter,oN in enumerate( thisLemmaRowsList, start=1 ):
-                oWordRef, oRowType, oMorphemeRowList, oLemmaRowList, oStrongs, oMorphology, oWord, oNoCantillations, oMorphemeGlosses, oContextualMorphemeGlosses, oWordGloss, oContextualWordGloss, oGlossCapitalisation, oGlossPunctuation, oGlossOrder, oGlossInsert, oRole, oNesting, oTags = state.OETRefData['word_tables'][HebrewWordFileName][oN].split( '\t' )
-                # print( f"    {oWordRef=} {oOSHBid=} {orowType=} {len(thisLemmaRowsList)=}" )
-                oHebrewWord = oNoCantillations
-                oWordGloss = oWordGloss.replace( '=', '_' )
-                oGloss = tidy_Hebrew_lemma_gloss( oContextualWordGloss if oContextualWordGloss else oWordGloss if oWordGloss else oContextualMorphemeGlosses if oContextualMorphemeGlosses else oMorphemeGlosses )
-                chosenGlossType = 'cWG' if oContextualWordGloss else 'wG' if oWordGloss else 'cMGs' if oContextualMorphemeGlosses else 'mGs'
-                # oFormattedContextGlossWords = oGloss # formatNTContextSpansOETGlossWords( oN, state )
-                translation = f'''{GLOSS_TYPE_STRING_DICT[chosenGlossType]}=‘<b>{oGloss}</b>’''' if oGloss else '<small>(no English gloss here)</small>'
-                for extraGlossType,extraGlossString in (('cWG',oContextualWordGloss),('wG',oWordGloss),('cMGs',oContextualMorphemeGlosses),('mGs',oMorphemeGlosses)):
-                    if extraGlossType != chosenGlossType and extraGlossString:
-                        extraGlossTypeString = 'possible glosses' if extraGlossType=='wG' and '/' in extraGlossString \
-                                                                else GLOSS_TYPE_STRING_DICT[extraGlossType]
-                        extraGlossString = tidy_Hebrew_lemma_gloss( extraGlossString )
-                        translation = f'''{translation} {extraGlossTypeString}=‘<b>{extraGlossString}</b>’'''
-                translation = translation.replace(',',', ').replace('</','PRoTecT').replace('/', ' / ').replace('PRoTecT', '</') # looks much nicer
-                oBBB, oCVW = oWordRef.split( '_', 1 )
-                oC, oVW = oCVW.split( ':', 1 )
-                oV, oW = oVW.split( 'w', 1 ) if 'w' in oVW else (oVW, '')
-                oOSISbookCode = bos_books_codes_py.bos_to_osis_book_code( oBBB )
-                oTidyBBB = getOETTidyBBB( oBBB )
-                oTidyBBBwithNotes = getOETTidyBBB( oBBB, addNotes=True )
-                oOSISbookCode = bos_books_codes_py.bos_to_osis_book_code( oBBB )
-                oTidyMorphology = oMorphology[4:] if oMorphology.startswith('····') else oMorphology
-                if oTidyMorphology != '···': usedMorphologies.add( oTidyMorphology )
-                oOET_LV_verse_HTML = oOET_RV_verse_HTML = None
-                if not state.TEST_MODE_FLAG or oBBB in state.preloadedBibles['OET-RV']:
-                    oOET_LV_verse_HTML = get_OET_LV_verse_HTML( level, oBBB, oC, oV )
-                    oOET_RV_verse_HTML = get_OET_RV_verse_HTML( level, oBBB, oC, oV )
-                # print( f"   {oBBB} {oC}:{oV} {oOET_RV_verse_HTML=}")
-                oOETLink = f'''<a title="View OET {oTidyBBB} text" href="{'../'*level}OET/byC/{oBBB}_C{oC}.htm#C{oC}V{oV}">{oTidyBBBwithNotes} {oC}:{oV}</a>''' \
-                                if not state.TEST_MODE_FLAG or oBBB in state.preloadedBibles['OET-RV'] \
-                                    else f'{oTidyBBBwithNotes} {oC}:{oV}'
-                oHebrewWordLink = f'<a title="Go to word page" href="../HebWrd/{getHebrewWordpageFilename(oN,state)}#Top">{oHebrewWord}</a>' if not state.TEST_MODE_FLAG or oBBB in state.preloadedBibles['OET-RV'] else oHebrewWord
-                lemmaHTML = f'''{lemmaHTML}\n<p class="lemmaLine">{oOETLink} <b>{oHebrewWordLink}</b> ({transliterate_Hebrew(oHebrewWord.replace(',',', '))})''' \
-                    f" {oTidyMorphology} {translation} " \
-                    f'''<a title="Go to Open Scriptures Hebrew verse page" href="https://hb.OpenScriptures.org/structure/OshbVerse/index.html?b={oOSISbookCode}&c={oC}&v={oV}">OSHB {oTidyBBBwithNotes} {oC}:{oV} word {oW}</a></p>{f'\n{oOET_LV_verse_HTML}' if oOET_LV_verse_HTML else ''}{f'\n{oOET_RV_verse_HTML}' if oOET_RV_verse_HTML else ''}'''
-                # other_count += 1
-                # if other_count >= 120:
-                #     lemmaHTML = f'{lemmaHTML}\n<p class="summary">({len(thisWordNumberList)-other_count-1:,} more examples not listed)</p>'
-                #     break
-                if displayCounter >= maxWordsToShow: break
-            assert '\\' not in lemmaHTML, f"{lemmaHTML=}"
-            assert not lemmaHTML.endswith('\n'), f"{lemmaHTML=}"
-            assert checkHtml( 'HebrewLemmaSegment', lemmaHTML, segmentOnly=True )
-            return lemmaHTML
-        # end of createOETReferencePages.create_Hebrew_lemma_pages.makeHebrewLemmaHTML
-
-        lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(hebLemma, hebLemmaWordRowsList)}" # Make all the Hebrew lemma pages
-
-        # Consider related lemmas, e.g., with or without prefix
-        this_extended_lemma_list = [hebLemma]
-        for ll2, this_second_lemma in enumerate( lemmaList ):
-            # print( f"  {mm} {this_second_lemma=}" )
-            if this_second_lemma and len(this_second_lemma)>1 and this_second_lemma not in this_extended_lemma_list:
-                prefix = None
-                if this_second_lemma.endswith( hebLemma ):
-                    prefix = this_second_lemma[:len(this_second_lemma)-len(hebLemma)]
-                elif hebLemma.endswith( this_second_lemma ):
-                    prefix = hebLemma[:len(hebLemma)-len(this_second_lemma)]
-                if prefix and len(prefix) < 6:
-                    if prefix in KNOWN_GREEK_PREFIXES:
-                        # print(f"create_Hebrew_lemma_pages also got lemma '{this_second_lemma}' with prefix '{prefix}' (cf. '{lemma}')")
-                        hebLemmaWordRowsList = state.OETRefData['OTLemmaRowNumbersDict'][this_second_lemma]
-                        # lemmaFormsList = sorted( state.OETRefData['OTLemmaFormsDict'][this_second_lemma] )
-                        # lemmaGlossesList = sorted( state.OETRefData['OTLemmaOETGlossesDict'][this_second_lemma] )
-                        this_second_lemma_link = f'<a title="Go to lemma page" href="{this_second_lemma}.htm#Top">{this_second_lemma}</a>'
-                        if len(this_extended_lemma_list) == 1:
-                            lemmasHtml = f"{lemmasHtml}\n<h1>Other possible lexically-related lemmas</h1>"
-                        lemmasHtml = f'''{lemmasHtml}
-<h2>Hebrew root <small>(lemma)</small> ‘{this_second_lemma}’ <small>with prefix=‘{prefix}’</small></h2>
-{makeHebrewLemmaHTML(this_second_lemma_link, hebLemmaWordRowsList)}'''
-                        this_extended_lemma_list.append( this_second_lemma )
-                    # else:
-                    #     print(f"create_Hebrew_lemma_pages ignored potential lemma '{this_second_lemma}' with unrecognised prefix '{prefix}' (cf. '{lemma}')")
-        # if len(this_extended_lemma_list) > 1:
-        #     print( f"Got {this_extended_lemma_list=}" )
-
-        # Consider other lemmas with similar English glosses
-        similarLemmaSet = set()
-        lemmaOETGlossesList = state.OETRefData['OTLemmaGlossDict'][hebLemma]
-        for lemmaGloss in lemmaOETGlossesList:
-            # print( f"  A {lemmaGloss=}" )
-            if lemmaGloss not in COMMON_ENGLISH_WORDS_LIST: # Ignore the most common words
-                # List other lemmas that are glossed similarly
-                try:
-                    similarWords = (lemmaGloss,) + SIMILAR_GLOSS_WORDS_DICT[lemmaGloss]
-                    # print( f"      {lemmaGloss=} {similarWords=} {ll} {lemma=} {lemmaGlossesList=}")
-                except KeyError: similarWords = (lemmaGloss,)
-                for similarWord in similarWords:
-                    for otherLemma,otherLemmaGlosses in state.OETRefData['OTLemmaOETGlossesDict'].items():
-                        # NOTE: otherLemmaGlosses contains raw words and well as HTML spans for gloss helpers, etc.
-                        if otherLemma != hebLemma:
-                            # print( f"{otherLemma=} {otherLemmaGlosses=}")
-                            if similarWord in otherLemmaGlosses:
-                                similarLemmaSet.add( otherLemma )
-        if similarLemmaSet:
-            # print( f"{lemma=} {lemmaGlossesList=} {extraLemmaSet=}" )
-            lemmasHtml = f'''{lemmasHtml}
-<h1>Lemmas with similar glosses to ‘{hebLemma}’ ({transliteratedLemma})</h1>'''
-            for extraLemma in similarLemmaSet:
-                transliteratedExtraLemma = transliterate_Hebrew( extraLemma )
-                extra_lemma_link = f'<a title="Go to lemma page" href="{transliteratedExtraLemma}.htm#Top">{extraLemma}</a>'
-                hebExtraLemmaWordRowsListA = state.OETRefData['OTLemmaRowNumbersDict'][extraLemma]
-                assert len(hebExtraLemmaWordRowsListA) == 1
-                try: rowNum = list(state.OETRefData['OTLemmaGlossDict']).index(extraLemma)
-                except ValueError: continue # Lemma can be missing for some compound words, e.g., 'מִגְדַּל' migdel
-                assert rowNum == hebExtraLemmaWordRowsListA[0] - 1
-                hebExtraLemmaWordRowsListB = state.OETRefData['OTWordRowNumbersDict'][rowNum]
-                # print( f"{extraLemma=} {transliteratedExtraLemma=} {rowNum=} ({len(hebExtraLemmaWordRowsListA)}) {hebExtraLemmaWordRowsListA=} ({len(hebExtraLemmaWordRowsListB)}) {hebExtraLemmaWordRowsListB}" )
-                lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(extra_lemma_link, hebExtraLemmaWordRowsListB)}"
-        assert not lemmasHtml.endswith('\n'), f"{lemmasHtml=}"
-
-        # Consider other lemmas with contrastive English glosses
-        contrastiveLemmaSet = set()
-        for lemmaGloss in lemmaOETGlossesList:
-            # print( f"  B {lemmaGloss=}" )
-            if lemmaGloss not in COMMON_ENGLISH_WORDS_LIST: # Ignore the most common words
-                # List other lemmas that are glossed as antonyms
-                try:
-                    contrastiveWords = CONTRASTIVE_GLOSS_WORDS_DICT[lemmaGloss]
-                    print( f"      {lemmaGloss=} {contrastiveWords=} {lemmaIndex} {hebLemma=} {lemmaOETGlossesList=}")
-                    NEVER_GETS_HERE
-                except KeyError: contrastiveWords = []
-                for contrastiveWord in contrastiveWords:
-                    for otherLemma,otherLemmaGlosses in state.OETRefData['OTLemmaOETGlossesDict'].items():
-                        # NOTE: otherLemmaGlosses contains raw words and well as HTML spans for gloss helpers, etc.
-                        if otherLemma != hebLemma:
-                            # print( f"Found {otherLemma=} {otherLemmaGlosses=}")
-                            if contrastiveWord in otherLemmaGlosses:
-                                assert otherLemma not in similarLemmaSet
-                                contrastiveLemmaSet.add( otherLemma )
-        if contrastiveLemmaSet:
-            # print( f"{lemma=} {lemmaGlossesList=} {extraLemmaSet=}" )
-            lemmasHtml = f'''{lemmasHtml}
-<h1>Lemmas with contrastive glosses to ‘{hebLemma}’ ({transliteratedLemma})</h1>'''
-            for contrastiveLemma in contrastiveLemmaSet:
-                NEVER_GETS_HERE
-                transliteratedContrastiveLemma = transliterate_Hebrew( contrastiveLemma )
-                contrastive_lemma_link = f'<a title="Go to lemma page" href="{transliteratedContrastiveLemma}.htm#Top">{contrastiveLemma}</a>'
-                hebContrastiveLemmaWordRowsListA = state.OETRefData['OTLemmaRowNumbersDict'][contrastiveLemma]
-                assert len(hebContrastiveLemmaWordRowsListA) == 1
-                rowNum = list(state.OETRefData['OTLemmaGlossDict']).index(contrastiveLemma)
-                assert rowNum == hebContrastiveLemmaWordRowsListA[0] - 1
-                hebContrastiveLemmaWordRowsListB = state.OETRefData['OTWordRowNumbersDict'][rowNum]
-                print( f"{contrastiveLemma=} {transliteratedContrastiveLemma=} {rowNum=} ({len(hebContrastiveLemmaWordRowsListA)}) {hebContrastiveLemmaWordRowsListA=} ({len(hebContrastiveLemmaWordRowsListB)}) {hebContrastiveLemmaWordRowsListB}" )
-                lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(contrastive_lemma_link, hebContrastiveLemmaWordRowsListB)}"
-                # lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(contrastive_lemma_link, state.OETRefData['OTLemmaRowNumbersDict'][contrastiveLemma])}"
-        assert '\\' not in lemmasHtml, f"{lemmasHtml=}"
-        assert not lemmasHtml.endswith('\n'), f"{lemmasHtml=}"
-
-        # Consider other lemmas with the same root consonants
-        lemmaSet = state.OETRefData['OTLemmasForRootDict'][vowellessLemma]
-        # print( f"{hebLemma=} {vowellessLemma=} count={len(lemmaSet)} {lemmaSet=}")
-        assert hebLemma in lemmaSet
-        if len(lemmaSet) > 1:
-            lemmasHtml = f'''{lemmasHtml}
-<h1>Lemmas with same root consonants as ‘{vowellessLemma}’ ({transliteratedVowellessLemma})</h1>
-<p class="rem">It's possible that {'some of these' if len(lemmaSet)>2 else 'this'} might not have any actual semantic connection to the main root above—use with caution.</p>'''
-            for sameRootLemma in lemmaSet:
-                if sameRootLemma == hebLemma: continue # This is already the page we're on
-                transliteratedSameRootLemma = transliterate_Hebrew( sameRootLemma )
-                # print( f"{sameRootLemma=} from {hebLemma=} {vowellessLemma=} count={len(lemmaSet)} {lemmaSet=}")
-                other_lemma_link = f'<a title="Go to lemma page" href="{transliteratedSameRootLemma}.htm#Top">{sameRootLemma}</a>'
-                # hebOtherLemmaWordRowsListA = state.OETRefData['OTLemmaRowNumbersDict'][sameRootLemma]
-                # print( f"{vowellessLemma=} count={len(lemmaSet)} {sameRootLemma=} {transliteratedSameRootLemma=} ({len(hebOtherLemmaWordRowsListA)}) {hebOtherLemmaWordRowsListA=}" )
-                # if hebOtherLemmaWordRowsListA: assert len(hebOtherLemmaWordRowsListA) == 1
-                rowNum = list(state.OETRefData['OTLemmaGlossDict']).index(sameRootLemma) + 1
-                # print( f"    {rowNum=}" )
-                # if hebOtherLemmaWordRowsListA: assert rowNum == hebOtherLemmaWordRowsListA[0] - 1
-                hebOtherLemmaWordRowsListB = state.OETRefData['OTWordRowNumbersDict'][rowNum]
-                # print( f"    ({len(hebOtherLemmaWordRowsListB)}) {hebOtherLemmaWordRowsListB}" )
-                lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(other_lemma_link, hebOtherLemmaWordRowsListB)}"
-                # lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(other_lemma_link, state.OETRefData['OTLemmaRowNumbersDict'][sameRootLemma])}"
-        assert '\\' not in lemmasHtml, f"{lemmasHtml=}"
-        assert not lemmasHtml.endswith('\n'), f"{lemmasHtml=}"
-
-        if len(vowellessLemma) > 3:
-            lemmaSet = set()
-            if vowellessLemma[0] in 'מכ': # Then it's possibly a derived root with a prefix
-                # print( f"  {hebLemma=} {vowellessLemma=} count={len(lemmaSet)} {lemmaSet=}")
-                adjVowellessLemma = vowellessLemma[1:]
-                lemmaSet.update( state.OETRefData['OTLemmasForRootDict'][adjVowellessLemma] )
-                # print( f"         {adjVowellessLemma=} *NOW count={len(lemmaSet)} {lemmaSet=}")
-            if vowellessLemma.endswith( 'אל' ): # Like 'שְׁמוּאֵל' Shemu'el
-                # print( f"  EL {hebLemma=} {vowellessLemma=} count={len(lemmaSet)} {lemmaSet=}")
-                adjVowellessLemma = vowellessLemma[:-2] # Remove the final consonant
-                if len(adjVowellessLemma) > 3 and adjVowellessLemma[-1] in 'ו':
-                    adjVowellessLemma = adjVowellessLemma[:-1] # Remove the preceding vowel
-                # Change (the now) final consonants where required
-                if   adjVowellessLemma[-1] == 'נ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ן'
-                elif adjVowellessLemma[-1] == 'כ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ך'
-                elif adjVowellessLemma[-1] == 'מ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ם'
-                elif adjVowellessLemma[-1] == 'פ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ף'
-                elif adjVowellessLemma[-1] == 'צ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ץ'
-                lemmaSet.update( state.OETRefData['OTLemmasForRootDict'][adjVowellessLemma] )
-                # print( f"  Adding {state.OETRefData['OTLemmasForRootDict'][adjVowellessLemma]} to lemma {ll_output_filename}" )
-                # print( f"         {adjVowellessLemma=} NOW* count={len(lemmaSet)} {lemmaSet=}")
-            elif vowellessLemma.endswith( 'יה' ): # Like '' Elijah
-                # print( f"  YAH {hebLemma=} {vowellessLemma=} count={len(lemmaSet)} {lemmaSet=}")
-                adjVowellessLemma = vowellessLemma[:-2] # Remove the final consonant
-                if len(adjVowellessLemma) > 3 and adjVowellessLemma[-1] in 'ו':
-                    adjVowellessLemma = adjVowellessLemma[:-1] # Remove the preceding vowel
-                # Change (the now) final consonants where required
-                if   adjVowellessLemma[-1] == 'נ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ן'
-                elif adjVowellessLemma[-1] == 'כ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ך'
-                elif adjVowellessLemma[-1] == 'מ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ם'
-                elif adjVowellessLemma[-1] == 'פ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ף'
-                elif adjVowellessLemma[-1] == 'צ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ץ'
-                lemmaSet.update( state.OETRefData['OTLemmasForRootDict'][adjVowellessLemma] )
-                # print( f"  Adding {state.OETRefData['OTLemmasForRootDict'][adjVowellessLemma]} to lemma {ll_output_filename}" )
-                # print( f"         {adjVowellessLemma=} NOW* count={len(lemmaSet)} {lemmaSet=}")
-            elif vowellessLemma[-1] in 'הן': # Then it's possibly a derived root with a suffix
-                # print( f"  {hebLemma=} {vowellessLemma=} count={len(lemmaSet)} {lemmaSet=}")
-                adjVowellessLemma = vowellessLemma[:-1] # Remove the final consonant
-                if len(adjVowellessLemma) > 3 and adjVowellessLemma[-1] in 'ו':
-                    adjVowellessLemma = adjVowellessLemma[:-1] # Remove the preceding vowel
-                # Change (the now) final consonants where required
-                if   adjVowellessLemma[-1] == 'נ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ן'
-                elif adjVowellessLemma[-1] == 'כ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ך'
-                elif adjVowellessLemma[-1] == 'מ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ם'
-                elif adjVowellessLemma[-1] == 'פ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ף'
-                elif adjVowellessLemma[-1] == 'צ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ץ'
-                lemmaSet.update( state.OETRefData['OTLemmasForRootDict'][adjVowellessLemma] )
-                # print( f"         {adjVowellessLemma=} NOW* count={len(lemmaSet)} {lemmaSet=}")
-            vlWithoutY = vowellessLemma.replace( 'י', '' )
-            if vlWithoutY != vowellessLemma and len(vlWithoutY)>=3:
-                # print( f"Got {vlWithoutY=} from {vowellessLemma}" )
-                # print( f"  Adding {state.OETRefData['OTLemmasForRootDict'][vlWithoutY]} to lemma {ll_output_filename}" )
-                lemmaSet.update( state.OETRefData['OTLemmasForRootDict'][vlWithoutY] )
-            vlWithoutV = vowellessLemma.replace( 'ו', '' )
-            if vlWithoutV != vowellessLemma and len(vlWithoutV)>=3:
-                # print( f"Got {vlWithoutV=} from {vowellessLemma}" )
-                # print( f"  Adding {state.OETRefData['OTLemmasForRootDict'][vlWithoutV]} to lemma {ll_output_filename}" )
-                lemmaSet.update( state.OETRefData['OTLemmasForRootDict'][vlWithoutV] )
-            if 'י' in vowellessLemma and 'ו' in vowellessLemma:
-                vlWithoutYV = vowellessLemma.replace( 'י', '' ).replace( 'ו', '' )
-                if len(vlWithoutYV) >= 3:
-                    # print( f"  Got {vlWithoutYV=} from {vowellessLemma}" )
-                    # print( f"    Adding {state.OETRefData['OTLemmasForRootDict'][vlWithoutYV]} to lemma {ll_output_filename}" )
-                    lemmaSet.update( state.OETRefData['OTLemmasForRootDict'][vlWithoutYV] )
-            if lemmaSet:
-                lemmasHtml = f'''{lemmasHtml}
-    <h1>Lemmas with some of the same root consonants as ‘{vowellessLemma}’ ({transliteratedVowellessLemma})</h1>'''
-                for similarRootLemma in sorted( lemmaSet ):
-                    assert similarRootLemma != hebLemma
-                    transliteratedSimilarRootLemma = transliterate_Hebrew( similarRootLemma )
-                    # print( f"{similarRootLemma=} from {hebLemma=} {vowellessLemma=} count={len(lemmaSet)} {lemmaSet=}")
-                    other_lemma_link = f'<a title="Go to lemma page" href="{transliteratedSimilarRootLemma}.htm#Top">{similarRootLemma}</a>'
-                    # hebOtherLemmaWordRowsListA = state.OETRefData['OTLemmaRowNumbersDict'][similarRootLemma]
-                    # print( f"{vowellessLemma=} count={len(lemmaSet)} {similarRootLemma=} {transliteratedSimilarRootLemma=} ({len(hebOtherLemmaWordRowsListA)}) {hebOtherLemmaWordRowsListA=}" )
-                    # if hebOtherLemmaWordRowsListA: assert len(hebOtherLemmaWordRowsListA) == 1
-                    rowNum = list(state.OETRefData['OTLemmaGlossDict']).index(similarRootLemma) + 1
-                    # print( f"    {rowNum=}" )
-                    # if hebOtherLemmaWordRowsListA: assert rowNum == hebOtherLemmaWordRowsListA[0] - 1
-                    hebOtherLemmaWordRowsListB = state.OETRefData['OTWordRowNumbersDict'][rowNum]
-                    # print( f"    ({len(hebOtherLemmaWordRowsListB)}) {hebOtherLemmaWordRowsListB}" )
-                    lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(other_lemma_link, hebOtherLemmaWordRowsListB)}"
-                    # lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(other_lemma_link, state.OETRefData['OTLemmaRowNumbersDict'][similarRootLemma])}"
-            assert '\\' not in lemmasHtml, f"{lemmasHtml=}"
-            assert not lemmasHtml.endswith('\n'), f"{lemmasHtml=}"
-
-        keyHtml = ''
-        if usedMorphologies: # Add a key at the bottom
-            for usedMorphology in sorted( usedMorphologies ):
-                try:
-                    keyHtml = f"{keyHtml} <b>{usedMorphology}</b>={CNTR_MORPHOLOGY_NAME_DICT[usedMorphology.upper()]}"
-                except KeyError:
-                    logging.warning( f"Missing {usedMorphology=}")
-            if keyHtml:
-                keyHtml = f'\n<p class="key" id="Key"><b>Key</b>:{keyHtml}</p>'
-
-        # Now put it all together
-        top = makeTop( level, None, 'lemma', None, state ) \
-                        .replace( '__TITLE__', f"Hebrew lemma ‘{hebLemma}’{' TEST' if state.TEST_MODE_FLAG else ''}" ) \
-                        .replace( '__KEYWORDS__', 'Bible, word' )
-        lemmasHtml = f'''{top}{lemmasHtml}{keyHtml}{makeBottom( level, None, 'lemma', state )}'''
-        assert checkHtml( 'HebrewLemmaPage', lemmasHtml )
-        filepath = outputFolderPath.joinpath( ll_output_filename )
-        # assert not filepath.is_file(), f"{ll} {hebLemma=} {transliteratedLemma=} {filepath=}" # Check that we're not overwriting anything
-        if filepath.is_file():
-            logging.critical( f"create_Hebrew_lemma_pages was about to overwrite {filepath} for {lemmaIndex=} {hebLemma=} {transliteratedLemma=}" )
-            filepath = outputFolderPath.joinpath( f'2{ll_output_filename}' )
-            logging.critical( f"    Renamed to {filepath}" )
-        with open( filepath, 'wt', encoding='utf-8' ) as html_output_file:
-            html_output_file.write( lemmasHtml )
-        vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  Wrote {len(lemmasHtml):,} characters to {ll_output_filename}" )
-        lemmaLinks.append( f'<a href="{ll_output_filename}">{hebLemma}</a>')
-    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f'''    Created {len(lemmaLinks):,}{f"/{len(state.OETRefData['OTLemmaGlossDict']):,}" if len(lemmaLinks) < len(state.OETRefData['OTLemmaGlossDict']) else ''} Hebrew lemma pages.''' )
+        page_filename = ll_output_filename
+        if page_filename in usedFilenames:
+            logging.critical( f"create_Hebrew_lemma_pages was about to overwrite {outputFolderPath.joinpath( page_filename )} for {lemmaIndex=} {hebLemma=} {transliteratedLemma=}" )
+            filenameNumber = 2
+            while f'{filenameNumber}{ll_output_filename}' in usedFilenames:
+                filenameNumber += 1
+            page_filename = f'{filenameNumber}{ll_output_filename}'
+            logging.critical( f"    Renamed to {outputFolderPath.joinpath( page_filename )}" )
+        usedFilenames.add( page_filename )
+        lemmaJobs.append( (level, lemmaIndex, lemmaList, OTLemmaIndex, outputFolderPath, page_filename) )
+        lemmaLinks.append( f'<a href="{page_filename}">{hebLemma}</a>')
+    _create_word_pages( 'Hebrew lemma', create_Hebrew_lemma_page, lemmaJobs, (), state,
+                        chunkSize=LEMMA_PAGES_CHUNK_SIZE, progressInterval=2_000, parallelFlag=state.PARALLEL_LEMMA_PAGES_FLAG )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f'''    Created {len(lemmaLinks):,}{f"/{len(state.OETRefData['OTLemmaGlossDict']):,}" if len(lemmaLinks) < len(state.OETRefData['OTLemmaGlossDict']) else ''} Hebrew lemma pages{f" in {time()-startTime:,.1f} seconds ({1000*(time()-startTime)/len(lemmaLinks):,.1f}ms per page)" if lemmaLinks else ''}.''' )
 
     # Create index page for this folder
     filename = 'index.htm'
@@ -2604,6 +2514,360 @@ def create_Hebrew_lemma_pages( level:int, outputFolderPath:Path, state:State ) -
 # end of createOETReferencePages.create_Hebrew_lemma_pages
 
 
+def create_Hebrew_lemma_page( level:int, lemmaIndex:int, lemmaList:list[str], OTLemmaIndex:LemmaIndex, outputFolderPath:Path, ll_output_filename:str, state:State ) -> bool:
+    """
+    Makes the page for the Hebrew lemma at lemmaIndex in lemmaList
+        using the inverted indexes in OTLemmaIndex (rather than scanning all the other lemmas).
+
+    Doesn't change the state so it can also be run in forked worker processes.
+    """
+    hebLemma = lemmaList[lemmaIndex]
+    fnPrint( DEBUGGING_THIS_MODULE, f"create_Hebrew_lemma_page( {level}, {lemmaIndex}, {hebLemma}, …, {ll_output_filename} … )" )
+    transliteratedLemma = transliterate_Hebrew( hebLemma )
+    vowellessLemma = removeHebrewVowelPointing( hebLemma )
+    transliteratedVowellessLemma = transliterate_Hebrew( vowellessLemma )
+
+    hebLemmaWordRowsList = state.OETRefData['OTWordRowNumbersDict'][lemmaIndex+1]
+    # print( f"\n{lemmaIndex=} {len(lemmaList)=} {hebLemma=} {transliteratedLemma=} {state.OETRefData['OTWordRowNumbersDict'][lemmaIndex+1]=}\n{lemmaList[lemmaIndex]=}")
+    # if hebLemma == 'בָּרָא': print( f"\ncreate_Hebrew_lemma_pages: lemma {lemmaIndex}: {hebLemma=} {vowellessLemma=} {transliteratedLemma=} {transliteratedVowellessLemma=} ({len(hebLemmaWordRowsList)}) {hebLemmaWordRowsList=}" ); assert False, "We want to stop here"
+    # lemmaFormsList = sorted( state.OETRefData['OTLemmaFormsDict'][hebLemma] )
+    # lemmaOETGlossesList = state.OETRefData['OTLemmaGlossDict'][hebLemma].split( ';' )
+
+    # def getFirstHebrewWordNumber(grk:str,morph:str):
+    #     return state.OETRefData['OTFormUsageDict'][(grk,morph)][0]
+
+    usedMorphologies = set()
+
+    prevLemmaIndex = nextLemmaIndex = None
+    if lemmaIndex > 0:
+        if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG:
+            for LL in range( lemmaIndex-1, -1, -1 ): # Use -1 for stop, so zero will be included
+                if lemmaList[LL] in state.OETRefData['usedHebLemmasSet']:
+                    prevLemmaIndex = LL
+                    break
+        else: prevLemmaIndex = lemmaIndex - 1
+    if lemmaIndex<len(lemmaList)-1:
+        if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG:
+            for LL in range( lemmaIndex+1, len(lemmaList) ):
+                if lemmaList[LL] in state.OETRefData['usedHebLemmasSet']:
+                    nextLemmaIndex = LL
+                    break
+        else: nextLemmaIndex = lemmaIndex + 1
+    prevLink = f'<b><a title="Previous lemma" href="{transliterate_Hebrew(lemmaList[prevLemmaIndex])}.htm#Top">←</a></b> ' if prevLemmaIndex is not None else ''
+    nextLink = f' <b><a title="Next lemma" href="{transliterate_Hebrew(lemmaList[nextLemmaIndex])}.htm#Top">→</a></b>' if nextLemmaIndex else ''
+    lemmasHtml = f'''<h1 id="Top">Hebrew root <small>(lemma)</small> ‘{hebLemma}’ ({transliteratedLemma})</h1>
+<p class="pgNav">{prevLink}<b>{hebLemma}</b> <a title="Go to Hebrew word index" href="index.htm">⌂</a>{nextLink}</p>
+<p class="btnBar"><button type="button" id="wordsButton" title="Hide/Show word lines" onclick="hide_show_words()">Hide words</button> <button type="button" id="versesButton" title="Hide/Show verse lines" onclick="hide_show_verses()">Hide verses</button> <button type="button" id="coloursButton" title="Hide/Show verse colours" onclick="hide_show_colours()">Hide verse colours</button></p>'''
+# <p class="summary">This root form (lemma) ‘{hebLemma}’ is used in {'only one form' if len(lemmaFormsList)==1 else f'{len(lemmaFormsList):,} different forms'} in the Hebrew originals: {', '.join([f'<a title="View Hebrew word form" href="../HebWrd/{getFirstHebrewWordNumber(heb,morph)}.htm#Top">{heb}</a> <small>({morph[4:] if morph.startswith("....") else morph})</small>' for heb,morph in lemmaFormsList])}.</p>
+# <p class="summary">It is glossed in {'only one way' if len(lemmaOETGlossesList)==1 else f'{len(lemmaOETGlossesList):,} different ways'}: ‘<b>{"</b>’, ‘<b>".join(lemmaOETGlossesList)}</b>’.</p>
+
+    def makeHebrewLemmaHTML( thisLemmaStr:str, thisLemmaRowsList ) -> str:
+        """
+        The guts of making the lemma page
+            put into a function so that we can also re-use it for related words
+
+        Side-effects: updates usedRoleLetters and usedMorphologies
+        """
+        # for oN in thisLemmaRowsList:
+        #     _oref, orowType, oMorphemeRowList, olemmaRowList, ostrongs, ocantillationHierarchy, omorphology, oword, _oNoCantillations, oMorphemeGlosses, oContextualMorphemeGlosses, oWordGloss, oContextualWordGloss, oglossCapitalisation, oglossPunctuation, oglossOrder, oglossInsert, oRole, oNesting, oTags = state.OETRefData['word_tables'][wordFileName][oN].split( '\t' )
+        #     # usedRoleLetters.add( oRoleLetter )
+        # # oRoleLetter remains set to the last value added to the set (which is the only value if len(oRoleSet)==1)
+
+        if len(thisLemmaRowsList) > 100: # too many to list
+            maxWordsToShow = 50
+            lemmaHTML = f"<h2>Showing the first {maxWordsToShow} out of {len(thisLemmaRowsList)-1:,} uses of Hebrew root <small>(lemma)</small> ‘{thisLemmaStr}’ ({transliterate_Hebrew(thisLemmaStr)}) in the Hebrew originals</h2>"
+        else: # we can list all uses of the word
+            maxWordsToShow = 100
+            lemmaHTML = f"<h2>Have {len(thisLemmaRowsList):,} {'use' if len(thisLemmaRowsList)==1 else 'uses'} of Hebrew root <small>(lemma)</small> ‘{thisLemmaStr}’ ({transliterate_Hebrew(thisLemmaStr)}) in the Hebrew originals</h2>"
+        for displayCounter,oN in enumerate( thisLemmaRowsList, start=1 ):
+            oWordRef, oRowType, oMorphemeRowList, oLemmaRowList, oStrongs, oMorphology, oWord, oNoCantillations, oMorphemeGlosses, oContextualMorphemeGlosses, oWordGloss, oContextualWordGloss, oGlossCapitalisation, oGlossPunctuation, oGlossOrder, oGlossInsert, oRole, oNesting, oTags = state.OETRefData['word_tables'][HebrewWordFileName].getFields( oN )
+            # print( f"    {oWordRef=} {oOSHBid=} {orowType=} {len(thisLemmaRowsList)=}" )
+            oHebrewWord = oNoCantillations
+            oWordGloss = oWordGloss.replace( '=', '_' )
+            oGloss = tidy_Hebrew_lemma_gloss( oContextualWordGloss if oContextualWordGloss else oWordGloss if oWordGloss else oContextualMorphemeGlosses if oContextualMorphemeGlosses else oMorphemeGlosses )
+            chosenGlossType = 'cWG' if oContextualWordGloss else 'wG' if oWordGloss else 'cMGs' if oContextualMorphemeGlosses else 'mGs'
+            # oFormattedContextGlossWords = oGloss # formatNTContextSpansOETGlossWords( oN, state )
+            translation = f'''{GLOSS_TYPE_STRING_DICT[chosenGlossType]}=‘<b>{oGloss}</b>’''' if oGloss else '<small>(no English gloss here)</small>'
+            for extraGlossType,extraGlossString in (('cWG',oContextualWordGloss),('wG',oWordGloss),('cMGs',oContextualMorphemeGlosses),('mGs',oMorphemeGlosses)):
+                if extraGlossType != chosenGlossType and extraGlossString:
+                    extraGlossTypeString = 'possible glosses' if extraGlossType=='wG' and '/' in extraGlossString \
+                                                            else GLOSS_TYPE_STRING_DICT[extraGlossType]
+                    extraGlossString = tidy_Hebrew_lemma_gloss( extraGlossString )
+                    translation = f'''{translation} {extraGlossTypeString}=‘<b>{extraGlossString}</b>’'''
+            translation = translation.replace(',',', ').replace('</','PRoTecT').replace('/', ' / ').replace('PRoTecT', '</') # looks much nicer
+            oBBB, oC, oV = OTLemmaIndex.getRowVerse( oN )
+            oW = oWordRef.split( 'w', 1 )[1] if 'w' in oWordRef else ''
+            oTidyMorphology = oMorphology[4:] if oMorphology.startswith('····') else oMorphology
+            if oTidyMorphology != '···': usedMorphologies.add( oTidyMorphology )
+            oVerseLinked = not state.TEST_MODE_FLAG or oBBB in state.preloadedBibles['OET-RV']
+            oTidyBBBwithNotes, oOSISbookCode, oOETLink, oOET_LV_verse_HTML, oOET_RV_verse_HTML = get_Hebrew_lemma_line_verse_parts( level, oBBB, oC, oV, oVerseLinked )
+            # print( f"   {oBBB} {oC}:{oV} {oOET_RV_verse_HTML=}")
+            oHebrewWordLink = f'<a title="Go to word page" href="../HebWrd/{getHebrewWordpageFilename(oN,state)}#Top">{oHebrewWord}</a>' if oVerseLinked else oHebrewWord
+            lemmaHTML = f'''{lemmaHTML}\n<p class="lemmaLine">{oOETLink} <b>{oHebrewWordLink}</b> ({transliterate_Hebrew(oHebrewWord.replace(',',', '))})''' \
+                f" {oTidyMorphology} {translation} " \
+                f'''<a title="Go to Open Scriptures Hebrew verse page" href="https://hb.OpenScriptures.org/structure/OshbVerse/index.html?b={oOSISbookCode}&c={oC}&v={oV}">OSHB {oTidyBBBwithNotes} {oC}:{oV} word {oW}</a></p>{f'\n{oOET_LV_verse_HTML}' if oOET_LV_verse_HTML else ''}{f'\n{oOET_RV_verse_HTML}' if oOET_RV_verse_HTML else ''}'''
+            # other_count += 1
+            # if other_count >= 120:
+            #     lemmaHTML = f'{lemmaHTML}\n<p class="summary">({len(thisWordNumberList)-other_count-1:,} more examples not listed)</p>'
+            #     break
+            if displayCounter >= maxWordsToShow: break
+        assert '\\' not in lemmaHTML, f"{lemmaHTML=}"
+        assert not lemmaHTML.endswith('\n'), f"{lemmaHTML=}"
+        assert checkHtml( 'HebrewLemmaSegment', lemmaHTML, segmentOnly=True )
+        return lemmaHTML
+    # end of createOETReferencePages.create_Hebrew_lemma_page.makeHebrewLemmaHTML
+
+    lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(hebLemma, hebLemmaWordRowsList)}" # Make all the Hebrew lemma pages
+
+    # Consider related lemmas, e.g., with or without prefix
+    this_extended_lemma_list = [hebLemma]
+    for this_second_lemma, prefix in OTLemmaIndex.getPrefixedLemmas( hebLemma ): # Only KNOWN_GREEK_PREFIXES
+        # print(f"create_Hebrew_lemma_page also got lemma '{this_second_lemma}' with prefix '{prefix}' (cf. '{lemma}')")
+        hebLemmaWordRowsList = state.OETRefData['OTLemmaRowNumbersDict'][this_second_lemma]
+        # lemmaFormsList = sorted( state.OETRefData['OTLemmaFormsDict'][this_second_lemma] )
+        # lemmaGlossesList = sorted( state.OETRefData['OTLemmaOETGlossesDict'][this_second_lemma] )
+        this_second_lemma_link = f'<a title="Go to lemma page" href="{this_second_lemma}.htm#Top">{this_second_lemma}</a>'
+        if len(this_extended_lemma_list) == 1:
+            lemmasHtml = f"{lemmasHtml}\n<h1>Other possible lexically-related lemmas</h1>"
+        lemmasHtml = f'''{lemmasHtml}
+<h2>Hebrew root <small>(lemma)</small> ‘{this_second_lemma}’ <small>with prefix=‘{prefix}’</small></h2>
+{makeHebrewLemmaHTML(this_second_lemma_link, hebLemmaWordRowsList)}'''
+        this_extended_lemma_list.append( this_second_lemma )
+    # if len(this_extended_lemma_list) > 1:
+    #     print( f"Got {this_extended_lemma_list=}" )
+
+    # Consider other lemmas with similar English glosses
+    similarLemmaSet = set()
+    lemmaOETGlossesList = state.OETRefData['OTLemmaGlossDict'][hebLemma]
+    for lemmaGloss in lemmaOETGlossesList:
+        # print( f"  A {lemmaGloss=}" )
+        if lemmaGloss not in COMMON_ENGLISH_WORDS_LIST: # Ignore the most common words
+            # List other lemmas that are glossed similarly
+            try:
+                similarWords = (lemmaGloss,) + SIMILAR_GLOSS_WORDS_DICT[lemmaGloss]
+                # print( f"      {lemmaGloss=} {similarWords=} {ll} {lemma=} {lemmaGlossesList=}")
+            except KeyError: similarWords = (lemmaGloss,)
+            for similarWord in similarWords:
+                # NOTE: The glosses in the index contain raw words and well as HTML spans for gloss helpers, etc.
+                for otherLemma in OTLemmaIndex.getGlossLemmas( similarWord ):
+                    if otherLemma != hebLemma:
+                        similarLemmaSet.add( otherLemma )
+    if similarLemmaSet:
+        # print( f"{lemma=} {lemmaGlossesList=} {extraLemmaSet=}" )
+        lemmasHtml = f'''{lemmasHtml}
+<h1>Lemmas with similar glosses to ‘{hebLemma}’ ({transliteratedLemma})</h1>'''
+        for extraLemma in similarLemmaSet:
+            transliteratedExtraLemma = transliterate_Hebrew( extraLemma )
+            extra_lemma_link = f'<a title="Go to lemma page" href="{transliteratedExtraLemma}.htm#Top">{extraLemma}</a>'
+            hebExtraLemmaWordRowsListA = state.OETRefData['OTLemmaRowNumbersDict'][extraLemma]
+            assert len(hebExtraLemmaWordRowsListA) == 1
+            try: rowNum = OTLemmaIndex.getLemmaId( extraLemma )
+            except KeyError: continue # Lemma can be missing for some compound words, e.g., 'מִגְדַּל' migdel
+            assert rowNum == hebExtraLemmaWordRowsListA[0] - 1
+            hebExtraLemmaWordRowsListB = state.OETRefData['OTWordRowNumbersDict'][rowNum]
+            # print( f"{extraLemma=} {transliteratedExtraLemma=} {rowNum=} ({len(hebExtraLemmaWordRowsListA)}) {hebExtraLemmaWordRowsListA=} ({len(hebExtraLemmaWordRowsListB)}) {hebExtraLemmaWordRowsListB}" )
+            lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(extra_lemma_link, hebExtraLemmaWordRowsListB)}"
+    assert not lemmasHtml.endswith('\n'), f"{lemmasHtml=}"
+
+    # Consider other lemmas with contrastive English glosses
+    contrastiveLemmaSet = set()
+    for lemmaGloss in lemmaOETGlossesList:
+        # print( f"  B {lemmaGloss=}" )
+        if lemmaGloss not in COMMON_ENGLISH_WORDS_LIST: # Ignore the most common words
+            # List other lemmas that are glossed as antonyms
+            try:
+                contrastiveWords = CONTRASTIVE_GLOSS_WORDS_DICT[lemmaGloss]
+                print( f"      {lemmaGloss=} {contrastiveWords=} {lemmaIndex} {hebLemma=} {lemmaOETGlossesList=}")
+                NEVER_GETS_HERE
+            except KeyError: contrastiveWords = []
+            for contrastiveWord in contrastiveWords:
+                for otherLemma in OTLemmaIndex.getGlossLemmas( contrastiveWord ):
+                    if otherLemma != hebLemma:
+                        assert otherLemma not in similarLemmaSet
+                        contrastiveLemmaSet.add( otherLemma )
+    if contrastiveLemmaSet:
+        # print( f"{lemma=} {lemmaGlossesList=} {extraLemmaSet=}" )
+        lemmasHtml = f'''{lemmasHtml}
+<h1>Lemmas with contrastive glosses to ‘{hebLemma}’ ({transliteratedLemma})</h1>'''
+        for contrastiveLemma in contrastiveLemmaSet:
+            NEVER_GETS_HERE
+            transliteratedContrastiveLemma = transliterate_Hebrew( contrastiveLemma )
+            contrastive_lemma_link = f'<a title="Go to lemma page" href="{transliteratedContrastiveLemma}.htm#Top">{contrastiveLemma}</a>'
+            hebContrastiveLemmaWordRowsListA = state.OETRefData['OTLemmaRowNumbersDict'][contrastiveLemma]
+            assert len(hebContrastiveLemmaWordRowsListA) == 1
+            rowNum = OTLemmaIndex.getLemmaId( contrastiveLemma )
+            assert rowNum == hebContrastiveLemmaWordRowsListA[0] - 1
+            hebContrastiveLemmaWordRowsListB = state.OETRefData['OTWordRowNumbersDict'][rowNum]
+            print( f"{contrastiveLemma=} {transliteratedContrastiveLemma=} {rowNum=} ({len(hebContrastiveLemmaWordRowsListA)}) {hebContrastiveLemmaWordRowsListA=} ({len(hebContrastiveLemmaWordRowsListB)}) {hebContrastiveLemmaWordRowsListB}" )
+            lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(contrastive_lemma_link, hebContrastiveLemmaWordRowsListB)}"
+            # lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(contrastive_lemma_link, state.OETRefData['OTLemmaRowNumbersDict'][contrastiveLemma])}"
+    assert '\\' not in lemmasHtml, f"{lemmasHtml=}"
+    assert not lemmasHtml.endswith('\n'), f"{lemmasHtml=}"
+
+    # Consider other lemmas with the same root consonants
+    lemmaSet = state.OETRefData['OTLemmasForRootDict'][vowellessLemma]
+    # print( f"{hebLemma=} {vowellessLemma=} count={len(lemmaSet)} {lemmaSet=}")
+    assert hebLemma in lemmaSet
+    if len(lemmaSet) > 1:
+        lemmasHtml = f'''{lemmasHtml}
+<h1>Lemmas with same root consonants as ‘{vowellessLemma}’ ({transliteratedVowellessLemma})</h1>
+<p class="rem">It's possible that {'some of these' if len(lemmaSet)>2 else 'this'} might not have any actual semantic connection to the main root above—use with caution.</p>'''
+        for sameRootLemma in lemmaSet:
+            if sameRootLemma == hebLemma: continue # This is already the page we're on
+            transliteratedSameRootLemma = transliterate_Hebrew( sameRootLemma )
+            # print( f"{sameRootLemma=} from {hebLemma=} {vowellessLemma=} count={len(lemmaSet)} {lemmaSet=}")
+            other_lemma_link = f'<a title="Go to lemma page" href="{transliteratedSameRootLemma}.htm#Top">{sameRootLemma}</a>'
+            # hebOtherLemmaWordRowsListA = state.OETRefData['OTLemmaRowNumbersDict'][sameRootLemma]
+            # print( f"{vowellessLemma=} count={len(lemmaSet)} {sameRootLemma=} {transliteratedSameRootLemma=} ({len(hebOtherLemmaWordRowsListA)}) {hebOtherLemmaWordRowsListA=}" )
+            # if hebOtherLemmaWordRowsListA: assert len(hebOtherLemmaWordRowsListA) == 1
+            rowNum = OTLemmaIndex.getLemmaId( sameRootLemma ) + 1
+            # print( f"    {rowNum=}" )
+            # if hebOtherLemmaWordRowsListA: assert rowNum == hebOtherLemmaWordRowsListA[0] - 1
+            hebOtherLemmaWordRowsListB = state.OETRefData['OTWordRowNumbersDict'][rowNum]
+            # print( f"    ({len(hebOtherLemmaWordRowsListB)}) {hebOtherLemmaWordRowsListB}" )
+            lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(other_lemma_link, hebOtherLemmaWordRowsListB)}"
+            # lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(other_lemma_link, state.OETRefData['OTLemmaRowNumbersDict'][sameRootLemma])}"
+    assert '\\' not in lemmasHtml, f"{lemmasHtml=}"
+    assert not lemmasHtml.endswith('\n'), f"{lemmasHtml=}"
+
+    if len(vowellessLemma) > 3:
+        lemmaSet = set()
+        if vowellessLemma[0] in 'מכ': # Then it's possibly a derived root with a prefix
+            # print( f"  {hebLemma=} {vowellessLemma=} count={len(lemmaSet)} {lemmaSet=}")
+            adjVowellessLemma = vowellessLemma[1:]
+            lemmaSet.update( state.OETRefData['OTLemmasForRootDict'][adjVowellessLemma] )
+            # print( f"         {adjVowellessLemma=} *NOW count={len(lemmaSet)} {lemmaSet=}")
+        if vowellessLemma.endswith( 'אל' ): # Like 'שְׁמוּאֵל' Shemu'el
+            # print( f"  EL {hebLemma=} {vowellessLemma=} count={len(lemmaSet)} {lemmaSet=}")
+            adjVowellessLemma = vowellessLemma[:-2] # Remove the final consonant
+            if len(adjVowellessLemma) > 3 and adjVowellessLemma[-1] in 'ו':
+                adjVowellessLemma = adjVowellessLemma[:-1] # Remove the preceding vowel
+            # Change (the now) final consonants where required
+            if   adjVowellessLemma[-1] == 'נ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ן'
+            elif adjVowellessLemma[-1] == 'כ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ך'
+            elif adjVowellessLemma[-1] == 'מ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ם'
+            elif adjVowellessLemma[-1] == 'פ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ף'
+            elif adjVowellessLemma[-1] == 'צ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ץ'
+            lemmaSet.update( state.OETRefData['OTLemmasForRootDict'][adjVowellessLemma] )
+            # print( f"  Adding {state.OETRefData['OTLemmasForRootDict'][adjVowellessLemma]} to lemma {ll_output_filename}" )
+            # print( f"         {adjVowellessLemma=} NOW* count={len(lemmaSet)} {lemmaSet=}")
+        elif vowellessLemma.endswith( 'יה' ): # Like '' Elijah
+            # print( f"  YAH {hebLemma=} {vowellessLemma=} count={len(lemmaSet)} {lemmaSet=}")
+            adjVowellessLemma = vowellessLemma[:-2] # Remove the final consonant
+            if len(adjVowellessLemma) > 3 and adjVowellessLemma[-1] in 'ו':
+                adjVowellessLemma = adjVowellessLemma[:-1] # Remove the preceding vowel
+            # Change (the now) final consonants where required
+            if   adjVowellessLemma[-1] == 'נ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ן'
+            elif adjVowellessLemma[-1] == 'כ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ך'
+            elif adjVowellessLemma[-1] == 'מ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ם'
+            elif adjVowellessLemma[-1] == 'פ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ף'
+            elif adjVowellessLemma[-1] == 'צ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ץ'
+            lemmaSet.update( state.OETRefData['OTLemmasForRootDict'][adjVowellessLemma] )
+            # print( f"  Adding {state.OETRefData['OTLemmasForRootDict'][adjVowellessLemma]} to lemma {ll_output_filename}" )
+            # print( f"         {adjVowellessLemma=} NOW* count={len(lemmaSet)} {lemmaSet=}")
+        elif vowellessLemma[-1] in 'הן': # Then it's possibly a derived root with a suffix
+            # print( f"  {hebLemma=} {vowellessLemma=} count={len(lemmaSet)} {lemmaSet=}")
+            adjVowellessLemma = vowellessLemma[:-1] # Remove the final consonant
+            if len(adjVowellessLemma) > 3 and adjVowellessLemma[-1] in 'ו':
+                adjVowellessLemma = adjVowellessLemma[:-1] # Remove the preceding vowel
+            # Change (the now) final consonants where required
+            if   adjVowellessLemma[-1] == 'נ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ן'
+            elif adjVowellessLemma[-1] == 'כ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ך'
+            elif adjVowellessLemma[-1] == 'מ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ם'
+            elif adjVowellessLemma[-1] == 'פ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ף'
+            elif adjVowellessLemma[-1] == 'צ': adjVowellessLemma = f'{adjVowellessLemma[:-1]}ץ'
+            lemmaSet.update( state.OETRefData['OTLemmasForRootDict'][adjVowellessLemma] )
+            # print( f"         {adjVowellessLemma=} NOW* count={len(lemmaSet)} {lemmaSet=}")
+        vlWithoutY = vowellessLemma.replace( 'י', '' )
+        if vlWithoutY != vowellessLemma and len(vlWithoutY)>=3:
+            # print( f"Got {vlWithoutY=} from {vowellessLemma}" )
+            # print( f"  Adding {state.OETRefData['OTLemmasForRootDict'][vlWithoutY]} to lemma {ll_output_filename}" )
+            lemmaSet.update( state.OETRefData['OTLemmasForRootDict'][vlWithoutY] )
+        vlWithoutV = vowellessLemma.replace( 'ו', '' )
+        if vlWithoutV != vowellessLemma and len(vlWithoutV)>=3:
+            # print( f"Got {vlWithoutV=} from {vowellessLemma}" )
+            # print( f"  Adding {state.OETRefData['OTLemmasForRootDict'][vlWithoutV]} to lemma {ll_output_filename}" )
+            lemmaSet.update( state.OETRefData['OTLemmasForRootDict'][vlWithoutV] )
+        if 'י' in vowellessLemma and 'ו' in vowellessLemma:
+            vlWithoutYV = vowellessLemma.replace( 'י', '' ).replace( 'ו', '' )
+            if len(vlWithoutYV) >= 3:
+                # print( f"  Got {vlWithoutYV=} from {vowellessLemma}" )
+                # print( f"    Adding {state.OETRefData['OTLemmasForRootDict'][vlWithoutYV]} to lemma {ll_output_filename}" )
+                lemmaSet.update( state.OETRefData['OTLemmasForRootDict'][vlWithoutYV] )
+        if lemmaSet:
+            lemmasHtml = f'''{lemmasHtml}
+    <h1>Lemmas with some of the same root consonants as ‘{vowellessLemma}’ ({transliteratedVowellessLemma})</h1>'''
+            for similarRootLemma in sorted( lemmaSet ):
+                assert similarRootLemma != hebLemma
+                transliteratedSimilarRootLemma = transliterate_Hebrew( similarRootLemma )
+                # print( f"{similarRootLemma=} from {hebLemma=} {vowellessLemma=} count={len(lemmaSet)} {lemmaSet=}")
+                other_lemma_link = f'<a title="Go to lemma page" href="{transliteratedSimilarRootLemma}.htm#Top">{similarRootLemma}</a>'
+                # hebOtherLemmaWordRowsListA = state.OETRefData['OTLemmaRowNumbersDict'][similarRootLemma]
+                # print( f"{vowellessLemma=} count={len(lemmaSet)} {similarRootLemma=} {transliteratedSimilarRootLemma=} ({len(hebOtherLemmaWordRowsListA)}) {hebOtherLemmaWordRowsListA=}" )
+                # if hebOtherLemmaWordRowsListA: assert len(hebOtherLemmaWordRowsListA) == 1
+                rowNum = OTLemmaIndex.getLemmaId( similarRootLemma ) + 1
+                # print( f"    {rowNum=}" )
+                # if hebOtherLemmaWordRowsListA: assert rowNum == hebOtherLemmaWordRowsListA[0] - 1
+                hebOtherLemmaWordRowsListB = state.OETRefData['OTWordRowNumbersDict'][rowNum]
+                # print( f"    ({len(hebOtherLemmaWordRowsListB)}) {hebOtherLemmaWordRowsListB}" )
+                lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(other_lemma_link, hebOtherLemmaWordRowsListB)}"
+                # lemmasHtml = f"{lemmasHtml}\n{makeHebrewLemmaHTML(other_lemma_link, state.OETRefData['OTLemmaRowNumbersDict'][similarRootLemma])}"
+        assert '\\' not in lemmasHtml, f"{lemmasHtml=}"
+        assert not lemmasHtml.endswith('\n'), f"{lemmasHtml=}"
+
+    keyHtml = ''
+    if usedMorphologies: # Add a key at the bottom
+        for usedMorphology in sorted( usedMorphologies ):
+            try:
+                keyHtml = f"{keyHtml} <b>{usedMorphology}</b>={CNTR_MORPHOLOGY_NAME_DICT[usedMorphology.upper()]}"
+            except KeyError:
+                logging.warning( f"Missing {usedMorphology=}")
+        if keyHtml:
+            keyHtml = f'\n<p class="key" id="Key"><b>Key</b>:{keyHtml}</p>'
+
+    # Now put it all together
+    top = makeTop( level, None, 'lemma', None, state ) \
+                    .replace( '__TITLE__', f"Hebrew lemma ‘{hebLemma}’{' TEST' if state.TEST_MODE_FLAG else ''}" ) \
+                    .replace( '__KEYWORDS__', 'Bible, word' )
+    lemmasHtml = f'''{top}{lemmasHtml}{keyHtml}{makeBottom( level, None, 'lemma', state )}'''
+    assert checkHtml( 'HebrewLemmaPage', lemmasHtml )
+    filepath = outputFolderPath.joinpath( ll_output_filename )
+    assert not filepath.is_file(), f"{lemmaIndex} {hebLemma=} {transliteratedLemma=} {filepath=}" # Check that we're not overwriting anything
+    with open( filepath, 'wt', encoding='utf-8' ) as html_output_file:
+        html_output_file.write( lemmasHtml )
+    vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  Wrote {len(lemmasHtml):,} characters to {ll_output_filename}" )
+    return True
+# end of createOETReferencePages.create_Hebrew_lemma_page
+
+
+def tidyGlossOfGreekWord( engGloss:str ) -> str:
+    """
+    The gloss might be the OET-LV gloss,
+        or the original VLT gloss.
+    """
+        # .replace( '\\untr ', '<span class="untr">').replace( '\\untr*', '</span>') \
+        # .replace( '\\nd ', '<span class="nd">').replace( '\\nd*', '</span>') \
+        # .replace( '\\add ', '<span class="add">').replace( '\\add*', '</span>') \
+    assert '.' not in engGloss
+    assert '<span class="ul">' not in engGloss # already
+    assert '\\add -' not in engGloss
+    assert '\\add ¿' not in engGloss
+    # .replace( '\\add ¿', '<span class="unusedArticle">' )
+    result = ( engGloss
+        .replace( '\\add +', '<span class="addArticle">' )
+        .replace( '\\add =', '<span class="addCopula">' )
+        #.replace( '\\add <a title', '__PROTECT__' ) # Enable if required
+        .replace( '\\add <', '<span class="addDirectObject">' )
+        #.replace( '__PROTECT__', '\\add <a title' )
+        .replace( '\\add >', '<span class="addExtra">' )
+        .replace( '\\add &', '<span class="addOwner">' )
+        .replace( '\\add ', '<span class="add">').replace( '\\add*', '</span>')
+        .replace( '_', '<span class="ul">_</span>')
+        )
+    return result
+# end of createOETReferencePages.tidyGlossOfGreekWord
+
+
 GREEK_ROLE_TYPE_TABLE = {
     'noun': '<a title="Go to grammar page" href="../UGG/noun.htm#Top">noun</a>',
     'pronoun': '<a title="Go to grammar page" href="../UGG/pronoun.htm#Top">pronoun</a>',
@@ -2618,361 +2882,28 @@ def create_Greek_word_pages( level:int, outputFolderPath:Path, state:State ) ->
     try: os.makedirs( outputFolderPath )
     except FileExistsError: pass # it was already there
 
-    def tidyGlossOfGreekWord( engGloss:str ) -> str:
-        """
-        The gloss might be the OET-LV gloss,
-            or the original VLT gloss.
-        """
-            # .replace( '\\untr ', '<span class="untr">').replace( '\\untr*', '</span>') \
-            # .replace( '\\nd ', '<span class="nd">').replace( '\\nd*', '</span>') \
-            # .replace( '\\add ', '<span class="add">').replace( '\\add*', '</span>') \
-        assert '.' not in engGloss
-        assert '<span class="ul">' not in engGloss # already
-        assert '\\add -' not in engGloss
-        assert '\\add ¿' not in engGloss
-        # .replace( '\\add ¿', '<span class="unusedArticle">' )
-        result = ( engGloss
-            .replace( '\\add +', '<span class="addArticle">' )
-            .replace( '\\add =', '<span class="addCopula">' )
-            #.replace( '\\add <a title', '__PROTECT__' ) # Enable if required
-            .replace( '\\add <', '<span class="addDirectObject">' )
-            #.replace( '__PROTECT__', '\\add <a title' )
-            .replace( '\\add >', '<span class="addExtra">' )
-            .replace( '\\add &', '<span class="addOwner">' )
-            .replace( '\\add ', '<span class="add">').replace( '\\add*', '</span>')
-            .replace( '_', '<span class="ul">_</span>')
-            )
-        return result
-    # end of createOETReferencePages.tidyGlossOfGreekWord
-
-
     # Now make a page for each Greek word (including the variants not used in the translation)
     numWordPagesMade = 0
     wordLinksForIndex:list[str] = [] # Used below to make an index page
     state.OETRefData['usedGrkLemmas'], state.OETRefData['usedGrkStrongs'] = set(), set() # Used in next functions to make lemma and Strongs pages
-    for gg, columns_string in enumerate( state.OETRefData['word_tables'][GreekWordFileName][1:], start=1 ):
-        if gg % 40_000 == 0:
-            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      {numWordPagesMade+1:,} made out of {f'{gg:,} out of ' if gg!=numWordPagesMade+1 else ''}{len(state.OETRefData['word_tables'][GreekWordFileName])-1:,}…" )
-        if not columns_string: continue # a blank line (esp. at end)
-        # print( f"Word {n}: {columns_string}" )
-
-        usedRoleLetters, usedMorphologies = set(), set()
-
-        ref, greekWord, SRLemma, GrkLemma, VLTGlossWordsStr, OETGlossWordsStr, glossCaps, probability, extendedStrongs, roleLetter, morphology, tagsStr = columns_string.split( '\t' )
-
-        BBB, CVW = ref.split( '_', 1 )
+    wordJobs, wordLinks = [], []
+    for gg, wordFields in enumerate( state.OETRefData['word_tables'][GreekWordFileName].iterFields(), start=1 ):
+        if not wordFields[0]: continue # a blank line (esp. at end)
+        BBB = wordFields[0].split( '_', 1 )[0]
         if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG and BBB not in state.TEST_BOOK_LIST:
             continue # In some test modes, we only make the relevant word pages
-        C, VW = CVW.split( ':', 1 )
-        V, W = VW.split( 'w', 1 )
-        # ourTidyBBB = getOETTidyBBB( BBB, addNotes=True )
-        ourTidyBbb = getOETTidyBBB( BBB, titleCase=True )
-        ourTidyBbbWithNotes = getOETTidyBBB( BBB, titleCase=True, addNotes=True )
-        tidyBbbb = getOETTidyBBB( BBB, titleCase=True, allowFourChars=True )
-
         output_filename = getGreekWordpageFilename( gg, state )
-        # dPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Got '{columns_string}' for '{output_filename}'" )
         if DEBUGGING_THIS_MODULE or BibleOrgSysGlobals.debugFlag: # NOTE: this makes the function quite a bit slower
             # Check that we're not creating any duplicate filenames (that will then be overwritten)
             assert output_filename not in used_word_filenames, f"Greek {gg} {output_filename}"
             used_word_filenames.append( output_filename )
-        formattedOETGlossWords = formatNTSpansGlossWords( OETGlossWordsStr )
-        formattedVLTGlossWords = formatNTSpansGlossWords( VLTGlossWordsStr )
-        formattedContextGlossWords = formatNTContextSpansOETGlossWords( gg, state )
-        mainGlossWord = None
-        for someGlossWord in OETGlossWordsStr \
-                                .replace('\\add ','').replace('\\add*','') \
-                                .replace('\\sup ','').replace('\\sup*','') \
-                                .split( ' ' ):
-            # print( f"{someGlossWord=}" )
-            if '˱' not in someGlossWord and '˓' not in someGlossWord and '‹' not in someGlossWord: # We only want the main words not gloss helpers, etc.
-                assert not mainGlossWord, f"There should only be ONE {BBB} {C}:{V}w{W} {mainGlossWord=} {someGlossWord=} from {gg} {columns_string=}"
-                mainGlossWord = someGlossWord.split('/(')[0] # Throw away any Hebrew names #.replace('\\add_','\\add ')
-        if mainGlossWord and ('\\' in mainGlossWord or '/' in mainGlossWord):
-            if '\\' in mainGlossWord: print( f"{gg=} {mainGlossWord=} from {OETGlossWordsStr=}"); assert False, "We want to stop here"
-        if extendedStrongs == 'None': extendedStrongs = None
-        if roleLetter == 'None': roleLetter = None
-        if morphology == 'None': morphology = None
-
-        strongs = extendedStrongs[:-1] if extendedStrongs else None # drop the last digit
-        if strongs:
-            state.OETRefData['usedGrkStrongs'].add( getPositiveLeadingInt(strongs) ) # Used in next function to make Strongs pages
-
-        roleField = ''
-        if roleLetter:
-            roleName = CNTR_ROLE_NAME_DICT[roleLetter]
-            if roleName=='noun' and 'U' in glossCaps:
-                roleName = 'proper noun'
-            try: roleNameField = GREEK_ROLE_TYPE_TABLE[roleName]
-            except KeyError: roleNameField = roleName
-            roleField = f' Word role=<b>{roleNameField}</b>'
-            usedRoleLetters.add( roleLetter )
-
-        nominaSacraField = 'Marked with <b>Nomina Sacra</b>' if 'N' in glossCaps else ''
-
-        # probabilityField = f'<small>(P={probability}%)</small> ' if probability else ''
-
-        # morphologyField =
-        tidyRoleMorphology = tidyMorphology = moodField = tenseField = voiceField = personField = caseField = genderField = numberField = ''
-        if morphology:
-            # morphologyField = f' Morphology=<b>{morphology}</b>:' # Not currently used since we give all the following information instead
-            tidyMorphology = morphology[4:] if morphology.startswith('····') else morphology
-            tidyRoleMorphology = f'{roleLetter}-{tidyMorphology}'
-            assert len(morphology) == 7, f"Got {ref} '{greekWord}' morphology ({len(morphology)}) = '{morphology}'"
-            mood,tense,voice,person,case,gender,number = morphology
-            if mood!='·': moodField = f' mood=<b>{CNTR_MOOD_NAME_DICT[mood]}</b>'
-            if tense!='·': tenseField = f' tense=<b>{CNTR_TENSE_NAME_DICT[tense]}</b>'
-            if voice!='·': voiceField = f' voice=<b>{CNTR_VOICE_NAME_DICT[voice]}</b>'
-            if person!='·': personField = f' person=<b>{CNTR_PERSON_NAME_DICT[person]}</b>'
-            if case!='·': caseField = f' case=<b>{CNTR_CASE_NAME_DICT[case]}</b>'
-            if gender!='·': genderField = f' gender=<b>{CNTR_GENDER_NAME_DICT[gender]}</b>'
-            if number!='·': numberField = f' number=<b>{CNTR_NUMBER_NAME_DICT[number]}</b>' # or № ???
-            if tidyMorphology != '···': usedMorphologies.add( tidyMorphology )
-        else:
-            tidyRoleMorphology = roleLetter
-        translation = '<small>(no English gloss here)</small>' if not OETGlossWordsStr or OETGlossWordsStr=='-' else f'''‘{tidyGlossOfGreekWord(formattedContextGlossWords)}’'''
-        capsField = f' <small>(Caps={glossCaps})</small>' if glossCaps else ''
-
-        # Add pointers to people, locations, etc.
-        semanticExtras = nominaSacraField
-        if tagsStr:
-            for semanticTag in tagsStr.split( ';' ):
-                tagPrefix, tag = semanticTag[0], semanticTag[1:]
-                # print( f"{BBB} {C}:{V} '{semanticTag}' from {tagsStr=}" )
-                if tagPrefix == 'P':
-                    semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Person=<a title="View person details" href="../Per/{tag}.htm#Top">{tag}</a>'''
-                elif tagPrefix == 'L':
-                    semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Location=<a title="View place details" href="../Loc/{tag}.htm#Top">{tag}</a>'''
-                elif tagPrefix == 'Y':
-                    year = tag
-                    semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Year={year}{' AD' if int(year)>0 else ''}'''
-                elif tagPrefix == 'T':
-                    semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}TimeSeries={tag}'''
-                elif tagPrefix == 'E':
-                    semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Event={tag}'''
-                elif tagPrefix == 'G':
-                    semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Group={tag}'''
-                elif tagPrefix == 'F':
-                    semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Referred to from <a title="Go to referent word" href="{tag}.htm#Top">Word #{tag}</a>'''
-                elif tagPrefix == 'R':
-                    semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Refers to <a title="Go to referred word" href="{tag}.htm#Top">Word #{tag}</a>'''
-                else:
-                    logging.critical( f"Unknown '{tagPrefix}' word tag in {gg}: {columns_string}")
-                    unknownTag
-        state.OETRefData['usedGrkLemmas'].add( GrkLemma ) # Used in next function to make lemma pages
-        lemmaLink = f'<a title="View Greek root word" href="../GrkLem/{SRLemma}.htm#Top">{SRLemma}</a>'
-        lemmaGlossesList = sorted( state.OETRefData['NTLemmaOETGlossesDict'][SRLemma] )
-        numWordOETGlossesList = len( state.OETRefData['NTFormOETGlossesDict'][(greekWord,roleLetter,morphology)] )
-        wordOETGlossesList = sorted( state.OETRefData['NTFormOETGlossesDict'][(greekWord,roleLetter,morphology)] ) # Only used for comparison later with wordVLTGlossesList
-        wordOETGlossesStrList = [f'‘<b>{wordGloss}</b>’({state.OETRefData['NTFormOETGlossesCountDict'][(greekWord,roleLetter,morphology,wordGloss)]:,})'
-                        for wordGloss in sorted( state.OETRefData['NTFormOETGlossesDict'][(greekWord,roleLetter,morphology)], key=lambda wg: -state.OETRefData['NTFormOETGlossesCountDict'][(greekWord,roleLetter,morphology,wg)] ) ]
-        wordVLTGlossesList = sorted( state.OETRefData['NTFormVLTGlossesDict'][(greekWord,roleLetter,morphology)] )
-
-        prevN = nextN = None
-        if gg > 1:
-            if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG:
-                for nN in range( gg-1, 0, -1 ):
-                    nWordRef = state.OETRefData['word_tables'][GreekWordFileName][nN].split( '\t', 1 )[0]
-                    nBBB = nWordRef.split( '_', 1 )[0]
-                    if nBBB in state.TEST_BOOK_LIST:
-                        prevN = nN
-                        break
-            else: prevN = gg-1
-        if gg<len(state.OETRefData['word_tables'][GreekWordFileName])-1:
-            if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG:
-                for nN in range( gg+1, len(state.OETRefData['word_tables'][GreekWordFileName]) ):
-                    nWordRef = state.OETRefData['word_tables'][GreekWordFileName][nN].split( '\t', 1 )[0]
-                    nBBB = nWordRef.split( '_', 1 )[0]
-                    if nBBB in state.TEST_BOOK_LIST:
-                        nextN = nN
-                        break
-            else: nextN = gg+1
-        prevLink = f'<b><a title="Previous word" href="{getGreekWordpageFilename(prevN, state )}#Top">←</a></b> ' if prevN is not None else ''
-        nextLink = f' <b><a title="Next word" href="{getGreekWordpageFilename(nextN, state )}#Top">→</a></b>' if nextN else ''
-        oetLink = f''' <a title="View whole chapter" href="{'../'*level}OET/byC/{BBB}_C{C}.htm#C{C}">{ourTidyBbbWithNotes}{NARROW_NON_BREAK_SPACE}{C}</a>'''
-        parallelLink = f''' <b><a title="View verse in many parallel versions" href="{'../'*level}par/{BBB}/C{C}V{V}.htm#Top">║</a></b>'''
-        interlinearLink = f''' <b><a title="View interlinear verse word-by-word" href="{'../'*level}ilr/{BBB}/C{C}V{V}.htm#Top">═</a></b>''' if BBB in state.booksToLoad['OET'] else ''
-#  Strongs=<a title="Goes to Strongs dictionary" href="https://BibleHub.com/greek/{strongs}.htm">{extendedStrongs}</a> Lemma=<b>{lemmaLink}</b>
-        wordsHtml = f'''{'' if probability else '<div class="unusedWord">'}<h2>Open English Translation (OET)</h2>\n<h1 id="Top">Koine Greek wordlink #{gg}{'' if probability else ' <small>(Unused Greek word variant)</small>'}</h1>
-<p class="pgNav">{prevLink}{f'<b>{greekWord}</b>' if greekWord else '<small>(blank)</small>'} <a title="Go to Greek word index" href="index.htm">⌂</a>{nextLink}{oetLink}{parallelLink}{interlinearLink}</p>
-<p class="btnBar"><button type="button" id="wordsButton" title="Hide/Show word lines" onclick="hide_show_words()">Hide words</button> <button type="button" id="versesButton" title="Hide/Show verse lines" onclick="hide_show_verses()">Hide verses</button> <button type="button" id="coloursButton" title="Hide/Show verse colours" onclick="hide_show_colours()">Hide verse colours</button></p>
-<p class="link"><a title="Go to Statistical Restoration Greek page" href="https://GreekCNTR.org/collation/?v={CNTR_BOOK_ID_MAP[BBB]}{C.zfill(3)}{V.zfill(3)}">SR GNT {tidyBbbb} {C}:{V}</a>
- {f'<b>{greekWord}</b>' if greekWord else '<small>(blank)</small>'} ({transliterate_Greek(greekWord)}) {translation}{capsField if state.TEST_MODE_FLAG else ''}
- Strongs={f'<a title="Goes to Strongs dictionary" href="{'../'*level}ref/GrkStrng/G{strongs}.htm#Top">{extendedStrongs}</a>' if extendedStrongs else '<small>(none)</small>'} Lemma=<b>{lemmaLink}</b>
-<br> {roleField}{moodField}{tenseField}{voiceField}{personField}{caseField}{genderField}{numberField}{f'{NEWLINE}<br>  {semanticExtras}' if semanticExtras else ''}</p>
-<p class="note"><small>Note: With the help of a companion website, these word pages enable you to click through all the way back to photographs of the original manuscripts that the <em>Open English Translation</em> New Testament is translated from.
-If you go to the <em>Statistical Restoration</em> Greek page (by clicking on the SR Bible reference above), from there you can click on the original manuscript numbers (e.g., 𝔓1, 01, 02, etc.) in the <i>Witness</i> column there, to see their transcription of the original Greek page.
-From there, you can click on the 🔍 magnifying glass icon to view a photograph of the actual leaf of the codex.
-This is all part of the commitment of the <em>Open English Translation</em> team to be transparent about all levels of the Bible translation process right back to the original manuscripts.</small></p>{'' if probability else f'{NEWLINE}</div><!--unusedWord-->'}'''
-        assert '\\' not in wordsHtml, f"{wordsHtml=}"
-
-        if probability: # Now list all the other places where this same Greek word is used
-            # other_count = 0
-            if numWordOETGlossesList > 1:
-                wordOETGlossesStr = tidyGlossOfGreekWord( ', '.join( wordOETGlossesStrList ) )
-            thisWordNumberList = state.OETRefData['NTFormUsageDict'][(greekWord,roleLetter,morphology)]
-            if len(thisWordNumberList) > 100: # too many to list
-                maxWordsToShow = 50
-                wordsHtml = f'{wordsHtml}\n<h2>Showing the first {maxWordsToShow} out of {len(thisWordNumberList)-1:,} uses of identical word form {greekWord} <small>({tidyRoleMorphology})</small> in the Greek originals</h2>'
-                if numWordOETGlossesList > 1:
-                    wordsHtml = f'''{wordsHtml}\n<p class="summary">The word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> has {numWordOETGlossesList:,} different glosses: {wordOETGlossesStr}.</p>'''
-                    if wordVLTGlossesList != wordOETGlossesList:
-                        wordsHtml = f'''{wordsHtml}\n<p class="summary"><small>(In <span title="the forthcoming Verified Literal Translation">the VLT</span>, the word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> has {len(wordVLTGlossesList):,} different glosses: ‘<b>{"</b>’, ‘<b>".join(wordVLTGlossesList)}</b>’)</small>.</p>'''
-                else:
-                    assert wordOETGlossesList == [OETGlossWordsStr], f"{wordOETGlossesList}  vs {[OETGlossWordsStr]}"
-                    wordsHtml = f'{wordsHtml}\n<p class="summary">The word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> is always and only glossed as ‘<b>{OETGlossWordsStr}</b>’.</p>'
-                    if VLTGlossWordsStr != OETGlossWordsStr:
-                        wordsHtml = f'{wordsHtml}\n<p class="summary"><small>(In <span title="the forthcoming Verified Literal Translation">the VLT</span>, the word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> was always and only glossed as ‘<b>{VLTGlossWordsStr}</b>’)</small>.</p>'
-            else: # we can list all uses of the word
-                maxWordsToShow = 100
-                if len(thisWordNumberList) == 1:
-                    wordsHtml = f'{wordsHtml}\n<h2>Only use of identical word form {greekWord} <small>({tidyRoleMorphology})</small> in the Greek originals</h2>'
-                    # grkLemmaWordRowsList = state.OETRefData['NTLemmaDict'][lemma]
-                    # lemmaFormsList = sorted( state.OETRefData['NTLemmaFormsDict'][lemma] )
-                    # if len(grkLemmaWordRowsList) == 1:
-                    #     # print( f"{ref} '{greek}' ({glossWords}) {lemma=} {grkLemmaWordRowsList=} {grkLmmaFormsList=} {lemmaGlossesList=}" )
-                    #     assert len(lemmaFormsList) == 1
-                    #     assert len(lemmaGlossesList) == 1
-                    #     html = f'''{html.replace(lemmaLink, f'{lemmaLink}<sup>*</sup>')}\n<p class="note"><sup>*</sup>Note: This is also the only occurrence of the word root <small>(lemma)</small> '{lemma}' in the Greek originals.</p>'''
-                else:
-                    wordsHtml = f'{wordsHtml}\n<h2>Other uses ({len(thisWordNumberList)-1:,}) of identical word form {greekWord} <small>({tidyRoleMorphology})</small> in the Greek originals</h2>'
-                if numWordOETGlossesList > 1:
-                    wordsHtml = f'''{wordsHtml}\n<p class="summary">The word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> has {numWordOETGlossesList:,} different glosses: {wordOETGlossesStr}.</p>'''
-                    if wordVLTGlossesList != wordOETGlossesList:
-                        wordsHtml = f'''{wordsHtml}\n<p class="summary"><small>(In <span title="the forthcoming Verified Literal Translation">the VLT</span>, the word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> has {len(wordVLTGlossesList):,} different glosses: ‘<b>{"</b>’, ‘<b>".join(wordVLTGlossesList)}</b>’)</small>.</p>'''
-                else:
-                    assert wordOETGlossesList == [formattedOETGlossWords], f"{gg} {BBB} {C}:{V} {greekWord=} {roleLetter=} {morphology=}: {wordOETGlossesList}  vs {[formattedOETGlossWords]}"
-                    wordsHtml = f'{wordsHtml}\n<p class="summary">The word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> is always and only glossed as ‘<b>{tidyGlossOfGreekWord(formattedOETGlossWords)}</b>’.</p>'
-                    if formattedVLTGlossWords != formattedOETGlossWords:
-                        wordsHtml = f'{wordsHtml}\n<p class="summary"><small>(In <span title="the forthcoming Verified Literal Translation">the VLT</span>, the word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> was always and only glossed as ‘<b>{formattedVLTGlossWords}</b>’)</small>.</p>'
-            displayCounter = 0 # Don't use enumerate on the next line, because there is a condition inside the loop
-            for oN in thisWordNumberList:
-                # if oN==gg: continue # don't duplicate the word we're making the page for
-                oWordRef, _oGreekWord, _oSRLemma, _oGrkLemma, _oVLTGlossWords, oOETGlossWords, _oGlossCaps,_oProbability, _oExtendedStrongs, _oRoleLetter, _oMorphology, _oTagsStr = state.OETRefData['word_tables'][GreekWordFileName][oN].split( '\t' )
-                oFormattedContextGlossWords = formatNTContextSpansOETGlossWords( oN, state )
-                oBBB, oCVW = oWordRef.split( '_', 1 )
-                oC, oVW = oCVW.split( ':', 1 )
-                oV, oW = oVW.split( 'w', 1 )
-                oTidyBBB = getOETTidyBBB( oBBB )
-                oTidyBBBwithNotes = getOETTidyBBB( oBBB, addNotes=True )
-                oTidyBbbb = getOETTidyBBB( oBBB, titleCase=True, allowFourChars=True )
-                oTidyBbbbWithNotes = getOETTidyBBB( oBBB, titleCase=True, allowFourChars=True, addNotes=True )
-                # if other_count == 0:
-                translation = '<small>(no English gloss here)</small>' if oOETGlossWords=='-' else f'''‘{tidyGlossOfGreekWord(oFormattedContextGlossWords)}’'''
-                oOET_LV_verse_HTML = oOET_RV_verse_HTML = None
-                if not state.TEST_MODE_FLAG or oBBB in state.preloadedBibles['OET-RV']:
-                    oOET_LV_verse_HTML = get_OET_LV_verse_HTML( level, oBBB, oC, oV )
-                    oOET_RV_verse_HTML = get_OET_RV_verse_HTML( level, oBBB, oC, oV )
-                wordsHtml = f'''{wordsHtml}\n<p class="wordLine"><a title="View OET {oTidyBBB} text" href="{'../'*level}OET/byC/{oBBB}_C{oC}.htm#C{oC}V{oV}">{oTidyBbbbWithNotes} {oC}:{oV}</a>''' \
-f''' {translation} <a title="Go to Statistical Restoration Greek page" href="https://GreekCNTR.org/collation/?v={CNTR_BOOK_ID_MAP[oBBB]}{oC.zfill(3)}{oV.zfill(3)}">SR GNT {oTidyBbbbWithNotes} {oC}:{oV} word {oW}</a></p>{f'\n{oOET_LV_verse_HTML}' if oOET_LV_verse_HTML else ''}{f'\n{oOET_RV_verse_HTML}' if oOET_RV_verse_HTML else ''}''' \
-                    if not state.TEST_MODE_FLAG or oBBB in state.preloadedBibles['OET-RV'] else \
-                    f'''{wordsHtml}\n<p class="wordLine">{oTidyBbbbWithNotes} {oC}:{oV}''' \
-f''' {translation} <a title="Go to Statistical Restoration Greek page" href="https://GreekCNTR.org/collation/?v={CNTR_BOOK_ID_MAP[oBBB]}{oC.zfill(3)}{oV.zfill(3)}">SR GNT {oTidyBbbbWithNotes} {oC}:{oV} word {oW}</a></p>{f'\n{oOET_LV_verse_HTML}' if oOET_LV_verse_HTML else ''}{f'\n{oOET_RV_verse_HTML}' if oOET_RV_verse_HTML else ''}'''
-                # other_count += 1
-                # if other_count >= 120:
-                #     html = f'{html}\n<p class="summary">({len(thisWordNumberList)-other_count-1:,} more examples not listed)</p>'
-                #     break
-                displayCounter += 1
-                if displayCounter >= maxWordsToShow: break
-            if len(lemmaGlossesList) > numWordOETGlossesList:
-                wordsHtml = f'''{wordsHtml}\n<p class="lemmaGlossesSummary">The various word forms of the root word (lemma) ‘{lemmaLink}’ {f"""have {len(lemmaGlossesList):,} different glosses: ‘<b>{tidyGlossOfGreekWord("</b>’, ‘<b>".join(lemmaGlossesList))}</b>’""" if len(lemmaGlossesList)>1 else f"have only one gloss: ‘<b>{tidyGlossOfGreekWord(lemmaGlossesList[0])}</b>’"}.</p>'''
-            elif len(thisWordNumberList) == 1:
-                grkLemmaWordRowsList = state.OETRefData['NTLemmaDict'][SRLemma]
-                grkLemmaFormsList = state.OETRefData['NTLemmaFormsDict'][SRLemma]
-                if len(grkLemmaWordRowsList) == 1:
-                    # print( f"{ref} '{greek}' ({glossWords}) {lemma=} {grkLemmaWordRowsList=} {grkLemmaFormsList=} {lemmaGlossesList=}" )
-                    assert len(grkLemmaFormsList) == 1
-                    assert len(lemmaGlossesList) == 1
-                    wordsHtml = f'''{wordsHtml.replace(lemmaLink, f'{lemmaLink}<sup>*</sup>', 1)}\n<p class="note"><sup>*</sup>Note: This is also the only occurrence of the word root <small>(lemma)</small> ‘{SRLemma}’ in the Greek originals.</p>'''
-
-            if mainGlossWord not in COMMON_ENGLISH_WORDS_LIST: # Ignore the most common words
-                # List other words that are glossed similarly
-                try:
-                    similarWords = (mainGlossWord,) + SIMILAR_GLOSS_WORDS_DICT[mainGlossWord]
-                    # print( f"      {mainGlossWord=} {similarWords=}")
-                except KeyError: similarWords = (mainGlossWord,)
-                extraHTMLList = []
-                extraWordSet, extraLemmaSet = set(), set()
-                for similarWord in similarWords:
-                    nList = state.OETRefData['OETNTGlossWordDict'][similarWord]
-                    # print( f'''    {n} {ref} {greekWord} '{mainGlossWord}' {f'{similarWord=} ' if similarWord!=mainGlossWord else ''}({len(nList)}) {nlist[:8]=}{'…' if len(nList)>8 else ''}''' )
-                    if len(nList) > 1:
-                        if similarWord==mainGlossWord: assert gg in nList
-                        if len(nList)>400:
-                            dPrint( 'Info', DEBUGGING_THIS_MODULE, f"create_Greek_word_pages has EXCESSIVE {len(nList):,} entries for '{mainGlossWord}' from {similarWord=}")
-                        for thisN in nList:
-                            # if thisN == gg: continue # That's the current word row
-                            eWordRef, eGreekWord, eSRLemma, _eGrkLemma, _eVLTGlossWordsStr, _eOETGlossWordsStr, _eGlossCaps, _eProbability, _eExtendedStrongs, eRoleLetter, eMorphology, _eTagsStr = state.OETRefData['word_tables'][GreekWordFileName][thisN].split( '\t' )
-                            if eRoleLetter == 'None': eRoleLetter = None
-                            if eMorphology == 'None': eMorphology = None
-                            if eGreekWord!=greekWord or eRoleLetter!=roleLetter or eMorphology!=morphology:
-                                eBBB, eCVW = eWordRef.split( '_', 1 )
-                                eC, eVW = eCVW.split( ':', 1 )
-                                eV, eW = eVW.split( 'w', 1 )
-                                eTidyBBB = getOETTidyBBB( eBBB )
-                                eTidyBbbb = getOETTidyBBB( eBBB, titleCase=True, allowFourChars=True )
-
-                                eGreekPossibleLink = f'<a title="Go to word page" href="../GrkWrd/{getGreekWordpageFilename(thisN, state )}#Top">{eGreekWord}</a>' if not state.TEST_MODE_FLAG or state.ALL_TEST_REFERENCE_PAGES_FLAG or eBBB in state.TEST_BOOK_LIST else eGreekWord
-                                eLemmaLink = f'<a title="View Greek root word" href="../GrkLem/{eSRLemma}.htm#Top">{eSRLemma}</a>' if eSRLemma!=SRLemma else ''
-                                eFormattedContextGlossWords = tidyGlossOfGreekWord( formatNTContextSpansOETGlossWords( thisN, state ) )
-                                assert '\\' not in eFormattedContextGlossWords, f"{gg=} {eFormattedContextGlossWords=}"
-                                eTidyRoleMorphology = eTidyMorphology = '' #= eMoodField = eTenseField = eVoiceField = ePersonField = eCaseField = eGenderField = eNumberField = ''
-                                if eMorphology:
-                                    assert len(eMorphology) == 7, f"Got {eWordRef} '{eGreekWord}' morphology ({len(eMorphology)}) = '{eMorphology}'"
-                                    eTidyMorphology = eMorphology[4:] if eMorphology.startswith('····') else eMorphology
-                                    eTidyRoleMorphology = f'{eRoleLetter}-{eTidyMorphology}'
-                                    usedRoleLetters.add( eRoleLetter )
-                                    if eTidyMorphology != '···': usedMorphologies.add( eTidyMorphology )
-                                else:
-                                    eTidyRoleMorphology = eRoleLetter
-                                eOET_LV_verse_HTML = eOET_RV_verse_HTML = None
-                                if not state.TEST_MODE_FLAG or eBBB in state.preloadedBibles['OET-RV']:
-                                    eOET_LV_verse_HTML = get_OET_LV_verse_HTML( level, eBBB, eC, eV )
-                                    eOET_RV_verse_HTML = get_OET_RV_verse_HTML( level, eBBB, eC, eV )
-                                extraHTMLList.append( f'''<p class="wordLine"><a title="View OET {eTidyBBB} text" href="{'../'*level}OET/byC/{eBBB}_C{eC}.htm#C{eC}V{eV}">{eTidyBBB} {eC}:{eV}</a>'''
-f''' <b>{eGreekPossibleLink}</b> ({transliterate_Greek(eGreekWord)}) <small>{eTidyRoleMorphology}</small>{f' Lemma={eLemmaLink}' if eLemmaLink else ''}'''
-f''' ‘{eFormattedContextGlossWords}’'''
-f''' <a title="Go to Statistical Restoration Greek page" href="https://GreekCNTR.org/collation/?v={CNTR_BOOK_ID_MAP[eBBB]}{eC.zfill(3)}{eV.zfill(3)}">SR GNT {eTidyBbbb} {eC}:{eV} word {eW}</a></p>{f'\n{eOET_LV_verse_HTML}' if eOET_LV_verse_HTML else ''}{f'\n{eOET_RV_verse_HTML}' if eOET_RV_verse_HTML else ''}'''
-                                    if not state.TEST_MODE_FLAG or eBBB in state.preloadedBibles['OET-RV'] else
-                                        f'''<p class="wordLine">{eTidyBBB} {eC}:{eV} ‘{eGreekPossibleLink}’ <small>({eTidyRoleMorphology})</small>{f' Lemma={eLemmaLink}' if eLemmaLink else ''}''' \
-f''' ‘{eFormattedContextGlossWords}’''' \
-f''' <a title="Go to Statistical Restoration Greek page" href="https://GreekCNTR.org/collation/?v={CNTR_BOOK_ID_MAP[eBBB]}{eC.zfill(3)}{eV.zfill(3)}">SR GNT {eTidyBbbb} {eC}:{eV} word {eW}</a></p>{f'\n{eOET_LV_verse_HTML}' if eOET_LV_verse_HTML else ''}{f'\n{eOET_RV_verse_HTML}' if eOET_RV_verse_HTML else ''}''' )
-                                extraWordSet.add( eGreekPossibleLink )
-                                extraLemmaSet.add( eLemmaLink if eLemmaLink else lemmaLink )
-                if extraHTMLList:
-                    wordsHtml = f'''{wordsHtml}\n<h2 class="otherGreek">Greek words ({len(extraHTMLList):,}) other than {greekWord} <small>({tidyRoleMorphology})</small> with a gloss related to ‘{mainGlossWord}’</h2>'''
-                    if len(extraHTMLList) > 10:
-                        wordsHtml = f'''{wordsHtml}\n<p class="summary">Have {len(extraWordSet):,} other words{f" ({', '.join(extraWordSet)})" if len(extraWordSet)<30 else ''} with {len(extraLemmaSet):,} lemma{'' if len(extraLemmaSet)==1 else 's'} altogether ({', '.join(sorted(extraLemmaSet))})</p>'''
-                    wordsHtml = f'''{wordsHtml}\n{NEWLINE.join(extraHTMLList)}'''
-        assert '\\' not in wordsHtml, f"{wordsHtml=}"
-        assert '</span>C1.htm' not in wordsHtml, f"{wordsHtml=}"
-
-        keyHtml = ''
-        if usedRoleLetters or usedMorphologies: # Add a key at the bottom
-            for usedRoleLetter in sorted( usedRoleLetters ):
-                keyHtml = f'{keyHtml} <b>{usedRoleLetter}</b>={CNTR_ROLE_NAME_DICT[usedRoleLetter]}'
-            for usedMorphology in sorted( usedMorphologies ):
-                try:
-                    keyHtml = f"{keyHtml} <b>{usedMorphology}</b>={CNTR_MORPHOLOGY_NAME_DICT[usedMorphology.upper()]}"
-                except KeyError:
-                    logging.warning( f"create_Greek_word_pages: Missing {usedMorphology=}")
-            if keyHtml:
-                keyHtml = f'\n<p class="key" id="Key"><b>Key</b>:{keyHtml}</p>'
-
-        # Now put it all together
-        top = makeTop( level, None, 'word', None, state ) \
-                        .replace( '__TITLE__', f"Greek word ‘{greekWord}’{' TEST' if state.TEST_MODE_FLAG else ''}" ) \
-                        .replace( '__KEYWORDS__', 'Bible, word' ) \
-                        .replace( 'par/"', f'par/{BBB}/C{C}V{V}.htm#Top"' )
-        wordsHtml = f'''{top}{wordsHtml}{keyHtml}{makeBottom( level, None, 'word', state )}'''
-        assert checkHtml( 'GreekWordPage', wordsHtml )
-        filepath = outputFolderPath.joinpath( output_filename )
-        assert not filepath.is_file(), f"{filepath=}" # Check that we're not overwriting anything
-        with open( filepath, 'wt', encoding='utf-8' ) as html_output_file:
-            html_output_file.write( wordsHtml )
-        vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"      Wrote {len(wordsHtml):,} characters to {output_filename}" )
-        wordLinksForIndex.append( f'<a href="{output_filename}">{greekWord}</a>')
-        numWordPagesMade += 1
+        wordJobs.append( (level, gg, wordFields, outputFolderPath, output_filename) )
+        wordLinks.append( f'<a href="{output_filename}">{wordFields[1]}</a>' )
+    get_Greek_morphology_table( state ) # Made before forking so that the workers all share it
+    for jj, made in enumerate( _create_word_pages( 'Greek word', create_Greek_word_page, wordJobs, ('usedGrkLemmas','usedGrkStrongs'), state ) ):
+        if made:
+            wordLinksForIndex.append( wordLinks[jj] )
+            numWordPagesMade += 1
     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f'''    Created {numWordPagesMade:,}{f"/{len(state.OETRefData['word_tables'][GreekWordFileName])-1:,}" if numWordPagesMade < len(state.OETRefData['word_tables'][GreekWordFileName])-1 else ''} Greek word pages (using {len(state.OETRefData['usedGrkLemmas']):,} Greek lemmas).''' )
 
     # Create index page for this folder
@@ -3031,6 +2962,348 @@ f''' <a title="Go to Statistical Restoration Greek page" href="https://GreekCN
 # end of createOETReferencePages.create_Greek_word_pages
 
 
+def create_Greek_word_page( level:int, gg:int, wordFields:tuple[str,...], outputFolderPath:Path, word_output_filename:str, state:State ) -> bool:
+    """
+    Make the page for the Greek word in row gg of the word table.
+
+    Only changes state.OETRefData['usedGrkLemmas'] and ['usedGrkStrongs'] (so it can be run in forked worker processes).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"create_Greek_word_page( {level}, {gg}, ..., {word_output_filename} ... )" )
+
+    usedRoleLetters, usedMorphologies = set(), set()
+
+    ref, greekWord, SRLemma, GrkLemma, VLTGlossWordsStr, OETGlossWordsStr, glossCaps, probability, extendedStrongs, roleLetter, morphology, tagsStr = wordFields
+
+    BBB, CVW = ref.split( '_', 1 )
+    C, VW = CVW.split( ':', 1 )
+    V, W = VW.split( 'w', 1 )
+    # ourTidyBBB = getOETTidyBBB( BBB, addNotes=True )
+    ourTidyBbb = getOETTidyBBB( BBB, titleCase=True )
+    ourTidyBbbWithNotes = getOETTidyBBB( BBB, titleCase=True, addNotes=True )
+    tidyBbbb = getOETTidyBBB( BBB, titleCase=True, allowFourChars=True )
+
+    formattedOETGlossWords = formatNTSpansGlossWords( OETGlossWordsStr )
+    formattedVLTGlossWords = formatNTSpansGlossWords( VLTGlossWordsStr )
+    formattedContextGlossWords = formatNTContextSpansOETGlossWords( gg, state )
+    mainGlossWord = None
+    for someGlossWord in OETGlossWordsStr \
+                            .replace('\\add ','').replace('\\add*','') \
+                            .replace('\\sup ','').replace('\\sup*','') \
+                            .split( ' ' ):
+        # print( f"{someGlossWord=}" )
+        if '˱' not in someGlossWord and '˓' not in someGlossWord and '‹' not in someGlossWord: # We only want the main words not gloss helpers, etc.
+            assert not mainGlossWord, f"There should only be ONE {BBB} {C}:{V}w{W} {mainGlossWord=} {someGlossWord=} from {gg} {wordFields=}"
+            mainGlossWord = someGlossWord.split('/(')[0] # Throw away any Hebrew names #.replace('\\add_','\\add ')
+    if mainGlossWord and ('\\' in mainGlossWord or '/' in mainGlossWord):
+        if '\\' in mainGlossWord: print( f"{gg=} {mainGlossWord=} from {OETGlossWordsStr=}"); assert False, "We want to stop here"
+    if extendedStrongs == 'None': extendedStrongs = None
+    if roleLetter == 'None': roleLetter = None
+    if morphology == 'None': morphology = None
+
+    strongs = extendedStrongs[:-1] if extendedStrongs else None # drop the last digit
+    if strongs:
+        state.OETRefData['usedGrkStrongs'].add( getPositiveLeadingInt(strongs) ) # Used in next function to make Strongs pages
+
+    # The role and morphology fields are only decoded once for each different code (in the morphology table)
+    _roleName, roleField, morphologyFields, tidyMorphology, tidyRoleMorphology, _morphologyText = get_Greek_morphology_table( state ).getDecode( wordFields[9], wordFields[10], glossCaps )
+    if roleLetter:
+        usedRoleLetters.add( roleLetter )
+
+    nominaSacraField = 'Marked with <b>Nomina Sacra</b>' if 'N' in glossCaps else ''
+
+    # probabilityField = f'<small>(P={probability}%)</small> ' if probability else ''
+
+    if morphology and tidyMorphology != '···': usedMorphologies.add( tidyMorphology )
+    translation = '<small>(no English gloss here)</small>' if not OETGlossWordsStr or OETGlossWordsStr=='-' else f'''‘{tidyGlossOfGreekWord(formattedContextGlossWords)}’'''
+    capsField = f' <small>(Caps={glossCaps})</small>' if glossCaps else ''
+
+    # Add pointers to people, locations, etc.
+    semanticExtras = nominaSacraField
+    if tagsStr:
+        for semanticTag in tagsStr.split( ';' ):
+            tagPrefix, tag = semanticTag[0], semanticTag[1:]
+            # print( f"{BBB} {C}:{V} '{semanticTag}' from {tagsStr=}" )
+            if tagPrefix == 'P':
+                semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Person=<a title="View person details" href="../Per/{tag}.htm#Top">{tag}</a>'''
+            elif tagPrefix == 'L':
+                semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Location=<a title="View place details" href="../Loc/{tag}.htm#Top">{tag}</a>'''
+            elif tagPrefix == 'Y':
+                year = tag
+                semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Year={year}{' AD' if int(year)>0 else ''}'''
+            elif tagPrefix == 'T':
+                semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}TimeSeries={tag}'''
+            elif tagPrefix == 'E':
+                semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Event={tag}'''
+            elif tagPrefix == 'G':
+                semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Group={tag}'''
+            elif tagPrefix == 'F':
+                semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Referred to from <a title="Go to referent word" href="{tag}.htm#Top">Word #{tag}</a>'''
+            elif tagPrefix == 'R':
+                semanticExtras = f'''{semanticExtras}{' ' if semanticExtras else ''}Refers to <a title="Go to referred word" href="{tag}.htm#Top">Word #{tag}</a>'''
+            else:
+                logging.critical( f"Unknown '{tagPrefix}' word tag in {gg}: {wordFields}")
+                unknownTag
+    state.OETRefData['usedGrkLemmas'].add( GrkLemma ) # Used in next function to make lemma pages
+    lemmaLink = f'<a title="View Greek root word" href="../GrkLem/{SRLemma}.htm#Top">{SRLemma}</a>'
+    lemmaGlossesList = sorted( state.OETRefData['NTLemmaOETGlossesDict'][SRLemma] )
+    numWordOETGlossesList = len( state.OETRefData['NTFormOETGlossesDict'][(greekWord,roleLetter,morphology)] )
+    wordOETGlossesList = sorted( state.OETRefData['NTFormOETGlossesDict'][(greekWord,roleLetter,morphology)] ) # Only used for comparison later with wordVLTGlossesList
+    wordOETGlossesStrList = [f'‘<b>{wordGloss}</b>’({state.OETRefData['NTFormOETGlossesCountDict'][(greekWord,roleLetter,morphology,wordGloss)]:,})'
+                    for wordGloss in sorted( state.OETRefData['NTFormOETGlossesDict'][(greekWord,roleLetter,morphology)], key=lambda wg: -state.OETRefData['NTFormOETGlossesCountDict'][(greekWord,roleLetter,morphology,wg)] ) ]
+    wordVLTGlossesList = sorted( state.OETRefData['NTFormVLTGlossesDict'][(greekWord,roleLetter,morphology)] )
+
+    prevN = nextN = None
+    if gg > 1:
+        if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG:
+            for nN in range( gg-1, 0, -1 ):
+                nWordRef = state.OETRefData['word_tables'][GreekWordFileName].getField( nN, 'Ref' )
+                nBBB = nWordRef.split( '_', 1 )[0]
+                if nBBB in state.TEST_BOOK_LIST:
+                    prevN = nN
+                    break
+        else: prevN = gg-1
+    if gg<len(state.OETRefData['word_tables'][GreekWordFileName])-1:
+        if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG:
+            for nN in range( gg+1, len(state.OETRefData['word_tables'][GreekWordFileName]) ):
+                nWordRef = state.OETRefData['word_tables'][GreekWordFileName].getField( nN, 'Ref' )
+                nBBB = nWordRef.split( '_', 1 )[0]
+                if nBBB in state.TEST_BOOK_LIST:
+                    nextN = nN
+                    break
+        else: nextN = gg+1
+    prevLink = f'<b><a title="Previous word" href="{getGreekWordpageFilename(prevN, state )}#Top">←</a></b> ' if prevN is not None else ''
+    nextLink = f' <b><a title="Next word" href="{getGreekWordpageFilename(nextN, state )}#Top">→</a></b>' if nextN else ''
+    oetLink = f''' <a title="View whole chapter" href="{'../'*level}OET/byC/{BBB}_C{C}.htm#C{C}">{ourTidyBbbWithNotes}{NARROW_NON_BREAK_SPACE}{C}</a>'''
+    parallelLink = f''' <b><a title="View verse in many parallel versions" href="{'../'*level}par/{BBB}/C{C}V{V}.htm#Top">║</a></b>'''
+    interlinearLink = f''' <b><a title="View interlinear verse word-by-word" href="{'../'*level}ilr/{BBB}/C{C}V{V}.htm#Top">═</a></b>''' if BBB in state.booksToLoad['OET'] else ''
+#  Strongs=<a title="Goes to Strongs dictionary" href="https://BibleHub.com/greek/{strongs}.htm">{extendedStrongs}</a> Lemma=<b>{lemmaLink}</b>
+    wordsHtml = f'''{'' if probability else '<div class="unusedWord">'}<h2>Open English Translation (OET)</h2>\n<h1 id="Top">Koine Greek wordlink #{gg}{'' if probability else ' <small>(Unused Greek word variant)</small>'}</h1>
+<p class="pgNav">{prevLink}{f'<b>{greekWord}</b>' if greekWord else '<small>(blank)</small>'} <a title="Go to Greek word index" href="index.htm">⌂</a>{nextLink}{oetLink}{parallelLink}{interlinearLink}</p>
+<p class="btnBar"><button type="button" id="wordsButton" title="Hide/Show word lines" onclick="hide_show_words()">Hide words</button> <button type="button" id="versesButton" title="Hide/Show verse lines" onclick="hide_show_verses()">Hide verses</button> <button type="button" id="coloursButton" title="Hide/Show verse colours" onclick="hide_show_colours()">Hide verse colours</button></p>
+<p class="link"><a title="Go to Statistical Restoration Greek page" href="https://GreekCNTR.org/collation/?v={CNTR_BOOK_ID_MAP[BBB]}{C.zfill(3)}{V.zfill(3)}">SR GNT {tidyBbbb} {C}:{V}</a>
+ {f'<b>{greekWord}</b>' if greekWord else '<small>(blank)</small>'} ({transliterate_Greek(greekWord)}) {translation}{capsField if state.TEST_MODE_FLAG else ''}
+ Strongs={f'<a title="Goes to Strongs dictionary" href="{'../'*level}ref/GrkStrng/G{strongs}.htm#Top">{extendedStrongs}</a>' if extendedStrongs else '<small>(none)</small>'} Lemma=<b>{lemmaLink}</b>
+<br> {roleField}{morphologyFields}{f'{NEWLINE}<br>  {semanticExtras}' if semanticExtras else ''}</p>
+<p class="note"><small>Note: With the help of a companion website, these word pages enable you to click through all the way back to photographs of the original manuscripts that the <em>Open English Translation</em> New Testament is translated from.
+If you go to the <em>Statistical Restoration</em> Greek page (by clicking on the SR Bible reference above), from there you can click on the original manuscript numbers (e.g., 𝔓1, 01, 02, etc.) in the <i>Witness</i> column there, to see their transcription of the original Greek page.
+From there, you can click on the 🔍 magnifying glass icon to view a photograph of the actual leaf of the codex.
+This is all part of the commitment of the <em>Open English Translation</em> team to be transparent about all levels of the Bible translation process right back to the original manuscripts.</small></p>{'' if probability else f'{NEWLINE}</div><!--unusedWord-->'}'''
+    assert '\\' not in wordsHtml, f"{wordsHtml=}"
+
+    if probability: # Now list all the other places where this same Greek word is used
+        # other_count = 0
+        if numWordOETGlossesList > 1:
+            wordOETGlossesStr = tidyGlossOfGreekWord( ', '.join( wordOETGlossesStrList ) )
+        thisWordNumberList = state.OETRefData['NTFormUsageDict'][(greekWord,roleLetter,morphology)]
+        if len(thisWordNumberList) > 100: # too many to list
+            maxWordsToShow = 50
+            wordsHtml = f'{wordsHtml}\n<h2>Showing the first {maxWordsToShow} out of {len(thisWordNumberList)-1:,} uses of identical word form {greekWord} <small>({tidyRoleMorphology})</small> in the Greek originals</h2>'
+            if numWordOETGlossesList > 1:
+                wordsHtml = f'''{wordsHtml}\n<p class="summary">The word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> has {numWordOETGlossesList:,} different glosses: {wordOETGlossesStr}.</p>'''
+                if wordVLTGlossesList != wordOETGlossesList:
+                    wordsHtml = f'''{wordsHtml}\n<p class="summary"><small>(In <span title="the forthcoming Verified Literal Translation">the VLT</span>, the word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> has {len(wordVLTGlossesList):,} different glosses: ‘<b>{"</b>’, ‘<b>".join(wordVLTGlossesList)}</b>’)</small>.</p>'''
+            else:
+                assert wordOETGlossesList == [OETGlossWordsStr], f"{wordOETGlossesList}  vs {[OETGlossWordsStr]}"
+                wordsHtml = f'{wordsHtml}\n<p class="summary">The word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> is always and only glossed as ‘<b>{OETGlossWordsStr}</b>’.</p>'
+                if VLTGlossWordsStr != OETGlossWordsStr:
+                    wordsHtml = f'{wordsHtml}\n<p class="summary"><small>(In <span title="the forthcoming Verified Literal Translation">the VLT</span>, the word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> was always and only glossed as ‘<b>{VLTGlossWordsStr}</b>’)</small>.</p>'
+        else: # we can list all uses of the word
+            maxWordsToShow = 100
+            if len(thisWordNumberList) == 1:
+                wordsHtml = f'{wordsHtml}\n<h2>Only use of identical word form {greekWord} <small>({tidyRoleMorphology})</small> in the Greek originals</h2>'
+                # grkLemmaWordRowsList = state.OETRefData['NTLemmaDict'][lemma]
+                # lemmaFormsList = sorted( state.OETRefData['NTLemmaFormsDict'][lemma] )
+                # if len(grkLemmaWordRowsList) == 1:
+                #     # print( f"{ref} '{greek}' ({glossWords}) {lemma=} {grkLemmaWordRowsList=} {grkLmmaFormsList=} {lemmaGlossesList=}" )
+                #     assert len(lemmaFormsList) == 1
+                #     assert len(lemmaGlossesList) == 1
+                #     html = f'''{html.replace(lemmaLink, f'{lemmaLink}<sup>*</sup>')}\n<p class="note"><sup>*</sup>Note: This is also the only occurrence of the word root <small>(lemma)</small> '{lemma}' in the Greek originals.</p>'''
+            else:
+                wordsHtml = f'{wordsHtml}\n<h2>Other uses ({len(thisWordNumberList)-1:,}) of identical word form {greekWord} <small>({tidyRoleMorphology})</small> in the Greek originals</h2>'
+            if numWordOETGlossesList > 1:
+                wordsHtml = f'''{wordsHtml}\n<p class="summary">The word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> has {numWordOETGlossesList:,} different glosses: {wordOETGlossesStr}.</p>'''
+                if wordVLTGlossesList != wordOETGlossesList:
+                    wordsHtml = f'''{wordsHtml}\n<p class="summary"><small>(In <span title="the forthcoming Verified Literal Translation">the VLT</span>, the word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> has {len(wordVLTGlossesList):,} different glosses: ‘<b>{"</b>’, ‘<b>".join(wordVLTGlossesList)}</b>’)</small>.</p>'''
+            else:
+                assert wordOETGlossesList == [formattedOETGlossWords], f"{gg} {BBB} {C}:{V} {greekWord=} {roleLetter=} {morphology=}: {wordOETGlossesList}  vs {[formattedOETGlossWords]}"
+                wordsHtml = f'{wordsHtml}\n<p class="summary">The word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> is always and only glossed as ‘<b>{tidyGlossOfGreekWord(formattedOETGlossWords)}</b>’.</p>'
+                if formattedVLTGlossWords != formattedOETGlossWords:
+                    wordsHtml = f'{wordsHtml}\n<p class="summary"><small>(In <span title="the forthcoming Verified Literal Translation">the VLT</span>, the word form ‘{greekWord}’ <small>({tidyRoleMorphology})</small> was always and only glossed as ‘<b>{formattedVLTGlossWords}</b>’)</small>.</p>'
+        displayCounter = 0 # Don't use enumerate on the next line, because there is a condition inside the loop
+        for oN in thisWordNumberList:
+            # if oN==gg: continue # don't duplicate the word we're making the page for
+            oWordRef, _oGreekWord, _oSRLemma, _oGrkLemma, _oVLTGlossWords, oOETGlossWords, _oGlossCaps,_oProbability, _oExtendedStrongs, _oRoleLetter, _oMorphology, _oTagsStr = state.OETRefData['word_tables'][GreekWordFileName].getFields( oN )
+            oFormattedContextGlossWords = formatNTContextSpansOETGlossWords( oN, state )
+            oBBB, oCVW = oWordRef.split( '_', 1 )
+            oC, oVW = oCVW.split( ':', 1 )
+            oV, oW = oVW.split( 'w', 1 )
+            oTidyBBB = getOETTidyBBB( oBBB )
+            oTidyBBBwithNotes = getOETTidyBBB( oBBB, addNotes=True )
+            oTidyBbbb = getOETTidyBBB( oBBB, titleCase=True, allowFourChars=True )
+            oTidyBbbbWithNotes = getOETTidyBBB( oBBB, titleCase=True, allowFourChars=True, addNotes=True )
+            # if other_count == 0:
+            translation = '<small>(no English gloss here)</small>' if oOETGlossWords=='-' else f'''‘{tidyGlossOfGreekWord(oFormattedContextGlossWords)}’'''
+            oOET_LV_verse_HTML = oOET_RV_verse_HTML = None
+            if not state.TEST_MODE_FLAG or oBBB in state.preloadedBibles['OET-RV']:
+                oOET_LV_verse_HTML = get_OET_LV_verse_HTML( level, oBBB, oC, oV )
+                oOET_RV_verse_HTML = get_OET_RV_verse_HTML( level, oBBB, oC, oV )
+            wordsHtml = f'''{wordsHtml}\n<p class="wordLine"><a title="View OET {oTidyBBB} text" href="{'../'*level}OET/byC/{oBBB}_C{oC}.htm#C{oC}V{oV}">{oTidyBbbbWithNotes} {oC}:{oV}</a>''' \
+f''' {translation} <a title="Go to Statistical Restoration Greek page" href="https://GreekCNTR.org/collation/?v={CNTR_BOOK_ID_MAP[oBBB]}{oC.zfill(3)}{oV.zfill(3)}">SR GNT {oTidyBbbbWithNotes} {oC}:{oV} word {oW}</a></p>{f'\n{oOET_LV_verse_HTML}' if oOET_LV_verse_HTML else ''}{f'\n{oOET_RV_verse_HTML}' if oOET_RV_verse_HTML else ''}''' \
+                if not state.TEST_MODE_FLAG or oBBB in state.preloadedBibles['OET-RV'] else \
+                f'''{wordsHtml}\n<p class="wordLine">{oTidyBbbbWithNotes} {oC}:{oV}''' \
+f''' {translation} <a title="Go to Statistical Restoration Greek page" href="https://GreekCNTR.org/collation/?v={CNTR_BOOK_ID_MAP[oBBB]}{oC.zfill(3)}{oV.zfill(3)}">SR GNT {oTidyBbbbWithNotes} {oC}:{oV} word {oW}</a></p>{f'\n{oOET_LV_verse_HTML}' if oOET_LV_verse_HTML else ''}{f'\n{oOET_RV_verse_HTML}' if oOET_RV_verse_HTML else ''}'''
+            # other_count += 1
+            # if other_count >= 120:
+            #     html = f'{html}\n<p class="summary">({len(thisWordNumberList)-other_count-1:,} more examples not listed)</p>'
+            #     break
+            displayCounter += 1
+            if displayCounter >= maxWordsToShow: break
+        if len(lemmaGlossesList) > numWordOETGlossesList:
+            wordsHtml = f'''{wordsHtml}\n<p class="lemmaGlossesSummary">The various word forms of the root word (lemma) ‘{lemmaLink}’ {f"""have {len(lemmaGlossesList):,} different glosses: ‘<b>{tidyGlossOfGreekWord("</b>’, ‘<b>".join(lemmaGlossesList))}</b>’""" if len(lemmaGlossesList)>1 else f"have only one gloss: ‘<b>{tidyGlossOfGreekWord(lemmaGlossesList[0])}</b>’"}.</p>'''
+        elif len(thisWordNumberList) == 1:
+            grkLemmaWordRowsList = state.OETRefData['NTLemmaDict'][SRLemma]
+            grkLemmaFormsList = state.OETRefData['NTLemmaFormsDict'][SRLemma]
+            if len(grkLemmaWordRowsList) == 1:
+                # print( f"{ref} '{greek}' ({glossWords}) {lemma=} {grkLemmaWordRowsList=} {grkLemmaFormsList=} {lemmaGlossesList=}" )
+                assert len(grkLemmaFormsList) == 1
+                assert len(lemmaGlossesList) == 1
+                wordsHtml = f'''{wordsHtml.replace(lemmaLink, f'{lemmaLink}<sup>*</sup>', 1)}\n<p class="note"><sup>*</sup>Note: This is also the only occurrence of the word root <small>(lemma)</small> ‘{SRLemma}’ in the Greek originals.</p>'''
+
+        if mainGlossWord not in COMMON_ENGLISH_WORDS_LIST: # Ignore the most common words
+            # List other words that are glossed similarly
+            try:
+                similarWords = (mainGlossWord,) + SIMILAR_GLOSS_WORDS_DICT[mainGlossWord]
+                # print( f"      {mainGlossWord=} {similarWords=}")
+            except KeyError: similarWords = (mainGlossWord,)
+            extraHTMLList = []
+            extraWordSet, extraLemmaSet = set(), set()
+            for similarWord in similarWords:
+                nList = state.OETRefData['OETNTGlossWordDict'][similarWord]
+                # print( f'''    {n} {ref} {greekWord} '{mainGlossWord}' {f'{similarWord=} ' if similarWord!=mainGlossWord else ''}({len(nList)}) {nlist[:8]=}{'…' if len(nList)>8 else ''}''' )
+                if len(nList) > 1:
+                    if similarWord==mainGlossWord: assert gg in nList
+                    if len(nList)>400:
+                        dPrint( 'Info', DEBUGGING_THIS_MODULE, f"create_Greek_word_pages has EXCESSIVE {len(nList):,} entries for '{mainGlossWord}' from {similarWord=}")
+                    for thisN in nList:
+                        # if thisN == gg: continue # That's the current word row
+                        eWordRef, eGreekWord, eSRLemma, _eGrkLemma, _eVLTGlossWordsStr, _eOETGlossWordsStr, _eGlossCaps, _eProbability, _eExtendedStrongs, eRoleLetter, eMorphology, _eTagsStr = state.OETRefData['word_tables'][GreekWordFileName].getFields( thisN )
+                        if eRoleLetter == 'None': eRoleLetter = None
+                        if eMorphology == 'None': eMorphology = None
+                        if eGreekWord!=greekWord or eRoleLetter!=roleLetter or eMorphology!=morphology:
+                            eBBB, eCVW = eWordRef.split( '_', 1 )
+                            eC, eVW = eCVW.split( ':', 1 )
+                            eV, eW = eVW.split( 'w', 1 )
+                            eTidyBBB = getOETTidyBBB( eBBB )
+                            eTidyBbbb = getOETTidyBBB( eBBB, titleCase=True, allowFourChars=True )
+
+                            eGreekPossibleLink = f'<a title="Go to word page" href="../GrkWrd/{getGreekWordpageFilename(thisN, state )}#Top">{eGreekWord}</a>' if not state.TEST_MODE_FLAG or state.ALL_TEST_REFERENCE_PAGES_FLAG or eBBB in state.TEST_BOOK_LIST else eGreekWord
+                            eLemmaLink = f'<a title="View Greek root word" href="../GrkLem/{eSRLemma}.htm#Top">{eSRLemma}</a>' if eSRLemma!=SRLemma else ''
+                            eFormattedContextGlossWords = tidyGlossOfGreekWord( formatNTContextSpansOETGlossWords( thisN, state ) )
+                            assert '\\' not in eFormattedContextGlossWords, f"{gg=} {eFormattedContextGlossWords=}"
+                            eTidyRoleMorphology = eTidyMorphology = '' #= eMoodField = eTenseField = eVoiceField = ePersonField = eCaseField = eGenderField = eNumberField = ''
+                            if eMorphology:
+                                assert len(eMorphology) == 7, f"Got {eWordRef} '{eGreekWord}' morphology ({len(eMorphology)}) = '{eMorphology}'"
+                                eTidyMorphology = eMorphology[4:] if eMorphology.startswith('····') else eMorphology
+                                eTidyRoleMorphology = f'{eRoleLetter}-{eTidyMorphology}'
+                                usedRoleLetters.add( eRoleLetter )
+                                if eTidyMorphology != '···': usedMorphologies.add( eTidyMorphology )
+                            else:
+                                eTidyRoleMorphology = eRoleLetter
+                            eOET_LV_verse_HTML = eOET_RV_verse_HTML = None
+                            if not state.TEST_MODE_FLAG or eBBB in state.preloadedBibles['OET-RV']:
+                                eOET_LV_verse_HTML = get_OET_LV_verse_HTML( level, eBBB, eC, eV )
+                                eOET_RV_verse_HTML = get_OET_RV_verse_HTML( level, eBBB, eC, eV )
+                            extraHTMLList.append( f'''<p class="wordLine"><a title="View OET {eTidyBBB} text" href="{'../'*level}OET/byC/{eBBB}_C{eC}.htm#C{eC}V{eV}">{eTidyBBB} {eC}:{eV}</a>'''
+f''' <b>{eGreekPossibleLink}</b> ({transliterate_Greek(eGreekWord)}) <small>{eTidyRoleMorphology}</small>{f' Lemma={eLemmaLink}' if eLemmaLink else ''}'''
+f''' ‘{eFormattedContextGlossWords}’'''
+f''' <a title="Go to Statistical Restoration Greek page" href="https://GreekCNTR.org/collation/?v={CNTR_BOOK_ID_MAP[eBBB]}{eC.zfill(3)}{eV.zfill(3)}">SR GNT {eTidyBbbb} {eC}:{eV} word {eW}</a></p>{f'\n{eOET_LV_verse_HTML}' if eOET_LV_verse_HTML else ''}{f'\n{eOET_RV_verse_HTML}' if eOET_RV_verse_HTML else ''}'''
+                                if not state.TEST_MODE_FLAG or eBBB in state.preloadedBibles['OET-RV'] else
+                                    f'''<p class="wordLine">{eTidyBBB} {eC}:{eV} ‘{eGreekPossibleLink}’ <small>({eTidyRoleMorphology})</small>{f' Lemma={eLemmaLink}' if eLemmaLink else ''}''' \
+f''' ‘{eFormattedContextGlossWords}’''' \
+f''' <a title="Go to Statistical Restoration Greek page" href="https://GreekCNTR.org/collation/?v={CNTR_BOOK_ID_MAP[eBBB]}{eC.zfill(3)}{eV.zfill(3)}">SR GNT {eTidyBbbb} {eC}:{eV} word {eW}</a></p>{f'\n{eOET_LV_verse_HTML}' if eOET_LV_verse_HTML else ''}{f'\n{eOET_RV_verse_HTML}' if eOET_RV_verse_HTML else ''}''' )
+                            extraWordSet.add( eGreekPossibleLink )
+                            extraLemmaSet.add( eLemmaLink if eLemmaLink else lemmaLink )
+            if extraHTMLList:
+                wordsHtml = f'''{wordsHtml}\n<h2 class="otherGreek">Greek words ({len(extraHTMLList):,}) other than {greekWord} <small>({tidyRoleMorphology})</small> with a gloss related to ‘{mainGlossWord}’</h2>'''
+                if len(extraHTMLList) > 10:
+                    wordsHtml = f'''{wordsHtml}\n<p class="summary">Have {len(extraWordSet):,} other words{f" ({', '.join(extraWordSet)})" if len(extraWordSet)<30 else ''} with {len(extraLemmaSet):,} lemma{'' if len(extraLemmaSet)==1 else 's'} altogether ({', '.join(sorted(extraLemmaSet))})</p>'''
+                wordsHtml = f'''{wordsHtml}\n{NEWLINE.join(extraHTMLList)}'''
+    assert '\\' not in wordsHtml, f"{wordsHtml=}"
+    assert '</span>C1.htm' not in wordsHtml, f"{wordsHtml=}"
+
+    keyHtml = ''
+    if usedRoleLetters or usedMorphologies: # Add a key at the bottom
+        for usedRoleLetter in sorted( usedRoleLetters ):
+            keyHtml = f'{keyHtml} <b>{usedRoleLetter}</b>={CNTR_ROLE_NAME_DICT[usedRoleLetter]}'
+        for usedMorphology in sorted( usedMorphologies ):
+            try:
+                keyHtml = f"{keyHtml} <b>{usedMorphology}</b>={CNTR_MORPHOLOGY_NAME_DICT[usedMorphology.upper()]}"
+            except KeyError:
+                logging.warning( f"create_Greek_word_pages: Missing {usedMorphology=}")
+        if keyHtml:
+            keyHtml = f'\n<p class="key" id="Key"><b>Key</b>:{keyHtml}</p>'
+
+    # Now put it all together
+    top = makeTop( level, None, 'word', None, state ) \
+                    .replace( '__TITLE__', f"Greek word ‘{greekWord}’{' TEST' if state.TEST_MODE_FLAG else ''}" ) \
+                    .replace( '__KEYWORDS__', 'Bible, word' ) \
+                    .replace( 'par/"', f'par/{BBB}/C{C}V{V}.htm#Top"' )
+    wordsHtml = f'''{top}{wordsHtml}{keyHtml}{makeBottom( level, None, 'word', state )}'''
+    assert checkHtml( 'GreekWordPage', wordsHtml )
+    filepath = outputFolderPath.joinpath( word_output_filename )
+    assert not filepath.is_file(), f"{filepath=}" # Check that we're not overwriting anything
+    with open( filepath, 'wt', encoding='utf-8' ) as html_output_file:
+        html_output_file.write( wordsHtml )
+    vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"      Wrote {len(wordsHtml):,} characters to {word_output_filename}" )
+    return True
+# end of createOETReferencePages.create_Greek_word_page
+
+
+@cache
+def get_Greek_lemma_line_verse_parts( level:int, BBB:str, C:str, V:str, verseLinked:bool ) -> tuple[str,str,str|None,str|None]:
+    """
+    Returns the parts of a Greek lemma page line which only depend on the verse
+        (because many of the word rows on the lemma pages are in the same verses):
+            tidyBbbb, OETLink, OET_LV_verse_HTML, OET_RV_verse_HTML
+
+    verseLinked is False if the verse isn't on the site (i.e., when only some books are made in TEST mode).
+    """
+    tidyBBB = getOETTidyBBB( BBB )
+    tidyBbbb = getOETTidyBBB( BBB, titleCase=True, allowFourChars=True )
+    tidyBbbbWithNotes = getOETTidyBBB( BBB, titleCase=True, allowFourChars=True, addNotes=True )
+    OET_LV_verse_HTML = OET_RV_verse_HTML = None
+    if verseLinked:
+        OET_LV_verse_HTML = get_OET_LV_verse_HTML( level, BBB, C, V )
+        OET_RV_verse_HTML = get_OET_RV_verse_HTML( level, BBB, C, V )
+    OETLink = f'''<a title="View OET {tidyBBB} text" href="{'../'*level}OET/byC/{BBB}_C{C}.htm#C{C}V{V}">{tidyBbbbWithNotes} {C}:{V}</a>''' \
+                    if verseLinked else f'{tidyBbbbWithNotes} {C}:{V}'
+    return tidyBbbb, OETLink, OET_LV_verse_HTML, OET_RV_verse_HTML
+# end of createOETReferencePages.get_Greek_lemma_line_verse_parts
+
+
+def tidy_Greek_lemma_gloss( engGloss:str ) -> str:
+    """
+    """
+        # .replace( '\\untr ', '<span class="untr">').replace( '\\untr*', '</span>') \
+        # .replace( '\\nd ', '<span class="nd">').replace( '\\nd*', '</span>') \
+        # .replace( '\\add ', '<span class="add">').replace( '\\add*', '</span>') \
+    assert '<span class="ul">' not in engGloss # already
+    result = ( engGloss
+        .replace( '\\add +', '<span class="addArticle">' )
+        # .replace( '\\add ¿', '<span class="unusedArticle">' )
+        # .replace( '\\add =', '<span class="addCopula">' )
+        # .replace( '\\add <a title', '__PROTECT__' ) # Enable if required
+        # .replace( '\\add <', '<span class="addDirectObject">' )
+        # .replace( '__PROTECT__', '\\add <a title' )
+        .replace( '\\add >', '<span class="addExtra">' )
+        # .replace( '\\add &', '<span class="addOwner">' )
+        .replace( '\\add ', '<span class="add">').replace( '\\add*', '</span>')
+        # .replace( '_', '<span class="ul">_</span>')
+        )
+    return result
+# end of createOETReferencePages.tidy_Greek_lemma_gloss
+
+
 def create_Greek_lemma_pages( level:int, outputFolderPath:Path, state:State ) -> None:
     """
     These end up in OBD/ref/GrkLem/abc.htm
@@ -3043,242 +3316,24 @@ def create_Greek_lemma_pages( level:int, outputFolderPath:Path, state:State ) ->
     try: os.makedirs( outputFolderPath )
     except FileExistsError: pass # it was already there
 
-    def tidy_Greek_lemma_gloss( engGloss:str ) -> str:
-        """
-        """
-            # .replace( '\\untr ', '<span class="untr">').replace( '\\untr*', '</span>') \
-            # .replace( '\\nd ', '<span class="nd">').replace( '\\nd*', '</span>') \
-            # .replace( '\\add ', '<span class="add">').replace( '\\add*', '</span>') \
-        assert '<span class="ul">' not in engGloss # already
-        result = ( engGloss
-            .replace( '\\add +', '<span class="addArticle">' )
-            # .replace( '\\add ¿', '<span class="unusedArticle">' )
-            # .replace( '\\add =', '<span class="addCopula">' )
-            # .replace( '\\add <a title', '__PROTECT__' ) # Enable if required
-            # .replace( '\\add <', '<span class="addDirectObject">' )
-            # .replace( '__PROTECT__', '\\add <a title' )
-            .replace( '\\add >', '<span class="addExtra">' )
-            # .replace( '\\add &', '<span class="addOwner">' )
-            .replace( '\\add ', '<span class="add">').replace( '\\add*', '</span>')
-            # .replace( '_', '<span class="ul">_</span>')
-            )
-        return result
-    # end of createOETReferencePages.tidy_Greek_lemma_gloss
-
-
     lemmaList = sorted( [lemma for lemma in state.OETRefData['NTLemmaDict']] )
+    NTLemmaIndex = LemmaIndex( lemmaList, state.OETRefData['NTLemmaOETGlossesDict'], KNOWN_GREEK_PREFIXES, state.OETRefData['word_tables'][GreekWordFileName] )
 
     # Now make a page for each Greek lemma (including the variants not used in the translation)
+    startTime = time()
     lemmaLinks:list[str] = [] # Used below to make an index page
+    lemmaJobs = []
     for lemmaIndex, lemma in enumerate( lemmaList ):
-        if (lemmaIndex+1) % 1_000 == 0:
-            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"      {len(lemmaLinks):,} made out of {f'{lemmaIndex:,} out of ' if lemmaIndex!=len(lemmaLinks) else ''}{len(lemmaList):,}…" )
         # print( f"Lemma {ll}: {lemma}" )
         grkLemma = state.OETRefData['NTGreekLemmaDict'][lemma]
         if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG and grkLemma not in state.OETRefData['usedGrkLemmas']:
             continue # Don't make this page
-        grkLemmaWordRowsList = state.OETRefData['NTLemmaDict'][lemma]
-        grkLemmaFormsList = sorted( state.OETRefData['NTLemmaFormsDict'][lemma], key=lambda t3: -state.OETRefData['NTLemmaFormsCountDict'][(lemma,*t3)] )
-        numGrkLemmaOETGlossesList = len( state.OETRefData['NTLemmaOETGlossesDict'][lemma] )
-        grkLemmaOETGlossesList = sorted( state.OETRefData['NTLemmaOETGlossesDict'][lemma] ) # Only used for comparison later with grkLemmaVLTGlossesList
-        grkLemmaOETGlossesStrList = [f'‘<b>{lemmaGloss}</b>’({state.OETRefData['NTLemmaOETGlossesCountDict'][(lemma,lemmaGloss)]:,})'
-                        for lemmaGloss in sorted( state.OETRefData['NTLemmaOETGlossesDict'][lemma], key=lambda lg: -state.OETRefData['NTLemmaOETGlossesCountDict'][(lemma,lg)] ) ]
-        grkLemmaVLTGlossesList = sorted( state.OETRefData['NTLemmaVLTGlossesDict'][lemma] )
-
-        def getFirstGreekWordNumber(grk:str,roleLetter:str,morph:str):
-            return state.OETRefData['NTFormUsageDict'][(grk,roleLetter,morph)][0]
-
-        usedRoleLetters, usedMorphologies = set(), set()
         output_filename = f'{lemma}.htm'
-
-        prevLemmaIndex = nextLemmaIndex = None
-        if lemmaIndex > 1:
-            if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG:
-                for LL in range( lemmaIndex-1, 0, -1 ):
-                    LLLemma = lemmaList[LL]
-                    LLGrkLemma = state.OETRefData['NTGreekLemmaDict'][LLLemma]
-                    if LLGrkLemma in state.OETRefData['usedGrkLemmas']:
-                        prevLemmaIndex = LL
-                        break
-            else: prevLemmaIndex = lemmaIndex-1
-        if lemmaIndex<len(lemmaList)-1:
-            if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG:
-                for LL in range( lemmaIndex+1, len(lemmaList) ):
-                    LLLemma = lemmaList[LL]
-                    LLGrkLemma = state.OETRefData['NTGreekLemmaDict'][LLLemma]
-                    if LLGrkLemma in state.OETRefData['usedGrkLemmas']:
-                        nextLemmaIndex = LL
-                        break
-            else: nextLemmaIndex = lemmaIndex+1
-        prevLink = f'<b><a title="Previous lemma" href="{lemmaList[prevLemmaIndex]}.htm#Top">←</a></b> ' if prevLemmaIndex is not None else ''
-        nextLink = f' <b><a title="Next lemma" href="{lemmaList[nextLemmaIndex]}.htm#Top">→</a></b>' if nextLemmaIndex else ''
-        lemmasHtml = f'''<h1 id="Top">Greek root word <small>(lemma)</small> ‘{grkLemma}’ ({lemma})</h1>
-<p class="pgNav">{prevLink}<b>{lemma}</b> <a title="Go to Greek word index" href="index.htm">⌂</a>{nextLink}</p>
-<p class="btnBar"><button type="button" id="wordsButton" title="Hide/Show word lines" onclick="hide_show_words()">Hide words</button> <button type="button" id="versesButton" title="Hide/Show verse lines" onclick="hide_show_verses()">Hide verses</button> <button type="button" id="coloursButton" title="Hide/Show verse colours" onclick="hide_show_colours()">Hide verse colours</button></p>
-<p class="summary">This root form (lemma) ‘{grkLemma}’ is used in {'only one form' if len(grkLemmaFormsList)==1 else f'{len(grkLemmaFormsList):,} different forms'} in the Greek originals: {', '.join([f'<a title="View Greek word form" href="../GrkWrd/{getGreekWordpageFilename(getFirstGreekWordNumber(grk,roleLetter,morph), state )}#Top">{grk}</a> <small>({state.OETRefData['NTLemmaFormsCountDict'][(lemma,grk,roleLetter,morph)]:,}, {roleLetter}-{morph[4:] if morph.startswith("....") else morph})</small>' for grk,roleLetter,morph in grkLemmaFormsList])}.</p>
-<p class="summary">It is glossed in {'only one way' if numGrkLemmaOETGlossesList==1 else f'{numGrkLemmaOETGlossesList:,} different ways'}: {tidy_Greek_lemma_gloss(', '.join(grkLemmaOETGlossesStrList))}.</p>'''
-        if grkLemmaVLTGlossesList != grkLemmaOETGlossesList:
-            lemmasHtml = f'''{lemmasHtml}<p class="summary"><small>(In <span title="the forthcoming Verified Literal Translation">the VLT</span>, it was glossed in {'only one way' if len(grkLemmaVLTGlossesList)==1 else f'{len(grkLemmaVLTGlossesList):,} different ways'}: ‘<b>{"</b>’, ‘<b>".join(grkLemmaVLTGlossesList)}</b>’.)</small></p>'''
-
-        def makeGreekLemmaHTML( thisLemmaStr:str, thisLemmaRowsList ) -> str:
-            """
-            The guts of making the lemma page
-                put into a function so that we can also re-use it for related words
-
-            Side-effects: udates usedRoleLetters and usedMorphologies
-            """
-            oRoleSet = set()
-            for oN in thisLemmaRowsList:
-                _oWordRef, _oGreekWord, _oSRLemma, _oGrkLemma, _oVLTGlossWords, _oOETGlossWords, _oGlossCaps,_oProbability, _oExtendedStrongs, oRoleLetter, _oMorphology, _oTagsStr = state.OETRefData['word_tables'][GreekWordFileName][oN].split( '\t' )
-                oRoleSet.add( oRoleLetter )
-                # usedRoleLetters.add( oRoleLetter )
-            # oRoleLetter remains set to the last value added to the set (which is the only value if len(oRoleSet)==1)
-
-            if len(thisLemmaRowsList) > 100: # too many to list
-                maxWordsToShow = 50
-                lemmaHTML = f"<h2>Showing the first {maxWordsToShow} out of {len(thisLemmaRowsList)-1:,} uses of Greek root word <small>(lemma)</small> ‘{thisLemmaStr}’ {f'<small>({CNTR_ROLE_NAME_DICT[oRoleLetter]})</small> ' if len(oRoleSet)==1 else ''}in the Greek originals</h2>"
-            else: # we can list all uses of the word
-                maxWordsToShow = 100
-                lemmaHTML = f"<h2>Have {len(thisLemmaRowsList):,} {'use' if len(thisLemmaRowsList)==1 else 'uses'} of Greek root word <small>(lemma)</small> ‘{thisLemmaStr}’ {f'<small>({CNTR_ROLE_NAME_DICT[oRoleLetter]})</small> ' if len(oRoleSet)==1 else ''}in the Greek originals</h2>"
-            for displayCounter,oN in enumerate( thisLemmaRowsList, start=1 ):
-                oWordRef, oGreekWord, _oSRLemma, _oGrkLemma, oVLTGlossWords, oOETGlossWords, _oGlossCaps,_oProbability, _oExtendedStrongs, oRoleLetter, oMorphology, _oTagsStr = state.OETRefData['word_tables'][GreekWordFileName][oN].split( '\t' )
-                oFormattedContextGlossWords = formatNTContextSpansOETGlossWords( oN, state )
-                oBBB, oCVW = oWordRef.split( '_', 1 )
-                oC, oVW = oCVW.split( ':', 1 )
-                oV, oW = oVW.split( 'w', 1 )
-                oTidyBBB = getOETTidyBBB( oBBB )
-                oTidyBBBwithNotes = getOETTidyBBB( oBBB, addNotes=True )
-                oTidyBbbb = getOETTidyBBB( oBBB, titleCase=True, allowFourChars=True )
-                oTidyBbbbWithNotes = getOETTidyBBB( oBBB, titleCase=True, allowFourChars=True, addNotes=True )
-                oTidyMorphology = oMorphology[4:] if oMorphology.startswith('····') else oMorphology
-                usedRoleLetters.add( oRoleLetter )
-                if oTidyMorphology != '···': usedMorphologies.add( oTidyMorphology )
-                # if other_count == 0:
-                oOETLink = f'''<a title="View OET {oTidyBBB} text" href="{'../'*level}OET/byC/{oBBB}_C{oC}.htm#C{oC}V{oV}">{oTidyBbbbWithNotes} {oC}:{oV}</a>''' \
-                                if not state.TEST_MODE_FLAG or oBBB in state.preloadedBibles['OET-RV'] \
-                                    else f'{oTidyBbbbWithNotes} {oC}:{oV}'
-                oGreekWordLink = f'<a title="Go to word page" href="../GrkWrd/{getGreekWordpageFilename(oN, state )}#Top">{oGreekWord}</a>' if not state.TEST_MODE_FLAG or oBBB in state.preloadedBibles['OET-RV'] else oGreekWord
-                translation = '<small>(no English gloss here)</small>' if oVLTGlossWords=='-' else f'''‘{tidy_Greek_lemma_gloss(oFormattedContextGlossWords)}’'''
-                oOET_LV_verse_HTML = oOET_RV_verse_HTML = None
-                if not state.TEST_MODE_FLAG or oBBB in state.preloadedBibles['OET-RV']:
-                    oOET_LV_verse_HTML = get_OET_LV_verse_HTML( level, oBBB, oC, oV )
-                    oOET_RV_verse_HTML = get_OET_RV_verse_HTML( level, oBBB, oC, oV )
-                lemmaHTML = f'''{lemmaHTML}\n<p class="lemmaLine">{oOETLink} <b>{oGreekWordLink}</b> ({transliterate_Greek(oGreekWord)})''' \
-                    f"{f' {CNTR_ROLE_NAME_DICT[oRoleLetter].title()}' if len(oRoleSet)>1 else ''} {oTidyMorphology}" \
-                    f''' {translation} <a title="Go to Statistical Restoration Greek page" href="https://GreekCNTR.org/collation/?v={CNTR_BOOK_ID_MAP[oBBB]}{oC.zfill(3)}{oV.zfill(3)}">SR GNT {oTidyBbbb} {oC}:{oV} word {oW}</a></p>{f'\n{oOET_LV_verse_HTML}' if oOET_LV_verse_HTML else ''}{f'\n{oOET_RV_verse_HTML}' if oOET_RV_verse_HTML else ''}'''
-                # other_count += 1
-                # if other_count >= 120:
-                #     lemmaHTML = f'{lemmaHTML}\n<p class="summary">({len(thisWordNumberList)-other_count-1:,} more examples not listed)</p>'
-                #     break
-                if displayCounter >= maxWordsToShow: break
-            assert '\\' not in lemmaHTML, f"{lemmaHTML=}"
-            return lemmaHTML
-        # end of createOETReferencePages.create_Greek_lemma_pages.makeGreekLemmaHTML
-
-        lemmasHtml = f"{lemmasHtml}\n{makeGreekLemmaHTML(lemma, grkLemmaWordRowsList)}"
-
-        # Consider related lemmas, e.g., with or without prefix
-        this_extended_lemma_list = [lemma]
-        for mm, this_second_lemma in enumerate( lemmaList ):
-            if this_second_lemma and len(this_second_lemma)>1 and this_second_lemma not in this_extended_lemma_list:
-                prefix = None
-                if this_second_lemma.endswith( lemma ):
-                    prefix = this_second_lemma[:len(this_second_lemma)-len(lemma)]
-                elif lemma.endswith( this_second_lemma ):
-                    prefix = lemma[:len(lemma)-len(this_second_lemma)]
-                if prefix and len(prefix) < 6:
-                    if prefix in KNOWN_GREEK_PREFIXES:
-                        # print(f"create_Greek_lemma_pages also got lemma '{this_second_lemma}' with prefix '{prefix}' (cf. '{lemma}')")
-                        grkLemmaWordRowsList = state.OETRefData['NTLemmaDict'][this_second_lemma]
-                        # lemmaFormsList = sorted( state.OETRefData['NTLemmaFormsDict'][this_second_lemma] )
-                        # lemmaGlossesList = sorted( state.OETRefData['NTLemmaOETGlossesDict'][this_second_lemma] )
-                        this_second_lemma_link = f'<a title="Go to lemma page" href="{this_second_lemma}.htm#Top">{this_second_lemma}</a>'
-                        if len(this_extended_lemma_list) == 1:
-                            lemmasHtml = f"{lemmasHtml}\n<h1>Other possible lexically-related lemmas</h1>"
-                        lemmasHtml = f'''{lemmasHtml}
-<h2>Greek root word <small>(lemma)</small> ‘{this_second_lemma}’ <small>with prefix=‘{prefix}’</small></h2>
-{makeGreekLemmaHTML(this_second_lemma_link, grkLemmaWordRowsList)}'''
-                        this_extended_lemma_list.append( this_second_lemma )
-                    # else:
-                    #     print(f"create_Greek_lemma_pages ignored potential lemma '{this_second_lemma}' with unrecognised prefix '{prefix}' (cf. '{lemma}')")
-        # if len(this_extended_lemma_list) > 1:
-        #     print( f"Got {this_extended_lemma_list=}" )
-
-        # Consider other lemmas with similar English glosses
-        similarLemmaSet = set()
-        for lemmaGloss in grkLemmaOETGlossesList:
-            if lemmaGloss not in COMMON_ENGLISH_WORDS_LIST: # Ignore the most common words
-                # List other lemmas that are glossed similarly
-                try:
-                    similarWords = (lemmaGloss,) + SIMILAR_GLOSS_WORDS_DICT[lemmaGloss]
-                    # print( f"      {lemmaGloss=} {similarWords=} {ll} {lemma=} {lemmaGlossesList=}")
-                except KeyError: similarWords = (lemmaGloss,)
-                for similarWord in similarWords:
-                    for otherLemma,otherLemmaGlosses in state.OETRefData['NTLemmaOETGlossesDict'].items():
-                        # NOTE: otherLemmaGlosses contains raw words and well as HTML spans for gloss helpers, etc.
-                        if otherLemma != lemma:
-                            # print( f"{otherLemma=} {otherLemmaGlosses=}")
-                            if similarWord in otherLemmaGlosses:
-                                similarLemmaSet.add( otherLemma )
-        if similarLemmaSet:
-            # print( f"{lemma=} {lemmaGlossesList=} {extraLemmaSet=}" )
-            lemmasHtml = f'''{lemmasHtml}
-<h1>Lemmas with similar glosses to ‘{grkLemma}’ ({lemma})</h1>'''
-            for extraLemma in similarLemmaSet:
-                extra_lemma_link = f'<a title="Go to lemma page" href="{extraLemma}.htm#Top">{extraLemma}</a>'
-                lemmasHtml = f"{lemmasHtml}\n{makeGreekLemmaHTML(extra_lemma_link, state.OETRefData['NTLemmaDict'][extraLemma])}"
-
-        # Consider other lemmas with contrastive English glosses
-        contrastiveLemmaSet = set()
-        for lemmaGloss in grkLemmaOETGlossesList:
-            if lemmaGloss not in COMMON_ENGLISH_WORDS_LIST: # Ignore the most common words
-                # List other lemmas that are glossed as antonyms
-                try:
-                    contrastiveWords = CONTRASTIVE_GLOSS_WORDS_DICT[lemmaGloss]
-                    # print( f"      {lemmaGloss=} {contrastiveWords=} {ll} {lemma=} {lemmaGlossesList=}")
-                except KeyError: contrastiveWords = []
-                for contrastiveWord in contrastiveWords:
-                    for otherLemma,otherLemmaGlosses in state.OETRefData['NTLemmaOETGlossesDict'].items():
-                        # NOTE: otherLemmaGlosses contains raw words and well as HTML spans for gloss helpers, etc.
-                        if otherLemma != lemma:
-                            # print( f"{otherLemma=} {otherLemmaGlosses=}")
-                            if contrastiveWord in otherLemmaGlosses:
-                                assert otherLemma not in similarLemmaSet
-                                contrastiveLemmaSet.add( otherLemma )
-        if contrastiveLemmaSet:
-            # print( f"{lemma=} {lemmaGlossesList=} {extraLemmaSet=}" )
-            lemmasHtml = f'''{lemmasHtml}
-<h1>Lemmas with contrastive glosses to ‘{grkLemma}’ ({lemma})</h1>'''
-            for contrastiveLemma in contrastiveLemmaSet:
-                extra_lemma_link = f'<a title="Go to lemma page" href="{contrastiveLemma}.htm#Top">{contrastiveLemma}</a>'
-                lemmasHtml = f"{lemmasHtml}\n{makeGreekLemmaHTML(extra_lemma_link, state.OETRefData['NTLemmaDict'][contrastiveLemma])}"
-        assert '\\' not in lemmasHtml, f"{lemmalemmasHtmlHTML=}"
-
-        keyHtml = ''
-        if usedRoleLetters or usedMorphologies: # Add a key at the bottom
-            for usedRoleLetter in sorted( usedRoleLetters ):
-                keyHtml = f'{keyHtml} <b>{usedRoleLetter}</b>={CNTR_ROLE_NAME_DICT[usedRoleLetter]}'
-            for usedMorphology in sorted( usedMorphologies ):
-                try:
-                    keyHtml = f"{keyHtml} <b>{usedMorphology}</b>={CNTR_MORPHOLOGY_NAME_DICT[usedMorphology.upper()]}"
-                except KeyError:
-                    logging.warning( f"Missing {usedMorphology=}")
-            if keyHtml:
-                keyHtml = f'\n<p class="key" id="Key"><b>Key</b>:{keyHtml}</p>'
-
-        # Now put it all together
-        top = makeTop( level, None, 'lemma', None, state ) \
-                        .replace( '__TITLE__', f"Greek lemma ‘{lemma}’{' TEST' if state.TEST_MODE_FLAG else ''}" ) \
-                        .replace( '__KEYWORDS__', 'Bible, word' )
-        lemmasHtml = f'''{top}{lemmasHtml}{keyHtml}{makeBottom( level, None, 'lemma', state )}'''
-        assert checkHtml( f'GreekLemmaPage for {lemmaIndex} {lemma=}', lemmasHtml )
-        filepath = outputFolderPath.joinpath( output_filename )
-        assert not filepath.is_file() # Check that we're not overwriting anything
-        with open( filepath, 'wt', encoding='utf-8' ) as html_output_file:
-            html_output_file.write( lemmasHtml )
-        vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  Wrote {len(lemmasHtml):,} characters to {output_filename}" )
+        lemmaJobs.append( (level, lemmaIndex, lemmaList, NTLemmaIndex, outputFolderPath, output_filename) )
         lemmaLinks.append( f'<a href="{output_filename}">{lemma}</a>')
-    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"    Created {len(lemmaLinks):,}{f'/{len(lemmaList):,}' if len(lemmaLinks) < len(lemmaList) else ''} Greek lemma pages." )
+    _create_word_pages( 'Greek lemma', create_Greek_lemma_page, lemmaJobs, (), state,
+                        chunkSize=LEMMA_PAGES_CHUNK_SIZE, progressInterval=1_000, parallelFlag=state.PARALLEL_LEMMA_PAGES_FLAG )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"    Created {len(lemmaLinks):,}{f'/{len(lemmaList):,}' if len(lemmaLinks) < len(lemmaList) else ''} Greek lemma pages{f' in {time()-startTime:,.1f} seconds ({1000*(time()-startTime)/len(lemmaLinks):,.1f}ms per page)' if lemmaLinks else ''}." )
 
     # Create index page for this folder
     filename = 'index.htm'
@@ -3338,6 +3393,194 @@ def create_Greek_lemma_pages( level:int, outputFolderPath:Path, state:State ) ->
 # end of createOETReferencePages.create_Greek_lemma_pages
 
 
+def create_Greek_lemma_page( level:int, lemmaIndex:int, lemmaList:list[str], NTLemmaIndex:LemmaIndex, outputFolderPath:Path, output_filename:str, state:State ) -> bool:
+    """
+    Makes the page for the Greek lemma at lemmaIndex in lemmaList
+        using the inverted indexes in NTLemmaIndex (rather than scanning all the other lemmas).
+
+    Doesn't change the state so it can also be run in forked worker processes.
+    """
+    lemma = lemmaList[lemmaIndex]
+    fnPrint( DEBUGGING_THIS_MODULE, f"create_Greek_lemma_page( {level}, {lemmaIndex}, {lemma}, …, {output_filename} … )" )
+    grkLemma = state.OETRefData['NTGreekLemmaDict'][lemma]
+    grkLemmaWordRowsList = state.OETRefData['NTLemmaDict'][lemma]
+    grkLemmaFormsList = sorted( state.OETRefData['NTLemmaFormsDict'][lemma], key=lambda t3: -state.OETRefData['NTLemmaFormsCountDict'][(lemma,*t3)] )
+    numGrkLemmaOETGlossesList = len( state.OETRefData['NTLemmaOETGlossesDict'][lemma] )
+    grkLemmaOETGlossesList = sorted( state.OETRefData['NTLemmaOETGlossesDict'][lemma] ) # Only used for comparison later with grkLemmaVLTGlossesList
+    grkLemmaOETGlossesStrList = [f'‘<b>{lemmaGloss}</b>’({state.OETRefData['NTLemmaOETGlossesCountDict'][(lemma,lemmaGloss)]:,})'
+                    for lemmaGloss in sorted( state.OETRefData['NTLemmaOETGlossesDict'][lemma], key=lambda lg: -state.OETRefData['NTLemmaOETGlossesCountDict'][(lemma,lg)] ) ]
+    grkLemmaVLTGlossesList = sorted( state.OETRefData['NTLemmaVLTGlossesDict'][lemma] )
+
+    def getFirstGreekWordNumber(grk:str,roleLetter:str,morph:str):
+        return state.OETRefData['NTFormUsageDict'][(grk,roleLetter,morph)][0]
+
+    usedRoleLetters, usedMorphologies = set(), set()
+
+    prevLemmaIndex = nextLemmaIndex = None
+    if lemmaIndex > 1:
+        if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG:
+            for LL in range( lemmaIndex-1, 0, -1 ):
+                LLLemma = lemmaList[LL]
+                LLGrkLemma = state.OETRefData['NTGreekLemmaDict'][LLLemma]
+                if LLGrkLemma in state.OETRefData['usedGrkLemmas']:
+                    prevLemmaIndex = LL
+                    break
+        else: prevLemmaIndex = lemmaIndex-1
+    if lemmaIndex<len(lemmaList)-1:
+        if state.TEST_MODE_FLAG and not state.ALL_TEST_REFERENCE_PAGES_FLAG:
+            for LL in range( lemmaIndex+1, len(lemmaList) ):
+                LLLemma = lemmaList[LL]
+                LLGrkLemma = state.OETRefData['NTGreekLemmaDict'][LLLemma]
+                if LLGrkLemma in state.OETRefData['usedGrkLemmas']:
+                    nextLemmaIndex = LL
+                    break
+        else: nextLemmaIndex = lemmaIndex+1
+    prevLink = f'<b><a title="Previous lemma" href="{lemmaList[prevLemmaIndex]}.htm#Top">←</a></b> ' if prevLemmaIndex is not None else ''
+    nextLink = f' <b><a title="Next lemma" href="{lemmaList[nextLemmaIndex]}.htm#Top">→</a></b>' if nextLemmaIndex else ''
+    lemmasHtml = f'''<h1 id="Top">Greek root word <small>(lemma)</small> ‘{grkLemma}’ ({lemma})</h1>
+<p class="pgNav">{prevLink}<b>{lemma}</b> <a title="Go to Greek word index" href="index.htm">⌂</a>{nextLink}</p>
+<p class="btnBar"><button type="button" id="wordsButton" title="Hide/Show word lines" onclick="hide_show_words()">Hide words</button> <button type="button" id="versesButton" title="Hide/Show verse lines" onclick="hide_show_verses()">Hide verses</button> <button type="button" id="coloursButton" title="Hide/Show verse colours" onclick="hide_show_colours()">Hide verse colours</button></p>
+<p class="summary">This root form (lemma) ‘{grkLemma}’ is used in {'only one form' if len(grkLemmaFormsList)==1 else f'{len(grkLemmaFormsList):,} different forms'} in the Greek originals: {', '.join([f'<a title="View Greek word form" href="../GrkWrd/{getGreekWordpageFilename(getFirstGreekWordNumber(grk,roleLetter,morph), state )}#Top">{grk}</a> <small>({state.OETRefData['NTLemmaFormsCountDict'][(lemma,grk,roleLetter,morph)]:,}, {roleLetter}-{morph[4:] if morph.startswith("....") else morph})</small>' for grk,roleLetter,morph in grkLemmaFormsList])}.</p>
+<p class="summary">It is glossed in {'only one way' if numGrkLemmaOETGlossesList==1 else f'{numGrkLemmaOETGlossesList:,} different ways'}: {tidy_Greek_lemma_gloss(', '.join(grkLemmaOETGlossesStrList))}.</p>'''
+    if grkLemmaVLTGlossesList != grkLemmaOETGlossesList:
+        lemmasHtml = f'''{lemmasHtml}<p class="summary"><small>(In <span title="the forthcoming Verified Literal Translation">the VLT</span>, it was glossed in {'only one way' if len(grkLemmaVLTGlossesList)==1 else f'{len(grkLemmaVLTGlossesList):,} different ways'}: ‘<b>{"</b>’, ‘<b>".join(grkLemmaVLTGlossesList)}</b>’.)</small></p>'''
+
+    def makeGreekLemmaHTML( thisLemmaStr:str, thisLemmaRowsList ) -> str:
+        """
+        The guts of making the lemma page
+            put into a function so that we can also re-use it for related words
+
+        Side-effects: udates usedRoleLetters and usedMorphologies
+        """
+        oRoleSet = set()
+        for oN in thisLemmaRowsList:
+            _oWordRef, _oGreekWord, _oSRLemma, _oGrkLemma, _oVLTGlossWords, _oOETGlossWords, _oGlossCaps,_oProbability, _oExtendedStrongs, oRoleLetter, _oMorphology, _oTagsStr = state.OETRefData['word_tables'][GreekWordFileName].getFields( oN )
+            oRoleSet.add( oRoleLetter )
+            # usedRoleLetters.add( oRoleLetter )
+        # oRoleLetter remains set to the last value added to the set (which is the only value if len(oRoleSet)==1)
+
+        if len(thisLemmaRowsList) > 100: # too many to list
+            maxWordsToShow = 50
+            lemmaHTML = f"<h2>Showing the first {maxWordsToShow} out of {len(thisLemmaRowsList)-1:,} uses of Greek root word <small>(lemma)</small> ‘{thisLemmaStr}’ {f'<small>({CNTR_ROLE_NAME_DICT[oRoleLetter]})</small> ' if len(oRoleSet)==1 else ''}in the Greek originals</h2>"
+        else: # we can list all uses of the word
+            maxWordsToShow = 100
+            lemmaHTML = f"<h2>Have {len(thisLemmaRowsList):,} {'use' if len(thisLemmaRowsList)==1 else 'uses'} of Greek root word <small>(lemma)</small> ‘{thisLemmaStr}’ {f'<small>({CNTR_ROLE_NAME_DICT[oRoleLetter]})</small> ' if len(oRoleSet)==1 else ''}in the Greek originals</h2>"
+        for displayCounter,oN in enumerate( thisLemmaRowsList, start=1 ):
+            oWordRef, oGreekWord, _oSRLemma, _oGrkLemma, oVLTGlossWords, oOETGlossWords, _oGlossCaps,_oProbability, _oExtendedStrongs, oRoleLetter, oMorphology, _oTagsStr = state.OETRefData['word_tables'][GreekWordFileName].getFields( oN )
+            oFormattedContextGlossWords = formatNTContextSpansOETGlossWords( oN, state )
+            oBBB, oC, oV = NTLemmaIndex.getRowVerse( oN )
+            oW = oWordRef.split( 'w', 1 )[1]
+            oTidyMorphology = oMorphology[4:] if oMorphology.startswith('····') else oMorphology
+            usedRoleLetters.add( oRoleLetter )
+            if oTidyMorphology != '···': usedMorphologies.add( oTidyMorphology )
+            # if other_count == 0:
+            oVerseLinked = not state.TEST_MODE_FLAG or oBBB in state.preloadedBibles['OET-RV']
+            oTidyBbbb, oOETLink, oOET_LV_verse_HTML, oOET_RV_verse_HTML = get_Greek_lemma_line_verse_parts( level, oBBB, oC, oV, oVerseLinked )
+            oGreekWordLink = f'<a title="Go to word page" href="../GrkWrd/{getGreekWordpageFilename(oN, state )}#Top">{oGreekWord}</a>' if oVerseLinked else oGreekWord
+            translation = '<small>(no English gloss here)</small>' if oVLTGlossWords=='-' else f'''‘{tidy_Greek_lemma_gloss(oFormattedContextGlossWords)}’'''
+            lemmaHTML = f'''{lemmaHTML}\n<p class="lemmaLine">{oOETLink} <b>{oGreekWordLink}</b> ({transliterate_Greek(oGreekWord)})''' \
+                f"{f' {CNTR_ROLE_NAME_DICT[oRoleLetter].title()}' if len(oRoleSet)>1 else ''} {oTidyMorphology}" \
+                f''' {translation} <a title="Go to Statistical Restoration Greek page" href="https://GreekCNTR.org/collation/?v={CNTR_BOOK_ID_MAP[oBBB]}{oC.zfill(3)}{oV.zfill(3)}">SR GNT {oTidyBbbb} {oC}:{oV} word {oW}</a></p>{f'\n{oOET_LV_verse_HTML}' if oOET_LV_verse_HTML else ''}{f'\n{oOET_RV_verse_HTML}' if oOET_RV_verse_HTML else ''}'''
+            # other_count += 1
+            # if other_count >= 120:
+            #     lemmaHTML = f'{lemmaHTML}\n<p class="summary">({len(thisWordNumberList)-other_count-1:,} more examples not listed)</p>'
+            #     break
+            if displayCounter >= maxWordsToShow: break
+        assert '\\' not in lemmaHTML, f"{lemmaHTML=}"
+        return lemmaHTML
+    # end of createOETReferencePages.create_Greek_lemma_page.makeGreekLemmaHTML
+
+    lemmasHtml = f"{lemmasHtml}\n{makeGreekLemmaHTML(lemma, grkLemmaWordRowsList)}"
+
+    # Consider related lemmas, e.g., with or without prefix
+    this_extended_lemma_list = [lemma]
+    for this_second_lemma, prefix in NTLemmaIndex.getPrefixedLemmas( lemma ): # Only KNOWN_GREEK_PREFIXES
+        # print(f"create_Greek_lemma_page also got lemma '{this_second_lemma}' with prefix '{prefix}' (cf. '{lemma}')")
+        grkLemmaWordRowsList = state.OETRefData['NTLemmaDict'][this_second_lemma]
+        # lemmaFormsList = sorted( state.OETRefData['NTLemmaFormsDict'][this_second_lemma] )
+        # lemmaGlossesList = sorted( state.OETRefData['NTLemmaOETGlossesDict'][this_second_lemma] )
+        this_second_lemma_link = f'<a title="Go to lemma page" href="{this_second_lemma}.htm#Top">{this_second_lemma}</a>'
+        if len(this_extended_lemma_list) == 1:
+            lemmasHtml = f"{lemmasHtml}\n<h1>Other possible lexically-related lemmas</h1>"
+        lemmasHtml = f'''{lemmasHtml}
+<h2>Greek root word <small>(lemma)</small> ‘{this_second_lemma}’ <small>with prefix=‘{prefix}’</small></h2>
+{makeGreekLemmaHTML(this_second_lemma_link, grkLemmaWordRowsList)}'''
+        this_extended_lemma_list.append( this_second_lemma )
+    # if len(this_extended_lemma_list) > 1:
+    #     print( f"Got {this_extended_lemma_list=}" )
+
+    # Consider other lemmas with similar English glosses
+    similarLemmaSet = set()
+    for lemmaGloss in grkLemmaOETGlossesList:
+        if lemmaGloss not in COMMON_ENGLISH_WORDS_LIST: # Ignore the most common words
+            # List other lemmas that are glossed similarly
+            try:
+                similarWords = (lemmaGloss,) + SIMILAR_GLOSS_WORDS_DICT[lemmaGloss]
+                # print( f"      {lemmaGloss=} {similarWords=} {ll} {lemma=} {lemmaGlossesList=}")
+            except KeyError: similarWords = (lemmaGloss,)
+            for similarWord in similarWords:
+                # NOTE: The glosses in the index contain raw words and well as HTML spans for gloss helpers, etc.
+                for otherLemma in NTLemmaIndex.getGlossLemmas( similarWord ):
+                    if otherLemma != lemma:
+                        similarLemmaSet.add( otherLemma )
+    if similarLemmaSet:
+        # print( f"{lemma=} {lemmaGlossesList=} {extraLemmaSet=}" )
+        lemmasHtml = f'''{lemmasHtml}
+<h1>Lemmas with similar glosses to ‘{grkLemma}’ ({lemma})</h1>'''
+        for extraLemma in similarLemmaSet:
+            extra_lemma_link = f'<a title="Go to lemma page" href="{extraLemma}.htm#Top">{extraLemma}</a>'
+            lemmasHtml = f"{lemmasHtml}\n{makeGreekLemmaHTML(extra_lemma_link, state.OETRefData['NTLemmaDict'][extraLemma])}"
+
+    # Consider other lemmas with contrastive English glosses
+    contrastiveLemmaSet = set()
+    for lemmaGloss in grkLemmaOETGlossesList:
+        if lemmaGloss not in COMMON_ENGLISH_WORDS_LIST: # Ignore the most common words
+            # List other lemmas that are glossed as antonyms
+            try:
+                contrastiveWords = CONTRASTIVE_GLOSS_WORDS_DICT[lemmaGloss]
+                # print( f"      {lemmaGloss=} {contrastiveWords=} {ll} {lemma=} {lemmaGlossesList=}")
+            except KeyError: contrastiveWords = []
+            for contrastiveWord in contrastiveWords:
+                for otherLemma in NTLemmaIndex.getGlossLemmas( contrastiveWord ):
+                    if otherLemma != lemma:
+                        assert otherLemma not in similarLemmaSet
+                        contrastiveLemmaSet.add( otherLemma )
+    if contrastiveLemmaSet:
+        # print( f"{lemma=} {lemmaGlossesList=} {extraLemmaSet=}" )
+        lemmasHtml = f'''{lemmasHtml}
+<h1>Lemmas with contrastive glosses to ‘{grkLemma}’ ({lemma})</h1>'''
+        for contrastiveLemma in contrastiveLemmaSet:
+            extra_lemma_link = f'<a title="Go to lemma page" href="{contrastiveLemma}.htm#Top">{contrastiveLemma}</a>'
+            lemmasHtml = f"{lemmasHtml}\n{makeGreekLemmaHTML(extra_lemma_link, state.OETRefData['NTLemmaDict'][contrastiveLemma])}"
+    assert '\\' not in lemmasHtml, f"{lemmalemmasHtmlHTML=}"
+
+    keyHtml = ''
+    if usedRoleLetters or usedMorphologies: # Add a key at the bottom
+        for usedRoleLetter in sorted( usedRoleLetters ):
+            keyHtml = f'{keyHtml} <b>{usedRoleLetter}</b>={CNTR_ROLE_NAME_DICT[usedRoleLetter]}'
+        for usedMorphology in sorted( usedMorphologies ):
+            try:
+                keyHtml = f"{keyHtml} <b>{usedMorphology}</b>={CNTR_MORPHOLOGY_NAME_DICT[usedMorphology.upper()]}"
+            except KeyError:
+                logging.warning( f"Missing {usedMorphology=}")
+        if keyHtml:
+            keyHtml = f'\n<p class="key" id="Key"><b>Key</b>:{keyHtml}</p>'
+
+    # Now put it all together
+    top = makeTop( level, None, 'lemma', None, state ) \
+                    .replace( '__TITLE__', f"Greek lemma ‘{lemma}’{' TEST' if state.TEST_MODE_FLAG else ''}" ) \
+                    .replace( '__KEYWORDS__', 'Bible, word' )
+    lemmasHtml = f'''{top}{lemmasHtml}{keyHtml}{makeBottom( level, None, 'lemma', state )}'''
+    assert checkHtml( f'GreekLemmaPage for {lemmaIndex} {lemma=}', lemmasHtml )
+    filepath = outputFolderPath.joinpath( output_filename )
+    assert not filepath.is_file() # Check that we're not overwriting anything
+    with open( filepath, 'wt', encoding='utf-8' ) as html_output_file:
+        html_output_file.write( lemmasHtml )
+    vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  Wrote {len(lemmasHtml):,} characters to {output_filename}" )
+    return True
+# end of createOETReferencePages.create_Greek_lemma_page
+
+
 NUM_STRONGS_INDEX_ENTRIES = 60
 STRONGS_NUMBER_REGEX = re.compile( '>[GH][1-9][0-9]{0,4}<' ) # It's inside a span
 STRONGS_FOLDER_DICT = {'G':'GrkStrng', 'H':'HebStrng'}
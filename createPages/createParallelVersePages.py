@@ -85,10 +85,15 @@ CHANGELOG:
     2026-05-26 Reducing some logging verbosity
     2026-07-05 Added OpenBibleImages
     2026-08-16 If second paired version is the same as the first, combine them (BSB/MSB & WEBBE/WMBB)
+    2026-10-16 Optionally shard the books (balanced by verse count) across forked processes
+    2026-10-16 Raise the garbage collection thresholds in the shard workers (startForkedWorker) and report their shared/private memory
+    2026-10-16 Use the WordTable columns in brightenSRGNT() and brightenUHB() (rather than splitting the TSV rows again)
+    2026-10-16 Look up verses in the word tables with WordTableIndex.getWordNumberRange()
 """
 from pathlib import Path
 import os
 import logging
+import multiprocessing
 import re
 from collections import defaultdict
 
@@ -114,13 +119,14 @@ from html import do_OET_RV_HTMLcustomisations, do_OET_LV_HTMLcustomisations, do_
 from createSectionPages import findSectionNumber
 from createOETReferencePages import OSHB_ADJECTIVE_DICT, OSHB_PARTICLE_DICT, OSHB_NOUN_DICT, OSHB_PREPOSITION_DICT, OSHB_PRONOUN_DICT, OSHB_SUFFIX_DICT
 from OETHandlers import getOETTidyBBB, getOETBookName, livenOETWordLinks, livenOETCompatibleWordLinks, getHebrewWordpageFilename, getGreekWordpageFilename
-from spellCheckEnglish import spellCheckAndMarkHTMLText
+from spellCheckEnglish import spellCheckAndMarkHTMLText, getSpellCheckCounters, clearSpellCheckCounters, mergeSpellCheckCounters
+from buildStages import startForkedWorker, getMemoryUsage, formatMemoryUsage
 
 
-LAST_MODIFIED_DATE = '2026-08-19' # by RJH
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
 SHORT_PROGRAM_NAME = "createParallelVersePages"
 PROGRAM_NAME = "OpenBibleData createParallelVersePages functions"
-PROGRAM_VERSION = '1.0.4'
+PROGRAM_VERSION = '1.0.7'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -187,10 +193,15 @@ def createParallelVersePages( level:int, folder:Path, state:State ) -> bool:
     # Now create the actual parallel pages
     state.versesWithImages = defaultdict( list )
     state.possibleUnmatchedProperNames = set()
-    for BBB in reorderBooksForOETVersions( state.allBBBs ):
-        if not state.TEST_MODE_FLAG or BBB in state.TEST_BOOK_LIST: # Don't need parallel pages for non-test books
-            if bos_books_codes_py.is_chapter_verse_book( BBB ):
-                createParallelVersePagesForBook( level, folder, BBB, BBBNextLinks, parallelVersions, state )
+    BBBsToMake = [BBB for BBB in reorderBooksForOETVersions( state.allBBBs )
+                    if (not state.TEST_MODE_FLAG or BBB in state.TEST_BOOK_LIST) # Don't need parallel pages for non-test books
+                    and bos_books_codes_py.is_chapter_verse_book( BBB )]
+    if state.SHARD_PARALLEL_VERSE_PAGES_FLAG and BibleOrgSysGlobals.maxProcesses > 1 and len(BBBsToMake) > 1 \
+    and not BibleOrgSysGlobals.alreadyMultiprocessing: # Process the books with different processes
+        _createParallelVersePagesForBooksSharded( level, folder, BBBsToMake, BBBNextLinks, parallelVersions, state )
+    else: # no multi-processing
+        for BBB in BBBsToMake:
+            createParallelVersePagesForBook( level, folder, BBB, BBBNextLinks, parallelVersions, state )
     vPrint( 'Info', DEBUGGING_THIS_MODULE, f"\nPossible Unmatched Proper Names ({len(state.possibleUnmatchedProperNames):,}) {sorted(state.possibleUnmatchedProperNames)}" )
 
     # Create index page
@@ -219,6 +230,97 @@ def createParallelVersePages( level:int, folder:Path, state:State ) -> bool:
 # end of createParallelVersePages.createParallelVersePages
 
 
+def _getBookVerseCount( BBB:str, parallelVersions:list[str], state:State ) -> int:
+    """
+    Returns the number of verses in the book (using the same reference Bible as createParallelVersePagesForBook)
+        which is roughly proportional to how long it takes to make the parallel pages for that book.
+
+    Note: this also causes the book to be loaded BEFORE we fork (so it's shared).
+    """
+    for versionAbbreviation in parallelVersions: # Our adjusted order
+        if versionAbbreviation == 'OET': continue # that's only a "pseudo-version"!
+        try: referenceBible = state.preloadedBibles[versionAbbreviation]
+        except KeyError: continue # We don't have that version
+        if BBB not in referenceBible: continue # don't want to force loading the book
+        numChapters = referenceBible.getNumChapters( BBB ) # Causes the book to be loaded if not already
+        if numChapters:
+            return sum( referenceBible.getNumVerses( BBB, c ) or 0 for c in range( 1, numChapters+1 ) )
+    return 1
+# end of createParallelVersePages._getBookVerseCount
+
+
+_shardParameters = None # Set just before forking so that the worker processes inherit it (rather than pickling the huge state)
+def _createParallelVersePagesForBooksMP( shardIndex:int ) -> tuple[list[str],dict,set,dict]:
+    """
+    Multiprocessing version!
+
+    Makes the parallel verse pages for the books in one shard
+        and returns only the small results that need to be merged back into the parent process.
+    """
+    level, folder, shards, BBBLinks, parallelVersions, state = _shardParameters
+    fnPrint( DEBUGGING_THIS_MODULE, f"_createParallelVersePagesForBooksMP( {shardIndex} ) for {shards[shardIndex]}" )
+
+    startForkedWorker()
+    # Only send back what this shard found (this process might have done another shard already)
+    state.versesWithImages = defaultdict( list )
+    state.possibleUnmatchedProperNames = set()
+    clearSpellCheckCounters()
+    BBBsMade = []
+    for BBB in shards[shardIndex]:
+        if createParallelVersePagesForBook( level, folder, BBB, BBBLinks, parallelVersions, state ):
+            BBBsMade.append( BBB )
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"    Parallel verse pages shard {shardIndex} {BBBsMade} finished with {formatMemoryUsage( getMemoryUsage() )}." )
+    return BBBsMade, dict( state.versesWithImages ), state.possibleUnmatchedProperNames, getSpellCheckCounters()
+# end of createParallelVersePages._createParallelVersePagesForBooksMP
+
+
+def _createParallelVersePagesForBooksSharded( level:int, folder:Path, BBBsToMake:list[str], BBBLinks:list[str], parallelVersions:list[str], state:State ) -> list[str]:
+    """
+    Split the books into shards with roughly equal numbers of verses,
+        then fork processes (which inherit the preloaded Bibles) to make the parallel verse pages for each shard.
+
+    Returns the list of books that were made.
+    """
+    global _shardParameters
+    fnPrint( DEBUGGING_THIS_MODULE, f"_createParallelVersePagesForBooksSharded( {level}, {folder}, {BBBsToMake}, … )" )
+
+    # Put the biggest books in first, each into the shard with the fewest verses so far
+    BBBVerseCounts = {BBB:_getBookVerseCount( BBB, parallelVersions, state ) for BBB in BBBsToMake}
+    numShards = min( BibleOrgSysGlobals.maxProcesses, len(BBBsToMake) )
+    shards, shardVerseCounts = [[] for _s in range(numShards)], [0] * numShards
+    for BBB in sorted( BBBsToMake, key=lambda BBB: BBBVerseCounts[BBB], reverse=True ):
+        smallestShardIndex = shardVerseCounts.index( min( shardVerseCounts ) )
+        shards[smallestShardIndex].append( BBB )
+        shardVerseCounts[smallestShardIndex] += BBBVerseCounts[BBB]
+    for shard in shards: shard.sort( key=BBBsToMake.index ) # Back into our book order within each shard
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Creating parallel verse pages for {len(BBBsToMake)} books using {numShards} processes with {shardVerseCounts} verses: {shards}…" )
+
+    _shardParameters = (level, folder, shards, BBBLinks, parallelVersions, state)
+    BibleOrgSysGlobals.alreadyMultiprocessing = True
+    try:
+        with multiprocessing.get_context( 'fork' ).Pool( processes=numShards ) as pool: # start worker processes
+            results = pool.map( _createParallelVersePagesForBooksMP, range(numShards), chunksize=1 )
+    finally:
+        BibleOrgSysGlobals.alreadyMultiprocessing = False
+        _shardParameters = None
+    assert len(results) == numShards
+
+    # Merge the shard results back into our state (in our book order so we get the same results as the serial version)
+    BBBsMade, shardVersesWithImages = [], {}
+    for shardBBBsMade, versesWithImages, possibleUnmatchedProperNames, spellCheckCounters in results:
+        BBBsMade.extend( shardBBBsMade )
+        shardVersesWithImages.update( versesWithImages )
+        state.possibleUnmatchedProperNames.update( possibleUnmatchedProperNames )
+        mergeSpellCheckCounters( spellCheckCounters )
+    for BBB in BBBsToMake:
+        if BBB in shardVersesWithImages:
+            state.versesWithImages[BBB].extend( shardVersesWithImages[BBB] )
+    BBBsMade.sort( key=BBBsToMake.index )
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Made parallel verse pages for {len(BBBsMade)}/{len(BBBsToMake)} books." )
+    return BBBsMade
+# end of createParallelVersePages._createParallelVersePagesForBooksSharded
+
+
 class MissingBookError( Exception ): pass
 class UntranslatedVerseError( Exception ): pass
 
@@ -1303,18 +1405,19 @@ def brightenSRGNT( BBB:str, C:str, V:str, brightenTextHtml:str, verseEntryList,
     strippedGrkWords = [punctuatedGrkWord.lstrip( '“‘˚(' ).rstrip( '.,?!:’ ”·;)–…' ) for punctuatedGrkWord in punctuatedGrkWords] # Includes (now) space between speech closing marks
 
     # Match Greek words to word numbers
-    firstWordNumber,lastWordNumber = state.OETRefData['word_table_indexes'][wordFileName][brRef]
+    firstWordNumber,lastWordNumber = state.OETRefData['word_table_indexes'][wordFileName].getWordNumberRange( BBB, C, V )
+    wordTable = state.OETRefData['word_tables'][wordFileName]
+    refColumn, greekWordColumn, probabilityColumn = wordTable.getColumn( 'Ref' ), wordTable.getColumn( 'GreekWord' ), wordTable.getColumn( 'Probability' )
     currentWordNumber = firstWordNumber
     grkWordNumbers = []
     for strippedGrkWord in strippedGrkWords:
         assert strippedGrkWord, f"{brRef} {strippedGrkWords=} from {punctuatedGrkWords=} from {cleanedbrightenTextHtml=} from {brightenTextHtml=}"
         # print( f"  {brRef} {strippedGrkWord=} {currentWordNumber=} from ({firstWordNumber},{lastWordNumber})" )
-        ref, greekWord, SRLemma, _GrkLemma, VLTGlossWordsStr, OETGlossWordsStr, glossCaps, probability, extendedStrongs, roleLetter, morphology, tagsStr = state.OETRefData['word_tables'][wordFileName][currentWordNumber].split( '\t' )
-        # print( f"    A {currentWordNumber=} {ref=} {greekWord=}" )
-        while probability!='X' and currentWordNumber < lastWordNumber:
+        # print( f"    A {currentWordNumber=} {refColumn[currentWordNumber]=} {greekWordColumn[currentWordNumber]=}" )
+        while probabilityColumn[currentWordNumber]!='X' and currentWordNumber < lastWordNumber:
             currentWordNumber += 1
-            ref, greekWord, SRLemma, _GrkLemma, VLTGlossWordsStr, OETGlossWordsStr, glossCaps, probability, extendedStrongs, roleLetter, morphology, tagsStr = state.OETRefData['word_tables'][wordFileName][currentWordNumber].split( '\t' )
-            # print( f"    B {currentWordNumber=} {ref=} {greekWord=}" )
+            # print( f"    B {currentWordNumber=} {refColumn[currentWordNumber]=} {greekWordColumn[currentWordNumber]=}" )
+        ref, greekWord, probability = refColumn[currentWordNumber], greekWordColumn[currentWordNumber], probabilityColumn[currentWordNumber]
         assert probability=='X', f"  {ref} {greekWord=} {currentWordNumber=} {probability=}"
         if not greekWord.startswith('κρ') and not greekWord.startswith('μακρ') and not greekWord.startswith('γενν'): # Seems there were some spelling changes
             # and greekWord not in ('κράββατον','κράββατόν'):
@@ -1559,7 +1662,7 @@ def brightenUHB( BBB:str, C:str, V:str, brightenUHBTextHtml:str, verseEntryList,
     # print( f"  brightenUHB strippedHebWords={str(strippedHebWords).replace(WJ,'')}" )
 
     # Match Hebrew words to word numbers -- we use the original numbering which is marked as variant in UHB
-    try: firstWordNumber,lastWordNumber = state.OETRefData['word_table_indexes'][wordFileName][f'{BBB}_{vC}:{vV}']
+    try: firstWordNumber,lastWordNumber = state.OETRefData['word_table_indexes'][wordFileName].getWordNumberRange( BBB, vC, vV )
     except KeyError as e:
         logging.error( f"brightenUHB() {UHBRef} nothing for {e}" )
         return brightenUHBTextHtml, []
@@ -1568,7 +1671,6 @@ def brightenUHB( BBB:str, C:str, V:str, brightenUHBTextHtml:str, verseEntryList,
     hebWordNumbers = []
     for strippedHebWord in strippedHebWords:
         # print( f"  {UHBRef} strippedHebWord='{strippedHebWord.replace(WJ,'')}' {currentWordNumber=} from ({firstWordNumber},{lastWordNumber})" )
-        ref, rowType, morphemeRowList, lemmaRowList, strongs, morphology, word, noCantillations, morphemeGlosses, contextualMorphemeGlosses, wordGloss, contextualWordGloss, glossCapitalisation, glossPunctuation, glossOrder, glossInsert, role, nesting, tags = state.OETRefData['word_tables'][wordFileName][currentWordNumber].split( '\t' )
         hebWordNumbers.append( currentWordNumber )
         # TODO: probably d field in PSA is a problem
         # NOTE: Next two lines temporarily disabled 5Jun24
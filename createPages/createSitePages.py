@@ -73,21 +73,44 @@ CHANGELOG:
     2026-04-22 Section indexes are now made BEFORE pickling
     2026-07-04 Added OBI pictures and a few more version numbers on About page, etc.
     2026-08-22 Added FRT to OET books (even though no OET-LV version)
+    2026-10-16 Declare the page families as build stages so independent ones can be built concurrently (with --jobs)
+    2026-10-16 Freeze preloaded objects before starting the build stages
+    2026-10-16 Optional incremental builds using a page fingerprint manifest
+    2026-10-16 Added --resume to skip build stages that were completed by a crashed build
+    2026-10-16 Added --stages, --books, and --versions to build only part of the site (and only preload the versions needed)
+    2026-10-16 Measure each step of the build and save the results in BUILD_REPORT_FILEPATH
+    2026-10-16 Declare the other big state inputs of the build stages so they can be released when no longer needed
+    2026-10-16 Publish the site by atomically switching a symbolic link to a new release folder (and added --rollback)
+    2026-10-16 Delete old folders in background threads (after moving them into TRASH_FOLDER)
+    2026-10-16 Added --preload-jobs
+    2026-10-16 Added --verify-hash
+    2026-10-16 Log and report which reference bundle sections the build materialised
+    2026-10-16 Added --daemon to preload once and then build for each request from buildDaemon.py
+    2026-10-16 Added --preload-memory-budget and exit with status 1 if the build fails
+    2026-10-16 Split the OET word tables into columns once (as WordTables)
+    2026-10-16 Use the OET word tables mapped from their binary forms (MappedWordTables) if we can
+    2026-10-16 Use (and save) WordTableIndexes for the BCV indexes to the OET word tables
+    2026-10-16 Added --verify-word-indexes
+    2026-10-16 Leave the previous site live (and keep the old releases) if the new release can't be switched to
+    2026-10-16 Added --migrate-site
+    2026-10-16 Only build the versions selected with --versions (that the selected stages need) when --stages is also given
 """
 from pathlib import Path
+import sys
 import os
 import shutil
 import glob
 from datetime import date
 import logging
 from collections import defaultdict
+from functools import partial
 
 import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
 from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint, BOOKLIST_OT39, BOOKLIST_NT27
 import bos_books_codes_py
 
-from settings import State, state, reorderBooksForOETVersions
-from Bibles import preloadVersions
+from settings import State, state, reorderBooksForOETVersions, selectBooks
+from Bibles import preloadVersions, mapOETWordTables
 from OETHandlers import getOETTidyBBB, getOETBookName
 from createBookPages import createOETBookPages, createBookPages
 from createChapterPages import createOETSideBySideChapterPages, createChapterPages
@@ -100,79 +123,155 @@ from createOETReferencePages import createOETReferencePages
 from createAppJsonFiles import createAppJsonFiles
 from Dict import createTyndaleDictPages, createUBSDictionaryPages
 from html import makeTop, makeViewNavListParagraph, makeBottom, checkHtml
-from spellCheckEnglish import printSpellCheckSummary
-
-
-LAST_MODIFIED_DATE = '2026-08-22' # by RJH
+from spellCheckEnglish import printSpellCheckSummary, getSpellCheckCounters, mergeSpellCheckCounters
+from buildStages import BuildStage, prepareForForkedWorkers, runBuildStages, getCompletedStages, removeStageCheckpoint, CHECKPOINT_FOLDER_NAME
+from pageManifest import PageManifest, MANIFEST_FILENAME
+from buildReport import BuildReport
+from backgroundRemover import BackgroundRemover
+from publishSite import makeReleaseFolder, migrateToReleases, switchToRelease, removeOldReleases, rollBackRelease
+from buildDaemon import BAD_REQUEST_EXIT_STATUS, serveBuildRequests
+from preloadProfile import PreloadMemoryBudgetError
+from wordTable import WordTable, MappedWordTable
+from wordTableIndex import getWordTableIndex
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
 SHORT_PROGRAM_NAME = "createSitePages"
 PROGRAM_NAME = "OpenBibleData (OBD) Create Site Pages"
-PROGRAM_VERSION = '1.0.5'
+PROGRAM_VERSION = '1.1.14'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False # Adds debugging output
 
 NEWLINE = '\n'
 
+BUILD_STAGE_NAMES = ('par','versions','sections','ilr','rel','tpc','kingdoms','UBS','dct','ref','app') # See _getBuildStages()
+
 
 def _createSitePages() -> bool:
     """
     Build all the pages in a temporary location
+
+    Returns False if any build stages failed.
     """
     fnPrint( DEBUGGING_THIS_MODULE, "_createSitePages()")
     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"_createSitePages() running in {'TEST' if state.TEST_MODE_FLAG else 'production'} mode with {'all production books' if state.ALL_PRODUCTION_BOOKS_FLAG else 'reduced books being loaded'} for {f'{len(state.TEST_VERSIONS_ONLY)}/' if state.TEST_VERSIONS_ONLY else ''}{len(state.BibleLocations):,} Bible versions…" )
     if state.TEST_MODE_FLAG:
         vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"    {state.TEST_BOOK_LIST=}" )
+    state.buildReport = BuildReport()
+    state.backgroundRemover = BackgroundRemover( state.TRASH_FOLDER, state.NUM_DELETION_THREADS ) # So old folders can be deleted while we build
+
+    buildStages = _getSelectedBuildStages( state )
+    buildInputs = _getBuildInputs( state.BibleVersions, state )
+    completedStages = _cleanBuildFolder( buildStages, buildInputs, state )
+    try: _preloadSiteData( state )
+    except PreloadMemoryBudgetError as err:
+        logging.critical( f"Aborting site build: {err}" )
+        _saveBuildReport( state ) # Including the preload profile so far
+        return False
+    return _buildSitePages( buildStages, buildInputs, completedStages, state )
+# end of createSitePages._createSitePages
+
+
+def _getSelectedBuildStages( state:State ) -> list[BuildStage]:
+    """
+    Returns the build stages to run
+        and (if only some stages were selected) sets state.TEST_VERSIONS_ONLY to the versions that they need
+        (only out of state.SELECTED_VERSIONS if some versions were also selected).
+    """
+    buildStages = _getBuildStages( state )
+    if state.SELECTED_BUILD_STAGES: # Only preload the versions that the selected stages actually need
+        state.TEST_VERSIONS_ONLY = _getNeededVersions( buildStages, state, state.SELECTED_VERSIONS )
+        if state.SELECTED_VERSIONS:
+            unusedVersions = [versionAbbreviation for versionAbbreviation in state.SELECTED_VERSIONS if versionAbbreviation not in state.TEST_VERSIONS_ONLY]
+            if unusedVersions:
+                logging.warning( f"Selected {unusedVersions} version(s) aren't used by the {[buildStage.name for buildStage in buildStages]} stages so won't be built" )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Building {[buildStage.name for buildStage in buildStages]} stages which need {len(state.TEST_VERSIONS_ONLY)} versions: {state.TEST_VERSIONS_ONLY}" )
+    return buildStages
+# end of createSitePages._getSelectedBuildStages
+
+
+def _getBuildInputs( BibleVersions:list[str], state:State ) -> str:
+    """
+    Returns a string with anything that affects every page (for the checkpoints and the page manifest).
+
+    BibleVersions is the list from before preloading (which removes some, e.g., TOSN).
+    """
+    return f"{PROGRAM_NAME_VERSION} {state.TEST_MODE_FLAG} {state.OET_VERSION_NUMBER_STRING if state.TEST_MODE_FLAG else ''} {BibleVersions} {state.TEST_VERSIONS_ONLY} {state.TEST_BOOK_LIST}"
+# end of createSitePages._getBuildInputs
 
-    try: os.makedirs( state.TEMP_BUILD_FOLDER )
-    except FileExistsError:
-        assert os.path.isdir( state.TEMP_BUILD_FOLDER )
-        _cleanHTMLFolders( state.TEMP_BUILD_FOLDER, state )
 
+def _cleanBuildFolder( buildStages:list[BuildStage], buildInputs:str, state:State ) -> dict[str,dict]:
+    """
+    Make or clean out the temporary build folder.
+
+    Returns the stages that were already completed (if we're resuming a crashed build).
+    """
+    with state.buildReport.measure( 'clean' ):
+        try: os.makedirs( state.TEMP_BUILD_FOLDER )
+        except FileExistsError:
+            assert os.path.isdir( state.TEMP_BUILD_FOLDER )
+            # If we're resuming a crashed build, keep the pages from any stages that were already completed
+            completedStages = getCompletedStages( buildStages, state, buildInputs ) if state.RESUME_BUILD_FLAG else {}
+            _cleanHTMLFolders( state.TEMP_BUILD_FOLDER, state, buildStages, completedStages )
+        else: completedStages = {}
+    return completedStages
+# end of createSitePages._cleanBuildFolder
+
+
+def _preloadSiteData( state:State ) -> None:
+    """
+    Preload our Bibles and other resources, and then load and index the OET word tables.
+    """
     # Preload our various Bibles
     for versionAbbreviation in state.BibleVersions:
         state.booksToLoad[versionAbbreviation] = BOOKLIST_OT39 if state.booksToLoad[versionAbbreviation]==['OT'] \
                                             else BOOKLIST_NT27 if state.booksToLoad[versionAbbreviation]==['NT'] \
                                             else state.booksToLoad[versionAbbreviation] # NOTE: We don't replace ['ALL'] because that is 'all available', including 'FRT','XXA', etc.
-    numLoadedVersions = preloadVersions( state )
+    with state.buildReport.measure( 'preload' ):
+        preloadVersions( state )
     vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\nPreloaded {len(state.preloadedBibles)} Bible versions: {list(state.preloadedBibles.keys())}" )
     # preloadUwTranslationNotes( state )
     # fillSelectedVerses( state )
 
-    # Load our OET worddata tables
-    state.OETRefData = {} # This is where we will store all our temporary ref data
-    state.OETRefData['word_tables'] = {}
-    lvBible = state.preloadedBibles['OET-LV']
-    assert len(lvBible.ESFMWordTables) == 2, f"{len(lvBible.ESFMWordTables)=}"
-    # print( f"{lvBible.ESFMWordTables=}" )
-    for wordTableFilename in lvBible.ESFMWordTables:
-        assert wordTableFilename.endswith( '.tsv' )
-        if lvBible.ESFMWordTables[wordTableFilename] is None:
-            lvBible.loadESFMWordFile( wordTableFilename )
-        # print( f"{type(lvBible.ESFMWordTables[wordTableFilename])}" )
-        state.OETRefData['word_tables'][wordTableFilename] = lvBible.ESFMWordTables[wordTableFilename]
-        columnHeaders = state.OETRefData['word_tables'][wordTableFilename][0]
-        # print( f"{columnHeaders=}")
-        if '_OT_' in wordTableFilename:
-            assert columnHeaders == 'Ref\tRowType\tMorphemeRowList\tLemmaRowList\tStrongs\tMorphology\tWord\tNoCantillations\tMorphemeGlosses\tContextualMorphemeGlosses\tWordGloss\tContextualWordGloss\tGlossCapitalisation\tGlossPunctuation\tGlossOrder\tGlossInsert\tRole\tNesting\tTags' # If not, probably need to fix some stuff
-        elif '_NT_' in wordTableFilename:
-            assert columnHeaders == 'Ref\tGreekWord\tSRLemma\tGreekLemma\tVLTGlossWords\tOETGlossWords\tGlossCaps\tProbability\tStrongsExt\tRole\tMorphology\tTags' # If not, probably need to fix some stuff
-
-    # Make a BCV index to the OET word tables
-    state.OETRefData['word_table_indexes'] = {}
-    for wordTableFilename in lvBible.ESFMWordTables:
-        state.OETRefData['word_table_indexes'][wordTableFilename] = {}
-        lastBCVref = None
-        startIx = 1
-        for n, columns_string in enumerate( state.OETRefData['word_tables'][wordTableFilename][1:], start=1 ):
-            wordRef = columns_string.split( '\t', 1 )[0] # Something like 'MAT_1:1w1'
-            BCVref = wordRef.split( 'w', 1 )[0] # Something like 'MAT_1:1'
-            if BCVref != lastBCVref:
-                if lastBCVref is not None:
-                    state.OETRefData['word_table_indexes'][wordTableFilename][lastBCVref] = (startIx,n-1)
-                startIx = n
-                lastBCVref = BCVref
-        state.OETRefData['word_table_indexes'][wordTableFilename][lastBCVref] = (startIx,n) # Save the final one
+    with state.buildReport.measure( 'wordTables' ):
+        # Load our OET worddata tables
+        state.OETRefData = {} # This is where we will store all our temporary ref data
+        state.OETRefData['word_tables'] = {}
+        lvBible = state.preloadedBibles['OET-LV']
+        assert len(lvBible.ESFMWordTables) == 2, f"{len(lvBible.ESFMWordTables)=}"
+        # print( f"{lvBible.ESFMWordTables=}" )
+        mapOETWordTables( lvBible, state ) # Usually already done when the OET-LV was loaded
+        for wordTableFilename in lvBible.ESFMWordTables:
+            assert wordTableFilename.endswith( '.tsv' )
+            if isinstance( lvBible.ESFMWordTables[wordTableFilename], MappedWordTable ): # Fields are decoded from the mapped file when they're used
+                state.OETRefData['word_tables'][wordTableFilename] = lvBible.ESFMWordTables[wordTableFilename]
+            else: # Still have the TSV lines
+                if lvBible.ESFMWordTables[wordTableFilename] is None:
+                    lvBible.loadESFMWordFile( wordTableFilename )
+                # print( f"{type(lvBible.ESFMWordTables[wordTableFilename])}" )
+                state.OETRefData['word_tables'][wordTableFilename] = WordTable( wordTableFilename, lvBible.ESFMWordTables[wordTableFilename] ) # Split into columns once
+            columnHeaders = state.OETRefData['word_tables'][wordTableFilename][0]
+            # print( f"{columnHeaders=}")
+            if '_OT_' in wordTableFilename:
+                assert columnHeaders == 'Ref\tRowType\tMorphemeRowList\tLemmaRowList\tStrongs\tMorphology\tWord\tNoCantillations\tMorphemeGlosses\tContextualMorphemeGlosses\tWordGloss\tContextualWordGloss\tGlossCapitalisation\tGlossPunctuation\tGlossOrder\tGlossInsert\tRole\tNesting\tTags' # If not, probably need to fix some stuff
+            elif '_NT_' in wordTableFilename:
+                assert columnHeaders == 'Ref\tGreekWord\tSRLemma\tGreekLemma\tVLTGlossWords\tOETGlossWords\tGlossCaps\tProbability\tStrongsExt\tRole\tMorphology\tTags' # If not, probably need to fix some stuff
+
+        # Make (or load) a BCV index to the OET word tables
+        state.OETRefData['word_table_indexes'] = {}
+        for wordTableFilename in lvBible.ESFMWordTables:
+            state.OETRefData['word_table_indexes'][wordTableFilename] = getWordTableIndex( wordTableFilename, state.OETRefData['word_tables'][wordTableFilename], state.BINARY_WORD_TABLES_FOLDER )
+# end of createSitePages._preloadSiteData
+
+
+def _buildSitePages( buildStages:list[BuildStage], buildInputs:str, completedStages:dict[str,dict], state:State ) -> bool:
+    """
+    Build the pages from the preloaded data (in state.TEMP_BUILD_FOLDER)
+        and then make them into a new release (if requested).
 
+    Returns False if any build stages failed.
+    """
     # Determine our inclusive list of books for all versions
     allBBBs = set()
     for BBB in bos_books_codes_py.get_all_bos_book_codes():
@@ -236,207 +335,442 @@ def _createSitePages() -> bool:
     # Ok, let's go create some static pages
     assert 'discoveryResults' in state.preloadedBibles['OET-RV'].__dict__
     assert 'discoveryResults' in state.preloadedBibles['OET-LV'].__dict__
-    createOETSectionLists( state.preloadedBibles['OET-RV'], state ) # Have to do this early for section references
-
-    # Do individual verse pages first because they give more detailed error messages for source Bible formatting errors
-    # TODO: We could use multiprocessing to do all these at once
-    #   (except that state is quite huge with all preloaded versions and hence expensive to pickle)
-    if state.CREATE_PARALLEL_VERSE_PAGES == 'FIRST':
-        createParallelVersePages( 1, state.TEMP_BUILD_FOLDER.joinpath('par/'), state )
-    elif not state.CREATE_PARALLEL_VERSE_PAGES:
-        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"NOT GENERATING {'TEST ' if state.TEST_MODE_FLAG else ''}parallel verse pages." )
-    elif state.CREATE_PARALLEL_VERSE_PAGES != 'LAST': have_invalid_value
-
-    if state.CREATE_BOOK_AND_OTHER_PAGES_FLAG:
-        state.chaptersWithImages = defaultdict( list )
-        if 'OET' in state.BibleVersions: # this is a special case
-            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Creating {'TEST ' if state.TEST_MODE_FLAG else ''}version pages for OET…" )
-            versionFolder = state.TEMP_BUILD_FOLDER.joinpath( f'OET/' )
-            _createOETVersionPages( 1, versionFolder, state.preloadedBibles['OET-RV'], state.preloadedBibles['OET-LV'], state )
-            _createOETMissingVersesPage( 1, versionFolder )
-        for versionAbbreviation, thisBible in state.preloadedBibles.items(): # doesn't include OET pseudo-translation
-            # if versionAbbreviation not in ('TTN',) \
-            if versionAbbreviation in state.versionsWithoutTheirOwnPages:
-                if versionAbbreviation == 'TTN': continue # These ones don't even have a folder
-                # We just write a very bland index page here
-                versionName = state.BibleNames[versionAbbreviation]
-                indexHtml = f'<h1 id="Top">{versionName}</h1>'
-                top = makeTop( 1, None, 'site', None, state ) \
-                                .replace( '__TITLE__', f"{versionName}{' TEST' if state.TEST_MODE_FLAG else ''}" ) \
-                                .replace( '__KEYWORDS__', f'Bible, {versionAbbreviation}, {versionName}' )
-                folder = state.TEMP_BUILD_FOLDER.joinpath( f'{versionAbbreviation}/' )
-                os.makedirs( folder )
-                filepath = folder.joinpath( 'index.htm' )
-                assert not filepath.is_file() # Check that we're not overwriting anything
-                with open( filepath, 'wt', encoding='utf-8' ) as indexHtmlFile:
-                    indexHtmlFile.write( f'''{top}{indexHtml}\n<p class="note"><a href="details.htm">See copyright details.</p><!--note-->\n{makeBottom( 1, None, 'site', state )}''' )
-                vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"    {len(indexHtml):,} characters written to {filepath}" )
-            else: # these versions should have the full pages
-                if versionAbbreviation == 'TTN': continue # Not actually a Bible version
-                # vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\nDoing discovery for {thisBible.abbreviation} ({thisBible.name})…" )
-                assert 'discoveryResults' in thisBible.__dict__
-                if 'haveSectionHeadings' not in thisBible.discoveryResults['ALL']: # probably we have no books that actually loaded
-                    dPrint( 'Normal', DEBUGGING_THIS_MODULE, f"Adding discoveryResults 'haveSectionHeadings' for {thisBible.abbreviation}: no books loaded?" )
-                    thisBible.discoveryResults['ALL']['haveSectionHeadings'] = False # We need this in several places
-                if not state.TEST_MODE_FLAG or versionAbbreviation not in ('OEB','WEBBE','WEB','WMBB','WMB','NET','LSV','FBV','TCNT','T4T','LEB',
-                                                        'BBE','Moff','JPS','ASV','DRA','YLT','Drby','RV','Wbstr',
-                                                        'KJB-1769','Bshps','Gnva','Cvdl','TNT','Wycl'):
-                    # In test mode, we don't usually need to make all those pages, even just for the test books
-                    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Creating {'TEST ' if state.TEST_MODE_FLAG else ''}version pages for {thisBible.abbreviation} ({thisBible.name})…" )
-                    versionFolder = state.TEMP_BUILD_FOLDER.joinpath( f'{thisBible.abbreviation}/' )
-                    _createVersionPages( 1, versionFolder, thisBible, state )
-
-        if 'OET' in state.BibleVersions: # this is a special case
-            rvBible, lvBible = state.preloadedBibles['OET-RV'], state.preloadedBibles['OET-LV']
-            if rvBible.discoveryResults['ALL']['haveSectionHeadings'] or lvBible.discoveryResults['ALL']['haveSectionHeadings']:
-                versionFolder = state.TEMP_BUILD_FOLDER.joinpath( f'OET/' )
-                createOETSectionPages( 2, versionFolder.joinpath('bySec/'), rvBible, lvBible, state )
-        state.sectionsWithImages = defaultdict( list )
-        for versionAbbreviation, thisBible in state.preloadedBibles.items(): # doesn't include OET pseudo-translation
-            if versionAbbreviation not in ('TTN',) \
-            and versionAbbreviation in state.versionsWithoutTheirOwnPages: continue # We don't worry about these few selected verses here
-            if versionAbbreviation not in ('TOSN','TTN','SOTN','UTN'): # We don't make separate notes pages
-                if thisBible.discoveryResults['ALL']['haveSectionHeadings']:
-                    versionFolder = state.TEMP_BUILD_FOLDER.joinpath( f'{thisBible.abbreviation}/' )
-                    createSectionPages( 2, versionFolder.joinpath('bySec/'), thisBible, state )
+    with state.buildReport.measure( 'sectionLists' ):
+        createOETSectionLists( state.preloadedBibles['OET-RV'], state ) # Have to do this early for section references
 
-    if state.CREATE_PARALLEL_VERSE_PAGES == 'LAST':
-        createParallelVersePages( 1, state.TEMP_BUILD_FOLDER.joinpath('par/'), state )
-    elif not state.CREATE_PARALLEL_VERSE_PAGES:
+    # Do individual verse pages first (if requested) because they give more detailed error messages for source Bible formatting errors
+    #   The stages that don't depend on each other can be built at the same time by forked worker processes
+    if not state.CREATE_PARALLEL_VERSE_PAGES:
         vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"NOT GENERATING {'TEST ' if state.TEST_MODE_FLAG else ''}parallel verse pages." )
-    elif state.CREATE_PARALLEL_VERSE_PAGES != 'FIRST': have_invalid_value
-
-    if not state.REUSE_EXISTING_WORD_PAGES_FLAG:
-        createOETInterlinearPages( 1, state.TEMP_BUILD_FOLDER.joinpath('ilr/'), state )
-        createParallelPassagePages( 1, state.TEMP_BUILD_FOLDER.joinpath('rel/'), state )
-        createTopicPages( 1, state.TEMP_BUILD_FOLDER.joinpath('tpc/'), state )
-        createKingdomPages( 2, state.TEMP_BUILD_FOLDER.joinpath('ref/Kingdoms/'), state )
-        createUBSDictionaryPages( 1, state.TEMP_BUILD_FOLDER.joinpath('UBS/'), state )
-        createTyndaleDictPages( 1, state.TEMP_BUILD_FOLDER.joinpath('dct/'), state )
-        createOETReferencePages( 1, state.TEMP_BUILD_FOLDER.joinpath('ref/'), state )
-        createAppJsonFiles( 1, state.TEMP_BUILD_FOLDER.joinpath('app/'), state )
-    else:
+    elif state.CREATE_PARALLEL_VERSE_PAGES not in ('FIRST','LAST'): have_invalid_value
+    if state.REUSE_EXISTING_WORD_PAGES_FLAG:
         # Don't rebuild these reference pages -- we'll reuse the existing folders full of pages
         vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"\nNOT GENERATING new {'TEST ' if state.TEST_MODE_FLAG else ''}reference pages (Interlinear & parallel passages, topic and kingdom pages, OET html & json word pages, UBS dict, Tyndale Dict)." )
-
-    _createDetailsPages( 0, state.TEMP_BUILD_FOLDER, state )
-    _createSearchPage( 0, state.TEMP_BUILD_FOLDER, state )
-    _createAboutPage( 0, state.TEMP_BUILD_FOLDER, state )
-    _createNewsPage( 0, state.TEMP_BUILD_FOLDER, state )
-    _createOETKeyPage( 0, state.TEMP_BUILD_FOLDER, state )
-
-    _createMainIndexPage( 0, state.TEMP_BUILD_FOLDER, state )
+    if state.INCREMENTAL_BUILD_FLAG: # Unchanged pages can be reused from the previous build (which is in the destination folder)
+        state.pageManifest = PageManifest( state.DESTINATION_FOLDER, state.TEMP_BUILD_FOLDER, buildInputs=buildInputs )
+    prepareForForkedWorkers() # Everything's preloaded now so help the worker processes to keep sharing it
+    # Each Bible and table is released after the last stage that uses it,
+    #   but the TEST details pages still list the verses in the selected-verses-only versions
+    keepResources = tuple( f'Bible.{versionAbbreviation}' for versionAbbreviation in state.selectedVersesOnlyVersions ) if state.TEST_MODE_FLAG else ()
+    if not runBuildStages( buildStages, state.NUM_BUILD_JOBS, state, buildInputs, completedStages, keepResources ):
+        logging.critical( "Aborting site build because some build stages failed" )
+        _saveBuildReport( state )
+        return False
+
+    with state.buildReport.measure( 'topLevelPages' ):
+        _createDetailsPages( 0, state.TEMP_BUILD_FOLDER, state )
+        _createSearchPage( 0, state.TEMP_BUILD_FOLDER, state )
+        _createAboutPage( 0, state.TEMP_BUILD_FOLDER, state )
+        _createNewsPage( 0, state.TEMP_BUILD_FOLDER, state )
+        _createOETKeyPage( 0, state.TEMP_BUILD_FOLDER, state )
+
+        _createMainIndexPage( 0, state.TEMP_BUILD_FOLDER, state )
 
     state.preloadedBibles = None # Reduce memory use now
 
+    if state.pageManifest is not None:
+        state.pageManifest.save() # Goes with the pages to the destination folder (for the next build)
+
     if state.CREATE_PARALLEL_VERSE_PAGES and state.DO_SPELL_CHECKS_FLAG:
         printSpellCheckSummary( state ) # Collected while making parallel verse pages
 
     vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"\n{state.TEMP_BUILD_FOLDER} is {_getFolderSize(state.TEMP_BUILD_FOLDER)//1_000_000:,} MB" )
 
-    if state.UPDATE_ACTUAL_SITE_WHEN_BUILT_FLAG and not state.TEST_VERSIONS_ONLY and state.CREATE_PARALLEL_VERSE_PAGES:
-        # Clean away any existing folders so we can copy in the newly built stuff
-        try: os.makedirs( f'{state.DESTINATION_FOLDER}/' )
-        except FileExistsError: # they were already there
-            assert os.path.isdir( state.DESTINATION_FOLDER )
-            _cleanHTMLFolders( state.DESTINATION_FOLDER, state )
-
-        try: # Now move the site from our temporary build location to overwrite the destination location
-            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"Moving files and folders from {state.TEMP_BUILD_FOLDER}/ to {state.DESTINATION_FOLDER}/…" )
-            count = 0
-            for fileOrFolderPath in glob.glob( f'{state.TEMP_BUILD_FOLDER}/*' ):
-                vPrint( 'Info', DEBUGGING_THIS_MODULE, f"    Moving {fileOrFolderPath} to {state.DESTINATION_FOLDER}/…" )
-                # Note: shutil.copy2 is the same as copy but keeps metadata like creation and modification times
-                shutil.move( fileOrFolderPath, f'{state.DESTINATION_FOLDER}/', copy_function=shutil.copy2)
-                count += 1
-            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Moved {count:,} folders and files into {state.DESTINATION_FOLDER}/." )
-        except Exception as e:
-            logging.critical( f"Oops, something went wrong copying folders/files into {state.DESTINATION_FOLDER}/: {e} with {fileOrFolderPath=}" )
-
-        try: # We also need to copy the TOBD maps across
-            TOBDmapSourceFolder = os.path.join( state.BibleLocations['TOSN'], '../OBD/Maps/artfiles/' )
-            TOBDmapDestinationFolder = state.DESTINATION_FOLDER.joinpath( 'dct/' )
-            try: os.makedirs( TOBDmapDestinationFolder )
-            except FileExistsError: pass # it was already there
-            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"Copying TOBD maps from {TOBDmapSourceFolder} to {TOBDmapDestinationFolder}/…" )
-            count = 0
-            for imgFilepath in glob.glob( f'{TOBDmapSourceFolder}/*.png' ):
-                vPrint( 'Info', DEBUGGING_THIS_MODULE, f"    Copying {imgFilepath} to {TOBDmapDestinationFolder}/…" )
-                # Note: shutil.copy2 is the same as copy but keeps metadata like creation and modification times
-                try:
-                    shutil.copy2( imgFilepath, f'{TOBDmapDestinationFolder}/' )
-                    count += 1
-                except FileNotFoundError as e:
-                    logging.critical( f"TOBD image file problem: {e}" )
-            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Copied {count:,} maps into {TOBDmapDestinationFolder}/." )
-        except Exception as e:
-            logging.critical( f"Oops, something went wrong copying image files into {state.DESTINATION_FOLDER}/: {e} with {imgFilepath=}" )
-
-        try: # We need to copy the .css and .js files across
-            count = 0
-            for filepath in glob.glob( '*.css' ):
-                vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Copying {filepath}…" )
-                # Note: shutil.copy2 is the same as copy but keeps metadata like creation and modification times
-                shutil.copy2( filepath, state.DESTINATION_FOLDER )
-                count += 1
-            shutil.copy2( 'Bible.js', state.DESTINATION_FOLDER )
-            shutil.copy2( 'Dict.js', state.DESTINATION_FOLDER )
-            shutil.copy2( 'KB.js', state.DESTINATION_FOLDER )
-            count += 2
-            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"Copied {count:,} stylesheets and scripts into {state.DESTINATION_FOLDER}/." )
-        except Exception as e:
-            logging.critical( f"Oops, something went wrong copying aux files into {state.DESTINATION_FOLDER}/: {e} with {filepath=}" )
+    if state.UPDATE_ACTUAL_SITE_WHEN_BUILT_FLAG and not state.TEST_VERSIONS_ONLY and state.CREATE_PARALLEL_VERSE_PAGES \
+    and not state.SELECTED_BUILD_STAGES and not state.SELECTED_BOOKS:
+        # Turn our temporary build folder into a new release folder (carrying over anything that we didn't rebuild)
+        with state.buildReport.measure( 'makeRelease' ):
+            try: shutil.rmtree( state.TEMP_BUILD_FOLDER.joinpath( CHECKPOINT_FOLDER_NAME ) ) # Not needed now that the build has finished
+            except FileNotFoundError: pass
+            try: releaseFolder = makeReleaseFolder( state.TEMP_BUILD_FOLDER, state.DESTINATION_FOLDER, state.RELEASES_FOLDER,
+                                                        replacedNames=set( _getSiteEntryNames( state.DESTINATION_FOLDER, state ) ) )
+            except Exception as e:
+                logging.critical( f"Oops, something went wrong making a release from {state.TEMP_BUILD_FOLDER}/ in {state.RELEASES_FOLDER}/: {e}" )
+                releaseFolder = None
+
+        if releaseFolder is not None:
+            with state.buildReport.measure( 'copyAssets' ):
+                try: # We also need to copy the TOBD maps across
+                    TOBDmapSourceFolder = os.path.join( state.BibleLocations['TOSN'], '../OBD/Maps/artfiles/' )
+                    TOBDmapDestinationFolder = releaseFolder.joinpath( 'dct/' )
+                    try: os.makedirs( TOBDmapDestinationFolder )
+                    except FileExistsError: pass # it was already there
+                    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"Copying TOBD maps from {TOBDmapSourceFolder} to {TOBDmapDestinationFolder}/…" )
+                    count = 0
+                    for imgFilepath in glob.glob( f'{TOBDmapSourceFolder}/*.png' ):
+                        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"    Copying {imgFilepath} to {TOBDmapDestinationFolder}/…" )
+                        # Note: shutil.copy2 is the same as copy but keeps metadata like creation and modification times
+                        try:
+                            shutil.copy2( imgFilepath, f'{TOBDmapDestinationFolder}/' )
+                            count += 1
+                        except FileNotFoundError as e:
+                            logging.critical( f"TOBD image file problem: {e}" )
+                    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Copied {count:,} maps into {TOBDmapDestinationFolder}/." )
+                except Exception as e:
+                    logging.critical( f"Oops, something went wrong copying image files into {releaseFolder}/: {e} with {imgFilepath=}" )
+
+                try: # We need to copy the .css and .js files across
+                    count = 0
+                    for filepath in glob.glob( '*.css' ):
+                        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Copying {filepath}…" )
+                        # Note: shutil.copy2 is the same as copy but keeps metadata like creation and modification times
+                        shutil.copy2( filepath, releaseFolder )
+                        count += 1
+                    shutil.copy2( 'Bible.js', releaseFolder )
+                    shutil.copy2( 'Dict.js', releaseFolder )
+                    shutil.copy2( 'KB.js', releaseFolder )
+                    count += 2
+                    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"Copied {count:,} stylesheets and scripts into {releaseFolder}/." )
+                except Exception as e:
+                    logging.critical( f"Oops, something went wrong copying aux files into {releaseFolder}/: {e} with {filepath=}" )
+
+            # Now make the new release live (in one atomic step) and tidy up the older ones
+            with state.buildReport.measure( 'switchRelease' ):
+                try: switchToRelease( state.DESTINATION_FOLDER, releaseFolder )
+                except Exception as e:
+                    logging.critical( f"Oops, something went wrong switching {state.DESTINATION_FOLDER} to {releaseFolder}/ so the previous site is still live: {e}" )
+                else:
+                    removeOldReleases( state.DESTINATION_FOLDER, state.RELEASES_FOLDER, state.NUM_KEPT_RELEASES,
+                                    removeFunction=state.backgroundRemover.remove if state.backgroundRemover is not None else shutil.rmtree )
 
         vPrint( 'Normal', DEBUGGING_THIS_MODULE, f'''\nNOW RUN "npx pagefind --glob "{{OET,par}}/**/*.{{htm}}" --site ../htmlPages{f'/{state.DEBUG_DESTINATION_FOLDER_NAME}' if state.TEST_MODE_FLAG else ''}/" to create search index!''' )
     else:
         vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"NOT UPDATING the actual {'TEST ' if state.TEST_MODE_FLAG else ''}site{'' if state.UPDATE_ACTUAL_SITE_WHEN_BUILT_FLAG else ' (as requested)'}." )
         if state.TEST_VERSIONS_ONLY:
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  (because {state.TEST_VERSIONS_ONLY=})" )
+        if state.SELECTED_BUILD_STAGES or state.SELECTED_BOOKS:
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  (because {state.SELECTED_BUILD_STAGES=} {state.SELECTED_BOOKS=})" )
         if not state.CREATE_PARALLEL_VERSE_PAGES:
             vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  (because no parallel verse pages were built)" )
-# end of createSitePages._createSitePages
+
+    _saveBuildReport( state )
+    return True
+# end of createSitePages._buildSitePages
 
 
-def _cleanHTMLFolders( folder:Path, state:State ) -> bool:
+def _saveBuildReport( state:State ) -> None:
     """
+    Save the time and resources used by each step of the build (to compare with previous builds)
+        and display them.
+
+    Also waits for any old folders to finish being deleted (so that's included in the report).
     """
-    fnPrint( DEBUGGING_THIS_MODULE, f"_cleanHTMLFolders( {folder} )")
-    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"Cleaning away any existing folders at {folder}/…")
-
-    try: os.unlink( folder.joinpath( 'index.htm' ) )
-    except FileNotFoundError: pass
-    try: os.unlink( folder.joinpath( 'AllDetails.htm' ) )
-    except FileNotFoundError: pass
-    try: os.unlink( folder.joinpath( 'About.htm' ) )
-    except FileNotFoundError: pass
-    try: os.unlink( folder.joinpath( 'News.htm' ) )
-    except FileNotFoundError: pass
-    try: os.unlink( folder.joinpath( 'OETKey.htm' ) )
-    except FileNotFoundError: pass
-    try: os.unlink( folder.joinpath( 'Search.htm' ) )
-    except FileNotFoundError: pass
-    try: shutil.rmtree( folder.joinpath( 'par/' ) )
-    except FileNotFoundError: pass
-    try: shutil.rmtree( folder.joinpath( 'ilr/' ) )
-    except FileNotFoundError: pass
-    try: shutil.rmtree( folder.joinpath( 'rel/' ) )
-    except FileNotFoundError: pass
-    try: shutil.rmtree( folder.joinpath( 'tpc/' ) )
-    except FileNotFoundError: pass
+    if state.backgroundRemover is not None:
+        with state.buildReport.measure( 'waitForDeletion' ):
+            deletionResults = state.backgroundRemover.join()
+        state.buildReport.addEntry( deletionResults )
+        state.backgroundRemover = None
+    materialisedSections = None # None if the reference data was loaded from its source files
+    if state.referenceBundle is not None: # Include any that were only unpickled in worker processes
+        materialisedSections = list( dict.fromkeys( state.referenceBundle.materialisedNames
+                                    + [sectionName for entry in state.buildReport.entries for sectionName in entry.get( 'materialisedSections', () )] ) )
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  This build materialised {len(materialisedSections)}/{len(state.referenceBundle.sections)} reference sections: {materialisedSections}" )
+    state.buildReport.save( state.BUILD_REPORT_FILEPATH,
+                            settings={ 'programNameVersion':PROGRAM_NAME_VERSION, 'testMode':state.TEST_MODE_FLAG, 'numBuildJobs':state.NUM_BUILD_JOBS,
+                                        'maxProcesses':BibleOrgSysGlobals.maxProcesses, 'stages':state.SELECTED_BUILD_STAGES, 'books':state.TEST_BOOK_LIST if state.SELECTED_BOOKS or not state.ALL_PRODUCTION_BOOKS_FLAG else 'ALL',
+                                        'versions':state.TEST_VERSIONS_ONLY or 'ALL', 'resume':state.RESUME_BUILD_FLAG, 'incremental':state.INCREMENTAL_BUILD_FLAG,
+                                        'materialisedReferenceSections':materialisedSections } )
+    state.buildReport.printSummary()
+# end of createSitePages._saveBuildReport
+
+
+def _selectBuildStages( selectedStageNames:list[str], state:State ) -> list[str]:
+    """
+    Only build the given stages (if they're all valid).
+
+    Returns a list of any unknown stage names.
+    """
+    badStageNames = [stageName for stageName in selectedStageNames if stageName not in BUILD_STAGE_NAMES]
+    if not badStageNames:
+        state.SELECTED_BUILD_STAGES = selectedStageNames
+        # Set the older flags to match so that the stages get declared
+        state.CREATE_PARALLEL_VERSE_PAGES = (state.CREATE_PARALLEL_VERSE_PAGES or 'LAST') if 'par' in selectedStageNames else None
+        state.CREATE_BOOK_AND_OTHER_PAGES_FLAG = 'versions' in selectedStageNames or 'sections' in selectedStageNames
+        state.REUSE_EXISTING_WORD_PAGES_FLAG = not any( stageName in selectedStageNames for stageName in ('ilr','rel','tpc','kingdoms','UBS','dct','ref','app') )
+    return badStageNames
+# end of createSitePages._selectBuildStages
+
+
+def _runBuildDaemon() -> None:
+    """
+    Preload everything once (like _createSitePages() does)
+        and then build the pages for each request from buildDaemon.py (in a forked child process).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "_runBuildDaemon()")
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"_runBuildDaemon() preloading in {'TEST' if state.TEST_MODE_FLAG else 'production'} mode with {'all production books' if state.ALL_PRODUCTION_BOOKS_FLAG else f'{state.TEST_BOOK_LIST}'} for {f'{len(state.TEST_VERSIONS_ONLY)}/' if state.TEST_VERSIONS_ONLY else ''}{len(state.BibleLocations):,} Bible versions…" )
+    state.buildReport = BuildReport() # Just for the preloading
+    _getSelectedBuildStages( state ) # So we only preload the versions that any selected stages need
+    BibleVersionsBeforePreload = state.BibleVersions[:]
+    _preloadSiteData( state )
+    state.buildReport.printSummary()
+    state.buildReport = None
+    prepareForForkedWorkers( state ) # So the build processes keep sharing the preloaded data (including all the books)
+    serveBuildRequests( state.BUILD_DAEMON_SOCKET_PATH, partial( _buildForDaemonRequest, BibleVersionsBeforePreload ) )
+# end of createSitePages._runBuildDaemon
+
+
+def _dropUnselectedBooks( state:State ) -> None:
+    """
+    Remove the books that aren't in state.booksToLoad (e.g., after selectBooks()) from the preloaded Bibles.
+    """
+    for versionAbbreviation, thisBible in state.preloadedBibles.items():
+        if versionAbbreviation in state.selectedVersesOnlyVersions: continue # These are dicts, not Bible objects
+        booksToLoad = state.booksToLoad.get( versionAbbreviation, ['ALL'] )
+        if 'ALL' in booksToLoad: continue
+        for BBB in list( thisBible.books ):
+            if BBB not in booksToLoad and BBB != 'FRT':
+                del thisBible.books[BBB]
+# end of createSitePages._dropUnselectedBooks
+
+
+def _buildForDaemonRequest( BibleVersionsBeforePreload:list[str], request:dict ) -> int:
+    """
+    Runs in a forked child of the build daemon (so the state is already preloaded)
+        with its output going back to the client.
+
+    The request (from buildDaemon.py) can select the stages, the books (which must have been preloaded),
+        and the output folder (used instead of state.TEMP_BUILD_FOLDER and then NOT made into a release).
+
+    Returns the exit status for the client.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"_buildForDaemonRequest( {request} )")
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Build daemon process {os.getpid()} building {request}…" )
+    if request.get( 'stages' ):
+        badStageNames = _selectBuildStages( request['stages'], state )
+        if badStageNames:
+            logging.critical( f"Unknown build stage(s) {badStageNames}: expected some of {','.join(BUILD_STAGE_NAMES)}" )
+            return BAD_REQUEST_EXIT_STATUS
+    if request.get( 'books' ):
+        badBBBs = [BBB for BBB in request['books'] if BBB not in state.OET_BOOK_ORDER
+                                                    or (not state.ALL_PRODUCTION_BOOKS_FLAG and BBB not in state.TEST_BOOK_LIST)]
+        if badBBBs:
+            logging.critical( f"Unknown or not preloaded book code(s) {badBBBs} -- restart the build daemon with --books to preload them" )
+            return BAD_REQUEST_EXIT_STATUS
+        selectBooks( request['books'], state )
+        _dropUnselectedBooks( state )
+    if request.get( 'outputFolder' ):
+        state.TEMP_BUILD_FOLDER = Path( request['outputFolder'] )
+        state.UPDATE_ACTUAL_SITE_WHEN_BUILT_FLAG = False
+
+    state.buildReport = BuildReport()
+    state.backgroundRemover = BackgroundRemover( state.TRASH_FOLDER, state.NUM_DELETION_THREADS ) # Threads aren't inherited from the daemon
+    buildStages = _getSelectedBuildStages( state )
+    missingVersions = [versionAbbreviation for versionAbbreviation in (state.TEST_VERSIONS_ONLY or ())
+                        if versionAbbreviation != 'OET' and versionAbbreviation not in state.preloadedBibles]
+    if missingVersions:
+        logging.critical( f"The build daemon didn't preload {missingVersions} -- restart it without --stages or --versions" )
+        return BAD_REQUEST_EXIT_STATUS
+    buildInputs = _getBuildInputs( BibleVersionsBeforePreload, state )
+    completedStages = _cleanBuildFolder( buildStages, buildInputs, state )
+    return 0 if _buildSitePages( buildStages, buildInputs, completedStages, state ) else 1
+# end of createSitePages._buildForDaemonRequest
+
+
+def _getBuildStages( state:State ) -> list[BuildStage]:
+    """
+    Declare the families of pages that we need to build this time
+        along with what they read and write and what they depend on.
+
+    The order here is the order that they're built in if we're not using worker processes.
+
+    If state.SELECTED_BUILD_STAGES is set, only those stages (and the stages that they depend on) are returned.
+    """
+    parallelVerseStage = BuildStage( 'par', createParallelVersePages, 1, 'par/', inputVersions='ALL', inputTables=('word_tables','word_table_indexes'),
+                                    inputAttributes=('TyndaleBookIntrosDict','TyndaleBookIntroSummariesDict'), outputs=('par/',), stateOutputs=('versionComments','versesWithImages','possibleUnmatchedProperNames'),
+                                    collectFunction=getSpellCheckCounters, mergeFunction=mergeSpellCheckCounters )
+    buildStages = []
+    if state.CREATE_PARALLEL_VERSE_PAGES == 'FIRST':
+        buildStages.append( parallelVerseStage )
+    if state.CREATE_BOOK_AND_OTHER_PAGES_FLAG:
+        buildStages.append( BuildStage( 'versions', _createAllVersionPages, 1, '', inputVersions='ALL', inputTables=('word_tables','word_table_indexes'),
+                                    outputs=tuple( f'{versionAbbreviation}/' for versionAbbreviation in state.BibleVersions ), stateOutputs=('chaptersWithImages',) ) )
+        buildStages.append( BuildStage( 'sections', _createAllSectionPages, 2, '', inputVersions='ALL', inputTables=('word_tables','word_table_indexes'),
+                                    outputs=tuple( f'{versionAbbreviation}/bySec/' for versionAbbreviation in state.BibleVersions ), stateOutputs=('sectionsWithImages','sectionsWithMaps') ) )
+    if state.CREATE_PARALLEL_VERSE_PAGES == 'LAST':
+        buildStages.append( parallelVerseStage )
+    if not state.REUSE_EXISTING_WORD_PAGES_FLAG:
+        buildStages.append( BuildStage( 'ilr', createOETInterlinearPages, 1, 'ilr/', inputVersions='ALL', inputTables=('word_tables','word_table_indexes'), outputs=('ilr/',) ) )
+        buildStages.append( BuildStage( 'rel', createParallelPassagePages, 1, 'rel/', inputVersions='ALL', inputTables=('word_tables','word_table_indexes'), outputs=('rel/',) ) )
+        buildStages.append( BuildStage( 'tpc', createTopicPages, 1, 'tpc/', inputVersions='ALL', inputTables=('word_tables','word_table_indexes'), outputs=('tpc/',) ) )
+        buildStages.append( BuildStage( 'kingdoms', createKingdomPages, 2, 'ref/Kingdoms/', inputVersions='ALL', inputTables=('word_tables','word_table_indexes'), outputs=('ref/Kingdoms/',) ) )
+        buildStages.append( BuildStage( 'UBS', createUBSDictionaryPages, 1, 'UBS/', inputVersions=('OET-RV','OET-LV','TOSN'),
+                                    inputAttributes=('UBS_GNT_DATA','UBS_GNT_ID_INDEX','UBS_GNT_LEMMA_INDEX',
+                                                     'UBS_HEB_DOMAIN_DATA','UBS_HEB_DATA','UBS_HEB_ID_INDEX','UBS_HEB_LEMMA_INDEX'), outputs=('UBS/',) ) )
+        buildStages.append( BuildStage( 'dct', createTyndaleDictPages, 1, 'dct/', inputVersions=('OET-RV','OET-LV','TOSN'), inputTables=('word_tables','word_table_indexes'),
+                                    inputAttributes=('TOBDData',), outputs=('dct/',) ) )
+        buildStages.append( BuildStage( 'ref', createOETReferencePages, 1, 'ref/', inputVersions=('OET-RV','OET-LV'), inputTables=('word_tables','word_table_indexes'), outputs=('ref/',),
+                                    # These are the tables that createAppJsonFiles() needs (and which are too slow to recalculate)
+                                    stateOutputs=('OETRefData.OTFormUsageDict','OETRefData.OTLemmaRowNumbersDict','OETRefData.OTWordRowNumbersDict',
+                                                  'OETRefData.OTFormOETGlossesDict','OETRefData.OTLemmaOETGlossesDict','OETRefData.OETOTGlossWordDict',
+                                                  'OETRefData.OTStrongsRefs','OETRefData.OTHebLemmaList','OETRefData.OTTransLemmaList','OETRefData.usedHebStrongsSet',
+                                                  'OETRefData.NTFormUsageDict','OETRefData.NTLemmaDict','OETRefData.NTLemmaFormsDict',
+                                                  'OETRefData.NTFormOETGlossesDict','OETRefData.NTFormVLTGlossesDict','OETRefData.NTLemmaOETGlossesDict',
+                                                  'OETRefData.OETNTGlossWordDict','OETRefData.NTStrongsRefs') ) )
+        buildStages.append( BuildStage( 'app', createAppJsonFiles, 1, 'app/', inputVersions=('OET-RV','OET-LV'), inputTables=('word_tables','word_table_indexes'),
+                                    outputs=('app/',), dependsOn=('ref',) ) )
+    assert all( buildStage.name in BUILD_STAGE_NAMES for buildStage in buildStages )
+
+    if state.SELECTED_BUILD_STAGES:
+        stageDict = {buildStage.name:buildStage for buildStage in buildStages}
+        selectedNames = set()
+        stageNamesToAdd = list( state.SELECTED_BUILD_STAGES )
+        while stageNamesToAdd:
+            stageName = stageNamesToAdd.pop()
+            if stageName in stageDict and stageName not in selectedNames:
+                selectedNames.add( stageName )
+                stageNamesToAdd.extend( stageDict[stageName].dependsOn ) # e.g., 'app' needs the tables made by 'ref'
+        buildStages = [buildStage for buildStage in buildStages if buildStage.name in selectedNames]
+    return buildStages
+# end of createSitePages._getBuildStages
+
+
+def _getNeededVersions( buildStages:list[BuildStage], state:State, selectedVersions:list[str]|None=None ) -> list[str]:
+    """
+    Returns the list of versions that need to be preloaded for the given build stages.
+
+    If selectedVersions is given, stages that can use ALL versions only get those ones
+        (but we still need the versions that the stages actually name).
+    We always need the OET (for the word tables and the section lists).
+    """
+    neededVersions = {'OET','OET-RV','OET-LV'}
+    for buildStage in buildStages:
+        neededVersions.update( (selectedVersions or state.BibleVersions) if buildStage.inputVersions == 'ALL' else buildStage.inputVersions )
+    return [versionAbbreviation for versionAbbreviation in state.BibleVersions if versionAbbreviation in neededVersions]
+# end of createSitePages._getNeededVersions
+
+
+def _createAllVersionPages( level:int, folder:Path, state:State ) -> bool:
+    """
+    Create the book, chapter, and other pages for each version
+        (or just a bland index page for the versions without their own pages).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"_createAllVersionPages( {level}, {folder} )" )
+
+    state.chaptersWithImages = defaultdict( list )
+    if 'OET' in state.BibleVersions: # this is a special case
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Creating {'TEST ' if state.TEST_MODE_FLAG else ''}version pages for OET…" )
+        versionFolder = folder.joinpath( f'OET/' )
+        _createOETVersionPages( level, versionFolder, state.preloadedBibles['OET-RV'], state.preloadedBibles['OET-LV'], state )
+        _createOETMissingVersesPage( level, versionFolder )
+    for versionAbbreviation, thisBible in state.preloadedBibles.items(): # doesn't include OET pseudo-translation
+        # if versionAbbreviation not in ('TTN',) \
+        if versionAbbreviation in state.versionsWithoutTheirOwnPages:
+            if versionAbbreviation == 'TTN': continue # These ones don't even have a folder
+            # We just write a very bland index page here
+            versionName = state.BibleNames[versionAbbreviation]
+            indexHtml = f'<h1 id="Top">{versionName}</h1>'
+            top = makeTop( level, None, 'site', None, state ) \
+                            .replace( '__TITLE__', f"{versionName}{' TEST' if state.TEST_MODE_FLAG else ''}" ) \
+                            .replace( '__KEYWORDS__', f'Bible, {versionAbbreviation}, {versionName}' )
+            versionFolder = folder.joinpath( f'{versionAbbreviation}/' )
+            os.makedirs( versionFolder )
+            filepath = versionFolder.joinpath( 'index.htm' )
+            assert not filepath.is_file() # Check that we're not overwriting anything
+            with open( filepath, 'wt', encoding='utf-8' ) as indexHtmlFile:
+                indexHtmlFile.write( f'''{top}{indexHtml}\n<p class="note"><a href="details.htm">See copyright details.</p><!--note-->\n{makeBottom( level, None, 'site', state )}''' )
+            vPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"    {len(indexHtml):,} characters written to {filepath}" )
+        else: # these versions should have the full pages
+            if versionAbbreviation == 'TTN': continue # Not actually a Bible version
+            # vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\nDoing discovery for {thisBible.abbreviation} ({thisBible.name})…" )
+            assert 'discoveryResults' in thisBible.__dict__
+            if 'haveSectionHeadings' not in thisBible.discoveryResults['ALL']: # probably we have no books that actually loaded
+                dPrint( 'Normal', DEBUGGING_THIS_MODULE, f"Adding discoveryResults 'haveSectionHeadings' for {thisBible.abbreviation}: no books loaded?" )
+                thisBible.discoveryResults['ALL']['haveSectionHeadings'] = False # We need this in several places
+            if not state.TEST_MODE_FLAG or versionAbbreviation not in ('OEB','WEBBE','WEB','WMBB','WMB','NET','LSV','FBV','TCNT','T4T','LEB',
+                                                    'BBE','Moff','JPS','ASV','DRA','YLT','Drby','RV','Wbstr',
+                                                    'KJB-1769','Bshps','Gnva','Cvdl','TNT','Wycl'):
+                # In test mode, we don't usually need to make all those pages, even just for the test books
+                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"Creating {'TEST ' if state.TEST_MODE_FLAG else ''}version pages for {thisBible.abbreviation} ({thisBible.name})…" )
+                versionFolder = folder.joinpath( f'{thisBible.abbreviation}/' )
+                _createVersionPages( level, versionFolder, thisBible, state )
+    return True
+# end of createSitePages._createAllVersionPages
+
+
+def _createAllSectionPages( level:int, folder:Path, state:State ) -> bool:
+    """
+    Create the section pages for each version that has section headings.
+
+    Note: level is the level of the bySec/ folders.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"_createAllSectionPages( {level}, {folder} )" )
+
+    for thisBible in state.preloadedBibles.values(): # Make sure that we don't fail if the version pages weren't built first
+        if 'haveSectionHeadings' not in thisBible.discoveryResults['ALL']: # probably we have no books that actually loaded
+            thisBible.discoveryResults['ALL']['haveSectionHeadings'] = False # We need this in several places
+
+    if 'OET' in state.BibleVersions: # this is a special case
+        rvBible, lvBible = state.preloadedBibles['OET-RV'], state.preloadedBibles['OET-LV']
+        if rvBible.discoveryResults['ALL']['haveSectionHeadings'] or lvBible.discoveryResults['ALL']['haveSectionHeadings']:
+            versionFolder = folder.joinpath( f'OET/' )
+            createOETSectionPages( level, versionFolder.joinpath('bySec/'), rvBible, lvBible, state )
+    state.sectionsWithImages = defaultdict( list )
+    for versionAbbreviation, thisBible in state.preloadedBibles.items(): # doesn't include OET pseudo-translation
+        if versionAbbreviation not in ('TTN',) \
+        and versionAbbreviation in state.versionsWithoutTheirOwnPages: continue # We don't worry about these few selected verses here
+        if versionAbbreviation not in ('TOSN','TTN','SOTN','UTN'): # We don't make separate notes pages
+            if thisBible.discoveryResults['ALL']['haveSectionHeadings']:
+                versionFolder = folder.joinpath( f'{thisBible.abbreviation}/' )
+                createSectionPages( level, versionFolder.joinpath('bySec/'), thisBible, state )
+    return True
+# end of createSitePages._createAllSectionPages
+
+
+def _getSiteEntryNames( folder:Path, state:State ) -> list[str]:
+    """
+    Returns the names of the files and folders (ending with '/') at the top of the site that we build,
+        i.e., the ones that get replaced by each build.
+    """
+    entryNames = ['index.htm','AllDetails.htm','About.htm','News.htm','OETKey.htm','Search.htm',MANIFEST_FILENAME]
+    entryNames += ['par/','ilr/','rel/','tpc/']
     if folder == state.TEMP_BUILD_FOLDER \
     or not state.REUSE_EXISTING_WORD_PAGES_FLAG: # Leave the existing folders there if we're not rebuilding these reference pages
-        try: shutil.rmtree( folder.joinpath( 'ref/' ) )
-        except FileNotFoundError: pass
-        try: shutil.rmtree( folder.joinpath( 'app/' ) )
-        except FileNotFoundError: pass
-        try: shutil.rmtree( folder.joinpath( 'UBS/' ) )
-        except FileNotFoundError: pass
-        try: shutil.rmtree( folder.joinpath( 'dct/' ) )
-        except FileNotFoundError: pass
-    for versionAbbreviation in state.allPossibleBibleVersions + ['PLBL','HAP','SOTN','UTN','TOSN','TOBD','UBS','THBD','BMM','OBI']:
-        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Removing tree at {folder.joinpath( f'{versionAbbreviation}/' )}/…")
-        try: shutil.rmtree( folder.joinpath( f'{versionAbbreviation}/' ) )
+        entryNames += ['ref/','app/','UBS/','dct/']
+    entryNames += [f'{versionAbbreviation}/' for versionAbbreviation in state.allPossibleBibleVersions + ['PLBL','HAP','SOTN','UTN','TOSN','TOBD','UBS','THBD','BMM','OBI']]
+    return entryNames
+# end of createSitePages._getSiteEntryNames
+
+
+def _removeFolder( folderPath:Path, state:State ) -> None:
+    """
+    Moves the folder out of the way to be deleted in the background (if we can), else deletes it now
+    """
+    if state.backgroundRemover is not None:
+        state.backgroundRemover.remove( folderPath )
+    else:
+        try: shutil.rmtree( folderPath )
         except FileNotFoundError: pass
+# end of createSitePages._removeFolder
+
+
+def _cleanHTMLFolders( folder:Path, state:State, buildStages:list[BuildStage]|None=None, completedStages:dict[str,dict]|None=None ) -> bool:
+    """
+    If completedStages is given (when resuming a build), the output folders of those stages are kept,
+        but the output folders (and checkpoints) of the other buildStages are removed.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"_cleanHTMLFolders( {folder}, {list(completedStages) if completedStages else None} )")
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"Cleaning away any existing folders at {folder}/{' (except for completed build stages)' if completedStages else ''}…")
+
+    keptFolderNames = {output for buildStage in buildStages if buildStage.name in completedStages for output in buildStage.outputs} \
+                        if completedStages else set()
+
+    entryNames = _getSiteEntryNames( folder, state )
+    if completedStages: # Also need to remove incomplete stage folders that are inside kept folders, e.g., 'ref/Kingdoms/'
+        entryNames += [output for buildStage in buildStages if buildStage.name not in completedStages for output in buildStage.outputs if output]
+    for entryName in entryNames:
+        if entryName in keptFolderNames: continue
+        if entryName.endswith( '/' ):
+            vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Removing tree at {folder.joinpath( entryName )}/…")
+            _removeFolder( folder.joinpath( entryName ), state )
+        else:
+            try: os.unlink( folder.joinpath( entryName ) )
+            except FileNotFoundError: pass
+    if completedStages:
+        for buildStage in buildStages:
+            if buildStage.name not in completedStages:
+                removeStageCheckpoint( buildStage.name, folder )
+    else:
+        _removeFolder( folder.joinpath( CHECKPOINT_FOLDER_NAME ), state )
     return True
 # end of createSitePages._cleanHTMLFolders
 
@@ -1120,14 +1454,16 @@ def briefDemo() -> None:
     _createSitePages()
 # end of createSitePages.briefDemo
 
-def fullDemo() -> None:
+def fullDemo() -> bool:
     """
     Full demo to check class is working
+
+    Returns False if the build failed.
     """
     BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
 
     # Demo the createSitePages object
-    _createSitePages()
+    return _createSitePages()
 # end of createSitePages.fullDemo
 
 if __name__ == '__main__':
@@ -1137,11 +1473,71 @@ if __name__ == '__main__':
 
     # Configure basic Bible Organisational System (BOS) set-up
     parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    parser.add_argument( '-j', '--jobs', type=int, default=state.NUM_BUILD_JOBS, metavar='N',
+                        help=f"number of build stages to run at once in forked worker processes (default {state.NUM_BUILD_JOBS} builds them one after the other)" )
+    parser.add_argument( '--preload-jobs', type=int, default=state.NUM_PRELOAD_JOBS, metavar='N',
+                        help=f"number of forked processes to load versions that don't have current pickle files (default {state.NUM_PRELOAD_JOBS})" )
+    parser.add_argument( '--preload-memory-budget', type=int, default=state.PRELOAD_MEMORY_BUDGET_MB, metavar='MB',
+                        help="abort the build if preloading any one version increases the memory used by more than this (default no limit)" )
+    parser.add_argument( '--verify-hash', action='store_true', default=state.VERIFY_PICKLE_HASHES_FLAG,
+                        help="hash every source file to check that the pickle files are current (rather than trusting the file times)" )
+    parser.add_argument( '--verify-word-indexes', action='store_true', default=state.VERIFY_WORD_INDEXES_FLAG,
+                        help="make the OET word, lemma, form, and Strongs indexes again and check that they're the same as the saved ones" )
+    parser.add_argument( '--resume', action='store_true', default=state.RESUME_BUILD_FLAG,
+                        help=f"keep the pages from build stages that were completed by a previous (crashed) build in {state.TEMP_BUILD_FOLDER}/ and don't build them again" )
+    parser.add_argument( '--stages', metavar='STAGES',
+                        help=f"comma-separated list of build stages to run (from {','.join(BUILD_STAGE_NAMES)}) -- default is all of them" )
+    parser.add_argument( '--books', metavar='BOOKS',
+                        help="comma-separated list of BOS book codes to load and build, e.g., MRK,GAL -- default is set in settings.py" )
+    parser.add_argument( '--versions', metavar='VERSIONS',
+                        help="comma-separated list of versions to preload (as well as the OET) -- default is all of them" )
+    parser.add_argument( '--daemon', action='store_true',
+                        help=f"preload everything and then build the pages for each request from buildDaemon.py (on {state.BUILD_DAEMON_SOCKET_PATH}) in a forked process" )
+    parser.add_argument( '--rollback', action='store_true',
+                        help=f"don't build anything, just switch {state.DESTINATION_FOLDER} back to the previous release in {state.RELEASES_FOLDER}/" )
+    parser.add_argument( '--migrate-site', action='store_true',
+                        help=f"don't build anything, just move the existing {state.DESTINATION_FOLDER}/ folder into {state.RELEASES_FOLDER}/ and replace it with a link to it" )
     BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
-
-    fullDemo()
+    state.NUM_BUILD_JOBS = max( 1, BibleOrgSysGlobals.commandLineArguments.jobs )
+    state.NUM_PRELOAD_JOBS = max( 1, BibleOrgSysGlobals.commandLineArguments.preload_jobs )
+    state.PRELOAD_MEMORY_BUDGET_MB = BibleOrgSysGlobals.commandLineArguments.preload_memory_budget
+    state.VERIFY_PICKLE_HASHES_FLAG = BibleOrgSysGlobals.commandLineArguments.verify_hash
+    state.VERIFY_WORD_INDEXES_FLAG = BibleOrgSysGlobals.commandLineArguments.verify_word_indexes
+    state.RESUME_BUILD_FLAG = BibleOrgSysGlobals.commandLineArguments.resume
+    if BibleOrgSysGlobals.commandLineArguments.stages:
+        badStageNames = _selectBuildStages( BibleOrgSysGlobals.commandLineArguments.stages.split( ',' ), state )
+        if badStageNames: parser.error( f"Unknown build stage(s) {badStageNames}: expected some of {','.join(BUILD_STAGE_NAMES)}" )
+    if BibleOrgSysGlobals.commandLineArguments.books:
+        selectedBBBs = BibleOrgSysGlobals.commandLineArguments.books.upper().split( ',' )
+        badBBBs = [BBB for BBB in selectedBBBs if BBB not in state.OET_BOOK_ORDER]
+        if badBBBs: parser.error( f"Unknown book code(s) {badBBBs}" )
+        selectBooks( selectedBBBs, state )
+    if BibleOrgSysGlobals.commandLineArguments.versions:
+        selectedVersions = BibleOrgSysGlobals.commandLineArguments.versions.split( ',' )
+        badVersions = [versionAbbreviation for versionAbbreviation in selectedVersions if versionAbbreviation not in state.BibleVersions]
+        if badVersions: parser.error( f"Unknown version(s) {badVersions}: expected some of {','.join(state.BibleVersions)}" )
+        state.SELECTED_VERSIONS = state.TEST_VERSIONS_ONLY = [versionAbbreviation for versionAbbreviation in state.BibleVersions
+                                    if versionAbbreviation in ('OET','OET-RV','OET-LV') or versionAbbreviation in selectedVersions]
+
+    if BibleOrgSysGlobals.commandLineArguments.migrate_site:
+        migratedRelease = migrateToReleases( state.DESTINATION_FOLDER, state.RELEASES_FOLDER )
+        if migratedRelease is None:
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"{state.DESTINATION_FOLDER} isn't an actual folder so there's nothing to migrate." )
+        BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+        sys.exit( 0 )
+    if BibleOrgSysGlobals.commandLineArguments.rollback:
+        rolledBackRelease = rollBackRelease( state.DESTINATION_FOLDER, state.RELEASES_FOLDER )
+        BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+        sys.exit( 0 if rolledBackRelease is not None else 1 )
+    if BibleOrgSysGlobals.commandLineArguments.daemon:
+        _runBuildDaemon()
+        BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+        sys.exit( 0 )
+
+    buildSucceeded = fullDemo()
 
     BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+    if not buildSucceeded: sys.exit( 1 )
     print( f"\nThis build of the site (which completed) was done with {'STRICT' if BibleOrgSysGlobals.strictCheckingFlag else 'NON-strict'} checking" )
     WAS_ENABLED = False # Do this just so the next line displays more readably
     assert WAS_ENABLED, "   and this build (WHICH COMPLETED) was done with ASSERT statements ENABLED."
@@ -0,0 +1,201 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# entryCodec.py
+#
+# Module handling compact binary encoding of OpenBibleData InternalBibleEntryLists
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling compact binary encoding of OpenBibleData InternalBibleEntryLists
+    (i.e., the _processedLines of each book) for the book caches.
+
+Pickling each InternalBibleEntry separately is slow and takes lots of space,
+    so instead an entry list is encoded as:
+        a string table: every different string (once only) as one UTF-8 block separated by NULs
+        a marker table: every different marker (once only)
+        flat arrays (of fixed-size integers) with one marker code and four string numbers per entry,
+            the offsets of each entry's extras, and four numbers per extra
+and decoded straight back into an InternalBibleEntryList of InternalBibleEntry objects.
+
+encodeEntryList( entryList:InternalBibleEntryList ) -> bytes
+decodeEntryList( encodedBytes:bytes ) -> InternalBibleEntryList
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version
+"""
+from array import array
+import struct
+import sys
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from bible_organisational_system import InternalBibleEntryList, InternalBibleEntry, InternalBibleExtraList, InternalBibleExtra
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "entryCodec"
+PROGRAM_NAME = "OpenBibleData entry list codec"
+PROGRAM_VERSION = '0.10'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+ENTRY_CODEC_MAGIC = b'OBDE'
+ENTRY_CODEC_FORMAT_VERSION = 1
+_HEADER_STRUCT = struct.Struct( '<4sBBIIII' ) # magic, version, littleEndianFlag, numStrings, numMarkers, numEntries, numExtras
+STRING_SEPARATOR = '\x00' # Can't occur in any of the strings (else encodeEntryList raises a ValueError)
+
+
+def _joinStrings( strings:list[str] ) -> bytes:
+    for someString in strings:
+        if STRING_SEPARATOR in someString:
+            raise ValueError( f"Can't encode string containing NUL: {someString[:40]!r}" )
+    return STRING_SEPARATOR.join( strings ).encode( 'utf-8' )
+# end of entryCodec._joinStrings
+
+
+def _splitStrings( stringBytes:bytes, numStrings:int ) -> list[str]:
+    return stringBytes.decode( 'utf-8' ).split( STRING_SEPARATOR ) if numStrings else []
+# end of entryCodec._splitStrings
+
+
+def encodeEntryList( entryList:InternalBibleEntryList ) -> bytes:
+    """
+    Returns the entries encoded as bytes (see the module docstring).
+
+    Raises a ValueError (or other exception) if something can't be encoded
+        (so the caller can use pickle instead).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"encodeEntryList( {len(entryList):,} entries )" )
+    stringNumbers, markerCodes = {None:0}, {} # String number zero means None
+    def getStringNumber( someString:str|None ) -> int:
+        try: return stringNumbers[someString]
+        except KeyError:
+            stringNumbers[someString] = stringNumber = len(stringNumbers)
+            return stringNumber
+
+    entryMarkers, entryFlags, entryFields = array( 'H' ), array( 'B' ), array( 'I' )
+    extrasOffsets, extraFields = array( 'I', [0] ), array( 'I' )
+    for entry in entryList:
+        marker = entry.getMarker()
+        try: entryMarkers.append( markerCodes[marker] )
+        except KeyError:
+            markerCodes[marker] = len(markerCodes)
+            entryMarkers.append( markerCodes[marker] )
+        entryFields.extend( (getStringNumber( entry.getOriginalMarker() ), getStringNumber( entry.getAdjustedText() ),
+                                getStringNumber( entry.getCleanText() ), getStringNumber( entry.getOriginalText() )) )
+        extras = entry.getExtras()
+        entryFlags.append( extras is not None )
+        if extras is not None:
+            for extra in extras:
+                extraFields.extend( (getStringNumber( extra.getType() ), extra.getIndex(),
+                                        getStringNumber( extra.getText() ), getStringNumber( extra.getCleanText() )) )
+        extrasOffsets.append( len(extraFields) // 4 )
+
+    stringBytes = _joinStrings( list(stringNumbers)[1:] ) # Without the None
+    markerBytes = _joinStrings( list(markerCodes) )
+    arrays = (entryMarkers, entryFlags, entryFields, extrasOffsets, extraFields)
+    return b''.join( [_HEADER_STRUCT.pack( ENTRY_CODEC_MAGIC, ENTRY_CODEC_FORMAT_VERSION, sys.byteorder=='little',
+                                            len(stringNumbers)-1, len(markerCodes), len(entryMarkers), len(extraFields)//4 ),
+                        struct.pack( '<II', len(stringBytes), len(markerBytes) ), stringBytes, markerBytes]
+                    + [someArray.tobytes() for someArray in arrays] )
+# end of entryCodec.encodeEntryList
+
+
+def decodeEntryList( encodedBytes:bytes ) -> InternalBibleEntryList:
+    """
+    Returns a new InternalBibleEntryList from bytes made by encodeEntryList().
+    """
+    magic, formatVersion, littleEndianFlag, numStrings, numMarkers, numEntries, numExtras = _HEADER_STRUCT.unpack_from( encodedBytes )
+    if magic != ENTRY_CODEC_MAGIC or formatVersion != ENTRY_CODEC_FORMAT_VERSION:
+        raise ValueError( f"Not an encoded entry list (version {ENTRY_CODEC_FORMAT_VERSION}): {encodedBytes[:_HEADER_STRUCT.size]!r}" )
+    offset = _HEADER_STRUCT.size
+    numStringBytes, numMarkerBytes = struct.unpack_from( '<II', encodedBytes, offset )
+    offset += 8
+    strings = [None] + _splitStrings( encodedBytes[offset:offset+numStringBytes], numStrings )
+    offset += numStringBytes
+    markers = _splitStrings( encodedBytes[offset:offset+numMarkerBytes], numMarkers )
+    offset += numMarkerBytes
+
+    arrays = []
+    for typecode, numItems in (('H',numEntries), ('B',numEntries), ('I',4*numEntries), ('I',numEntries+1), ('I',4*numExtras)):
+        someArray = array( typecode )
+        numBytes = numItems * someArray.itemsize
+        someArray.frombytes( encodedBytes[offset:offset+numBytes] )
+        if littleEndianFlag != (sys.byteorder=='little'): someArray.byteswap()
+        arrays.append( someArray )
+        offset += numBytes
+    entryMarkers, entryFlags, entryFields, extrasOffsets, extraFields = arrays
+
+    entries = []
+    for n in range( numEntries ):
+        if entryFlags[n]:
+            extras = []
+            for x in range( 4*extrasOffsets[n], 4*extrasOffsets[n+1], 4 ):
+                extras.append( InternalBibleExtra( strings[extraFields[x]], extraFields[x+1], strings[extraFields[x+2]], strings[extraFields[x+3]], None ) )
+            extras = InternalBibleExtraList( extras )
+        else: extras = None
+        f = 4 * n
+        entries.append( InternalBibleEntry( markers[entryMarkers[n]], strings[entryFields[f]], strings[entryFields[f+1]],
+                                            strings[entryFields[f+2]], extras, strings[entryFields[f+3]] ) )
+    return InternalBibleEntryList( entries )
+# end of entryCodec.decodeEntryList
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the entry codec
+    demoEntryList = InternalBibleEntryList( [InternalBibleEntry( 'c', 'c', '1', '1', None, '1' ),
+                                            InternalBibleEntry( 'v', 'v', '1', '1', None, '1' ),
+                                            InternalBibleEntry( 'v~', 'v~', 'In the beginning', 'In the beginning', InternalBibleExtraList(), 'In the beginning' )] )
+    encodedBytes = encodeEntryList( demoEntryList )
+    decodedEntryList = decodeEntryList( encodedBytes )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Encoded {len(demoEntryList)} entries into {len(encodedBytes):,} bytes and decoded {len(decodedEntryList)} entries." )
+# end of entryCodec.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of entryCodec.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of entryCodec.py
@@ -40,6 +40,8 @@ makeViewNavListParagraph( level:int, versionAbbreviation:str|None, pageType:str,
     Note: versionAbbreviation can be None for parallel, interlinear and word pages, etc.
         It can also be the 'OET' pseudo version.
         Can return an empty string.
+makePageChromeConfig( state:State ) -> None
+    (Re)make the snapshot of the State data used by makeTop and makeViewNavListParagraph.
 makeBookNavListParagraph( linksList:list[str], workAbbrevPlus:str, state:State ) -> str
 makeBottom( level:int, versionAbbreviation:str|None, pageType:str, state:State ) -> str
 _makeFooter( level:int, versionAbbreviation:str|None, pageType:str, state:State ) -> str
@@ -93,6 +95,7 @@ CHANGELOG:
         openbibledata_rust module (page_chrome); deleted the superseded Python
         _makeNavigationLinks and _makeWorkNavListParagraph implementations.
         Output byte-fidelity is checked by golden_makeTop.py.
+    2026-10-16 Added makePageChromeConfig so the snapshot can be made before any Bibles are released
 """
 import logging
 from datetime import datetime
@@ -108,10 +111,10 @@ from settings import State, state
 from OETHandlers import getBBBFromOETBookName
 
 
-LAST_MODIFIED_DATE = '2026-08-22' # by RJH
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
 SHORT_PROGRAM_NAME = "html"
 PROGRAM_NAME = "OpenBibleData HTML functions"
-PROGRAM_VERSION = '1.0.3'
+PROGRAM_VERSION = '1.0.4'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -142,11 +145,22 @@ def _getPageChromeConfig( state:State ):
     Assumes those State fields are settled before page creation starts
     (which Bibles.loadBibles guarantees).
     """
-    global _pageChromeConfigCache
     if _pageChromeConfigCache is None or _pageChromeConfigCache[0] != id(state):
-        _pageChromeConfigCache = (id(state), openbibledata_rust.PageChromeConfig(state))
+        makePageChromeConfig( state )
     return _pageChromeConfigCache[1]
 
+def makePageChromeConfig( state:State ) -> None:
+    """
+    (Re)make the Rust snapshot of the State data needed by the page-top builders.
+
+    runBuildStages calls this before it releases any Bibles or forks any worker processes,
+        so that the snapshot is always made from the real preloaded Bibles
+        (even if the only stages left to build don't use them, e.g., when resuming a build)
+        and so that the workers share it rather than each making their own.
+    """
+    global _pageChromeConfigCache
+    _pageChromeConfigCache = (id(state), openbibledata_rust.PageChromeConfig(state))
+
 def makeTop( level:int, versionAbbreviation:str|None, pageType:str, versionSpecificFileOrFolderName:str|None, state:State ) -> str:
     """
     Create the very top part of an HTML page.
@@ -0,0 +1,206 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# lemmaIndex.py
+#
+# Module handling the OpenBibleData inverted lemma indexes for the lemma pages
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling the OpenBibleData inverted lemma indexes for the lemma pages.
+
+Each lemma page lists the other lemmas which are related to it,
+    i.e., the same lemma with a known prefix added or removed, and the lemmas with similar or contrastive glosses,
+    and the verse of each word row that it shows.
+Rather than scanning all the other lemmas (and all their glosses) for every lemma page,
+    a LemmaIndex is made in one pass over the lemma list, the lemma glosses, and the word table 'Ref' column:
+        lemma -> lemma id (its position in the lemma list),
+        lemma id -> the prefixed/unprefixed lemma ids,
+        gloss -> the lemmas glossed with it (in the same order as the lemma glosses dict),
+        and row number -> verse id -> (BBB, C, V).
+
+The lemma -> sorted word rows lists are already in the word indexes (see wordIndexes.py).
+
+LemmaIndex( lemmaList:list[str], lemmaGlossesDict:dict[str,set[str]], knownPrefixes:tuple[str,...], wordTable:WordTable )
+    getLemmaId( lemma:str ) -> int
+    getPrefixedLemmas( lemma:str ) -> list[tuple[str,str]]
+    getGlossLemmas( gloss:str ) -> list[str]
+    getRowVerse( rowNumber:int ) -> tuple[str,str,str]|None
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version
+"""
+from array import array
+from time import time
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+from wordTable import WordTable
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "lemmaIndex"
+PROGRAM_NAME = "OpenBibleData lemma index handler"
+PROGRAM_VERSION = '0.10'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+MAX_PREFIX_LENGTH = 5 # Longer known prefixes are ignored
+
+
+class LemmaIndex:
+    """
+    Inverted indexes of the lemmas of one of the OET word tables.
+    """
+    def __init__( self, lemmaList:list[str], lemmaGlossesDict:dict[str,set[str]], knownPrefixes:tuple[str,...], wordTable:WordTable ) -> None:
+        """
+        The lemma ids are the positions in lemmaList (the first one if a lemma is there more than once).
+
+        lemmaGlossesDict maps a lemma (or word form) to a set of its glosses.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"LemmaIndex.__init__( ({len(lemmaList):,}), ({len(lemmaGlossesDict):,}), {knownPrefixes}, {wordTable} )" )
+        startTime = time()
+        self.lemmaList = lemmaList
+        self.lemmaIds:dict[str,int] = {}
+        for lemmaId, lemma in enumerate( lemmaList ):
+            self.lemmaIds.setdefault( lemma, lemmaId )
+
+        # Find the lemmas which are another lemma with a known prefix (in one pass over the lemmas)
+        prefixes = [prefix for prefix in knownPrefixes if 0 < len(prefix) <= MAX_PREFIX_LENGTH]
+        self.prefixedLemmaIds:dict[int,list[tuple[int,str]]] = {}
+        for lemmaId, lemma in enumerate( lemmaList ):
+            if self.lemmaIds[lemma] != lemmaId: continue # a duplicate
+            for prefix in prefixes:
+                try: prefixedLemmaId = self.lemmaIds[f'{prefix}{lemma}']
+                except KeyError: continue
+                # The lemma pages only list other lemmas with more than one character
+                if len(prefix) + len(lemma) > 1:
+                    self.prefixedLemmaIds.setdefault( lemmaId, [] ).append( (prefixedLemmaId, prefix) )
+                if len(lemma) > 1:
+                    self.prefixedLemmaIds.setdefault( prefixedLemmaId, [] ).append( (lemmaId, prefix) )
+        for relatedLemmaIds in self.prefixedLemmaIds.values():
+            relatedLemmaIds.sort() # Into lemma list order
+
+        # Invert the lemma glosses (in one pass over the glosses)
+        self.glossLemmas:dict[str,list[str]] = {}
+        for lemma, glosses in lemmaGlossesDict.items():
+            for gloss in glosses:
+                self.glossLemmas.setdefault( gloss, [] ).append( lemma )
+
+        # Find the verse of each row (in one pass over the 'Ref' column)
+        self.verseRefs:list[tuple[str,str,str]|None] = [None] # So that verse id zero is 'no verse'
+        verseIds = {}
+        self.rowVerseIds = array( 'I', [0] ) # For the column header row
+        refColumn = wordTable.getColumn( 'Ref' )
+        for n in range( 1, len(refColumn) ):
+            BCVref = refColumn[n].split( 'w', 1 )[0] # Something like 'MAT_1:1' (or '' for a blank row)
+            try: verseId = verseIds[BCVref]
+            except KeyError:
+                try:
+                    BBB, CV = BCVref.split( '_', 1 )
+                    C, V = CV.split( ':', 1 )
+                except ValueError: verseId = 0 # Not a verse reference
+                else:
+                    verseId = len(self.verseRefs)
+                    self.verseRefs.append( (BBB, C, V) )
+                verseIds[BCVref] = verseId
+            self.rowVerseIds.append( verseId )
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"    Made lemma index for {len(lemmaList):,} lemmas ({len(self.prefixedLemmaIds):,} with prefixes), {len(self.glossLemmas):,} glosses, and {len(self.verseRefs)-1:,} verses in {time()-startTime:.1f} seconds." )
+    # end of LemmaIndex.__init__
+
+    def __repr__( self ) -> str:
+        return f"LemmaIndex( {len(self.lemmaList):,} lemmas, {len(self.glossLemmas):,} glosses, {len(self.verseRefs)-1:,} verses )"
+
+    def getLemmaId( self, lemma:str ) -> int:
+        """
+        Returns the position of the lemma in the lemma list.
+
+        Raises a KeyError if it's not there.
+        """
+        return self.lemmaIds[lemma]
+    # end of LemmaIndex.getLemmaId
+
+    def getPrefixedLemmas( self, lemma:str ) -> list[tuple[str,str]]:
+        """
+        Returns a list of (otherLemma, prefix) 2-tuples (in lemma list order)
+            where otherLemma is this lemma with a known prefix added or removed
+            (and has more than one character).
+        """
+        try: lemmaId = self.lemmaIds[lemma]
+        except KeyError: return []
+        return [(self.lemmaList[prefixedLemmaId], prefix) for prefixedLemmaId, prefix in self.prefixedLemmaIds.get( lemmaId, () )]
+    # end of LemmaIndex.getPrefixedLemmas
+
+    def getGlossLemmas( self, gloss:str ) -> list[str]:
+        """
+        Returns the lemmas (in the order of the lemma glosses dict) which have this gloss in their set of glosses.
+        """
+        return self.glossLemmas.get( gloss, [] )
+    # end of LemmaIndex.getGlossLemmas
+
+    def getRowVerse( self, rowNumber:int ) -> tuple[str,str,str]|None:
+        """
+        Returns the (BBB, C, V) of the word table row (or None if the row has no verse reference).
+        """
+        return self.verseRefs[self.rowVerseIds[rowNumber]]
+    # end of LemmaIndex.getRowVerse
+# end of class LemmaIndex
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the LemmaIndex object
+    wordTable = WordTable( 'DEMO_NT_word_table.tsv', ['Ref\tGreekWord\tLemma',
+                                                    'JHN_1:1w1\tἘν\ten', 'JHN_1:1w2\tἀρχῇ\tarχē', 'JHN_1:3w8\tἐγένετο\tginomai', 'JHN_1:6w1\tἘγένετο\tginomai', ''] )
+    lemmaList = ['arχē', 'en', 'ginomai', 'epiginomai']
+    lemmaIndex = LemmaIndex( lemmaList, {'arχē':{'beginning'}, 'en':{'in'}, 'ginomai':{'became','came'}, 'epiginomai':{'came'}}, ('epi','para'), wordTable )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {lemmaIndex} {lemmaIndex.getLemmaId('ginomai')=} {lemmaIndex.getPrefixedLemmas('ginomai')=} {lemmaIndex.getGlossLemmas('came')=} {lemmaIndex.getRowVerse(4)=}" )
+# end of lemmaIndex.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of lemmaIndex.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of lemmaIndex.py
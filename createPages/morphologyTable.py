@@ -0,0 +1,168 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# morphologyTable.py
+#
+# Module handling the OpenBibleData morphology decode tables
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling the OpenBibleData morphology decode tables.
+
+There are several hundred thousand word rows in the OET word tables,
+    but only a few thousand different (row type, morphology) or (role, morphology, caps) codes.
+So rather than expanding the morphology codes again for every word row (for the word pages and the app json files),
+    a MorphologyTable is made (in one pass over the encoded word table columns)
+    with the decodes (e.g., the HTML and plain text forms) of each different code.
+
+The decode function (e.g., createOETReferencePages.decode_Hebrew_morphology) is passed in,
+    because the morphology name dicts are in the modules that use them.
+
+MorphologyTable( tableName:str, decodeFunction:Callable[...,tuple[str,...]], keys:Iterable[tuple[str,...]]=() )
+    fromWordTable( tableName:str, decodeFunction:Callable[...,tuple[str,...]], wordTable:WordTable, columnNames:tuple[str,...] ) -> MorphologyTable
+    getDecode( *key:str ) -> tuple[str,...]
+getMorphologyText( morphologyHtml:str ) -> str
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version
+"""
+from collections.abc import Callable, Iterable
+from itertools import islice
+from time import time
+import re
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+from wordTable import WordTable
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "morphologyTable"
+PROGRAM_NAME = "OpenBibleData morphology decode tables"
+PROGRAM_VERSION = '0.10'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+HTML_TAG_REGEX = re.compile( '<[^>]+>' )
+WHITESPACE_REGEX = re.compile( r'\s+' )
+
+
+class MorphologyTable:
+    """
+    The decodes of the different morphology codes of one of the OET word tables.
+    """
+    def __init__( self, tableName:str, decodeFunction:Callable[...,tuple[str,...]], keys:Iterable[tuple[str,...]]=() ) -> None:
+        """
+        Each key is the tuple of arguments (e.g., (rowType, morphology)) to give to decodeFunction.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"MorphologyTable.__init__( {tableName}, {decodeFunction.__name__}, … )" )
+        self.tableName, self.decodeFunction = tableName, decodeFunction
+        self.decodes:dict[tuple[str,...],tuple[str,...]] = {}
+        for key in keys:
+            if key not in self.decodes:
+                self.decodes[key] = decodeFunction( *key )
+    # end of MorphologyTable.__init__
+
+    @classmethod
+    def fromWordTable( cls, tableName:str, decodeFunction:Callable[...,tuple[str,...]], wordTable:WordTable, columnNames:tuple[str,...] ) -> 'MorphologyTable':
+        """
+        Make the decodes of each different combination of the values of the given columns
+            (found from the codes of the encoded columns, so it's one pass over small ints).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"MorphologyTable.fromWordTable( {tableName}, {decodeFunction.__name__}, {wordTable}, {columnNames} )" )
+        startTime = time()
+        encodedColumns = wordTable.getEncodedColumns( *columnNames )
+        keyCodes = set( zip( *(islice( encodedColumn.codes, 1, None ) for encodedColumn in encodedColumns) ) ) # Skip the column header row
+        morphologyTable = cls( tableName, decodeFunction,
+                    (tuple( encodedColumn.values[code] for encodedColumn, code in zip( encodedColumns, codes ) ) for codes in sorted( keyCodes )) )
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"    Made {morphologyTable} from {len(wordTable)-1:,} {wordTable.filename} rows in {time()-startTime:.2f} seconds." )
+        return morphologyTable
+    # end of MorphologyTable.fromWordTable
+
+    def __len__( self ) -> int:
+        return len(self.decodes)
+    def __repr__( self ) -> str:
+        return f"MorphologyTable( {self.tableName}, {len(self.decodes):,} decodes )"
+
+    def getDecode( self, *key:str ) -> tuple[str,...]:
+        """
+        Returns the decodes of the morphology code.
+
+        If the code wasn't in the word table (so isn't in our table yet), it's decoded now (and remembered).
+        """
+        try: return self.decodes[key]
+        except KeyError:
+            decode = self.decodes[key] = self.decodeFunction( *key )
+            return decode
+    # end of MorphologyTable.getDecode
+# end of class MorphologyTable
+
+
+def getMorphologyText( morphologyHtml:str ) -> str:
+    """
+    Returns the plain text form of the morphology HTML,
+        i.e., without the tags and with the spaces and line breaks tidied.
+    """
+    return WHITESPACE_REGEX.sub( ' ', HTML_TAG_REGEX.sub( '', morphologyHtml.replace( '<br>', ';' ) ) ).replace( ' ;', ';' ).strip()
+# end of morphologyTable.getMorphologyText
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the MorphologyTable object
+    def decodeDemoMorphology( roleLetter:str, morphology:str ) -> tuple[str,str]:
+        morphologyHtml = f' Word role=<b>{ {"N":"noun","P":"preposition","V":"verb"}[roleLetter] }</b>{f" morphology=<b>{morphology}</b>" if morphology else ""}'
+        return morphologyHtml, getMorphologyText( morphologyHtml )
+    wordTable = WordTable( 'DEMO_NT_word_table.tsv', ['Ref\tGreekWord\tRole\tMorphology',
+                                                    'JHN_1:1w1\tἘν\tP\t', 'JHN_1:1w2\tἀρχῇ\tN\t····DFS', 'JHN_1:3w8\tἐγένετο\tV\tIAM3···', 'JHN_1:6w1\tἘγένετο\tV\tIAM3···'] )
+    morphologyTable = MorphologyTable.fromWordTable( 'Demo morphology', decodeDemoMorphology, wordTable, ('Role','Morphology') )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {morphologyTable} {morphologyTable.getDecode('V','IAM3···')=} {morphologyTable.getDecode('N','····GFS')=}" )
+# end of morphologyTable.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of morphologyTable.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of morphologyTable.py
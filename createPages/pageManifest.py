@@ -0,0 +1,308 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# pageManifest.py
+#
+# Module handling OpenBibleData page fingerprint manifests (for incremental builds)
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling OpenBibleData page fingerprint manifests (for incremental builds).
+
+For each page that we make, we record a fingerprint of everything that went into it:
+    the verse entries that it rendered, any resource files (or in-memory tables) that it read,
+    and the version of the code that generated it.
+The manifest is saved with the built pages (so it gets moved to the actual site along with them).
+
+On the next build, if a page's fingerprint is unchanged,
+    we simply link (or copy) the page from the previous site
+    rather than rendering it all over again.
+
+getVerseEntryListHash( verseEntryList ) -> str
+getCodeFileHash( filepath:Path ) -> str
+getModuleFingerprint( module ) -> str
+PageManifest( previousSiteFolder:Path|None, buildFolder:Path, buildInputs:str='' )
+    makeFingerprint( generatorVersion:str, verseEntryLists=(), resourceFilepaths=(), extras=() ) -> str
+    reuseExistingPage( filepath:Path, fingerprint:str ) -> bool
+    recordPage( filepath:Path, fingerprint:str ) -> None
+    save() -> Path
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version for incremental rebuilds of version book and chapter pages
+    2026-10-16 Fingerprint tables that are any sequence of rows (e.g., WordTables)
+    2026-10-16 Add getModuleFingerprint (e.g., for the openbibledata_rust extension)
+"""
+from pathlib import Path
+import os
+import shutil
+import hashlib
+import json
+import logging
+from collections.abc import Sequence
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "pageManifest"
+PROGRAM_NAME = "OpenBibleData page manifest handler"
+PROGRAM_VERSION = '0.11'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+MANIFEST_FILENAME = 'OBD_page_manifest.json'
+MANIFEST_FORMAT_VERSION = 1
+
+
+def getVerseEntryListHash( verseEntryList ) -> str:
+    """
+    Returns a hash of the markers and the original (source) text of each entry,
+        so will change if anything in the source ESFM/USFM/etc. for these verses changes.
+    """
+    hasher = hashlib.sha256()
+    for entry in verseEntryList:
+        hasher.update( f'{entry.getMarker()}\t{entry.getOriginalText()}\n'.encode( 'utf-8' ) )
+    return hasher.hexdigest()
+# end of pageManifest.getVerseEntryListHash
+
+
+_codeFileHashCache = {} # Key is the filepath, value is (size, mtime_ns, hash)
+
+def getCodeFileHash( filepath:Path ) -> str:
+    """
+    Returns a hash of the contents of the (code) file.
+
+    The hash is remembered until the file size or time changes.
+    """
+    fileStat = os.stat( filepath )
+    cachedSize, cachedMTimeNs, cachedHash = _codeFileHashCache.get( str(filepath), (None, None, None) )
+    if fileStat.st_size == cachedSize and fileStat.st_mtime_ns == cachedMTimeNs:
+        return cachedHash
+    with open( filepath, 'rb' ) as codeFile:
+        fileHash = hashlib.file_digest( codeFile, 'sha256' ).hexdigest()
+    _codeFileHashCache[str(filepath)] = (fileStat.st_size, fileStat.st_mtime_ns, fileHash)
+    return fileHash
+# end of pageManifest.getCodeFileHash
+
+
+def getModuleFingerprint( module ) -> str:
+    """
+    Returns a hash of the file(s) of the loaded module,
+        so will change if the module is edited (or an extension module is rebuilt)
+        even if nobody remembers to change its version number.
+
+    For a package (e.g., the openbibledata_rust extension which has its compiled library beside its __init__.py),
+        all the files in the package folder are included.
+    """
+    moduleFilepath = getattr( module, '__file__', None )
+    if not moduleFilepath: # e.g., a built-in module
+        return f"{module.__name__} {getattr( module, '__version__', '' )}"
+    moduleFilepath = Path( moduleFilepath )
+    codeFilepaths = sorted( filepath for filepath in moduleFilepath.parent.iterdir() if filepath.is_file() ) \
+                        if moduleFilepath.name == '__init__.py' else [moduleFilepath]
+    hasher = hashlib.sha256( f'{module.__name__}\n'.encode( 'utf-8' ) )
+    for codeFilepath in codeFilepaths:
+        hasher.update( f'{codeFilepath.name} {getCodeFileHash( codeFilepath )}\n'.encode( 'utf-8' ) )
+    return hasher.hexdigest()
+# end of pageManifest.getModuleFingerprint
+
+
+class PageManifest:
+    """
+    Remembers the fingerprint of each page that we make
+        and allows unchanged pages to be reused from the previous site.
+
+    Page paths are stored relative to the build folder (and the site folder), e.g., 'KJB-1769/byC/MRK_C3.htm'.
+    buildInputs is included in every fingerprint: it's for anything that affects every page,
+        e.g., the list of versions in the page headers.
+    """
+    def __init__( self, previousSiteFolder:Path|None, buildFolder:Path, buildInputs:str='' ) -> None:
+        fnPrint( DEBUGGING_THIS_MODULE, f"PageManifest.__init__( {previousSiteFolder}, {buildFolder}, {buildInputs} )" )
+        self.previousSiteFolder, self.buildFolder, self.buildInputs = previousSiteFolder, buildFolder, buildInputs
+        self.previousPages, self.newPages = {}, {} # Key is the relative path, value is the fingerprint
+        self.numReused = self.numRendered = 0
+        self._fileFingerprintCache, self._dataFingerprintCache = {}, {}
+
+        if previousSiteFolder is not None:
+            previousManifestFilepath = previousSiteFolder.joinpath( MANIFEST_FILENAME )
+            try:
+                with open( previousManifestFilepath, 'rt', encoding='utf-8' ) as manifestFile:
+                    manifestDict = json.load( manifestFile )
+                if manifestDict.get( 'formatVersion' ) == MANIFEST_FORMAT_VERSION:
+                    self.previousPages = manifestDict['pages']
+                else:
+                    logging.warning( f"Ignoring {previousManifestFilepath} with format version {manifestDict.get( 'formatVersion' )}" )
+            except FileNotFoundError: pass # First build (or the site was cleaned)
+            except (json.JSONDecodeError, KeyError) as err:
+                logging.error( f"Ignoring unreadable page manifest {previousManifestFilepath}: {err}" )
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Page manifest has {len(self.previousPages):,} pages from the previous build." )
+    # end of PageManifest.__init__
+
+    def getFileFingerprint( self, filepath:Path|str ) -> str:
+        """
+        Returns a hash of the contents of the file
+            (cached so that each resource file is only read once per build).
+        """
+        filepath = str( filepath )
+        fileStat = os.stat( filepath )
+        cacheKey = (filepath, fileStat.st_size, fileStat.st_mtime_ns)
+        try: return self._fileFingerprintCache[cacheKey]
+        except KeyError: pass
+        with open( filepath, 'rb' ) as resourceFile:
+            fingerprint = hashlib.file_digest( resourceFile, 'sha256' ).hexdigest()
+        self._fileFingerprintCache[cacheKey] = fingerprint
+        return fingerprint
+    # end of PageManifest.getFileFingerprint
+
+    def getDataFingerprint( self, name:str, data:dict|list|tuple|str ) -> str:
+        """
+        Returns a hash of an in-memory table (like the OET word tables) that was loaded from resource files,
+            cached by name so that big tables are only hashed once per build.
+        """
+        try: return self._dataFingerprintCache[name]
+        except KeyError: pass
+        hasher = hashlib.sha256()
+        for item in ([data] if isinstance( data, str ) else data.items() if isinstance( data, dict ) else data):
+            if isinstance( item, tuple ) and len(item) == 2 and isinstance( item[1], Sequence ) and not isinstance( item[1], str ): # e.g., a dict of tables (lists of TSV row strings or WordTables)
+                hasher.update( f'{item[0]}\n'.encode( 'utf-8' ) )
+                for row in item[1]: hasher.update( f'{row}\n'.encode( 'utf-8' ) )
+            else: hasher.update( f'{item}\n'.encode( 'utf-8' ) )
+        self._dataFingerprintCache[name] = hasher.hexdigest()
+        return self._dataFingerprintCache[name]
+    # end of PageManifest.getDataFingerprint
+
+    def makeFingerprint( self, generatorVersion:str, verseEntryLists=(), resourceFilepaths=(), extras=() ) -> str:
+        """
+        Combine everything that goes into a page into a single fingerprint string.
+
+        generatorVersion should change whenever the code that makes the page changes.
+        extras are any other strings that end up in the page, e.g., navigation links, or data fingerprints.
+        """
+        hasher = hashlib.sha256( f'{self.buildInputs}\n{generatorVersion}\n'.encode( 'utf-8' ) )
+        for verseEntryList in verseEntryLists:
+            hasher.update( f'V{getVerseEntryListHash( verseEntryList )}\n'.encode( 'utf-8' ) )
+        for resourceFilepath in resourceFilepaths:
+            hasher.update( f'R{resourceFilepath}={self.getFileFingerprint( resourceFilepath )}\n'.encode( 'utf-8' ) )
+        for extra in extras:
+            hasher.update( f'X{extra}\n'.encode( 'utf-8' ) )
+        return hasher.hexdigest()
+    # end of PageManifest.makeFingerprint
+
+    def _getRelativePath( self, filepath:Path ) -> str:
+        return Path( filepath ).relative_to( self.buildFolder ).as_posix()
+    # end of PageManifest._getRelativePath
+
+    def reuseExistingPage( self, filepath:Path, fingerprint:str ) -> bool:
+        """
+        If the page at filepath (in the build folder) had exactly the same fingerprint in the previous build,
+            link (or copy) the previous page into the build folder, record it, and return True.
+
+        Otherwise return False (and the caller should render the page and then call recordPage()).
+        """
+        relativePath = self._getRelativePath( filepath )
+        if self.previousSiteFolder is None or self.previousPages.get( relativePath ) != fingerprint:
+            return False
+        previousFilepath = self.previousSiteFolder.joinpath( relativePath )
+        try: os.link( previousFilepath, filepath ) # Fast and takes no extra disk space
+        except FileNotFoundError: return False # Previous page has gone so we'll have to make it again
+        except OSError: # Maybe a different filesystem
+            try: shutil.copy2( previousFilepath, filepath )
+            except FileNotFoundError: return False
+        self.newPages[relativePath] = fingerprint
+        self.numReused += 1
+        return True
+    # end of PageManifest.reuseExistingPage
+
+    def recordPage( self, filepath:Path, fingerprint:str ) -> None:
+        """
+        Remember the fingerprint of a page that we've just rendered
+        """
+        self.newPages[self._getRelativePath( filepath )] = fingerprint
+        self.numRendered += 1
+    # end of PageManifest.recordPage
+
+    def getNewEntries( self ) -> tuple[dict[str,str],int,int]:
+        """
+        Returns what's been recorded in this process (so it can be sent back from a worker process)
+        """
+        return self.newPages, self.numReused, self.numRendered
+    # end of PageManifest.getNewEntries
+
+    def mergeNewEntries( self, newEntries:tuple[dict[str,str],int,int] ) -> None:
+        """
+        Adds what was recorded in a worker process (from getNewEntries())
+        """
+        newPages, numReused, numRendered = newEntries
+        self.newPages.update( newPages )
+        self.numReused += numReused
+        self.numRendered += numRendered
+    # end of PageManifest.mergeNewEntries
+
+    def save( self ) -> Path:
+        """
+        Save the manifest into the build folder (so it goes with the pages that it describes)
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "PageManifest.save()" )
+        manifestFilepath = self.buildFolder.joinpath( MANIFEST_FILENAME )
+        with open( manifestFilepath, 'wt', encoding='utf-8' ) as manifestFile:
+            json.dump( {'formatVersion':MANIFEST_FORMAT_VERSION, 'pages':dict( sorted( self.newPages.items() ) )}, manifestFile, ensure_ascii=False, indent=0 )
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Saved page manifest for {len(self.newPages):,} pages: reused {self.numReused:,} unchanged pages and rendered {self.numRendered:,}." )
+        return manifestFilepath
+    # end of PageManifest.save
+# end of class PageManifest
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the PageManifest object
+    pageManifest = PageManifest( None, Path( '../buildingHtmlPages/' ) )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {pageManifest.makeFingerprint( PROGRAM_NAME_VERSION, extras=('demo',) )=}" )
+# end of pageManifest.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of pageManifest.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of pageManifest.py
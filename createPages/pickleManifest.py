@@ -0,0 +1,212 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# pickleManifest.py
+#
+# Module handling OpenBibleData pickle staleness manifests
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling OpenBibleData pickle staleness manifests.
+
+Beside each pickled resource, e.g., 'OET-RV.OBD_Bible.pickle',
+    we save a small manifest, e.g., 'OET-RV.OBD_Bible.pickle.manifest.json',
+    listing the size, modification time, and content hash of each source file that it was made from.
+
+The pickle is current if one os.scandir() of each source folder finds exactly the same files, sizes, and times.
+If only the times differ (e.g., after a git checkout), the contents are hashed
+    and if they're unchanged, the pickle is still current (and the manifest times are updated).
+
+makePickleManifest( pickleFilepath:Path, sourceFolderPaths:list[Path], ignoredEnding:str ) -> Path
+checkPickleManifest( pickleFilepath:Path, verifyHashes:bool=False ) -> tuple[bool|None,str]
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version
+"""
+from pathlib import Path
+import os
+import hashlib
+import json
+import logging
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "pickleManifest"
+PROGRAM_NAME = "OpenBibleData pickle manifest handler"
+PROGRAM_VERSION = '0.10'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+PICKLE_MANIFEST_FILENAME_END = '.manifest.json'
+PICKLE_MANIFEST_FORMAT_VERSION = 1
+
+
+def _getManifestFilepath( pickleFilepath:Path ) -> Path:
+    return pickleFilepath.with_name( f'{pickleFilepath.name}{PICKLE_MANIFEST_FILENAME_END}' )
+# end of pickleManifest._getManifestFilepath
+
+
+def _getFileHash( filepath:str ) -> str|None:
+    try:
+        with open( filepath, 'rb' ) as sourceFile:
+            return hashlib.file_digest( sourceFile, 'sha256' ).hexdigest()
+    except OSError: return None
+# end of pickleManifest._getFileHash
+
+
+def _scanSourceFolder( folderPath:Path, ignoredEnding:str ) -> dict[str,tuple[int,int]]:
+    """
+    Returns a dict with the filename as the key, and (size, modification time in nanoseconds) as the value
+        for every file in the folder (not including subfolders) except for the pickles and their manifests.
+    """
+    sourceFiles = {}
+    try:
+        with os.scandir( folderPath ) as dirEntries:
+            for dirEntry in dirEntries:
+                if dirEntry.name.endswith( ignoredEnding ) or dirEntry.name.endswith( PICKLE_MANIFEST_FILENAME_END ) \
+                or not dirEntry.is_file():
+                    continue
+                fileStat = dirEntry.stat()
+                sourceFiles[dirEntry.name] = (fileStat.st_size, fileStat.st_mtime_ns)
+    except FileNotFoundError: pass
+    return sourceFiles
+# end of pickleManifest._scanSourceFolder
+
+
+def _saveManifest( pickleFilepath:Path, ignoredEnding:str, folders:dict[str,dict[str,list]] ) -> Path:
+    manifestFilepath = _getManifestFilepath( pickleFilepath )
+    temporaryFilepath = manifestFilepath.with_name( f'{manifestFilepath.name}.tmp' )
+    with open( temporaryFilepath, 'wt', encoding='utf-8' ) as manifestFile:
+        json.dump( {'formatVersion':PICKLE_MANIFEST_FORMAT_VERSION, 'pickleSize':pickleFilepath.stat().st_size,
+                    'ignoredEnding':ignoredEnding, 'folders':folders}, manifestFile, ensure_ascii=False, indent=1 )
+    os.replace( temporaryFilepath, manifestFilepath )
+    return manifestFilepath
+# end of pickleManifest._saveManifest
+
+
+def makePickleManifest( pickleFilepath:Path, sourceFolderPaths:list[Path], ignoredEnding:str ) -> Path:
+    """
+    Save the manifest of the source files for a pickle file that has just been written.
+
+    ignoredEnding is the pickle filename ending, e.g., '.OBD_Bible.pickle' (so other pickles in the folder aren't included).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"makePickleManifest( {pickleFilepath}, {sourceFolderPaths}, {ignoredEnding} )" )
+    folders = {}
+    for sourceFolderPath in sourceFolderPaths:
+        folders[str(sourceFolderPath)] = { filename:[size, mtime, _getFileHash( os.path.join( sourceFolderPath, filename ) )]
+                                            for filename, (size, mtime) in _scanSourceFolder( sourceFolderPath, ignoredEnding ).items() }
+    manifestFilepath = _saveManifest( pickleFilepath, ignoredEnding, folders )
+    vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Saved pickle manifest for {sum( len(folderFiles) for folderFiles in folders.values() ):,} source files: {manifestFilepath}" )
+    return manifestFilepath
+# end of pickleManifest.makePickleManifest
+
+
+def checkPickleManifest( pickleFilepath:Path, verifyHashes:bool=False ) -> tuple[bool|None,str]:
+    """
+    Returns (True, '') if the pickle is current,
+        (False, reason) if any source file has been added, removed, or changed,
+        or (None, reason) if there's no usable manifest.
+
+    If verifyHashes is set, the content of every source file is hashed and checked
+        (slower, but doesn't trust the file times at all).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"checkPickleManifest( {pickleFilepath}, {verifyHashes} )" )
+    manifestFilepath = _getManifestFilepath( pickleFilepath )
+    try:
+        with open( manifestFilepath, 'rt', encoding='utf-8' ) as manifestFile:
+            manifestDict = json.load( manifestFile )
+        if manifestDict.get( 'formatVersion' ) != PICKLE_MANIFEST_FORMAT_VERSION:
+            return None, f"{manifestFilepath.name} has format version {manifestDict.get( 'formatVersion' )}"
+        if manifestDict['pickleSize'] != pickleFilepath.stat().st_size:
+            return None, f"{pickleFilepath.name} was rewritten after {manifestFilepath.name}"
+        ignoredEnding, folders = manifestDict['ignoredEnding'], manifestDict['folders']
+    except FileNotFoundError: return None, f"no {manifestFilepath.name}"
+    except (json.JSONDecodeError, KeyError, TypeError) as err: return None, f"unreadable {manifestFilepath.name}: {err}"
+
+    numRehashed = 0
+    for sourceFolderPathString, manifestFiles in folders.items():
+        currentFiles = _scanSourceFolder( Path( sourceFolderPathString ), ignoredEnding )
+        if currentFiles.keys() != manifestFiles.keys():
+            changedFilenames = sorted( currentFiles.keys() ^ manifestFiles.keys() )
+            return False, f"{len(changedFilenames)} source files added or removed in {sourceFolderPathString}, e.g., {changedFilenames[0]}"
+        for filename, (size, mtime) in currentFiles.items():
+            manifestSize, manifestMTime, manifestHash = manifestFiles[filename]
+            if size != manifestSize:
+                return False, f"{filename} has changed size"
+            if mtime != manifestMTime or verifyHashes:
+                if manifestHash is None or _getFileHash( os.path.join( sourceFolderPathString, filename ) ) != manifestHash:
+                    return False, f"{filename} has changed"
+                if mtime != manifestMTime: # Same contents (e.g., after a git checkout) so remember the new time for next time
+                    manifestFiles[filename][1] = mtime
+                    numRehashed += 1
+    if numRehashed:
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  {numRehashed:,} source files for {pickleFilepath.name} have new times but the same contents." )
+        try: _saveManifest( pickleFilepath, ignoredEnding, folders )
+        except OSError as err: logging.warning( f"Couldn't update {manifestFilepath}: {err}" )
+    return True, ''
+# end of pickleManifest.checkPickleManifest
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the pickle manifest
+    import tempfile
+    with tempfile.TemporaryDirectory() as tempFolder:
+        demoFolderPath = Path( tempFolder )
+        demoFolderPath.joinpath( 'MRK.usfm' ).write_text( '\\id MRK\n' )
+        demoPickleFilepath = demoFolderPath.joinpath( 'DEMO.OBD_Bible.pickle' )
+        demoPickleFilepath.write_bytes( b'demo' )
+        makePickleManifest( demoPickleFilepath, [demoFolderPath], '.OBD_Bible.pickle' )
+        os.utime( demoFolderPath.joinpath( 'MRK.usfm' ) ) # Like a git checkout
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {checkPickleManifest( demoPickleFilepath )=}" )
+# end of pickleManifest.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of pickleManifest.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of pickleManifest.py
@@ -0,0 +1,189 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# preloadProfile.py
+#
+# Module profiling the OpenBibleData preloading of each version
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module profiling the OpenBibleData preloading of each version
+    so we can see which versions dominate the startup time and memory.
+
+For each version, preloadVersions() records:
+    the source format (the class of the loaded object, e.g., 'USFMBible', or 'SelectedVersesTSV' from loadSelectedVersesFile()),
+    whether it was loaded from its pickle/cache,
+    the load time,
+    the number of books and entries (InternalBibleEntries, or verses for selected verses only versions),
+    and the increase in the RSS of the main process after loading it.
+
+The results are printed as a table (slowest first) and saved in the build report (as 'preloadVersions').
+
+If a memory budget is given, a PreloadMemoryBudgetError is raised
+    as soon as any one version increases the RSS by more than that.
+
+PreloadMemoryBudgetError
+PreloadProfile( memoryBudgetMB:int|None=None )
+    startVersion() -> dict
+    finishVersion( versionAbbreviation:str, measurement:dict, versionObject, cacheHit:bool, loadSeconds:float|None=None ) -> dict
+    printTable() -> None
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version
+"""
+from time import time
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+from buildReport import getCurrentRssMB
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "preloadProfile"
+PROGRAM_NAME = "OpenBibleData preload profiler"
+PROGRAM_VERSION = '0.10'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+class PreloadMemoryBudgetError( Exception ): pass
+
+
+def _getBooksAndEntries( versionObject ) -> tuple[int|None,int|None]:
+    """
+    Returns the number of books and entries in the loaded version (or None if unknown)
+
+    For a Bible from a book cache, this doesn't load any more books
+        (because the cache saved the number of entries in each book).
+    """
+    if isinstance( versionObject, dict ): # From loadSelectedVersesFile() with (BBB,C,V) keys
+        return len( {BBB for BBB,_C,_V in versionObject} ), len(versionObject)
+    books = getattr( versionObject, 'books', None )
+    if books is None: return None, None
+    entryCounts = getattr( books, 'entryCounts', None ) # A LazyBookDict from bookCache.py
+    if entryCounts is not None:
+        return len(books), sum( entryCounts[BBB] for BBB in books ) if all( BBB in entryCounts for BBB in books ) else None
+    numEntries = 0
+    for bookObject in books.values():
+        processedLines = getattr( bookObject, '_processedLines', None )
+        if processedLines is None: return len(books), None
+        numEntries += len(processedLines)
+    return len(books), numEntries
+# end of preloadProfile._getBooksAndEntries
+
+
+class PreloadProfile:
+    """
+    Collects the profile entry for each preloaded version
+    """
+    def __init__( self, memoryBudgetMB:int|None=None ) -> None:
+        self.memoryBudgetMB = memoryBudgetMB
+        self.entries = []
+    # end of PreloadProfile.__init__
+
+    def startVersion( self ) -> dict:
+        """
+        Returns the starting values for finishVersion()
+        """
+        return { 'wallStart':time(), 'rssStartMB':getCurrentRssMB() }
+    # end of PreloadProfile.startVersion
+
+    def finishVersion( self, versionAbbreviation:str, measurement:dict, versionObject, cacheHit:bool, loadSeconds:float|None=None ) -> dict:
+        """
+        Record the profile entry for the version that started with the given measurement.
+
+        loadSeconds can be given if the version was loaded elsewhere (e.g., in a worker process),
+            in which case the measurement is just for receiving it here.
+
+        Raises a PreloadMemoryBudgetError if it used more than our memory budget.
+        """
+        rssEndMB = getCurrentRssMB()
+        numBooks, numEntries = _getBooksAndEntries( versionObject )
+        entry = { 'version':versionAbbreviation,
+                'sourceFormat':'SelectedVersesTSV' if isinstance( versionObject, dict ) else None if versionObject is None else type(versionObject).__name__,
+                'cacheHit':cacheHit,
+                'workerProcess':loadSeconds is not None,
+                'loadSeconds':round( time() - measurement['wallStart'] if loadSeconds is None else loadSeconds, 2 ),
+                'numBooks':numBooks, 'numEntries':numEntries,
+                'rssDeltaMB':None if rssEndMB is None or measurement['rssStartMB'] is None else rssEndMB - measurement['rssStartMB'],
+                }
+        self.entries.append( entry )
+        dPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Preload profile: {entry}" )
+        if self.memoryBudgetMB is not None and entry['rssDeltaMB'] is not None and entry['rssDeltaMB'] > self.memoryBudgetMB:
+            raise PreloadMemoryBudgetError( f"Preloading {versionAbbreviation} used {entry['rssDeltaMB']:,} MB which is more than the budget of {self.memoryBudgetMB:,} MB" )
+        return entry
+    # end of PreloadProfile.finishVersion
+
+    def printTable( self ) -> None:
+        """
+        Print a table of the versions with the slowest first
+        """
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\nPreloaded {len(self.entries)} versions (slowest first) in {sum( entry['loadSeconds'] for entry in self.entries ):,.1f} seconds (total):" )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {'Version':<12} {'Format':<20} {'Cache':<6} {'Seconds':>8} {'Books':>6} {'Entries':>10} {'RSS +MB':>8}" )
+        for entry in sorted( self.entries, key=lambda entry: entry['loadSeconds'], reverse=True ):
+            cacheString = 'hit' if entry['cacheHit'] else 'worker' if entry['workerProcess'] else 'miss'
+            booksString = '?' if entry['numBooks'] is None else f"{entry['numBooks']:,}"
+            entriesString = '?' if entry['numEntries'] is None else f"{entry['numEntries']:,}"
+            rssString = '?' if entry['rssDeltaMB'] is None else f"{entry['rssDeltaMB']:,}"
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {entry['version']:<12} {entry['sourceFormat'] or '?':<20} {cacheString:<6} {entry['loadSeconds']:>8.2f}"
+                                                    f" {booksString:>6} {entriesString:>10} {rssString:>8}" )
+    # end of PreloadProfile.printTable
+# end of class PreloadProfile
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the PreloadProfile object
+    preloadProfile = PreloadProfile( memoryBudgetMB=1_000 )
+    measurement = preloadProfile.startVersion()
+    demoVerses = { ('JHN','3',str(V)):'…' for V in range( 1, 37 ) }
+    preloadProfile.finishVersion( 'DEMO', measurement, demoVerses, cacheHit=False )
+    preloadProfile.printTable()
+# end of preloadProfile.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of preloadProfile.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of preloadProfile.py
@@ -0,0 +1,269 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# publishSite.py
+#
+# Module handling publishing OpenBibleData builds as releases
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling publishing OpenBibleData builds as releases.
+
+Rather than deleting the live site and then moving the new build into it
+    (which leaves a half-deleted site for several minutes),
+    the build folder is renamed into a new release folder, e.g., '../htmlPageReleases/htmlPages_2026-10-16_093012/',
+    and then the destination, e.g., '../htmlPages', which is a symbolic link to the live release,
+    is atomically switched to point to the new release.
+
+The previous releases are kept (up to a limit) so that we can instantly roll back to them.
+
+getReleaseFolders( destinationFolder:Path, releasesFolder:Path ) -> list[Path]
+getLiveRelease( destinationFolder:Path ) -> Path|None
+makeReleaseFolder( buildFolder:Path, destinationFolder:Path, releasesFolder:Path, replacedNames:set[str] ) -> Path
+migrateToReleases( destinationFolder:Path, releasesFolder:Path ) -> Path|None
+switchToRelease( destinationFolder:Path, releaseFolder:Path ) -> None
+removeOldReleases( destinationFolder:Path, releasesFolder:Path, numKept:int, removeFunction=shutil.rmtree ) -> list[Path]
+rollBackRelease( destinationFolder:Path, releasesFolder:Path ) -> Path|None
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version to publish by atomically switching a symbolic link
+    2026-10-16 Allow old releases to be deleted in the background
+    2026-10-16 Move (rather than fail) if the first release can't be renamed, and put the old site back if the switch fails
+    2026-10-16 Added migrateToReleases (for --migrate-site) to convert an existing site folder into the first release
+"""
+from pathlib import Path
+import os
+import shutil
+from datetime import datetime
+import logging
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "publishSite"
+PROGRAM_NAME = "OpenBibleData site publisher"
+PROGRAM_VERSION = '0.13'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+RELEASE_DATETIME_FORMAT = '%Y-%m-%d_%H%M%S' # So that the release folder names sort by age
+
+
+def getReleaseFolders( destinationFolder:Path, releasesFolder:Path ) -> list[Path]:
+    """
+    Returns the release folders for this destination with the oldest first
+    """
+    try:
+        return sorted( releasesFolder.glob( f'{destinationFolder.name}_*' ) )
+    except FileNotFoundError: return []
+# end of publishSite.getReleaseFolders
+
+
+def getLiveRelease( destinationFolder:Path ) -> Path|None:
+    """
+    Returns the release folder that the destination currently points to,
+        or None if the destination isn't (yet) a symbolic link.
+    """
+    if not destinationFolder.is_symlink(): return None
+    return Path( os.readlink( destinationFolder ) )
+# end of publishSite.getLiveRelease
+
+
+def _linkOrCopy( sourceFilepath:str, destinationFilepath:str ) -> None:
+    """
+    Hard links take no time or extra disk space (but might not work across filesystems)
+    """
+    try: os.link( sourceFilepath, destinationFilepath )
+    except OSError: shutil.copy2( sourceFilepath, destinationFilepath )
+# end of publishSite._linkOrCopy
+
+
+def _renameOrMove( sourceFolder:Path, destinationFolder:Path ) -> None:
+    """
+    Renaming is instant (but only works on the same filesystem)
+    """
+    try: os.rename( sourceFolder, destinationFolder )
+    except OSError as err:
+        logging.warning( f"Couldn't rename {sourceFolder}/ to {destinationFolder}/ ({err}) so moving it instead (slow)…" )
+        shutil.move( sourceFolder, destinationFolder, copy_function=shutil.copy2 )
+# end of publishSite._renameOrMove
+
+
+def makeReleaseFolder( buildFolder:Path, destinationFolder:Path, releasesFolder:Path, replacedNames:set[str] ) -> Path:
+    """
+    Renames the completed build folder to become a new release folder (so the build folder is gone afterwards).
+
+    Anything in the live site which isn't in the new build and isn't in replacedNames
+        (e.g., 'par/' or 'index.htm' which would normally be rebuilt)
+        is carried over into the new release using hard links,
+        e.g., word pages that weren't rebuilt this time, a search index, or the test site.
+
+    Returns the new release folder (which isn't live yet -- see switchToRelease()).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"makeReleaseFolder( {buildFolder}, {destinationFolder}, {releasesFolder}, {len(replacedNames)} )" )
+    os.makedirs( releasesFolder, exist_ok=True )
+    releaseFolder = releasesFolder.joinpath( f'{destinationFolder.name}_{datetime.now().strftime( RELEASE_DATETIME_FORMAT )}' )
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"Making new release {releaseFolder}/ from {buildFolder}/…" )
+    _renameOrMove( buildFolder, releaseFolder )
+
+    if destinationFolder.is_dir(): # Carry over anything from the live site that we didn't build this time
+        count = 0
+        with os.scandir( destinationFolder ) as dirEntries:
+            for dirEntry in dirEntries:
+                entryName = f'{dirEntry.name}/' if dirEntry.is_dir( follow_symlinks=False ) else dirEntry.name
+                newPath = releaseFolder.joinpath( dirEntry.name )
+                if entryName in replacedNames or os.path.lexists( newPath ): continue
+                vPrint( 'Info', DEBUGGING_THIS_MODULE, f"    Carrying over {dirEntry.path} into {releaseFolder}/…" )
+                if dirEntry.is_symlink(): # e.g., the test site inside the normal site (which has its own releases folder)
+                    os.symlink( os.readlink( dirEntry.path ), newPath )
+                elif dirEntry.is_dir():
+                    shutil.copytree( dirEntry.path, newPath, symlinks=True, copy_function=_linkOrCopy )
+                else: _linkOrCopy( dirEntry.path, newPath )
+                count += 1
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Carried over {count:,} folders and files from {destinationFolder}/ into {releaseFolder}/." )
+    return releaseFolder
+# end of publishSite.makeReleaseFolder
+
+
+def migrateToReleases( destinationFolder:Path, releasesFolder:Path ) -> Path|None:
+    """
+    Converts the destination from an actual folder (i.e., from before we published releases)
+        into a symbolic link to that same site, after it's renamed to become the oldest release.
+
+    This is done by createSitePages.py --migrate-site (or else by the first switchToRelease()).
+    There's a brief moment without a site (between the rename and making the link) this one time.
+    If the link can't be made, the folder is put back (so the site is still live) and the error is raised.
+
+    Returns the new release folder, or None if the destination isn't an actual folder (so there's nothing to do).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"migrateToReleases( {destinationFolder}, {releasesFolder} )" )
+    if not destinationFolder.is_dir() or destinationFolder.is_symlink(): return None
+    os.makedirs( releasesFolder, exist_ok=True )
+    previousFolder = releasesFolder.joinpath( f'{destinationFolder.name}_{datetime.fromtimestamp( destinationFolder.stat().st_mtime ).strftime( RELEASE_DATETIME_FORMAT )}' )
+    logging.warning( f"Converting {destinationFolder}/ to a symbolic link: renaming existing folder to {previousFolder}/" )
+    _renameOrMove( destinationFolder, previousFolder )
+    try: os.symlink( previousFolder.resolve(), destinationFolder, target_is_directory=True )
+    except OSError:
+        logging.critical( f"Couldn't link {destinationFolder} to {previousFolder}/ so putting it back" )
+        _renameOrMove( previousFolder, destinationFolder )
+        raise
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {destinationFolder} now points to {previousFolder}/." )
+    return previousFolder
+# end of publishSite.migrateToReleases
+
+
+def switchToRelease( destinationFolder:Path, releaseFolder:Path ) -> None:
+    """
+    Atomically makes the destination (a symbolic link) point to the given release folder.
+
+    If the destination is still an actual folder (i.e., from before we published releases),
+        it's first converted by migrateToReleases() (so the previous site is still live if the switch then fails).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"switchToRelease( {destinationFolder}, {releaseFolder} )" )
+    migrateToReleases( destinationFolder, releaseFolder.parent )
+    os.makedirs( destinationFolder.parent, exist_ok=True )
+    # Make the new link beside the old one, then replace the old one (an atomic rename)
+    temporaryLinkPath = destinationFolder.with_name( f'{destinationFolder.name}.newLink' )
+    try: os.unlink( temporaryLinkPath )
+    except FileNotFoundError: pass
+    os.symlink( releaseFolder.resolve(), temporaryLinkPath, target_is_directory=True )
+    os.replace( temporaryLinkPath, destinationFolder )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {destinationFolder} now points to {releaseFolder}/." )
+# end of publishSite.switchToRelease
+
+
+def removeOldReleases( destinationFolder:Path, releasesFolder:Path, numKept:int, removeFunction=shutil.rmtree ) -> list[Path]:
+    """
+    Delete all except the live release and the numKept releases before it.
+
+    removeFunction can be BackgroundRemover.remove to do the actual deleting in the background.
+
+    Returns the list of deleted release folders.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"removeOldReleases( {destinationFolder}, {releasesFolder}, {numKept} )" )
+    liveRelease = getLiveRelease( destinationFolder )
+    oldReleases = [releaseFolder for releaseFolder in getReleaseFolders( destinationFolder, releasesFolder )
+                    if liveRelease is None or releaseFolder.resolve() != liveRelease.resolve()]
+    removedReleases = oldReleases[:max( 0, len(oldReleases) - numKept )]
+    for releaseFolder in removedReleases:
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Removing old release {releaseFolder}/…" )
+        removeFunction( releaseFolder )
+    return removedReleases
+# end of publishSite.removeOldReleases
+
+
+def rollBackRelease( destinationFolder:Path, releasesFolder:Path ) -> Path|None:
+    """
+    Switch the destination back to the release before the live one.
+
+    Returns the release that is now live, or None if there's no earlier release.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"rollBackRelease( {destinationFolder}, {releasesFolder} )" )
+    liveRelease = getLiveRelease( destinationFolder )
+    releaseFolders = getReleaseFolders( destinationFolder, releasesFolder )
+    resolvedReleaseFolders = [releaseFolder.resolve() for releaseFolder in releaseFolders]
+    if liveRelease is None or liveRelease.resolve() not in resolvedReleaseFolders \
+    or resolvedReleaseFolders.index( liveRelease.resolve() ) == 0:
+        logging.critical( f"Can't roll back {destinationFolder}: no release before {liveRelease} in {releasesFolder}/" )
+        return None
+    previousRelease = releaseFolders[resolvedReleaseFolders.index( liveRelease.resolve() ) - 1]
+    switchToRelease( destinationFolder, previousRelease )
+    return previousRelease
+# end of publishSite.rollBackRelease
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the release folders
+    destinationFolder, releasesFolder = Path( '../htmlPages' ), Path( '../htmlPageReleases/' )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {getLiveRelease( destinationFolder )=} {getReleaseFolders( destinationFolder, releasesFolder )=}" )
+# end of publishSite.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of publishSite.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of publishSite.py
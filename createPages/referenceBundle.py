@@ -0,0 +1,209 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# referenceBundle.py
+#
+# Module handling the OpenBibleData TOSN/UBS reference data bundle
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling the OpenBibleData TOSN/UBS reference data bundle.
+
+When TOSN is loaded, we also load the Tyndale book intros, the Tyndale Open Bible Dictionary,
+    and the UBS Greek and Hebrew dictionaries (with their indexes).
+These are saved together in one file ('TOSN.OBD_Bible.pickle'), but each as a separately pickled section
+    with a header giving the offset and length of each section,
+    so each one can be unpickled on its own.
+
+The State class uses LazyReferenceSection for each of these attributes,
+    so a section is only unpickled the first time that it's used, e.g., state.TOBDData,
+    and the bundle remembers which sections were actually materialised (in this process).
+
+REFERENCE_SECTION_NAMES
+saveReferenceBundle( bundleFilepath:Path, sections:dict[str,object] ) -> None
+ReferenceBundle( bundleFilepath:Path )
+    loadSection( sectionName:str ) -> object
+LazyReferenceSection()
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version
+    2026-10-16 Write the bundle to a temporary file and then replace the old one
+"""
+from pathlib import Path
+import os
+import pickle
+import json
+import struct
+import logging
+from time import time
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "referenceBundle"
+PROGRAM_NAME = "OpenBibleData reference bundle handler"
+PROGRAM_VERSION = '0.10'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+REFERENCE_SECTION_NAMES = ( 'TyndaleBookIntrosDict', 'TyndaleBookIntroSummariesDict', 'TOBDData',
+                            'UBS_GNT_DATA', 'UBS_GNT_ID_INDEX', 'UBS_GNT_LEMMA_INDEX', # UBS Greek
+                            'UBS_HEB_DOMAIN_DATA', 'UBS_HEB_DATA', 'UBS_HEB_ID_INDEX', 'UBS_HEB_LEMMA_INDEX' ) # UBS Hebrew
+REFERENCE_BUNDLE_MAGIC = b'OBDR'
+REFERENCE_BUNDLE_FORMAT_VERSION = 1
+_PREFIX_STRUCT = struct.Struct( '<4sBI' ) # magic, version, header length
+
+
+def saveReferenceBundle( bundleFilepath:Path, sections:dict[str,object] ) -> None:
+    """
+    Save each of the given objects as a separately loadable section.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"saveReferenceBundle( {bundleFilepath}, {list(sections)} )" )
+    sectionBytesList, header, offset = [], {}, 0
+    for sectionName, sectionObject in sections.items():
+        sectionBytes = pickle.dumps( sectionObject, protocol=pickle.HIGHEST_PROTOCOL )
+        header[sectionName] = (offset, len(sectionBytes))
+        sectionBytesList.append( sectionBytes )
+        offset += len(sectionBytes)
+    headerBytes = json.dumps( header ).encode( 'utf-8' )
+    tempFilepath = Path( f'{bundleFilepath}.tmp' )
+    with open( tempFilepath, 'wb' ) as bundleFile:
+        bundleFile.write( _PREFIX_STRUCT.pack( REFERENCE_BUNDLE_MAGIC, REFERENCE_BUNDLE_FORMAT_VERSION, len(headerBytes) ) )
+        bundleFile.write( headerBytes )
+        for sectionBytes in sectionBytesList:
+            bundleFile.write( sectionBytes )
+    os.replace( tempFilepath, bundleFilepath ) # So a part-written bundle is never used
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Saved {len(sections)} reference sections ({offset/1_000_000:,.1f} MB) to {bundleFilepath}." )
+# end of referenceBundle.saveReferenceBundle
+
+
+class ReferenceBundle:
+    """
+    Reads the section offsets from a reference bundle file
+        and then loads each section when it's asked for.
+    """
+    def __init__( self, bundleFilepath:Path ) -> None:
+        """
+        Raises a pickle.UnpicklingError if it's not a reference bundle (e.g., an older TOSN pickle).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"ReferenceBundle.__init__( {bundleFilepath} )" )
+        self.bundleFilepath = bundleFilepath
+        with open( bundleFilepath, 'rb' ) as bundleFile:
+            prefixBytes = bundleFile.read( _PREFIX_STRUCT.size )
+            if len(prefixBytes) < _PREFIX_STRUCT.size:
+                raise pickle.UnpicklingError( f"{bundleFilepath} is too short to be a reference bundle" )
+            magic, formatVersion, headerLength = _PREFIX_STRUCT.unpack( prefixBytes )
+            if magic != REFERENCE_BUNDLE_MAGIC or formatVersion != REFERENCE_BUNDLE_FORMAT_VERSION:
+                raise pickle.UnpicklingError( f"{bundleFilepath} isn't a version {REFERENCE_BUNDLE_FORMAT_VERSION} reference bundle" )
+            self.sections = json.loads( bundleFile.read( headerLength ) )
+        self.dataOffset = _PREFIX_STRUCT.size + headerLength
+        self.materialisedNames = [] # In the order that they were loaded (in this process)
+    # end of ReferenceBundle.__init__
+
+    def __contains__( self, sectionName:str ) -> bool:
+        return sectionName in self.sections
+
+    def loadSection( self, sectionName:str ):
+        """
+        Unpickle and return the section (each call returns a new object).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"ReferenceBundle.loadSection( {sectionName} )" )
+        offset, length = self.sections[sectionName]
+        startTime = time()
+        with open( self.bundleFilepath, 'rb' ) as bundleFile:
+            bundleFile.seek( self.dataOffset + offset )
+            sectionObject = pickle.loads( bundleFile.read( length ) )
+        self.materialisedNames.append( sectionName )
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Materialised reference section {sectionName} ({length/1_000_000:,.1f} MB) in {time()-startTime:.2f} seconds." )
+        logging.info( f"Materialised reference section {sectionName} from {self.bundleFilepath}" )
+        return sectionObject
+    # end of ReferenceBundle.loadSection
+# end of class ReferenceBundle
+
+
+class LazyReferenceSection:
+    """
+    Use in a class (i.e., State) for an attribute that's loaded from the reference bundle (if there is one)
+        the first time it's used.
+
+    Because this only defines __get__, once the attribute is set (either here or by loading from the source files)
+        it's found in the instance's __dict__ and this isn't called again.
+    Deleting the attribute (to release it) means that it would be loaded again if it's used again.
+    """
+    def __set_name__( self, owner, name:str ) -> None:
+        self.name = name
+
+    def __get__( self, instance, owner=None ):
+        if instance is None: return self
+        referenceBundle = instance.referenceBundle
+        if referenceBundle is None or self.name not in referenceBundle:
+            raise AttributeError( f"'{type(instance).__name__}' object has no attribute '{self.name}' (and there's no reference bundle to load it from)" )
+        sectionObject = instance.__dict__[self.name] = referenceBundle.loadSection( self.name )
+        return sectionObject
+# end of class LazyReferenceSection
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the reference bundle
+    import tempfile
+    class DemoState:
+        referenceBundle = None
+        TOBDData = LazyReferenceSection()
+        UBS_GNT_DATA = LazyReferenceSection()
+    with tempfile.TemporaryDirectory() as tempFolder:
+        bundleFilepath = Path( tempFolder ).joinpath( 'TOSN.OBD_Bible.pickle' )
+        saveReferenceBundle( bundleFilepath, {'TOBDData':{'Articles':{'Aaron':'…'}}, 'UBS_GNT_DATA':['…']} )
+        demoState = DemoState()
+        demoState.referenceBundle = ReferenceBundle( bundleFilepath )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {demoState.TOBDData=} {demoState.referenceBundle.materialisedNames=}" )
+# end of referenceBundle.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of referenceBundle.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of referenceBundle.py
@@ -46,17 +46,36 @@ CHANGELOG:
     2026-02-05 Added RP-GNT to VERSIONS_WITHOUT_NT
     2026-03-27 Added SIL Open Translator’s Notes
     2026-05-30 Added Scriptura Layer-by-layer 'close-but-clear-translations'
+    2026-10-16 Added NUM_BUILD_JOBS, SHARD_PARALLEL_VERSE_PAGES_FLAG, INCREMENTAL_BUILD_FLAG, and RESUME_BUILD_FLAG
+    2026-10-16 Added SELECTED_BUILD_STAGES, SELECTED_BOOKS, and selectBooks()
+    2026-10-16 Added BUILD_REPORT_FILEPATH
+    2026-10-16 Added RELEASE_FINISHED_RESOURCES_FLAG
+    2026-10-16 Added RELEASES_FOLDER and NUM_KEPT_RELEASES
+    2026-10-16 Added TRASH_FOLDER and NUM_DELETION_THREADS
+    2026-10-16 Added NUM_PRELOAD_JOBS
+    2026-10-16 Added VERIFY_PICKLE_HASHES_FLAG
+    2026-10-16 Added referenceBundle and the lazily-loaded TOSN/UBS reference sections
+    2026-10-16 Added BUILD_DAEMON_SOCKET_PATH
+    2026-10-16 Added PRELOAD_MEMORY_BUDGET_MB and preloadProfile
+    2026-10-16 Added BINARY_WORD_TABLES_FOLDER
+    2026-10-16 Give the TEST site its own RELEASES_FOLDER
+    2026-10-16 Added VERIFY_WORD_INDEXES_FLAG
+    2026-10-16 Added PARALLEL_WORD_PAGES_FLAG
+    2026-10-16 Added PARALLEL_LEMMA_PAGES_FLAG
+    2026-10-16 Added SELECTED_VERSIONS
 """
 from pathlib import Path
 
 import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
-from BibleOrgSys.BibleOrgSysGlobals import dPrint, fnPrint, BOOKLIST_OT39
+from BibleOrgSys.BibleOrgSysGlobals import dPrint, fnPrint, BOOKLIST_OT39, BOOKLIST_NT27
 
+from referenceBundle import LazyReferenceSection
 
-LAST_MODIFIED_DATE = '2026-08-20' # by RJH
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
 SHORT_PROGRAM_NAME = "settings"
 PROGRAM_NAME = "OpenBibleData (OBD) Settings"
-PROGRAM_VERSION = '1.0.2'
+PROGRAM_VERSION = '1.0.17'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False # Adds debugging output
@@ -76,6 +95,8 @@ class State:
 
     # Many of these settings are used to omit some processing so as to get a speedier conclusion for debugging
     LOAD_RESOURCES_FROM_PICKLES_FLAG = True # Might have to disable loading pickles if they need updating (new code or data)
+    VERIFY_PICKLE_HASHES_FLAG = False # Hash every source file rather than trusting the file times in the pickle manifests (slower)
+    VERIFY_WORD_INDEXES_FLAG = False # Make the OET word, lemma, form, and Strongs indexes again and compare them with the saved ones (can be set with --verify-word-indexes)
     TEST_VERSIONS_ONLY = None #['OET','OET-RV','OET-LV', 'KJB-1611', 'TOSN','UTN'] # Usually None. Also stops actual site being built
     ALL_PRODUCTION_BOOKS_FLAG = not TEST_MODE_FLAG # If set to False, uses the TEST book list (with many less books) for a faster test build
     CREATE_PARALLEL_VERSE_PAGES = 'LAST' # 'FIRST','LAST', or None -- usually 'LAST' -- depending on debugging needs
@@ -84,15 +105,37 @@ class State:
     REUSE_EXISTING_WORD_PAGES_FLAG = TEST_MODE_FLAG and not NEW_BOOK_IN_TEST_LIST_FLAG # Don't recreate word pages
     ALL_TEST_REFERENCE_PAGES_FLAG = False # If have TEST_MODE_FLAG, make ALL word/lemma pages, or just the RELEVANT ones
     UPDATE_ACTUAL_SITE_WHEN_BUILT_FLAG = True # The pages are initially built in a tmp folder so need to be copied to the final destination
+    SELECTED_BUILD_STAGES = None # e.g., ['par','ref'] to only build those page families (can be set with --stages) -- also stops actual site being built
+    SELECTED_VERSIONS = None # e.g., ['OET','OET-RV','OET-LV','KJB-1611'] as selected with --versions (TEST_VERSIONS_ONLY is then just those that the selected stages need)
+    SELECTED_BOOKS = None # e.g., ['MRK','GAL'] to only load and build those books (can be set with --books) -- also stops actual site being built
+    RESUME_BUILD_FLAG = False # Keep the pages from build stages completed by a crashed build in TEMP_BUILD_FOLDER (can be set with --resume)
+    INCREMENTAL_BUILD_FLAG = False # Reuse version book and chapter pages from the previous site if none of their inputs have changed
+    SHARD_PARALLEL_VERSE_PAGES_FLAG = True # Fork BibleOrgSysGlobals.maxProcesses processes to make the parallel verse pages for different books
+    PARALLEL_WORD_PAGES_FLAG = True # Fork BibleOrgSysGlobals.maxProcesses processes to make the Hebrew and Greek word pages (in chunks of rows)
+    PARALLEL_LEMMA_PAGES_FLAG = True # Fork BibleOrgSysGlobals.maxProcesses processes to make the Hebrew and Greek lemma pages (in chunks of lemmas)
+    RELEASE_FINISHED_RESOURCES_FLAG = True # Drop each preloaded Bible and table (to save memory) once the last build stage that uses it is finished
+    PRELOAD_MEMORY_BUDGET_MB = None # Abort the build if preloading any one version increases the RSS by more than this (can be set with --preload-memory-budget)
+    NUM_PRELOAD_JOBS = 4 # Number of forked processes to load versions that don't have current pickle files -- 1 loads them one after the other (can be set with --preload-jobs)
+    NUM_BUILD_JOBS = 1 # Number of build stages (page families) to run at once in forked worker processes -- 1 builds them one after the other (can be set with --jobs)
 
     OET_RV_DC_BOOK_LIST = ['TOB','JDT','ESG','WIS','SIR','BAR','MA1','MA2','MA3','MA4','MAN']
 
     TEMP_BUILD_FOLDER = Path( '../buildingHtmlPages/' )
+    TRASH_FOLDER = Path( '../deletingHtmlPages/' ) # Old folders are moved here to be deleted in the background (must be on the same filesystem as the above)
+    NUM_DELETION_THREADS = 4
+    BUILD_REPORT_FILEPATH = Path( '../build_report.json' ) # Time and resources used by each step of the last build
+    BUILD_DAEMON_SOCKET_PATH = Path( '../OBD_buildDaemon.socket' ) # Where createSitePages.py --daemon waits for build requests (see buildDaemon.py)
+    BINARY_WORD_TABLES_FOLDER = Path( '../OBD_WordTables/' ) # Binary forms of the OET word tables which are opened with mmap (see wordTable.py) -- None to just keep the TSV lines in memory
     NORMAL_DESTINATION_FOLDER = Path( '../htmlPages/' )
     DEBUG_DESTINATION_FOLDER_NAME = 'Testa'
     DEBUG_DESTINATION_FOLDER_PATH = NORMAL_DESTINATION_FOLDER.joinpath( DEBUG_DESTINATION_FOLDER_NAME )
     DESTINATION_FOLDER = DEBUG_DESTINATION_FOLDER_PATH if TEST_MODE_FLAG or BibleOrgSysGlobals.debugFlag \
                             else NORMAL_DESTINATION_FOLDER
+    NORMAL_RELEASES_FOLDER = Path( '../htmlPageReleases/' )
+    DEBUG_RELEASES_FOLDER = Path( '../htmlTestPageReleases/' ) # Kept apart from the normal releases because the TEST site link is inside the normal site
+    RELEASES_FOLDER = DEBUG_RELEASES_FOLDER if TEST_MODE_FLAG or BibleOrgSysGlobals.debugFlag \
+                            else NORMAL_RELEASES_FOLDER # Each build goes into a new folder here and then DESTINATION_FOLDER is switched (a symbolic link) to point to it
+    NUM_KEPT_RELEASES = 2 # Number of previous releases to keep (to roll back to with --rollback)
 
     SITE_NAME = 'Open Bible Data'
     SITE_ABBREVIATION = 'OBD'
@@ -994,6 +1037,24 @@ Footnote markers PRECEDE the text that they concern,
 
     preloadedBibles = {}
     sectionsLists = {}
+    pageManifest = None # Set to a PageManifest for incremental builds
+    buildReport = None # Set to a BuildReport to record the time and resources used by each build step
+    preloadProfile = None # Set to a PreloadProfile by preloadVersions()
+    backgroundRemover = None # Set to a BackgroundRemover to delete old folders while we build
+
+    # These are either set when TOSN is loaded from its source files,
+    #   or else each one is unpickled from the referenceBundle (the TOSN pickle) the first time that it's used
+    referenceBundle = None # Set to a ReferenceBundle if TOSN was loaded from its pickle
+    TyndaleBookIntrosDict = LazyReferenceSection()
+    TyndaleBookIntroSummariesDict = LazyReferenceSection()
+    TOBDData = LazyReferenceSection()
+    UBS_GNT_DATA = LazyReferenceSection()
+    UBS_GNT_ID_INDEX = LazyReferenceSection()
+    UBS_GNT_LEMMA_INDEX = LazyReferenceSection()
+    UBS_HEB_DOMAIN_DATA = LazyReferenceSection()
+    UBS_HEB_DATA = LazyReferenceSection()
+    UBS_HEB_ID_INDEX = LazyReferenceSection()
+    UBS_HEB_LEMMA_INDEX = LazyReferenceSection()
 # end of State class
 
 state = State()
@@ -1021,6 +1082,32 @@ def reorderBooksForOETVersions( givenBookList:list[str] ) -> list[str]:
 # end of createSitePages.reorderBooksForOETVersions
 
 
+def selectBooks( BBBs:list[str], state:State ) -> None:
+    """
+    Only load (and build pages for) the given books,
+        i.e., like TEST_BOOK_LIST but can be set at run time (from the command line).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"selectBooks( {BBBs} )" )
+
+    state.SELECTED_BOOKS = BBBs
+    state.TEST_OT_BOOK_LIST = [BBB for BBB in BBBs if BBB in BOOKLIST_OT39]
+    state.TEST_NT_BOOK_LIST = [BBB for BBB in BBBs if BBB in BOOKLIST_NT27]
+    state.TEST_DC_BOOK_LIST = [BBB for BBB in BBBs if BBB not in BOOKLIST_OT39 and BBB not in BOOKLIST_NT27]
+    state.TEST_BOOK_LIST = state.TEST_OT_BOOK_LIST + state.TEST_DC_BOOK_LIST + state.TEST_NT_BOOK_LIST
+    state.ALL_PRODUCTION_BOOKS_FLAG = False # so the pickle filenames include the book list
+    state.OET_RV_BOOK_LIST = [BBB for BBB in state.OET_OT_BOOK_ORDER + state.OET_RV_DC_BOOK_LIST + state.OET_NT_BOOK_ORDER if BBB in BBBs]
+    state.OET_RV_BOOK_LIST_WITH_FRT = ['FRT'] + state.OET_RV_BOOK_LIST
+    newBooksToLoad = {}
+    for versionAbbreviation,bookList in state.booksToLoad.items():
+        if versionAbbreviation == 'OET-LV': # No FRT or DC books
+            newBooksToLoad[versionAbbreviation] = [BBB for BBB in state.TEST_BOOK_LIST if BBB in state.OET_LV_BOOK_LIST]
+        else: # In TEST mode, the existing lists are only the previous TEST books
+            newBooksToLoad[versionAbbreviation] = (['FRT'] if 'FRT' in bookList or ('ALL' in bookList and 'OET' in versionAbbreviation) else []) \
+                + [BBB for BBB in state.TEST_BOOK_LIST if 'ALL' in bookList or BBB in bookList or state.TEST_MODE_FLAG]
+    state.booksToLoad = newBooksToLoad
+# end of settings.selectBooks
+
+
 
 def briefDemo() -> None:
     """
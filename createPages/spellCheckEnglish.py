@@ -35,6 +35,7 @@ CHANGELOG:
     2025-10-10 Added support for (OET) LV & RV names tables
     2026-04-08 Handle divide by zero (TOTAL_GERMAN_WORDS_CHECKED_COUNT)
     2026-06-11 Handle new % (changed person) \\add format
+    2026-10-16 Added getSpellCheckCounters(), clearSpellCheckCounters() and mergeSpellCheckCounters() so results can come back from worker processes
 """
 from pathlib import Path
 from csv import  DictReader
@@ -46,10 +47,10 @@ from BibleOrgSys.BibleOrgSysGlobals import vPrint, fnPrint, dPrint, rreplace
 import bos_books_codes_py
 
 
-LAST_MODIFIED_DATE = '2026-08-17' # by RJH
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
 SHORT_PROGRAM_NAME = "spellCheckEnglish"
 PROGRAM_NAME = "English Bible Spell Check"
-PROGRAM_VERSION = '0.63'
+PROGRAM_VERSION = '0.64'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -895,6 +896,65 @@ def spellCheckAndMarkHTMLText( versionAbbreviation:str, ref:str, HTMLTextToCheck
 # end of spellCheckEnglish.spellCheckAndMarkHTMLText
 
 
+def getSpellCheckCounters() -> dict:
+    """
+    Returns the spell-check results collected (so far) in this process
+
+    Used by worker processes to send their results back to the main process
+    """
+    return { 'TOTAL_ENGLISH_WORDS_CHECKED_COUNT':TOTAL_ENGLISH_WORDS_CHECKED_COUNT, 'TOTAL_GERMAN_WORDS_CHECKED_COUNT':TOTAL_GERMAN_WORDS_CHECKED_COUNT, 'TOTAL_LATIN_WORDS_CHECKED_COUNT':TOTAL_LATIN_WORDS_CHECKED_COUNT,
+            'TOTAL_ENGLISH_MISSPELLING_COUNT':TOTAL_ENGLISH_MISSPELLING_COUNT, 'TOTAL_GERMAN_MISSPELLING_COUNT':TOTAL_GERMAN_MISSPELLING_COUNT, 'TOTAL_LATIN_MISSPELLING_COUNT':TOTAL_LATIN_MISSPELLING_COUNT,
+            'BAD_ENGLISH_WORD_SET':BAD_ENGLISH_WORD_SET, 'BAD_GERMAN_WORD_SET':BAD_GERMAN_WORD_SET, 'BAD_LATIN_WORD_SET':BAD_LATIN_WORD_SET,
+            'BAD_ENGLISH_WORD_LIST':BAD_ENGLISH_WORD_LIST, 'BAD_GERMAN_WORD_LIST':BAD_GERMAN_WORD_LIST, 'BAD_LATIN_WORD_LIST':BAD_LATIN_WORD_LIST,
+            'BAD_ENGLISH_COUNTS':BAD_ENGLISH_COUNTS, 'BAD_GERMAN_COUNTS':BAD_GERMAN_COUNTS, 'BAD_LATIN_COUNTS':BAD_LATIN_COUNTS,
+            'MISPELLING_VERSION_REF_DICT':MISPELLING_VERSION_REF_DICT }
+# end of spellCheckEnglish.getSpellCheckCounters()
+
+
+def clearSpellCheckCounters() -> None:
+    """
+    Throws away the spell-check results collected (so far) in this process
+
+    Used by worker processes so that they only send back their own results
+    """
+    global TOTAL_ENGLISH_WORDS_CHECKED_COUNT, TOTAL_ENGLISH_MISSPELLING_COUNT, TOTAL_GERMAN_WORDS_CHECKED_COUNT, TOTAL_GERMAN_MISSPELLING_COUNT, TOTAL_LATIN_WORDS_CHECKED_COUNT, TOTAL_LATIN_MISSPELLING_COUNT
+
+    TOTAL_ENGLISH_WORDS_CHECKED_COUNT = TOTAL_GERMAN_WORDS_CHECKED_COUNT = TOTAL_LATIN_WORDS_CHECKED_COUNT = 0
+    TOTAL_ENGLISH_MISSPELLING_COUNT = TOTAL_GERMAN_MISSPELLING_COUNT = TOTAL_LATIN_MISSPELLING_COUNT = 0
+    for ourContainer in (BAD_ENGLISH_WORD_SET, BAD_GERMAN_WORD_SET, BAD_LATIN_WORD_SET,
+                         BAD_ENGLISH_WORD_LIST, BAD_GERMAN_WORD_LIST, BAD_LATIN_WORD_LIST,
+                         BAD_ENGLISH_COUNTS, BAD_GERMAN_COUNTS, BAD_LATIN_COUNTS, MISPELLING_VERSION_REF_DICT):
+        ourContainer.clear()
+# end of spellCheckEnglish.clearSpellCheckCounters()
+
+
+def mergeSpellCheckCounters( counters:dict ) -> None:
+    """
+    Adds the spell-check results from getSpellCheckCounters() (in another process)
+        into the results for this process
+    """
+    global TOTAL_ENGLISH_WORDS_CHECKED_COUNT, TOTAL_ENGLISH_MISSPELLING_COUNT, TOTAL_GERMAN_WORDS_CHECKED_COUNT, TOTAL_GERMAN_MISSPELLING_COUNT, TOTAL_LATIN_WORDS_CHECKED_COUNT, TOTAL_LATIN_MISSPELLING_COUNT
+
+    TOTAL_ENGLISH_WORDS_CHECKED_COUNT += counters['TOTAL_ENGLISH_WORDS_CHECKED_COUNT']
+    TOTAL_GERMAN_WORDS_CHECKED_COUNT += counters['TOTAL_GERMAN_WORDS_CHECKED_COUNT']
+    TOTAL_LATIN_WORDS_CHECKED_COUNT += counters['TOTAL_LATIN_WORDS_CHECKED_COUNT']
+    TOTAL_ENGLISH_MISSPELLING_COUNT += counters['TOTAL_ENGLISH_MISSPELLING_COUNT']
+    TOTAL_GERMAN_MISSPELLING_COUNT += counters['TOTAL_GERMAN_MISSPELLING_COUNT']
+    TOTAL_LATIN_MISSPELLING_COUNT += counters['TOTAL_LATIN_MISSPELLING_COUNT']
+    BAD_ENGLISH_WORD_SET.update( counters['BAD_ENGLISH_WORD_SET'] )
+    BAD_GERMAN_WORD_SET.update( counters['BAD_GERMAN_WORD_SET'] )
+    BAD_LATIN_WORD_SET.update( counters['BAD_LATIN_WORD_SET'] )
+    BAD_ENGLISH_WORD_LIST.extend( counters['BAD_ENGLISH_WORD_LIST'] )
+    BAD_GERMAN_WORD_LIST.extend( counters['BAD_GERMAN_WORD_LIST'] )
+    BAD_LATIN_WORD_LIST.extend( counters['BAD_LATIN_WORD_LIST'] )
+    for ourCounts,theirCounts in ((BAD_ENGLISH_COUNTS,counters['BAD_ENGLISH_COUNTS']), (BAD_GERMAN_COUNTS,counters['BAD_GERMAN_COUNTS']), (BAD_LATIN_COUNTS,counters['BAD_LATIN_COUNTS'])):
+        for word,count in theirCounts.items():
+            ourCounts[word] += count
+    for versionAbbreviation,wordRefList in counters['MISPELLING_VERSION_REF_DICT'].items():
+        MISPELLING_VERSION_REF_DICT[versionAbbreviation].extend( wordRefList )
+# end of spellCheckEnglish.mergeSpellCheckCounters()
+
+
 def printSpellCheckSummary( state ) -> None:
     """
     Prints some summary results
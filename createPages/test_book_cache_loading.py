@@ -0,0 +1,111 @@
+#!/usr/bin/env -S uv run
+# -*- coding: utf-8 -*-
+#
+# test_book_cache_loading.py
+#
+# Tests that the books from the book caches are loaded in the main process before the build stages (and their workers) run
+
+import unittest
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from settings import State
+import html
+from bookCache import BookPlaceholder, LazyBookDict, getBookCacheFolderPath, readBookCacheInfo, canLoadBooks, saveBookCache, loadBookCache, loadAllBooks
+from buildStages import BuildStage, ReleasedVersion, runBuildStages
+
+
+def getPlaceholderBBBs(bible):
+    return [BBB for BBB,bookObject in dict.items(bible.books) if type(bookObject) is BookPlaceholder]
+
+
+class CachedBible(SimpleNamespace):
+    def __contains__(self, BBB): return BBB in self.books
+
+
+stageBookPlaceholders = {}
+def checkBooks(level, folder, state):
+    """ What a stage (or a worker process that it forks) would see if it read the books dicts directly """
+    for versionAbbreviation, thisBible in state.preloadedBibles.items():
+        stageBookPlaceholders[versionAbbreviation] = None if isinstance(thisBible, ReleasedVersion) else getPlaceholderBBBs(thisBible)
+
+
+class TestBookCacheLoading(unittest.TestCase):
+    def setUp(self):
+        self.tempFolder = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tempFolder.name)
+        html._pageChromeConfigCache = None
+
+    def tearDown(self):
+        html._pageChromeConfigCache = None
+        stageBookPlaceholders.clear()
+        self.tempFolder.cleanup()
+
+    def makeBible(self, abbreviation, BBBs):
+        bible = SimpleNamespace(abbreviation=abbreviation, books={}, discoveryResults={'ALL':{'haveSectionHeadings':False}})
+        for BBB in BBBs:
+            bible.books[BBB] = SimpleNamespace(BBB=BBB, containerBibleObject=bible, _processedLines=[f'{BBB} line 1'])
+        return bible
+
+    def loadBible(self, abbreviation, BBBs):
+        cacheFolderPath = getBookCacheFolderPath(self.folder, abbreviation)
+        saveBookCache(self.makeBible(abbreviation, BBBs), cacheFolderPath, ['ALL'])
+        loadedBible = loadBookCache(cacheFolderPath, ['ALL'])
+        return CachedBible(**vars(loadedBible))
+
+    def test_load_all_books(self):
+        bible = self.loadBible('WEB', ('GEN','MRK','JHN'))
+        self.assertIsInstance(bible.books, LazyBookDict)
+        self.assertEqual(getPlaceholderBBBs(bible), ['GEN','MRK','JHN'])
+        self.assertFalse(bible.books.isLoaded())
+        self.assertEqual(bible.books['MRK'].BBB, 'MRK')
+        self.assertEqual(loadAllBooks(bible), 2)
+        self.assertTrue(bible.books.isLoaded())
+        self.assertEqual(getPlaceholderBBBs(bible), [])
+        self.assertEqual([bookObject._processedLines for bookObject in dict.values(bible.books)], [['GEN line 1'], ['MRK line 1'], ['JHN line 1']])
+        self.assertEqual(loadAllBooks(bible), 0)
+        self.assertEqual(loadAllBooks(SimpleNamespace(abbreviation='TEST', books={'MRK':[]})), 0) # Not from a book cache
+
+    def test_copy_loads_books(self):
+        bible = self.loadBible('WEB', ('GEN','MRK'))
+        booksCopy = bible.books.copy()
+        self.assertIs(type(booksCopy), dict)
+        self.assertEqual([bookObject.BBB for bookObject in booksCopy.values()], ['GEN','MRK'])
+        self.assertTrue(all(type(bookObject) is not BookPlaceholder for bookObject in booksCopy.values()))
+
+    def test_subset_doesnt_replace_cache(self):
+        cacheFolderPath = getBookCacheFolderPath(self.folder, 'WEB')
+        self.assertIsNotNone(saveBookCache(self.makeBible('WEB', ('GEN','MRK','JHN')), cacheFolderPath, ['ALL']))
+        self.assertIsNone(saveBookCache(self.makeBible('WEB', ('MRK',)), cacheFolderPath, ['MRK'])) # e.g., a TEST build
+        self.assertEqual(sorted(path.name for path in cacheFolderPath.glob('???.pickle')), ['GEN.pickle', 'JHN.pickle', 'MRK.pickle'])
+        self.assertTrue(canLoadBooks(readBookCacheInfo(cacheFolderPath), ['GEN','MRK','JHN']))
+
+        cacheFolderPath = getBookCacheFolderPath(self.folder, 'OET-RV')
+        self.assertIsNotNone(saveBookCache(self.makeBible('OET-RV', ('MRK','JHN')), cacheFolderPath, ['MRK','JHN']))
+        self.assertIsNone(saveBookCache(self.makeBible('OET-RV', ('MRK','ROM')), cacheFolderPath, ['MRK','ROM']))
+        self.assertEqual(readBookCacheInfo(cacheFolderPath)['booksToLoad'], ['MRK','JHN'])
+        self.assertIsNotNone(saveBookCache(self.makeBible('OET-RV', ('MRK','JHN','ROM')), cacheFolderPath, ['MRK','JHN','ROM'])) # A superset
+        self.assertIsNotNone(saveBookCache(self.makeBible('OET-RV', ('GEN','MRK')), cacheFolderPath, ['ALL']))
+        self.assertEqual(sorted(path.name for path in cacheFolderPath.glob('???.pickle')), ['GEN.pickle', 'MRK.pickle'])
+        self.assertEqual(readBookCacheInfo(cacheFolderPath)['booksToLoad'], ['ALL'])
+
+    def test_books_loaded_before_stages(self):
+        state = State()
+        state.TEST_MODE_FLAG = False
+        state.RELEASE_FINISHED_RESOURCES_FLAG = True
+        state.TEMP_BUILD_FOLDER = self.folder.joinpath('build/')
+        state.TEMP_BUILD_FOLDER.mkdir()
+        state.BibleLocations = {}
+        state.pageManifest = state.buildReport = state.referenceBundle = None
+        state.BibleVersions = ['OET', 'OET-RV', 'OET-LV', 'WEB']
+        state.TEST_VERSIONS_ONLY = None
+        state.allBBBs = ['GEN', 'MRK', 'JHN']
+        state.preloadedBibles = {versionAbbreviation:self.loadBible(versionAbbreviation, BBBs)
+                                 for versionAbbreviation, BBBs in (('OET-RV',('MRK','JHN')), ('OET-LV',('MRK','JHN')), ('WEB',('GEN','MRK','JHN')))}
+        stages = [BuildStage('ref', checkBooks, 1, 'ref/', inputVersions=('OET-RV','OET-LV'), outputs=('ref/',))] # So WEB is released
+        self.assertTrue(runBuildStages(stages, 1, state, 'TEST'))
+        self.assertEqual(stageBookPlaceholders, {'OET-RV':[], 'OET-LV':[], 'WEB':None})
+
+
+if __name__ == '__main__':
+    unittest.main()
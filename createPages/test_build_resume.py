@@ -0,0 +1,103 @@
+#!/usr/bin/env -S uv run
+# -*- coding: utf-8 -*-
+#
+# test_build_resume.py
+#
+# Tests resuming a crashed build where only the last ('app') stage still has to be built
+
+import unittest
+from unittest.mock import patch
+import shutil
+import tempfile
+from pathlib import Path
+from settings import State
+import html
+import buildStages
+from buildStages import BuildStage, ReleasedVersion, getCompletedStages, runBuildStages
+
+
+class FakeBible:
+    """ Just enough of a loaded Bible for the page header snapshot """
+    def __init__(self, abbreviation, BBBs, haveSectionHeadings):
+        self.abbreviation, self.books = abbreviation, {BBB:[] for BBB in BBBs}
+        self.discoveryResults = {'ALL':{'haveSectionHeadings':haveSectionHeadings}}
+    def __contains__(self, BBB): return BBB in self.books
+
+
+def writePage(folder, filename, pageType, state):
+    folder.mkdir(parents=True, exist_ok=True)
+    folder.joinpath(filename).write_text(f"{html.makeTop(1, None, pageType, None, state)}\n<p>{filename}</p>\n", encoding='utf-8')
+
+def createVersionPages(level, folder, state):
+    for versionAbbreviation in state.preloadedBibles:
+        writePage(folder.joinpath(f'{versionAbbreviation}/'), 'index.htm', 'site', state)
+
+def createReferencePages(level, folder, state):
+    writePage(folder, 'index.htm', 'referenceIndex', state)
+
+appStageShouldCrash = False
+def createAppPages(level, folder, state):
+    if appStageShouldCrash: raise RuntimeError("Crashed in the app stage")
+    assert all(isinstance(state.preloadedBibles[versionAbbreviation], ReleasedVersion) for versionAbbreviation in ('WEB','KJB-1611')) # Only the 'versions' stage used them
+    writePage(folder, 'index.htm', 'search', state)
+
+
+class TestBuildResume(unittest.TestCase):
+    def setUp(self):
+        self.tempFolder = Path(tempfile.mkdtemp())
+        self.stages = [BuildStage('versions', createVersionPages, 1, '', inputVersions='ALL', outputs=('WEB/','KJB-1611/','OET-RV/','OET-LV/')),
+                       BuildStage('ref', createReferencePages, 1, 'ref/', inputVersions=('OET-RV','OET-LV'), outputs=('ref/',)),
+                       BuildStage('app', createAppPages, 1, 'app/', inputVersions=('OET-RV','OET-LV'), outputs=('app/',), dependsOn=('ref',))]
+        html._pageChromeConfigCache = None
+
+    def tearDown(self):
+        global appStageShouldCrash
+        appStageShouldCrash = False
+        html._pageChromeConfigCache = None
+        shutil.rmtree(self.tempFolder)
+
+    def makeState(self, buildFolderName):
+        """ Like a new run of createSitePages (after the Bibles are preloaded) """
+        state = State()
+        state.TEST_MODE_FLAG = False
+        state.RELEASE_FINISHED_RESOURCES_FLAG = True
+        state.TEMP_BUILD_FOLDER = self.tempFolder.joinpath(buildFolderName)
+        state.TEMP_BUILD_FOLDER.mkdir(exist_ok=True)
+        state.BibleLocations = {}
+        state.pageManifest = state.buildReport = state.referenceBundle = None
+        state.BibleVersions = ['OET', 'OET-RV', 'OET-LV', 'WEB', 'KJB-1611']
+        state.TEST_VERSIONS_ONLY = None
+        state.allBBBs = ['GEN', 'MRK', 'JHN']
+        state.preloadedBibles = {'OET-RV':FakeBible('OET-RV', ('MRK','JHN'), True),
+                                 'OET-LV':FakeBible('OET-LV', ('MRK','JHN'), False),
+                                 'WEB':FakeBible('WEB', ('GEN','MRK','JHN'), True),
+                                 'KJB-1611':FakeBible('KJB-1611', ('GEN','MRK'), False)}
+        return state
+
+    def test_resume_with_only_app_pending(self):
+        global appStageShouldCrash
+        self.assertTrue(runBuildStages(self.stages, 1, self.makeState('full/'), 'TEST'))
+        appPage = self.tempFolder.joinpath('full/app/index.htm').read_text(encoding='utf-8')
+
+        appStageShouldCrash = True
+        self.assertFalse(runBuildStages(self.stages, 1, self.makeState('crashed/'), 'TEST')) # Logged (not raised) like when using worker processes
+        self.assertFalse(self.tempFolder.joinpath('crashed/app/index.htm').exists())
+
+        appStageShouldCrash = False
+        html._pageChromeConfigCache = None # A new process
+        state = self.makeState('crashed/')
+        completedStages = getCompletedStages(self.stages, state, 'TEST')
+        self.assertEqual(sorted(completedStages), ['ref', 'versions'])
+        self.assertTrue(runBuildStages(self.stages, 1, state, 'TEST', completedStages))
+        self.assertEqual(self.tempFolder.joinpath('crashed/app/index.htm').read_text(encoding='utf-8'), appPage)
+
+    def test_edited_shared_module_isnt_resumed(self):
+        self.assertTrue(runBuildStages(self.stages, 1, self.makeState('full/'), 'TEST'))
+        self.assertEqual(sorted(getCompletedStages(self.stages, self.makeState('full/'), 'TEST')), ['app', 'ref', 'versions'])
+        realGetModuleFingerprint = buildStages.getModuleFingerprint
+        with patch('buildStages.getModuleFingerprint', side_effect=lambda module: 'EDITED' if module is html else realGetModuleFingerprint(module)):
+            self.assertEqual(getCompletedStages(self.stages, self.makeState('full/'), 'TEST'), {}) # html.py isn't the module of any stage function
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env -S uv run
+# -*- coding: utf-8 -*-
+#
+# test_page_manifest.py
+#
+# Tests that the chapter and book pages reuse unchanged pages using the page fingerprint manifest (incremental builds)
+
+import unittest
+from unittest.mock import patch
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from settings import State
+from pageManifest import PageManifest, MANIFEST_FILENAME, getModuleFingerprint
+from types import SimpleNamespace
+import createChapterPages
+import createBookPages
+
+
+class FakeEntry:
+    """ Just enough of an InternalBibleEntry for fingerprinting and our fake rendering """
+    def __init__(self, marker, text):
+        self.marker, self.text = marker, text
+    def getMarker(self): return self.marker
+    def getOriginalText(self): return self.text
+
+
+class FakeBible:
+    """ Just enough of a loaded Bible (from tiny ESFM files) for createChapterPages and createBookPages """
+    def __init__(self, abbreviation, sourceFolder, BBBs):
+        self.abbreviation, self.books, self.discoveryResults = abbreviation, {}, {}
+        for BBB in BBBs:
+            chapters = {'-1':[]}
+            for line in sourceFolder.joinpath(f'{BBB}.ESFM').read_text(encoding='utf-8').splitlines():
+                marker, text = line[1:].split(' ', 1)
+                if marker == 'c': chapters[text] = []
+                chapters[list(chapters)[-1]].append(FakeEntry(marker, text))
+            self.books[BBB] = chapters
+            self.discoveryResults[BBB] = {'haveIntroductoryText':len(chapters['-1']) > 1}
+    def getNumChapters(self, BBB): return len(self.books[BBB]) - 1
+    def getNumVerses(self, BBB, C):
+        return sum(1 for entry in self.books[BBB].get(str(C), ()) if entry.getMarker() == 'v')
+    def getContextVerseData(self, ref):
+        if len(ref) == 1: return [entry for chapter in self.books[ref[0]].values() for entry in chapter], ['book']
+        return self.books[ref[0]][ref[1]], ['chapter'] # Gives KeyError for a missing chapter (like the real one)
+
+
+class TestPageManifest(unittest.TestCase):
+    def setUp(self):
+        self.tempFolder = Path(tempfile.mkdtemp())
+        self.sourceFolder = self.tempFolder.joinpath('source/')
+        self.siteFolder = self.tempFolder.joinpath('site/')
+        self.buildFolder = self.tempFolder.joinpath('build/')
+        self.sourceFolder.mkdir()
+        self.writeBook('MRK', 'The beginning of the good message')
+        self.writeBook('GAL', 'Paul, an apostle')
+        # Only the page top and bottom, and the verse HTML are replaced (because they need the real site and Rust module)
+        self.patchers = [patch.multiple(module,
+                    makeTop=lambda level, versionAbbreviation, pageType, fileOrFolderName, state: '<html><title>__TITLE__</title><meta name="keywords" content="__KEYWORDS__">\n',
+                    makeBottom=lambda level, versionAbbreviation, pageType, state: f'\n<p>{pageType}</p></html>\n',
+                    makeBookNavListParagraph=lambda BBBLinks, versionAbbreviation, state: f'<p class="bkLst">{" ".join(BBBLinks)}</p>',
+                    checkHtml=lambda where, htmlToCheck, segmentOnly=False: True,
+                    convertVerseEntryListToHtml=lambda level, versionAbbreviation, ref, segmentType, contextList, verseEntryList, basicOnly, state:
+                                                    ''.join(f'<p class="{entry.getMarker()}">{entry.getOriginalText()}</p>' for entry in verseEntryList))
+                            for module in (createChapterPages, createBookPages)]
+        for patcher in self.patchers: patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers: patcher.stop()
+        shutil.rmtree(self.tempFolder)
+
+    def writeBook(self, BBB, firstVerseText):
+        self.sourceFolder.joinpath(f'{BBB}.ESFM').write_text(f'\\id {BBB}\n\\mt1 {BBB}\n\\ip About {BBB}\n\\c 1\n\\v 1 {firstVerseText}\n\\v 2 And then\n\\c 2\n\\v 1 Some days later\n', encoding='utf-8')
+
+    def build(self, buildInputs='TEST'):
+        """ Make the chapter and book pages (using the manifest from the last build), then move the build to the site """
+        state = State()
+        state.TEST_MODE_FLAG = False
+        state.booksToLoad = {'TST':['MRK','GAL'], 'OET':[]}
+        state.BBBsToProcess, state.BBBLinks = {'TST':['MRK','GAL']}, {'TST':['MRK','GAL']}
+        state.BibleNames = {'TST':'Test Bible'}
+        state.OETRefData = {'word_tables':{}}
+        self.buildFolder.mkdir()
+        state.pageManifest = PageManifest(self.siteFolder if self.siteFolder.is_dir() else None, self.buildFolder, buildInputs=buildInputs)
+        thisBible = FakeBible('TST', self.sourceFolder, ('MRK','GAL'))
+        createChapterPages.createChapterPages(3, self.buildFolder.joinpath('TST/byC/'), thisBible, state)
+        createBookPages.createBookPages(3, self.buildFolder.joinpath('TST/byDoc/'), thisBible, state)
+        state.pageManifest.save()
+        if self.siteFolder.is_dir(): shutil.rmtree(self.siteFolder)
+        self.buildFolder.rename(self.siteFolder)
+        return state.pageManifest
+
+    def makeSitePagesOld(self):
+        """ So that we can tell which pages get rewritten by the next build """
+        for filepath in self.siteFolder.glob('TST/*/*.htm'):
+            os.utime(filepath, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+
+    def getPageMtimes(self):
+        """ Returns the modification times of the pages that are in the manifest (the index pages are always remade) """
+        return {relativePath:self.siteFolder.joinpath(relativePath).stat().st_mtime_ns for relativePath in PageManifest(self.siteFolder, self.buildFolder).previousPages}
+
+    def test_first_build_renders_everything(self):
+        pageManifest = self.build()
+        self.assertEqual(sorted(pageManifest.newPages), ['TST/byC/GAL_C1.htm', 'TST/byC/GAL_C2.htm', 'TST/byC/GAL_Intro.htm', 'TST/byC/MRK_C1.htm', 'TST/byC/MRK_C2.htm', 'TST/byC/MRK_Intro.htm',
+                                                         'TST/byDoc/GAL.htm', 'TST/byDoc/MRK.htm'])
+        self.assertEqual((pageManifest.numReused, pageManifest.numRendered), (0, 8))
+        self.assertTrue(self.siteFolder.joinpath(MANIFEST_FILENAME).is_file())
+
+    def test_unchanged_rebuild_reuses_everything(self):
+        self.build()
+        self.makeSitePagesOld()
+        mtimesBefore = self.getPageMtimes()
+        pageManifest = self.build()
+        self.assertEqual((pageManifest.numReused, pageManifest.numRendered), (len(mtimesBefore), 0))
+        self.assertEqual(self.getPageMtimes(), mtimesBefore)
+
+    def test_editing_one_book_only_rerenders_that_book(self):
+        self.build()
+        self.makeSitePagesOld()
+        mtimesBefore = self.getPageMtimes()
+        self.writeBook('MRK', 'The start of the good message')
+        pageManifest = self.build()
+        mtimesAfter = self.getPageMtimes()
+        self.assertEqual(sorted(mtimesAfter), sorted(mtimesBefore))
+        self.assertEqual(sorted(relativePath for relativePath in mtimesAfter if mtimesAfter[relativePath] != mtimesBefore[relativePath]),
+                         ['TST/byC/MRK_C1.htm', 'TST/byDoc/MRK.htm'])
+        self.assertEqual((pageManifest.numReused, pageManifest.numRendered), (len(mtimesBefore) - 2, 2))
+        self.assertIn('The start of', self.siteFolder.joinpath('TST/byC/MRK_C1.htm').read_text(encoding='utf-8'))
+        self.assertIn('The start of', self.siteFolder.joinpath('TST/byDoc/MRK.htm').read_text(encoding='utf-8'))
+
+    def test_changed_build_inputs_rerender_everything(self):
+        pageManifest = self.build()
+        numPages = pageManifest.numRendered
+        pageManifest = self.build(buildInputs='CHANGED')
+        self.assertEqual((pageManifest.numReused, pageManifest.numRendered), (0, numPages))
+
+    def test_rebuilt_extension_changes_fingerprint(self):
+        packageFolder = self.tempFolder.joinpath('fake_rust/')
+        packageFolder.mkdir()
+        packageFolder.joinpath('__init__.py').write_text('from .fake_rust import *\n', encoding='utf-8')
+        packageFolder.joinpath('fake_rust.so').write_bytes(b'version one')
+        module = SimpleNamespace(__name__='fake_rust', __file__=str(packageFolder.joinpath('__init__.py')))
+        fingerprint = getModuleFingerprint(module)
+        self.assertEqual(getModuleFingerprint(module), fingerprint)
+        packageFolder.joinpath('fake_rust.so').write_bytes(b'version two') # Rebuilt with the same version number
+        self.assertNotEqual(getModuleFingerprint(module), fingerprint)
+        self.assertIn('openbibledata_rust', createChapterPages.PAGE_GENERATOR_VERSION)
+        self.assertIn('openbibledata_rust', createBookPages.PAGE_GENERATOR_VERSION)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env -S uv run
+# -*- coding: utf-8 -*-
+#
+# test_released_versions.py
+#
+# Tests that the page headers can still be made after Bibles are released (after their last build stage)
+
+import unittest
+from settings import State
+import html
+from buildStages import BuildStage, ReleasedVersion, _ResourceReleaser
+
+
+class FakeBible:
+    """ Just enough of a loaded Bible for the page header snapshot """
+    def __init__(self, abbreviation, BBBs, haveSectionHeadings):
+        self.abbreviation, self.books = abbreviation, {BBB:[] for BBB in BBBs}
+        self.discoveryResults = {'ALL':{'haveSectionHeadings':haveSectionHeadings}}
+    def __contains__(self, BBB): return BBB in self.books
+
+
+class TestReleasedVersions(unittest.TestCase):
+    def setUp(self):
+        self.state = State()
+        self.state.TEST_MODE_FLAG = False
+        self.state.RELEASE_FINISHED_RESOURCES_FLAG = True
+        self.state.BibleVersions = ['OET', 'OET-RV', 'OET-LV', 'WEB', 'KJB-1611']
+        self.state.TEST_VERSIONS_ONLY = None
+        self.state.allBBBs = ['GEN', 'MRK', 'JHN']
+        self.state.preloadedBibles = {'OET-RV':FakeBible('OET-RV', ('MRK','JHN'), True),
+                                      'OET-LV':FakeBible('OET-LV', ('MRK','JHN'), False),
+                                      'WEB':FakeBible('WEB', ('GEN','MRK','JHN'), True),
+                                      'KJB-1611':FakeBible('KJB-1611', ('GEN','MRK'), False)}
+        self.bibles = dict(self.state.preloadedBibles)
+        html._pageChromeConfigCache = None
+
+    def tearDown(self):
+        html._pageChromeConfigCache = None
+
+    def releaseAllExceptOET(self):
+        """ Like resuming a build where only the 'app' stage (which only reads the OET) still has to be built """
+        stages = [BuildStage('versions', None, 1, '', inputVersions='ALL'), BuildStage('app', None, 1, 'app/', inputVersions=('OET-RV','OET-LV'))]
+        _ResourceReleaser(stages, stages[1:], self.state)
+
+    def makeTops(self):
+        return [html.makeTop(level, versionAbbreviation, pageType, fileOrFolderName, self.state)
+                for level, versionAbbreviation, pageType, fileOrFolderName in ((1, 'WEB', 'book', 'GEN.htm'), (2, 'KJB-1611', 'chapter', 'byC/MRK_C1.htm'),
+                                                                             (1, 'OET', 'section', 'bySec/JHN_S1.htm'), (1, None, 'parallelVerse', 'MRK/C1V1.htm'))]
+
+    def test_released_version_keeps_books_and_discovery_results(self):
+        self.releaseAllExceptOET()
+        for versionAbbreviation in ('WEB', 'KJB-1611'):
+            releasedVersion = self.state.preloadedBibles[versionAbbreviation]
+            self.assertIsInstance(releasedVersion, ReleasedVersion)
+            for BBB in ('GEN', 'EXO', 'MRK', 'JHN', 'FRT'):
+                self.assertEqual(BBB in releasedVersion, BBB in self.bibles[versionAbbreviation], BBB)
+            self.assertIs(releasedVersion.discoveryResults, self.bibles[versionAbbreviation].discoveryResults)
+            with self.assertRaises(AttributeError): releasedVersion.books # Anything else still gives a clear error
+            with self.assertRaises(RuntimeError): list(releasedVersion)
+        self.assertIs(self.state.preloadedBibles['OET-RV'], self.bibles['OET-RV'])
+
+    def test_page_tops_after_release(self):
+        topsBefore = self.makeTops()
+        html._pageChromeConfigCache = None # So the snapshot is made again (like in a resumed build or a later worker process)
+        self.releaseAllExceptOET()
+        self.assertEqual(self.makeTops(), topsBefore)
+
+
+if __name__ == '__main__':
+    unittest.main()
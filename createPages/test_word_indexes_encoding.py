@@ -0,0 +1,207 @@
+#!/usr/bin/env -S uv run
+# -*- coding: utf-8 -*-
+#
+# test_word_indexes_encoding.py
+#
+# Tests that making the Hebrew and Greek word indexes from the dictionary-encoded word table columns
+#   gives exactly the same indexes (including the key and row number orders) as the previous scan of every row
+
+import unittest
+from collections import defaultdict
+import random
+import shutil
+import tempfile
+from types import SimpleNamespace
+from pathlib import Path
+from settings import State
+from wordTable import WordTable
+from wordTableTestData import HEBREW_HEADER, GREEK_HEADER, writeHebrewLemmaTable
+from createOETReferencePages import HebrewWordFileName, GreekWordFileName, \
+                    HEBREW_PREPROCESS_BBB_SELECTIONS, GREEK_PREPROCESS_BBB_SELECTIONS, COMMON_ENGLISH_WORDS_LIST, \
+                    makeHebrewWordIndexes, makeGreekWordIndexes, formatNTSpansGlossWords, \
+                    _getHebrewLemmaRowNumbers, _getHebrewGlossWords, _mergeRowNumbers
+
+
+HEBREW_NO_CANTILLATIONS = ('בָּרָא', 'אֱלֹהִים', 'הָאָרֶץ', 'אוֹר', 'וְאֵת')
+HEBREW_LEMMA_ROW_LISTS = ('1', '2', '3', '4', '1,4', '3,2', '###MISSING-B3###', '2,###MISSING-B3###')
+HEBREW_STRONGS = ('1254', '430', '776', '216', 'l,m,8179+', 'b,5788 a', 'c,d,853', '')
+HEBREW_MORPHOLOGIES = ('Vqp3ms', 'Ncmpa', 'Ncbsa', 'Ncbsc', '')
+HEBREW_GLOSSES = ('', '', '', 'created', 'God', 'earth', 'the=time//this_time', 'DOM', '\\untr DOM\\untr*', '\\nd Yahweh\\nd*', 'land[s]',
+                  'he_~_said', '[the] earth', '[man] walked', 'and,the', '(cmp) light', 'sons(ms)', 'the', 'in/on', 'to=him')
+GREEK_FORMS = ( # GreekWord, SRLemma, GreekLemmas, StrongsExt, Role, Morphologies
+    ('λόγος', 'λόγος', ('λόγος',), '30560', 'N', ('····NMS',)),
+    ('λόγου', 'λόγος', ('λόγος','λογος'), '30560', 'N', ('····GMS','None')),
+    ('θεός', 'θεός', ('θεός',), '23160', 'N', ('····NMS',)),
+    ('ἐγένετο', 'γίνομαι', ('γίνομαι','γίγνομαι'), '10960', 'V', ('IAM3···',)),
+    ('ἐν', 'ἐν', ('ἐν',), '17220', 'P', ('None','')),
+    ('φωτός', 'φῶς', ('φῶς',), '54570', 'N', ('····GNS',)),
+    )
+GREEK_GLOSSES = ('word', 'the word', '˓the˒ word', 'message', 'God', 'came', 'came ˱to˲ be', '‹and› became', 'in', 'light', '¬the brightness', '')
+GREEK_PROBABILITIES = ('90', '100', '62', '')
+
+
+def rowScanHebrewWordIndexes(wordTable, BBBSelections):
+    """ The previous (row by row) preprocessHebrewWordsLemmasGlosses code for the word table indexes """
+    indexes = {'OTFormUsageDict':defaultdict(list), 'OTLemmaRowNumbersDict':defaultdict(list), 'OTWordRowNumbersDict':defaultdict(list),
+               'OTFormOETGlossesDict':defaultdict(set), 'OTFormOETGlossesCountDict':defaultdict(int), 'OTLemmaOETGlossesDict':defaultdict(set),
+               'OETOTGlossWordDict':defaultdict(list), 'OTStrongsRefs':defaultdict(set)}
+    for BBBSelection in BBBSelections:
+        if isinstance(BBBSelection, str):
+            processBBB, ignoreBBBs = BBBSelection, None
+        else: processBBB, ignoreBBBs = None, BBBSelection
+        started = False
+        for n, wordFields in enumerate(wordTable.iterFields(), start=1):
+            if (processBBB is not None and wordFields[0].startswith(processBBB)) \
+            or (processBBB is None and wordFields[0][:3] not in ignoreBBBs):
+                started = True
+                ref, _rowType, _morphemeRowList, lemmaRowList, strongsField, morphology, _word, noCantillations, morphemeGlosses, contextualMorphemeGlosses, wordGloss, contextualWordGloss = wordFields[:12]
+                vRef = ref.split('w')[0]
+                gloss = contextualWordGloss if contextualWordGloss else wordGloss if wordGloss else contextualMorphemeGlosses if contextualMorphemeGlosses else morphemeGlosses
+                formMorph2Tuple = (noCantillations, morphology)
+                indexes['OTFormUsageDict'][formMorph2Tuple].append(n)
+                indexes['OTLemmaRowNumbersDict'][noCantillations] = []
+                for strongsNumber in strongsField.replace(' ', ',').replace('+', '').split(','):
+                    if strongsNumber.isdigit():
+                        indexes['OTStrongsRefs'][strongsNumber].add(vRef)
+                if lemmaRowList:
+                    for lemmaRowNumberStr in lemmaRowList.split(','):
+                        try:
+                            lemmaRowNumber = int(lemmaRowNumberStr)
+                            indexes['OTLemmaRowNumbersDict'][noCantillations].append(lemmaRowNumber)
+                            indexes['OTWordRowNumbersDict'][lemmaRowNumber].append(n)
+                        except ValueError: pass # '###MISSING-B3###'
+                if gloss:
+                    indexes['OTFormOETGlossesDict'][formMorph2Tuple].add(gloss)
+                    indexes['OTFormOETGlossesCountDict'][(noCantillations, morphology, gloss)] += 1
+                    indexes['OTLemmaOETGlossesDict'][noCantillations].add(gloss)
+                    if gloss != 'DOM':
+                        adjGloss = (gloss.replace('\\untr DOM\\untr*', '').replace('DOM', '')
+                                        .replace('\\nd ', '').replace('\\nd*', '')
+                                        .replace('_~_', ' ')
+                                        .replace('(cmp)', '')
+                                        .replace('[s]', '').replace('[es]', '')
+                                        .replace('(ms)', '').replace('(m)', '').replace('(fs)', '')
+                                        .replace('//', ' ').replace('/', ' ').replace('_', ' ').replace('=', ' ').replace(',', ' ')
+                                        .replace('(', ' ').replace(')', ' ')
+                                        .replace('   ', ' ').replace('  ', ' ').strip())
+                        if adjGloss:
+                            for someGlossWord in adjGloss.split(' '):
+                                if someGlossWord.startswith('[') and someGlossWord.endswith(']'):
+                                    continue
+                                if someGlossWord not in COMMON_ENGLISH_WORDS_LIST or someGlossWord == adjGloss:
+                                    indexes['OETOTGlossWordDict'][someGlossWord].append(n)
+            elif processBBB and started:
+                break
+    return indexes
+
+
+def rowScanGreekWordIndexes(wordTable, BBBSelections):
+    """ The previous (row by row) preprocessGreekWordsLemmasGlosses code """
+    indexes = {'NTFormUsageDict':defaultdict(list), 'NTLemmaDict':defaultdict(list), 'NTLemmaFormsDict':defaultdict(set), 'NTLemmaFormsCountDict':defaultdict(int),
+               'NTFormOETGlossesDict':defaultdict(set), 'NTFormVLTGlossesDict':defaultdict(set), 'NTFormOETGlossesCountDict':defaultdict(int),
+               'NTLemmaOETGlossesDict':defaultdict(set), 'NTLemmaVLTGlossesDict':defaultdict(set), 'NTLemmaOETGlossesCountDict':defaultdict(int),
+               'OETNTGlossWordDict':defaultdict(list), 'VLTGlossWordDict':defaultdict(list), 'NTGreekLemmaDict':{}, 'NTStrongsRefs':defaultdict(set)}
+    for BBBSelection in BBBSelections:
+        if isinstance(BBBSelection, str):
+            processBBB, ignoreBBBs = BBBSelection, None
+        else: processBBB, ignoreBBBs = None, BBBSelection
+        started = False
+        for n, wordFields in enumerate(wordTable.iterFields(), start=1):
+            if (processBBB is not None and wordFields[0].startswith(processBBB)) \
+            or (processBBB is None and wordFields[0][:3] not in ignoreBBBs):
+                started = True
+                ref, greekWord, SRLemma, GrkLemma, VLTGlossWordsStr, OETGlossWordsStr, _glossCaps, probability, extendedStrongs, roleLetter, morphology, _tagsStr = wordFields
+                if probability:
+                    OETFormattedGlossWords = formatNTSpansGlossWords(OETGlossWordsStr)
+                    VLTFormattedGlossWords = formatNTSpansGlossWords(VLTGlossWordsStr)
+                    formMorph3Tuple = (greekWord, roleLetter, None if morphology=='None' else morphology)
+                    indexes['NTFormUsageDict'][formMorph3Tuple].append(n)
+                    indexes['NTLemmaDict'][SRLemma].append(n)
+                    indexes['NTLemmaFormsDict'][SRLemma].add(formMorph3Tuple)
+                    indexes['NTLemmaFormsCountDict'][(SRLemma,*formMorph3Tuple)] += 1
+                    indexes['NTFormOETGlossesDict'][formMorph3Tuple].add(OETFormattedGlossWords)
+                    indexes['NTFormOETGlossesCountDict'][(*formMorph3Tuple, OETFormattedGlossWords)] += 1
+                    indexes['NTFormVLTGlossesDict'][formMorph3Tuple].add(VLTFormattedGlossWords)
+                    indexes['NTLemmaOETGlossesDict'][SRLemma].add(OETFormattedGlossWords)
+                    indexes['NTLemmaOETGlossesCountDict'][(SRLemma, OETFormattedGlossWords)] += 1
+                    indexes['NTLemmaVLTGlossesDict'][SRLemma].add(VLTFormattedGlossWords)
+                    for glossWordsStr, glossWordDict in ((OETGlossWordsStr, indexes['OETNTGlossWordDict']), (VLTGlossWordsStr, indexes['VLTGlossWordDict'])):
+                        for someGlossWord in glossWordsStr.split(' '):
+                            if '˓' not in someGlossWord and '˱' not in someGlossWord and '‹' not in someGlossWord:
+                                glossWordDict[someGlossWord].append(n)
+                    indexes['NTGreekLemmaDict'][SRLemma] = GrkLemma
+                indexes['NTStrongsRefs'][extendedStrongs[:-1]].add(ref.split('w', 1)[0])
+            elif processBBB and started:
+                break
+    return indexes
+
+
+class TestWordIndexesEncoding(unittest.TestCase):
+    def setUp(self):
+        self.tempFolder = Path(tempfile.mkdtemp())
+        writeHebrewLemmaTable(self.tempFolder.joinpath('OT/'))
+
+    def tearDown(self):
+        shutil.rmtree(self.tempFolder)
+
+    def makeHebrewRows(self, randomGenerator):
+        """ Returns a random Hebrew word table (with repeated fields, segs, and missing lemmas) """
+        hebrewRows = [HEBREW_HEADER]
+        for BBB in ('GEN', 'EXO', 'PSA', 'MAL'):
+            for C in range(1, 3):
+                for V in range(1, randomGenerator.randint(2, 6)):
+                    for W in range(1, randomGenerator.randint(2, 6)):
+                        word = randomGenerator.choice(HEBREW_NO_CANTILLATIONS)
+                        glosses = [randomGenerator.choice(HEBREW_GLOSSES) for _g in range(4)]
+                        hebrewRows.append(f'{BBB}_{C}:{V}w{W}\tw\t{len(hebrewRows)}\t{randomGenerator.choice(HEBREW_LEMMA_ROW_LISTS)}\t{randomGenerator.choice(HEBREW_STRONGS)}\t{randomGenerator.choice(HEBREW_MORPHOLOGIES)}'
+                                          f'\t{word}\t{word}\t{glosses[0]}\t{glosses[1]}\t{glosses[2]}\t{glosses[3]}\t\t\t\t\t\t\t')
+                    if randomGenerator.random() < 0.5:
+                        hebrewRows.append(f'{BBB}_{C}:{V}\tseg\t{len(hebrewRows)}\t\t\t\t׃\t\t\t\t\t\t\t\t\t\t\t\t')
+        return hebrewRows
+
+    def makeGreekRows(self, randomGenerator):
+        """ Returns a random Greek word table (with unused variants, and lemmas with different GreekLemmas) """
+        greekRows = [GREEK_HEADER]
+        for BBB in ('MAT', 'MRK', 'LUK', 'JHN', 'ACT', 'JN3'):
+            for C in range(1, 3):
+                for V in range(1, randomGenerator.randint(2, 6)):
+                    for W in range(1, randomGenerator.randint(2, 6)):
+                        greekWord, SRLemma, greekLemmas, extendedStrongs, roleLetter, morphologies = randomGenerator.choice(GREEK_FORMS)
+                        greekRows.append(f'{BBB}_{C}:{V}w{W}\t{greekWord}\t{SRLemma}\t{randomGenerator.choice(greekLemmas)}\t{randomGenerator.choice(GREEK_GLOSSES)}\t{randomGenerator.choice(GREEK_GLOSSES)}'
+                                         f'\t\t{randomGenerator.choice(GREEK_PROBABILITIES)}\t{extendedStrongs}\t{roleLetter}\t{randomGenerator.choice(morphologies)}\t')
+        return greekRows
+
+    def assertSameIndexes(self, encodedIndexes, rowScanIndexes):
+        for indexName, rowScanIndex in rowScanIndexes.items():
+            self.assertEqual(list(encodedIndexes[indexName].items()), list(rowScanIndex.items()), indexName) # Including the key order
+
+    def test_encoded_columns_give_the_row_scan_indexes(self):
+        for seed in range(12):
+            with self.subTest(seed=seed):
+                randomGenerator = random.Random(seed)
+                hebrewWordTable = WordTable(HebrewWordFileName, self.makeHebrewRows(randomGenerator))
+                greekWordTable = WordTable(GreekWordFileName, self.makeGreekRows(randomGenerator))
+                state = State()
+                state.preloadedBibles = {'OET-LV':SimpleNamespace(OTsourceFolder=self.tempFolder.joinpath('OT/'))}
+                state.OETRefData = {'word_tables':{HebrewWordFileName:hebrewWordTable, GreekWordFileName:greekWordTable}}
+                hebrewIndexes = makeHebrewWordIndexes(state)
+                greekIndexes = makeGreekWordIndexes(state)
+                self.assertSameIndexes(hebrewIndexes, rowScanHebrewWordIndexes(hebrewWordTable, HEBREW_PREPROCESS_BBB_SELECTIONS))
+                self.assertSameIndexes(greekIndexes, rowScanGreekWordIndexes(greekWordTable, GREEK_PREPROCESS_BBB_SELECTIONS))
+                self.assertTrue(hebrewIndexes['OTWordRowNumbersDict'] and greekIndexes['NTGreekLemmaDict']) # Check that the tables weren't empty
+
+    def test_helpers(self):
+        self.assertEqual(_getHebrewLemmaRowNumbers('1214,33'), [1214, 33])
+        self.assertEqual(_getHebrewLemmaRowNumbers('2,###MISSING-B3###'), [2])
+        self.assertEqual(_getHebrewLemmaRowNumbers(''), [])
+        self.assertEqual(_getHebrewGlossWords('DOM'), [])
+        self.assertEqual(_getHebrewGlossWords('\\nd Yahweh\\nd*'), ['Yahweh'])
+        self.assertEqual(_getHebrewGlossWords('the=time//this_time'), ['time', 'time'])
+        self.assertEqual(_getHebrewGlossWords('[man] walked'), ['walked'])
+        self.assertEqual(_getHebrewGlossWords('the'), ['the']) # The entire gloss
+        self.assertEqual(_mergeRowNumbers([[3, 9]]), [3, 9])
+        self.assertEqual(_mergeRowNumbers([[3, 9], [1, 4, 12], [5]]), [1, 3, 4, 5, 9, 12])
+
+
+if __name__ == '__main__':
+    unittest.main()
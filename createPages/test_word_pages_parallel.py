@@ -0,0 +1,144 @@
+#!/usr/bin/env -S uv run
+# -*- coding: utf-8 -*-
+#
+# test_word_pages_parallel.py
+#
+# Tests that making the Hebrew and Greek word pages in forked worker processes gives the same output as making them one after the other
+
+import unittest
+from unittest.mock import patch
+import multiprocessing
+import shutil
+import tempfile
+from types import SimpleNamespace
+from pathlib import Path
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from settings import State
+from wordTable import WordTable
+import createOETReferencePages
+from wordTableTestData import HEBREW_HEADER, GREEK_HEADER, REAL_OT_SOURCE_FOLDER, REAL_NT_SOURCE_FOLDER, writeHebrewLemmaTable, readWordTableRows
+from createOETReferencePages import HebrewWordFileName, GreekWordFileName, \
+                    makeHebrewWordIndexes, makeGreekWordIndexes, create_Hebrew_word_pages, create_Greek_word_pages, \
+                    get_Hebrew_lemma_line_verse_parts, get_Greek_lemma_line_verse_parts
+
+
+GREEK_WORDS = ( # GreekWord, SRLemma, VLTGlossWords, OETGlossWords, StrongsExt, Role, Morphology
+    ('λόγος', 'λόγος', 'word', 'word', '30560', 'N', '····NMS'),
+    ('λόγου', 'λόγος', 'word', 'message', '30560', 'N', '····GMS'),
+    ('θεός', 'θεός', 'God', 'God', '23160', 'N', '····NMS'),
+    ('ἐγένετο', 'γίνομαι', 'became', 'came', '10960', 'V', 'IAM3···'),
+    ('ἐν', 'ἐν', 'in', 'in', '17220', 'P', 'None'),
+    ('φῶς', 'φῶς', 'light', 'light', '54570', 'N', '····NNS'),
+    ('φωτός', 'φῶς', 'light', 'brightness', '54570', 'N', '····GNS'),
+    )
+HEBREW_WORDS = ( # LemmaRowList, Strongs, Morphology, Word, WordGloss, ContextualWordGloss
+    ('1', '1254', 'Vqp3ms', 'בָּרָא', 'created', ''),
+    ('2', '430', 'Ncmpa', 'אֱלֹהִים', 'God', ''),
+    ('3', '776', 'Ncbsa', 'אֶרֶץ', 'earth', 'land'),
+    ('3', '776', 'Ncbsc', 'אֶרֶץ', 'earth', ''),
+    ('4', '216', 'Ncbsa', 'אוֹר', 'light', ''),
+    )
+
+
+class TestWordPagesParallel(unittest.TestCase):
+    def setUp(self):
+        self.tempFolder = Path(tempfile.mkdtemp())
+        self.savedMaxProcesses = getattr(BibleOrgSysGlobals, 'maxProcesses', 1)
+        self.savedChunkSize = createOETReferencePages.WORD_PAGES_CHUNK_SIZE
+        createOETReferencePages.WORD_PAGES_CHUNK_SIZE = 7 # So that even our few test rows get split into lots of chunks
+        # Only the page top and bottom, and the OET verse texts are replaced (because they need the real site and Bibles)
+        self.patcher = patch.multiple(createOETReferencePages,
+                    makeTop=lambda level, versionAbbreviation, pageType, fileOrFolderName, state: f'<html><title>__TITLE__</title><meta name="keywords" content="__KEYWORDS__"><a href="{"../"*level}par/">║</a>\n',
+                    makeBottom=lambda level, versionAbbreviation, pageType, state: f'\n<p>{pageType}</p></html>\n',
+                    checkHtml=lambda where, htmlToCheck, segmentOnly=False: True,
+                    get_OET_LV_verse_HTML=lambda level, BBB, C, V: f'<p class="LVVerseText">{BBB} {C}:{V}</p>',
+                    get_OET_RV_verse_HTML=lambda level, BBB, C, V: f'<p class="RVVerseText">{BBB} {C}:{V}</p>' if V != '2' else '')
+        self.patcher.start()
+        self.OTSourceFolder = self.tempFolder.joinpath('OT/')
+        writeHebrewLemmaTable(self.OTSourceFolder)
+
+        # Make word table rows for some books (with some variants that aren't used and Hebrew segs)
+        self.greekRows = [GREEK_HEADER]
+        for BBB in ('MAT', 'MRK', 'JHN', 'JN3'):
+            for V in range(1, 6):
+                for W in range(1, 5):
+                    greekWord, SRLemma, VLTGlossWords, OETGlossWords, extendedStrongs, roleLetter, morphology = GREEK_WORDS[(len(self.greekRows) * 3 + V) % len(GREEK_WORDS)]
+                    probability = '' if W == 4 and V % 2 else '90'
+                    self.greekRows.append(f'{BBB}_1:{V}w{W}\t{greekWord}\t{SRLemma}\t{SRLemma}\t{VLTGlossWords}\t{OETGlossWords}\t{"N" if roleLetter=="N" and V==3 else ""}\t{probability}\t{extendedStrongs}\t{roleLetter}\t{morphology}\t{"Pjohn" if W==2 and V==4 else ""}')
+        self.hebrewRows = [HEBREW_HEADER]
+        for BBB in ('GEN', 'EXO', 'PSA'):
+            for V in range(1, 6):
+                for W in range(1, 4):
+                    lemmaRowList, strongs, morphology, word, wordGloss, contextualWordGloss = HEBREW_WORDS[(len(self.hebrewRows) * 2 + V) % len(HEBREW_WORDS)]
+                    self.hebrewRows.append(f'{BBB}_1:{V}w{W}\tw\t{len(self.hebrewRows)}\t{lemmaRowList}\t{strongs}\t{morphology}\t{word}\t{word}\t{wordGloss}\t\t{wordGloss}\t{contextualWordGloss}\t{"S" if W==1 else ""}\t\t\t\t\t\t')
+                self.hebrewRows.append(f'{BBB}_1:{V}\tseg\t{len(self.hebrewRows)}\t\t\t\t׃\t\t\t\t\t\t\t\t\t\t\t\t')
+
+    def tearDown(self):
+        self.patcher.stop()
+        BibleOrgSysGlobals.maxProcesses = self.savedMaxProcesses
+        createOETReferencePages.WORD_PAGES_CHUNK_SIZE = self.savedChunkSize
+        shutil.rmtree(self.tempFolder)
+
+    def makeWordPages(self, parallelFlag, folderName, testModeFlag=False):
+        """ Make the real Hebrew and Greek word pages from our word tables """
+        state = State()
+        state.TEST_MODE_FLAG = testModeFlag # If set, only the TEST_BOOK_LIST words get pages (like in a TEST build)
+        state.PARALLEL_WORD_PAGES_FLAG = parallelFlag
+        BibleOrgSysGlobals.maxProcesses = 3 if parallelFlag else 1
+        state.preloadedBibles = {'OET-LV':SimpleNamespace(OTsourceFolder=self.OTSourceFolder)}
+        if testModeFlag: state.preloadedBibles['OET-RV'] = frozenset(state.TEST_BOOK_LIST) # Only used for "BBB in" (to only link to TEST books)
+        state.OETRefData = {'word_tables':{HebrewWordFileName:WordTable(HebrewWordFileName, self.hebrewRows),
+                                            GreekWordFileName:WordTable(GreekWordFileName, self.greekRows)}}
+        bookLists = list(BibleOrgSysGlobals.BOOKLIST_OT39), list(BibleOrgSysGlobals.BOOKLIST_NT27)
+        makeHebrewWordIndexes(state)
+        makeGreekWordIndexes(state)
+        self.assertEqual((BibleOrgSysGlobals.BOOKLIST_OT39, BibleOrgSysGlobals.BOOKLIST_NT27), bookLists) # (They're also used for state.booksToLoad)
+        outputFolderPath = self.tempFolder.joinpath(folderName)
+        with patch.object(createOETReferencePages.multiprocessing, 'get_context', wraps=multiprocessing.get_context) as getContext:
+            create_Hebrew_word_pages(3, outputFolderPath.joinpath('HebWrd/'), state)
+            create_Greek_word_pages(3, outputFolderPath.joinpath('GrkWrd/'), state)
+        self.assertEqual(getContext.call_count, 2 if parallelFlag else 0) # Check that the pages were made in forked processes
+        self.assertFalse(BibleOrgSysGlobals.alreadyMultiprocessing)
+        usedSets = {usedSetName:state.OETRefData[usedSetName] for usedSetName in ('usedHebLemmasSet','usedHebStrongsSet','usedGrkLemmas','usedGrkStrongs')}
+        return usedSets, {str(filepath.relative_to(outputFolderPath)):filepath.read_bytes() for filepath in outputFolderPath.glob('*/*')}
+
+    def test_parallel_output_is_identical_to_serial(self):
+        serialSets, serialPages = self.makeWordPages(False, 'serial/')
+        parallelSets, parallelPages = self.makeWordPages(True, 'parallel/')
+        self.assertEqual(len(serialPages), len(self.hebrewRows) - 1 + len(self.greekRows) - 1 + 4) # Plus two index pages each
+        self.assertIn('GrkWrd/JN3c1v3w4.htm', serialPages) # An unused variant still gets a page
+        self.assertIn('HebWrd/PSAc1v5s' + str(len(self.hebrewRows) - 1) + '.htm', serialPages)
+        self.assertEqual(parallelSets, serialSets)
+        self.assertEqual(sorted(parallelPages), sorted(serialPages))
+        for filename, pageBytes in serialPages.items():
+            self.assertEqual(parallelPages[filename], pageBytes, filename)
+
+    @unittest.skipUnless(REAL_OT_SOURCE_FOLDER.joinpath(HebrewWordFileName).is_file() and REAL_NT_SOURCE_FOLDER.joinpath(GreekWordFileName).is_file(),
+                         f"Needs the real OET-LV word tables in {REAL_OT_SOURCE_FOLDER} and {REAL_NT_SOURCE_FOLDER}")
+    def test_real_test_book_pages_parallel_output_is_identical_to_serial(self):
+        self.OTSourceFolder = REAL_OT_SOURCE_FOLDER # For the real lemma table
+        self.hebrewRows = readWordTableRows(REAL_OT_SOURCE_FOLDER.joinpath(HebrewWordFileName))
+        self.greekRows = readWordTableRows(REAL_NT_SOURCE_FOLDER.joinpath(GreekWordFileName))
+        serialSets, serialPages = self.makeWordPages(False, 'serial/', testModeFlag=True)
+        parallelSets, parallelPages = self.makeWordPages(True, 'parallel/', testModeFlag=True)
+        self.assertTrue(any(filename.startswith(f'HebWrd/{State.TEST_OT_BOOK_LIST[0]}') for filename in serialPages))
+        self.assertTrue(any(filename.startswith(f'GrkWrd/{State.TEST_NT_BOOK_LIST[0]}') for filename in serialPages))
+        self.assertEqual(parallelSets, serialSets)
+        self.assertEqual(sorted(parallelPages), sorted(serialPages))
+        for filename, pageBytes in serialPages.items():
+            self.assertEqual(parallelPages[filename], pageBytes, filename)
+
+    def test_lemma_line_verse_parts_use_the_given_verse_linking(self):
+        get_Hebrew_lemma_line_verse_parts.cache_clear()
+        get_Greek_lemma_line_verse_parts.cache_clear()
+        for getVerseParts, BBB in ((get_Hebrew_lemma_line_verse_parts, 'GEN'), (get_Greek_lemma_line_verse_parts, 'JHN')):
+            OETLink, OET_LV_verse_HTML, OET_RV_verse_HTML = getVerseParts(3, BBB, '1', '1', False)[-3:]
+            self.assertNotIn('<a ', OETLink)
+            self.assertEqual((OET_LV_verse_HTML, OET_RV_verse_HTML), (None, None))
+            OETLink, OET_LV_verse_HTML, OET_RV_verse_HTML = getVerseParts(3, BBB, '1', '1', True)[-3:]
+            self.assertIn(f'href="../../../OET/byC/{BBB}_C1.htm#C1V1"', OETLink)
+            self.assertEqual((OET_LV_verse_HTML, OET_RV_verse_HTML), (f'<p class="LVVerseText">{BBB} 1:1</p>', f'<p class="RVVerseText">{BBB} 1:1</p>'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# wordIndexes.py
+#
+# Module handling the OpenBibleData cache of the word, lemma, form, and Strongs indexes
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling the OpenBibleData cache of the word, lemma, form, and Strongs indexes
+    that preprocessHebrewWordsLemmasGlosses() and preprocessGreekWordsLemmasGlosses() make
+    into state.OETRefData (e.g., 'OTFormUsageDict', 'OTLemmaGlossDict', 'NTStrongsRefs').
+
+The indexes (dicts and lists) for each testament are saved together
+    (e.g., '../OBD_WordTables/OET-LV_OT.OBD_WordIndexes') with a key
+    made from the hashes of the word table (and any other source files),
+    the BBB selections that they were preprocessed with, and the version of the preprocessing code,
+    so that they're only made again when one of those changes.
+
+In verification mode, the indexes are always made again and compared with the saved ones,
+    and a WordIndexesVerificationError is raised if they're different.
+
+WordIndexesVerificationError
+getWordIndexesKey( wordTable:WordTable, BBBSelections:tuple, sourceFilepaths:tuple[Path,...], codeVersion:str ) -> str
+loadWordIndexes( indexesFilepath:Path, indexesKey:str ) -> dict|None
+saveWordIndexes( indexesFilepath:Path, indexesKey:str, wordIndexes:dict ) -> None
+diffWordIndexes( savedIndexes:dict, madeIndexes:dict ) -> list[str]
+getWordIndexes( indexesName:str, indexesKey:str, makeIndexes:Callable[[],dict], cacheFolderPath:Path|None, verify:bool=False ) -> dict
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version
+"""
+from collections.abc import Callable
+from pathlib import Path
+import os
+import json
+import struct
+import pickle
+import hashlib
+import logging
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+from wordTable import WordTable
+from wordTableIndex import getWordTableHash
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "wordIndexes"
+PROGRAM_NAME = "OpenBibleData word indexes cache"
+PROGRAM_VERSION = '0.10'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+WORD_INDEXES_FILENAME_END = '.OBD_WordIndexes'
+WORD_INDEXES_MAGIC = b'OBDI'
+WORD_INDEXES_FORMAT_VERSION = 1
+_PREFIX_STRUCT = struct.Struct( '<4sBI' ) # magic, version, header length
+MAX_LOGGED_DIFFERENCES = 5 # For each index
+
+
+class WordIndexesVerificationError( Exception ): pass
+
+
+def getWordIndexesKey( wordTable:WordTable, BBBSelections:tuple, sourceFilepaths:tuple[Path,...], codeVersion:str ) -> str:
+    """
+    Returns a hash of everything that the indexes are made from.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"getWordIndexesKey( {wordTable}, {BBBSelections}, {sourceFilepaths}, {codeVersion} )" )
+    hasher = hashlib.sha256()
+    hasher.update( json.dumps( { 'wordTable':wordTable.filename, 'wordTableHash':getWordTableHash( wordTable ),
+                                 'BBBSelections':BBBSelections, 'codeVersion':codeVersion } ).encode( 'utf-8' ) )
+    for sourceFilepath in sourceFilepaths:
+        with open( sourceFilepath, 'rb' ) as sourceFile:
+            hasher.update( hashlib.file_digest( sourceFile, 'sha256' ).digest() )
+    return hasher.hexdigest()
+# end of wordIndexes.getWordIndexesKey
+
+
+def saveWordIndexes( indexesFilepath:Path, indexesKey:str, wordIndexes:dict ) -> None:
+    """
+    Save the indexes (pickled) after our prefix and header.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"saveWordIndexes( {indexesFilepath}, {indexesKey}, ({len(wordIndexes)}) )" )
+    headerBytes = json.dumps( { 'indexesKey':indexesKey, 'indexNames':list( wordIndexes ) } ).encode( 'utf-8' )
+    os.makedirs( indexesFilepath.parent, exist_ok=True )
+    tempFilepath = Path( f'{indexesFilepath}.tmp' )
+    with open( tempFilepath, 'wb' ) as indexesFile:
+        indexesFile.write( _PREFIX_STRUCT.pack( WORD_INDEXES_MAGIC, WORD_INDEXES_FORMAT_VERSION, len(headerBytes) ) )
+        indexesFile.write( headerBytes )
+        pickle.dump( wordIndexes, indexesFile, pickle.HIGHEST_PROTOCOL )
+    os.replace( tempFilepath, indexesFilepath ) # So a part-written file is never used
+# end of wordIndexes.saveWordIndexes
+
+
+def loadWordIndexes( indexesFilepath:Path, indexesKey:str ) -> dict|None:
+    """
+    Returns None if there's no indexes saved with this key.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"loadWordIndexes( {indexesFilepath}, {indexesKey} )" )
+    try:
+        with open( indexesFilepath, 'rb' ) as indexesFile:
+            prefixBytes = indexesFile.read( _PREFIX_STRUCT.size )
+            if len(prefixBytes) < _PREFIX_STRUCT.size: return None
+            magic, formatVersion, headerLength = _PREFIX_STRUCT.unpack( prefixBytes )
+            if magic != WORD_INDEXES_MAGIC or formatVersion != WORD_INDEXES_FORMAT_VERSION: return None
+            header = json.loads( indexesFile.read( headerLength ) )
+            if header['indexesKey'] != indexesKey: return None
+            wordIndexes = pickle.load( indexesFile )
+    except FileNotFoundError: return None # Not saved yet
+    except (OSError, EOFError, json.JSONDecodeError, KeyError, pickle.UnpicklingError) as err:
+        logging.warning( f"Unable to load word indexes from {indexesFilepath}: {err}" )
+        return None
+    if not isinstance( wordIndexes, dict ) or list( wordIndexes ) != header['indexNames']: return None
+    return wordIndexes
+# end of wordIndexes.loadWordIndexes
+
+
+def diffWordIndexes( savedIndexes:dict, madeIndexes:dict ) -> list[str]:
+    """
+    Returns a list of the differences between the saved and the made indexes (or an empty list if they're the same).
+
+    The order of the keys in the dicts is also compared (because the pages are made in that order).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"diffWordIndexes( ({len(savedIndexes)}), ({len(madeIndexes)}) )" )
+    differences = []
+    for indexName in savedIndexes.keys() - madeIndexes.keys():
+        differences.append( f"{indexName} was saved but not made" )
+    for indexName in madeIndexes.keys() - savedIndexes.keys():
+        differences.append( f"{indexName} was made but not saved" )
+    for indexName, madeIndex in madeIndexes.items():
+        if indexName not in savedIndexes: continue
+        savedIndex = savedIndexes[indexName]
+        if isinstance( madeIndex, dict ) and isinstance( savedIndex, dict ):
+            if savedIndex == madeIndex:
+                if list( savedIndex ) != list( madeIndex ):
+                    differences.append( f"{indexName} has the same {len(madeIndex):,} entries but in a different order" )
+                continue
+            differentKeys = [key for key in savedIndex.keys() | madeIndex.keys() if savedIndex.get( key ) != madeIndex.get( key )]
+            differences.append( f"{indexName} has {len(differentKeys):,} different entries (of {len(madeIndex):,} made and {len(savedIndex):,} saved)" )
+            for key in sorted( differentKeys, key=repr )[:MAX_LOGGED_DIFFERENCES]:
+                differences.append( f"  {indexName}[{key!r}]: saved {savedIndex.get( key, 'nothing' )!r} but made {madeIndex.get( key, 'nothing' )!r}" )
+        elif savedIndex != madeIndex:
+            differences.append( f"{indexName} is different: saved {type(savedIndex).__name__} of {len(savedIndex):,} but made {type(madeIndex).__name__} of {len(madeIndex):,}" )
+    return differences
+# end of wordIndexes.diffWordIndexes
+
+
+def getWordIndexes( indexesName:str, indexesKey:str, makeIndexes:Callable[[],dict], cacheFolderPath:Path|None, verify:bool=False ) -> dict:
+    """
+    Returns the indexes saved in cacheFolderPath with this key
+        else calls makeIndexes() to make them (and saves them for next time).
+
+    If cacheFolderPath is None, the indexes are just made.
+
+    If verify is set, the indexes are always made,
+        and a WordIndexesVerificationError is raised if they're different from the saved ones.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"getWordIndexes( {indexesName}, {indexesKey}, {makeIndexes}, {cacheFolderPath}, {verify} )" )
+    if cacheFolderPath is None: return makeIndexes()
+
+    indexesFilepath = Path( cacheFolderPath ).joinpath( f'{indexesName}{WORD_INDEXES_FILENAME_END}' )
+    savedIndexes = loadWordIndexes( indexesFilepath, indexesKey )
+    if savedIndexes is not None and not verify:
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Loaded {len(savedIndexes)} {indexesName} word indexes from {indexesFilepath}." )
+        return savedIndexes
+
+    madeIndexes = makeIndexes()
+    if savedIndexes is not None: # so we're verifying them
+        differences = diffWordIndexes( savedIndexes, madeIndexes )
+        if differences:
+            for difference in differences: logging.error( f"{indexesName} word indexes: {difference}" )
+            raise WordIndexesVerificationError( f"The {indexesName} word indexes saved in {indexesFilepath} are different from the ones just made ({len(differences):,} differences)" )
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Verified {len(madeIndexes)} {indexesName} word indexes saved in {indexesFilepath}." )
+        return madeIndexes
+    try: saveWordIndexes( indexesFilepath, indexesKey, madeIndexes )
+    except (OSError, pickle.PicklingError) as err:
+        logging.error( f"Unable to save {indexesName} word indexes to {indexesFilepath}: {err}" )
+        # But we ignore it (they'll just be made again next time)
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Made {len(madeIndexes)} {indexesName} word indexes." )
+    return madeIndexes
+# end of wordIndexes.getWordIndexes
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the word indexes cache
+    import tempfile
+    from collections import defaultdict
+    wordTable = WordTable( 'DEMO_NT_word_table.tsv', ['Ref\tGreekWord',
+                                                    'JHN_3:16w1\tΟὕτως', 'JHN_3:16w2\tγὰρ', 'JHN_3:17w1\tοὐ'] )
+    def makeDemoIndexes() -> dict:
+        formUsageDict = defaultdict(list)
+        for n, (_ref, greekWord) in enumerate( wordTable.iterFields(), start=1 ):
+            formUsageDict[greekWord].append( n )
+        return { 'DemoFormUsageDict':formUsageDict }
+    indexesKey = getWordIndexesKey( wordTable, ('JHN',), (), PROGRAM_VERSION )
+    with tempfile.TemporaryDirectory() as tempFolder:
+        getWordIndexes( 'DEMO_NT', indexesKey, makeDemoIndexes, Path( tempFolder ) ) # Makes and saves them
+        wordIndexes = getWordIndexes( 'DEMO_NT', indexesKey, makeDemoIndexes, Path( tempFolder ) ) # Loads them
+        getWordIndexes( 'DEMO_NT', indexesKey, makeDemoIndexes, Path( tempFolder ), verify=True ) # Makes and compares them
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {wordIndexes=}" )
+# end of wordIndexes.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of wordIndexes.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of wordIndexes.py
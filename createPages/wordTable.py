@@ -0,0 +1,527 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# wordTable.py
+#
+# Module handling the OpenBibleData columnar OET word tables
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling the OpenBibleData columnar OET word tables.
+
+The OET-LV ESFM Bible loads each word table as a list of TSV lines (with the column headers in the first line).
+Rather than having every word page, verse, and interlinear function split the same lines again and again,
+    each table is split once into a WordTable which holds a tuple for each column.
+
+The rows keep the same numbers as the ESFM word numbers (and as the lines in the TSV file),
+    so row 0 is the header line, and each column tuple is indexed by row number (with the column name at index 0).
+All of the fields are kept as the strs from the TSV file (so consumers still compare with, e.g., 'None' or 'X'),
+    but equal fields in a column share the same str object.
+A blank line (e.g., at the end of the file) keeps its row number, but has an empty str in every column.
+
+The WordTable still behaves like the list of TSV lines (e.g., wordTable[n] and len(wordTable))
+    for anything that wants the original line.
+
+Loading the OET word tables from the TSV files as lists of strs (and then splitting them) costs hundreds of MB,
+    so each table can also be saved in a binary form (e.g., '../OBD_WordTables/OET-LV_OT_word_table.OBD_WordTable'):
+        a small header (with the size and time of the TSV file that it was made from),
+        a row offset array (the start of each row in the blob),
+        a column offset array (the start of each field relative to the start of its row),
+        and then all the rows as one UTF-8 blob (without the tabs and newlines being removed).
+getMappedWordTable() only rewrites this when the TSV file has changed,
+    and then returns a MappedWordTable which opens it with mmap.
+A MappedWordTable has the same methods as a WordTable but only decodes a field (or row) when it's asked for,
+    and because the pages are mapped from the file, forked worker processes share them for free.
+A MappedWordTable pickles as just its filename and binary filepath (and is mapped again when it's unpickled).
+
+Many columns (e.g., morphology, Strongs, lemmas, roles, tags) only have a few thousand different values,
+    so getEncodedColumn() gives them as an EncodedColumn: an array of small int codes (one per row)
+    plus a tuple of the different values (indexed by code).
+This means that consumers can group and count rows by the codes
+    and only do any processing of each value once.
+The encoded columns are made the first time they're asked for (and then kept with the table).
+
+WordTable( filename:str, rows:list[str] )
+    getColumn( columnName:str ) -> tuple[str,...]
+    getField( rowNumber:int, columnName:str ) -> str
+    getFields( rowNumber:int ) -> tuple[str,...]
+    getRow( rowNumber:int ) -> WordTableRow
+    iterFields( startRowNumber:int=1 )
+    getEncodedColumn( columnName:str ) -> EncodedColumn
+    getEncodedColumns( *columnNames:str ) -> tuple[EncodedColumn,...]
+WordTableRow( wordTable:WordTable, rowNumber:int )
+EncodedColumn( columnName:str, codes:array, values:tuple[str,...] )
+saveBinaryWordTable( rows:list[str], binaryFilepath:Path, sourceFilepath:Path ) -> None
+isBinaryWordTableCurrent( binaryFilepath:Path, sourceFilepath:Path ) -> bool
+MappedWordTable( filename:str, binaryFilepath:Path )
+getMappedWordTable( filename:str, sourceFilepath:Path, binaryFolderPath:Path, rows:list[str]|None=None ) -> MappedWordTable
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version
+    2026-10-16 Add binary word table files and MappedWordTable (using mmap)
+    2026-10-16 Add dictionary-encoded columns (EncodedColumn)
+"""
+from collections.abc import Sequence
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+import os
+import sys
+import mmap
+import json
+import struct
+import pickle
+import logging
+from array import array
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "wordTable"
+PROGRAM_NAME = "OpenBibleData word table handler"
+PROGRAM_VERSION = '0.12'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+BINARY_WORD_TABLE_FILENAME_END = '.OBD_WordTable'
+BINARY_WORD_TABLE_MAGIC = b'OBDW'
+BINARY_WORD_TABLE_FORMAT_VERSION = 1
+_PREFIX_STRUCT = struct.Struct( '<4sBI' ) # magic, version, header length
+_ROW_OFFSET_TYPECODE, _COLUMN_OFFSET_TYPECODE = 'Q', 'H' # So no row can be longer than 64KB
+_ALIGNMENT = 8
+
+
+class WordTable( Sequence ):
+    """
+    An OET word table split into columns (once).
+
+    Indexing or iterating it still gives the original TSV lines.
+    """
+    def __init__( self, filename:str, rows:list[str] ) -> None:
+        """
+        Raises a ValueError if any (non-blank) line has the wrong number of fields.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"WordTable.__init__( {filename}, ({len(rows):,}) )" )
+        self.filename, self.rows = filename, rows # The rows are shared (not copied) so cost no extra memory
+        self.columnNames = tuple( rows[0].split( '\t' ) )
+        self.columnIndexes = { columnName:columnIndex for columnIndex,columnName in enumerate( self.columnNames ) }
+        numColumns = len(self.columnNames)
+        blankFields = ('',) * numColumns
+
+        columnLists = [[columnName] for columnName in self.columnNames]
+        columnValues = [{} for _columnName in self.columnNames] # So that repeated fields share one str
+        for rowNumber, row in enumerate( rows[1:], start=1 ):
+            fields = row.split( '\t' ) if row else blankFields
+            if len(fields) != numColumns:
+                raise ValueError( f"{filename} row {rowNumber} has {len(fields)} fields (expected {numColumns}): {row!r}" )
+            for columnList, values, field in zip( columnLists, columnValues, fields ):
+                columnList.append( values.setdefault( field, field ) )
+        self.columns = tuple( tuple( columnList ) for columnList in columnLists )
+        self._encodedColumns = {} # Made by getEncodedColumn() when they're first asked for
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Split {filename} into {numColumns} columns of {len(rows)-1:,} rows." )
+    # end of WordTable.__init__
+
+    def __len__( self ) -> int:
+        return len(self.rows)
+    def __getitem__( self, rowNumber:int ) -> str: # The original TSV line
+        return self.rows[rowNumber]
+    def __iter__( self ):
+        return iter( self.rows )
+    def __repr__( self ) -> str:
+        return f"WordTable( {self.filename}, {len(self.columnNames)} columns, {len(self.rows)-1:,} rows )"
+
+    def getColumn( self, columnName:str ) -> tuple[str,...]:
+        """
+        Returns the column tuple (indexed by row number).
+
+        Fetch this once before a loop rather than calling getField() for every row.
+        """
+        return self.columns[self.columnIndexes[columnName]]
+    # end of WordTable.getColumn
+
+    def getField( self, rowNumber:int, columnName:str ) -> str:
+        return self.columns[self.columnIndexes[columnName]][rowNumber]
+    # end of WordTable.getField
+
+    def getFields( self, rowNumber:int ) -> tuple[str,...]:
+        """
+        Returns all the fields of the row (in column order, like the old row.split( '\t' ) did).
+        """
+        return tuple( map( itemgetter( rowNumber ), self.columns ) )
+    # end of WordTable.getFields
+
+    def getRow( self, rowNumber:int ) -> 'WordTableRow':
+        return WordTableRow( self, rowNumber )
+    # end of WordTable.getRow
+
+    def iterFields( self, startRowNumber:int=1 ):
+        """
+        Yields the fields of each row (like getFields()) starting from the given row number.
+        """
+        return zip( *(islice( column, startRowNumber, None ) for column in self.columns) )
+    # end of WordTable.iterFields
+
+    def getEncodedColumn( self, columnName:str ) -> 'EncodedColumn':
+        """
+        Returns the column encoded as small int codes (made the first time that it's asked for).
+        """
+        try: return self._encodedColumns[columnName]
+        except KeyError: pass
+        encodedColumn = self._encodedColumns[columnName] = EncodedColumn.fromColumn( columnName, self.getColumn( columnName ) )
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Encoded {self.filename} {encodedColumn}." )
+        return encodedColumn
+    # end of WordTable.getEncodedColumn
+
+    def getEncodedColumns( self, *columnNames:str ) -> tuple['EncodedColumn',...]:
+        return tuple( self.getEncodedColumn( columnName ) for columnName in columnNames )
+    # end of WordTable.getEncodedColumns
+# end of class WordTable
+
+
+class WordTableRow:
+    """
+    A view of one row of a WordTable (which doesn't copy any of the fields).
+
+    Fields can be fetched by column name or by column index, e.g., row['GreekWord'] or row[1].
+    """
+    __slots__ = ('wordTable', 'rowNumber')
+
+    def __init__( self, wordTable:WordTable, rowNumber:int ) -> None:
+        if not 0 < rowNumber < len(wordTable):
+            raise IndexError( f"{wordTable.filename} has no row {rowNumber}" )
+        self.wordTable, self.rowNumber = wordTable, rowNumber
+    def __getitem__( self, column:str|int ) -> str:
+        return self.wordTable.columns[self.wordTable.columnIndexes[column] if isinstance( column, str ) else column][self.rowNumber]
+    def __len__( self ) -> int:
+        return len(self.wordTable.columns)
+    def __repr__( self ) -> str:
+        return f"WordTableRow( {self.wordTable.filename}, {self.rowNumber} )"
+
+    def getFields( self ) -> tuple[str,...]:
+        return self.wordTable.getFields( self.rowNumber )
+# end of class WordTableRow
+
+
+class EncodedColumn:
+    """
+    A word table column as an array of int codes (indexed by row number)
+        and a tuple of the different values (indexed by code).
+
+    As in the WordTable columns, row 0 has the column name.
+    """
+    __slots__ = ('columnName', 'codes', 'values')
+
+    def __init__( self, columnName:str, codes:array, values:tuple[str,...] ) -> None:
+        self.columnName, self.codes, self.values = columnName, codes, values
+    def __len__( self ) -> int:
+        return len(self.codes)
+    def __getitem__( self, rowNumber:int ) -> str:
+        return self.values[self.codes[rowNumber]]
+    def __repr__( self ) -> str:
+        return f"EncodedColumn( {self.columnName}, {len(self.codes)-1:,} rows, {len(self.values):,} values )"
+
+    @classmethod
+    def fromColumn( cls, columnName:str, column:Sequence[str] ) -> 'EncodedColumn':
+        """
+        Encode the column (in one pass), using the smallest int type that can hold the codes.
+        """
+        valueCodes = {}
+        codeList = [valueCodes.setdefault( value, len(valueCodes) ) for value in column]
+        typecode = 'B' if len(valueCodes) <= 0x100 else 'H' if len(valueCodes) <= 0x10000 else 'I'
+        return cls( columnName, array( typecode, codeList ), tuple( valueCodes ) )
+    # end of EncodedColumn.fromColumn
+
+    def getNumBytes( self ) -> int:
+        """
+        Returns the approximate memory used by the codes and the values.
+        """
+        return sys.getsizeof( self.codes ) + sys.getsizeof( self.values ) + sum( sys.getsizeof( value ) for value in self.values )
+    # end of EncodedColumn.getNumBytes
+# end of class EncodedColumn
+
+
+def _getSourceStat( sourceFilepath:Path ) -> dict:
+    sourceStat = os.stat( sourceFilepath )
+    return { 'sourceSize':sourceStat.st_size, 'sourceMTimeNs':sourceStat.st_mtime_ns }
+# end of wordTable._getSourceStat
+
+
+def _alignedLength( length:int ) -> int:
+    return (length + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+# end of wordTable._alignedLength
+
+
+def saveBinaryWordTable( rows:list[str], binaryFilepath:Path, sourceFilepath:Path ) -> None:
+    """
+    Save the rows (TSV lines, starting with the column headers) in our binary form.
+
+    The size and time of the source TSV file are saved in the header (so we can tell when it changes).
+
+    Raises a ValueError if any (non-blank) row has the wrong number of fields, or is too long.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"saveBinaryWordTable( ({len(rows):,}), {binaryFilepath}, {sourceFilepath} )" )
+    columnNames = rows[0].split( '\t' )
+    numColumns = len(columnNames)
+    maxColumnOffset = 2 ** (8 * array( _COLUMN_OFFSET_TYPECODE ).itemsize) - 1
+    rowOffsets, columnOffsets, blobParts, blobLength = array( _ROW_OFFSET_TYPECODE ), array( _COLUMN_OFFSET_TYPECODE ), [], 0
+    for rowNumber, row in enumerate( rows ):
+        rowBytes = row.encode( 'utf-8' )
+        if len(rowBytes) > maxColumnOffset:
+            raise ValueError( f"{sourceFilepath} row {rowNumber} is too long ({len(rowBytes):,} bytes)" )
+        rowOffsets.append( blobLength )
+        if rowBytes:
+            fields = row.split( '\t' )
+            if len(fields) != numColumns:
+                raise ValueError( f"{sourceFilepath} row {rowNumber} has {len(fields)} fields (expected {numColumns}): {row!r}" )
+            fieldOffset = 0
+            for field in fields:
+                columnOffsets.append( fieldOffset )
+                fieldOffset += len( field.encode( 'utf-8' ) ) + 1 # Plus the tab
+        else: columnOffsets.extend( [0] * numColumns ) # A blank row (has an empty field in every column)
+        blobParts.append( rowBytes )
+        blobLength += len(rowBytes)
+    rowOffsets.append( blobLength ) # So every row has an end offset
+
+    headerBytes = json.dumps( { 'numRows':len(rows), 'columnNames':columnNames, 'byteOrder':sys.byteorder,
+                                **_getSourceStat( sourceFilepath ) } ).encode( 'utf-8' )
+    headerLength = _alignedLength( _PREFIX_STRUCT.size + len(headerBytes) ) - _PREFIX_STRUCT.size
+    rowOffsetsBytes, columnOffsetsBytes = rowOffsets.tobytes(), columnOffsets.tobytes()
+    os.makedirs( Path( binaryFilepath ).parent, exist_ok=True )
+    tempFilepath = Path( f'{binaryFilepath}.tmp' )
+    with open( tempFilepath, 'wb' ) as binaryFile:
+        binaryFile.write( _PREFIX_STRUCT.pack( BINARY_WORD_TABLE_MAGIC, BINARY_WORD_TABLE_FORMAT_VERSION, headerLength ) )
+        binaryFile.write( headerBytes.ljust( headerLength ) )
+        binaryFile.write( rowOffsetsBytes ) # Already a multiple of _ALIGNMENT bytes
+        binaryFile.write( columnOffsetsBytes.ljust( _alignedLength( len(columnOffsetsBytes) ), b'\0' ) )
+        for rowBytes in blobParts:
+            binaryFile.write( rowBytes )
+    os.replace( tempFilepath, binaryFilepath ) # So a part-written file is never used
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Saved {len(rows)-1:,} rows of {sourceFilepath} into {binaryFilepath} ({os.path.getsize( binaryFilepath )/1_000_000:,.1f} MB)." )
+# end of wordTable.saveBinaryWordTable
+
+
+def _readBinaryWordTableHeader( binaryFile ) -> dict:
+    """
+    Returns the header dict (plus 'dataOffset')
+
+    Raises a pickle.UnpicklingError if it's not one of our binary word tables (or is for another byte order).
+    """
+    prefixBytes = binaryFile.read( _PREFIX_STRUCT.size )
+    if len(prefixBytes) < _PREFIX_STRUCT.size:
+        raise pickle.UnpicklingError( f"{binaryFile.name} is too short to be a binary word table" )
+    magic, formatVersion, headerLength = _PREFIX_STRUCT.unpack( prefixBytes )
+    if magic != BINARY_WORD_TABLE_MAGIC or formatVersion != BINARY_WORD_TABLE_FORMAT_VERSION:
+        raise pickle.UnpicklingError( f"{binaryFile.name} isn't a version {BINARY_WORD_TABLE_FORMAT_VERSION} binary word table" )
+    header = json.loads( binaryFile.read( headerLength ) )
+    if header['byteOrder'] != sys.byteorder:
+        raise pickle.UnpicklingError( f"{binaryFile.name} was made on a {header['byteOrder']}-endian computer" )
+    header['dataOffset'] = _PREFIX_STRUCT.size + headerLength
+    return header
+# end of wordTable._readBinaryWordTableHeader
+
+
+def isBinaryWordTableCurrent( binaryFilepath:Path, sourceFilepath:Path ) -> bool:
+    """
+    Returns True if the binary word table was made from the source TSV file as it is now.
+    """
+    try:
+        with open( binaryFilepath, 'rb' ) as binaryFile:
+            header = _readBinaryWordTableHeader( binaryFile )
+    except (OSError, pickle.UnpicklingError, json.JSONDecodeError, KeyError): return False
+    try: return all( header[key] == value for key,value in _getSourceStat( sourceFilepath ).items() )
+    except OSError: return False # No source file
+# end of wordTable.isBinaryWordTableCurrent
+
+
+class _MappedColumn( Sequence ):
+    """
+    A column of a MappedWordTable (indexed by row number, with the column name at index 0).
+
+    Each field is only decoded when it's asked for.
+    """
+    __slots__ = ('wordTable', 'columnIndex')
+
+    def __init__( self, wordTable:'MappedWordTable', columnIndex:int ) -> None:
+        self.wordTable, self.columnIndex = wordTable, columnIndex
+    def __len__( self ) -> int:
+        return len(self.wordTable)
+    def __getitem__( self, rowNumber:int|slice ) -> str|list[str]:
+        if isinstance( rowNumber, slice ):
+            return [self.wordTable._getFieldByIndex( n, self.columnIndex ) for n in range( *rowNumber.indices( len(self.wordTable) ) )]
+        return self.wordTable._getFieldByIndex( rowNumber, self.columnIndex )
+    def __repr__( self ) -> str:
+        return f"_MappedColumn( {self.wordTable.filename}, {self.wordTable.columnNames[self.columnIndex]} )"
+# end of class _MappedColumn
+
+
+class MappedWordTable( WordTable ):
+    """
+    An OET word table in our binary form opened with mmap.
+
+    It has the same methods as a WordTable, but decodes the fields (and rows) only when they're asked for.
+    """
+    def __init__( self, filename:str, binaryFilepath:Path ) -> None:
+        """
+        Raises a pickle.UnpicklingError if it's not one of our binary word tables.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"MappedWordTable.__init__( {filename}, {binaryFilepath} )" )
+        self.filename, self.binaryFilepath = filename, Path( binaryFilepath )
+        with open( binaryFilepath, 'rb' ) as binaryFile:
+            header = _readBinaryWordTableHeader( binaryFile )
+            self.mmap = mmap.mmap( binaryFile.fileno(), 0, access=mmap.ACCESS_READ ) # Stays open after the file is closed
+        self.numRows = header['numRows']
+        self.columnNames = tuple( header['columnNames'] )
+        self.columnIndexes = { columnName:columnIndex for columnIndex,columnName in enumerate( self.columnNames ) }
+        self.numColumns = len(self.columnNames)
+
+        mappedView = memoryview( self.mmap )
+        rowOffsetsStart = header['dataOffset']
+        columnOffsetsStart = rowOffsetsStart + (self.numRows + 1) * struct.calcsize( _ROW_OFFSET_TYPECODE )
+        columnOffsetsLength = self.numRows * self.numColumns * struct.calcsize( _COLUMN_OFFSET_TYPECODE )
+        self.blobStart = columnOffsetsStart + _alignedLength( columnOffsetsLength )
+        self.rowOffsets = mappedView[rowOffsetsStart:columnOffsetsStart].cast( _ROW_OFFSET_TYPECODE )
+        self.columnOffsets = mappedView[columnOffsetsStart:columnOffsetsStart+columnOffsetsLength].cast( _COLUMN_OFFSET_TYPECODE )
+        if self.blobStart + self.rowOffsets[-1] != len(self.mmap):
+            raise pickle.UnpicklingError( f"{binaryFilepath} is the wrong length ({len(self.mmap):,} bytes)" )
+        self.columns = tuple( _MappedColumn( self, columnIndex ) for columnIndex in range( self.numColumns ) )
+        self._encodedColumns = {}
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Mapped {filename} with {self.numColumns} columns of {self.numRows-1:,} rows from {binaryFilepath}." )
+    # end of MappedWordTable.__init__
+
+    def __reduce__( self ): # We don't pickle the mmap, just where to find it again
+        return MappedWordTable, (self.filename, self.binaryFilepath)
+
+    def __len__( self ) -> int:
+        return self.numRows
+    def __getitem__( self, rowNumber:int|slice ) -> str|list[str]: # The original TSV line(s)
+        if isinstance( rowNumber, slice ):
+            return [self[n] for n in range( *rowNumber.indices( self.numRows ) )]
+        if rowNumber < 0: rowNumber += self.numRows
+        if not 0 <= rowNumber < self.numRows: raise IndexError( f"{self.filename} has no row {rowNumber}" )
+        return self.mmap[self.blobStart+self.rowOffsets[rowNumber]:self.blobStart+self.rowOffsets[rowNumber+1]].decode( 'utf-8' )
+    def __iter__( self ):
+        return (self[n] for n in range( self.numRows ))
+    def __repr__( self ) -> str:
+        return f"MappedWordTable( {self.filename}, {self.numColumns} columns, {self.numRows-1:,} rows )"
+
+    def _getFieldByIndex( self, rowNumber:int, columnIndex:int ) -> str:
+        if rowNumber == 0: return self.columnNames[columnIndex] # Same as WordTable
+        if rowNumber < 0: rowNumber += self.numRows
+        if not 0 <= rowNumber < self.numRows: raise IndexError( f"{self.filename} has no row {rowNumber}" )
+        rowStart, rowEnd = self.rowOffsets[rowNumber], self.rowOffsets[rowNumber+1]
+        if rowStart == rowEnd: return '' # Blank row
+        columnOffsetIndex = rowNumber * self.numColumns + columnIndex
+        fieldStart = rowStart + self.columnOffsets[columnOffsetIndex]
+        fieldEnd = rowEnd if columnIndex == self.numColumns - 1 else rowStart + self.columnOffsets[columnOffsetIndex+1] - 1 # Before the tab
+        return self.mmap[self.blobStart+fieldStart:self.blobStart+fieldEnd].decode( 'utf-8' )
+    # end of MappedWordTable._getFieldByIndex
+
+    def getField( self, rowNumber:int, columnName:str ) -> str:
+        return self._getFieldByIndex( rowNumber, self.columnIndexes[columnName] )
+    # end of MappedWordTable.getField
+
+    def getFields( self, rowNumber:int ) -> tuple[str,...]:
+        """
+        Returns all the fields of the row (in column order, like the old row.split( '\t' ) did).
+        """
+        row = self[rowNumber]
+        return tuple( row.split( '\t' ) ) if row or rowNumber == 0 else ('',) * self.numColumns
+    # end of MappedWordTable.getFields
+
+    def iterFields( self, startRowNumber:int=1 ):
+        """
+        Yields the fields of each row (like getFields()) starting from the given row number.
+        """
+        return (self.getFields( n ) for n in range( startRowNumber, self.numRows ))
+    # end of MappedWordTable.iterFields
+# end of class MappedWordTable
+
+
+def getMappedWordTable( filename:str, sourceFilepath:Path, binaryFolderPath:Path, rows:list[str]|None=None ) -> MappedWordTable:
+    """
+    Returns the word table (from the source TSV file) mapped from its binary form in binaryFolderPath,
+        first (re)making the binary form if the source file has changed.
+
+    rows can be given if the TSV file has already been loaded (as a list of lines),
+        otherwise it's read from sourceFilepath (only if the binary form needs to be remade).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"getMappedWordTable( {filename}, {sourceFilepath}, {binaryFolderPath}, {None if rows is None else len(rows)} )" )
+    binaryFilepath = Path( binaryFolderPath ).joinpath( f'{Path( filename ).stem}{BINARY_WORD_TABLE_FILENAME_END}' )
+    if not isBinaryWordTableCurrent( binaryFilepath, sourceFilepath ):
+        if rows is None:
+            with open( sourceFilepath, 'rt', encoding='utf-8' ) as sourceFile:
+                sourceText = sourceFile.read()
+            if sourceText.startswith( BibleOrgSysGlobals.BOM ):
+                logging.info( f"getMappedWordTable: Detected UTF-16 Byte Order Marker in {sourceFilepath}" )
+                sourceText = sourceText[1:] # Remove the Unicode Byte Order Marker (BOM)
+            rows = sourceText.rstrip( '\n' ).split( '\n' ) # Remove any blank line at the end then split
+        saveBinaryWordTable( rows, binaryFilepath, sourceFilepath )
+    return MappedWordTable( filename, binaryFilepath )
+# end of wordTable.getMappedWordTable
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the WordTable object
+    wordTable = WordTable( 'DEMO_NT_word_table.tsv', ['Ref\tGreekWord\tProbability',
+                                                    'JHN_3:16w1\tΟὕτως\tX', 'JHN_3:16w2\tγὰρ\tX', ''] )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {wordTable} {wordTable.getColumn('GreekWord')=} {wordTable.getFields(2)=} {wordTable.getRow(1)['Ref']=}" )
+
+    # Demo the MappedWordTable object
+    import tempfile
+    with tempfile.TemporaryDirectory() as tempFolder:
+        sourceFilepath = Path( tempFolder ).joinpath( wordTable.filename )
+        with open( sourceFilepath, 'wt', encoding='utf-8' ) as sourceFile:
+            sourceFile.write( '\n'.join( wordTable.rows ) )
+        mappedWordTable = getMappedWordTable( wordTable.filename, sourceFilepath, tempFolder )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {mappedWordTable} {mappedWordTable.getColumn('GreekWord')[1:]=} {mappedWordTable.getFields(2)=} {mappedWordTable.getRow(1)['Ref']=}" )
+# end of wordTable.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of wordTable.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of wordTable.py
@@ -0,0 +1,296 @@
+#!/usr/bin/env -S uv run
+# -\*- coding: utf-8 -\*-
+# SPDX-FileCopyrightText: © 2026 Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# wordTableIndex.py
+#
+# Module handling the OpenBibleData BCV indexes of the OET word tables
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+OBD@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module handling the OpenBibleData BCV indexes of the OET word tables.
+
+For each word table, state.OETRefData['word_table_indexes'][wordTableFilename] is a WordTableIndex
+    which gives the first and last word (row) numbers for each verse, e.g., wordTableIndex.getWordNumberRange( 'MAT', '1', '1' ).
+
+Rather than a dict with string keys like 'MAT_1:1',
+    the index is three sorted integer arrays:
+        the packed (book reference number, chapter, verse) codes (see packBCV()),
+        the first word number of each verse, and the last word number of each verse,
+    and each lookup is a bisect of the codes.
+
+The index is made in one pass down the 'Ref' column of the word table,
+    and saved (e.g., '../OBD_WordTables/OET-LV_NT_word_table.OBD_WordTableIndex') with the hash of the word table
+    so that it's only made again when the word table changes.
+
+packBCV( BBB:str, C:str|int, V:str|int ) -> int
+WordTableIndex( codes:array, firstWordNumbers:array, lastWordNumbers:array )
+    getWordNumberRange( BBB:str, C:str|int, V:str|int ) -> tuple[int,int]
+    getRefWordNumberRange( BCVref:str ) -> tuple[int,int]
+buildWordTableIndex( wordTable:WordTable ) -> WordTableIndex
+getWordTableHash( wordTable:WordTable ) -> str
+getWordTableIndex( wordTableFilename:str, wordTable:WordTable, cacheFolderPath:Path|None ) -> WordTableIndex
+briefDemo() -> None
+fullDemo() -> None
+
+
+CHANGELOG:
+    2026-10-16 First version
+    2026-10-16 Make getWordTableHash() public (also used by wordIndexes.py)
+"""
+from pathlib import Path
+import os
+import sys
+import json
+import struct
+import hashlib
+import logging
+from array import array
+from bisect import bisect_left
+
+import BibleOrgSys.BibleOrgSysGlobals as BibleOrgSysGlobals
+from BibleOrgSys.BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+import bos_books_codes_py
+
+from wordTable import WordTable, MappedWordTable
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "wordTableIndex"
+PROGRAM_NAME = "OpenBibleData word table index handler"
+PROGRAM_VERSION = '0.11'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False # Adds debugging output
+
+
+WORD_TABLE_INDEX_FILENAME_END = '.OBD_WordTableIndex'
+WORD_TABLE_INDEX_MAGIC = b'OBDX'
+WORD_TABLE_INDEX_FORMAT_VERSION = 1
+_PREFIX_STRUCT = struct.Struct( '<4sBI' ) # magic, version, header length
+_TYPECODE = 'I' # For the codes and word numbers
+_BOOK_MULTIPLIER, _CHAPTER_MULTIPLIER = 1_000_000, 1_000 # So chapters and verses must be less than 1,000
+
+_bookReferenceNumbers:dict[str,int] = {}
+
+
+def packBCV( BBB:str, C:str|int, V:str|int ) -> int:
+    """
+    Returns an int that sorts in the same order as the references.
+
+    Raises a ValueError if the chapter or verse isn't a (small enough) number.
+    """
+    try: bookReferenceNumber = _bookReferenceNumbers[BBB]
+    except KeyError:
+        bookReferenceNumber = _bookReferenceNumbers[BBB] = bos_books_codes_py.get_reference_number( BBB )
+    intC, intV = int( C ), int( V )
+    if not (0 <= intC < _CHAPTER_MULTIPLIER and 0 <= intV < _CHAPTER_MULTIPLIER):
+        raise ValueError( f"Can't pack {BBB} {C}:{V}" )
+    return bookReferenceNumber * _BOOK_MULTIPLIER + intC * _CHAPTER_MULTIPLIER + intV
+# end of wordTableIndex.packBCV
+
+
+def _unpackBCVref( BCVref:str ) -> tuple[str,str,str]:
+    """
+    Splits a reference like 'MAT_1:1' into 'MAT', '1', '1'
+    """
+    BBB, CV = BCVref.split( '_', 1 )
+    C, V = CV.split( ':', 1 )
+    return BBB, C, V
+# end of wordTableIndex._unpackBCVref
+
+
+class WordTableIndex:
+    """
+    The first and last word (row) numbers in a word table for each verse.
+    """
+    def __init__( self, codes:array, firstWordNumbers:array, lastWordNumbers:array ) -> None:
+        """
+        The codes must be sorted (with the word numbers in the same order).
+        """
+        self.codes, self.firstWordNumbers, self.lastWordNumbers = codes, firstWordNumbers, lastWordNumbers
+    # end of WordTableIndex.__init__
+
+    def __len__( self ) -> int:
+        return len(self.codes)
+    def __repr__( self ) -> str: # Doesn't change between runs (so can be fingerprinted)
+        return f"WordTableIndex( {len(self.codes):,} verses )"
+
+    def getWordNumberRange( self, BBB:str, C:str|int, V:str|int ) -> tuple[int,int]:
+        """
+        Returns the first and last word numbers of the verse.
+
+        Raises a KeyError if the verse isn't in the word table (like the old dict did).
+        """
+        try: code = packBCV( BBB, C, V )
+        except ValueError: raise KeyError( f'{BBB}_{C}:{V}' )
+        ix = bisect_left( self.codes, code )
+        if ix == len(self.codes) or self.codes[ix] != code:
+            raise KeyError( f'{BBB}_{C}:{V}' )
+        return self.firstWordNumbers[ix], self.lastWordNumbers[ix]
+    # end of WordTableIndex.getWordNumberRange
+
+    def getRefWordNumberRange( self, BCVref:str ) -> tuple[int,int]:
+        """
+        Same as getWordNumberRange() but with a reference like 'MAT_1:1'.
+        """
+        try: BBB, C, V = _unpackBCVref( BCVref )
+        except ValueError: raise KeyError( BCVref )
+        return self.getWordNumberRange( BBB, C, V )
+    # end of WordTableIndex.getRefWordNumberRange
+# end of class WordTableIndex
+
+
+def buildWordTableIndex( wordTable:WordTable ) -> WordTableIndex:
+    """
+    Make the index in one pass down the 'Ref' column.
+
+    If a verse was in the table more than once (not next to each other), the last one is used.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"buildWordTableIndex( {wordTable} )" )
+    wordNumberRanges = {}
+    lastBCVref, startIx = None, 1
+    refColumn = wordTable.getColumn( 'Ref' )
+    for n in range( 1, len(refColumn) + 1 ):
+        BCVref = refColumn[n].split( 'w', 1 )[0] if n < len(refColumn) else None # Something like 'MAT_1:1' (or None at the end)
+        if BCVref == lastBCVref: continue
+        if lastBCVref: # not None or a blank row
+            try: wordNumberRanges[packBCV( *_unpackBCVref( lastBCVref ) )] = (startIx, n-1)
+            except ValueError as err:
+                logging.error( f"Unable to index {wordTable.filename} rows {startIx}-{n-1} for '{lastBCVref}': {err}" )
+        startIx, lastBCVref = n, BCVref
+
+    codes = array( _TYPECODE, sorted( wordNumberRanges ) )
+    return WordTableIndex( codes, array( _TYPECODE, (wordNumberRanges[code][0] for code in codes) ),
+                                  array( _TYPECODE, (wordNumberRanges[code][1] for code in codes) ) )
+# end of wordTableIndex.buildWordTableIndex
+
+
+def getWordTableHash( wordTable:WordTable ) -> str:
+    """
+    Hash the binary file of a MappedWordTable, or else the TSV lines.
+    """
+    if isinstance( wordTable, MappedWordTable ):
+        with open( wordTable.binaryFilepath, 'rb' ) as binaryFile:
+            return hashlib.file_digest( binaryFile, 'sha256' ).hexdigest()
+    hasher = hashlib.sha256()
+    for row in wordTable:
+        hasher.update( f'{row}\n'.encode( 'utf-8' ) )
+    return hasher.hexdigest()
+# end of wordTableIndex.getWordTableHash
+
+
+def _saveWordTableIndex( wordTableIndex:WordTableIndex, indexFilepath:Path, wordTableHash:str ) -> None:
+    headerBytes = json.dumps( { 'wordTableHash':wordTableHash, 'numVerses':len(wordTableIndex), 'byteOrder':sys.byteorder } ).encode( 'utf-8' )
+    os.makedirs( indexFilepath.parent, exist_ok=True )
+    tempFilepath = Path( f'{indexFilepath}.tmp' )
+    with open( tempFilepath, 'wb' ) as indexFile:
+        indexFile.write( _PREFIX_STRUCT.pack( WORD_TABLE_INDEX_MAGIC, WORD_TABLE_INDEX_FORMAT_VERSION, len(headerBytes) ) )
+        indexFile.write( headerBytes )
+        for indexArray in (wordTableIndex.codes, wordTableIndex.firstWordNumbers, wordTableIndex.lastWordNumbers):
+            indexArray.tofile( indexFile )
+    os.replace( tempFilepath, indexFilepath ) # So a part-written file is never used
+# end of wordTableIndex._saveWordTableIndex
+
+
+def _loadWordTableIndex( indexFilepath:Path, wordTableHash:str ) -> WordTableIndex|None:
+    """
+    Returns None if there's no index saved for this word table.
+    """
+    try:
+        with open( indexFilepath, 'rb' ) as indexFile:
+            prefixBytes = indexFile.read( _PREFIX_STRUCT.size )
+            if len(prefixBytes) < _PREFIX_STRUCT.size: return None
+            magic, formatVersion, headerLength = _PREFIX_STRUCT.unpack( prefixBytes )
+            if magic != WORD_TABLE_INDEX_MAGIC or formatVersion != WORD_TABLE_INDEX_FORMAT_VERSION: return None
+            header = json.loads( indexFile.read( headerLength ) )
+            if header['wordTableHash'] != wordTableHash or header['byteOrder'] != sys.byteorder: return None
+            indexArrays = []
+            for _ix in range( 3 ):
+                indexArray = array( _TYPECODE )
+                indexArray.fromfile( indexFile, header['numVerses'] )
+                indexArrays.append( indexArray )
+    except (OSError, EOFError, json.JSONDecodeError, KeyError): return None
+    return WordTableIndex( *indexArrays )
+# end of wordTableIndex._loadWordTableIndex
+
+
+def getWordTableIndex( wordTableFilename:str, wordTable:WordTable, cacheFolderPath:Path|None ) -> WordTableIndex:
+    """
+    Returns the index saved in cacheFolderPath for this word table (if it hasn't changed since)
+        else makes the index (and saves it for next time).
+
+    If cacheFolderPath is None, the index is just made.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"getWordTableIndex( {wordTableFilename}, {wordTable}, {cacheFolderPath} )" )
+    if cacheFolderPath is None: return buildWordTableIndex( wordTable )
+
+    indexFilepath = Path( cacheFolderPath ).joinpath( f'{Path( wordTableFilename ).stem}{WORD_TABLE_INDEX_FILENAME_END}' )
+    wordTableHash = getWordTableHash( wordTable )
+    wordTableIndex = _loadWordTableIndex( indexFilepath, wordTableHash )
+    if wordTableIndex is not None:
+        vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Loaded {wordTableFilename} index of {len(wordTableIndex):,} verses from {indexFilepath}." )
+        return wordTableIndex
+
+    wordTableIndex = buildWordTableIndex( wordTable )
+    try: _saveWordTableIndex( wordTableIndex, indexFilepath, wordTableHash )
+    except OSError as err:
+        logging.error( f"Unable to save {wordTableFilename} index to {indexFilepath}: {err}" )
+        # But we ignore it (it'll just be made again next time)
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Made {wordTableFilename} index of {len(wordTableIndex):,} verses." )
+    return wordTableIndex
+# end of wordTableIndex.getWordTableIndex
+
+
+def briefDemo() -> None:
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    # Demo the WordTableIndex object
+    import tempfile
+    wordTable = WordTable( 'DEMO_NT_word_table.tsv', ['Ref\tGreekWord',
+                                                    'JHN_3:16w1\tΟὕτως', 'JHN_3:16w2\tγὰρ', 'JHN_3:17w1\tοὐ', ''] )
+    with tempfile.TemporaryDirectory() as tempFolder:
+        getWordTableIndex( wordTable.filename, wordTable, Path( tempFolder ) ) # Makes and saves it
+        wordTableIndex = getWordTableIndex( wordTable.filename, wordTable, Path( tempFolder ) ) # Loads it
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {wordTableIndex} {wordTableIndex.getWordNumberRange('JHN','3','16')=} {wordTableIndex.getRefWordNumberRange('JHN_3:17')=}" )
+# end of wordTableIndex.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of wordTableIndex.fullDemo
+
+if __name__ == '__main__':
+    from multiprocessing import freeze_support
+    freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of wordTableIndex.py
@@ -0,0 +1,31 @@
+#!/usr/bin/env -S uv run
+# -*- coding: utf-8 -*-
+#
+# wordTableTestData.py
+#
+# The OET-LV word and lemma table data shared by the word table tests (test_word_indexes_encoding.py and test_word_pages_parallel.py)
+
+from pathlib import Path
+from settings import State
+from createOETReferencePages import HebrewLemmaFileName
+
+
+HEBREW_HEADER = 'Ref\tRowType\tMorphemeRowList\tLemmaRowList\tStrongs\tMorphology\tWord\tNoCantillations\tMorphemeGlosses\tContextualMorphemeGlosses\tWordGloss\tContextualWordGloss\tGlossCapitalisation\tGlossPunctuation\tGlossOrder\tGlossInsert\tRole\tNesting\tTags'
+HEBREW_LEMMAS = ('בָּרָא', 'אֱלֹהִים', 'אֶרֶץ', 'אוֹר') # Lemma table rows 1..4
+GREEK_HEADER = 'Ref\tGreekWord\tSRLemma\tGreekLemma\tVLTGlossWords\tOETGlossWords\tGlossCaps\tProbability\tStrongsExt\tRole\tMorphology\tTags'
+
+# Where createSitePages.py finds the real OET-LV word and lemma tables (if they're there)
+REAL_OT_SOURCE_FOLDER = Path(__file__).parent.joinpath(State.BibleLocations['OET-LV-OT']).resolve()
+REAL_NT_SOURCE_FOLDER = Path(__file__).parent.joinpath(State.BibleLocations['OET-LV-NT']).resolve()
+
+
+def writeHebrewLemmaTable(OTFolder):
+    """ Write a lemma table with our HEBREW_LEMMAS into the folder """
+    OTFolder.mkdir(exist_ok=True)
+    OTFolder.joinpath(HebrewLemmaFileName).write_text('Lemma\tGlosses\n' + ''.join(f'{lemma}\tgloss{ll}\n' for ll, lemma in enumerate(HEBREW_LEMMAS, start=1)), encoding='utf-8')
+
+
+def readWordTableRows(filepath):
+    """ Returns the rows (including the header) of a real word table file """
+    fileText = filepath.read_text(encoding='utf-8').lstrip('\ufeff') # Remove any Byte Order Marker
+    return fileText.rstrip('\n').split('\n')